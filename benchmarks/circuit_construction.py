@@ -58,7 +58,10 @@ def rotated_surface_code_memory_z_cycle(
 
 
 def surface_code_circuit(
-    distance: int, num_rounds: int, moment_by_moment: bool = True
+    distance: int,
+    num_rounds: int,
+    moment_by_moment: bool = True,
+    insert_strategy: cirq.InsertStrategy | None = None,
 ) -> cirq.Circuit:
     """Constructs a rotated memory Z surface code circuit with `distance` and `num_rounds`.
 
@@ -72,6 +75,10 @@ def surface_code_circuit(
         moment_by_moment: If True, the circuit is constructed moment-by-moment instead of
             operation-by-operation. This is useful to benchmark different circuit construction
             patterns for the same circuit.
+        insert_strategy: If set, the circuit is constructed operation-by-operation, but the first
+            layer of Hadamards of each round is inserted with this strategy at the start of the
+            round after the rest of the round was appended. This benchmarks circuit construction
+            that interleaves appends with inserts.
 
     Returns:
         A `cirq.Circuit` for surface code memory Z experiment for `distance` and `num_rounds`.
@@ -92,6 +99,15 @@ def surface_code_circuit(
     surface_code_cycle = rotated_surface_code_memory_z_cycle(
         data_qubits, x_measure_qubits, z_measure_qubits, x_order, z_order
     )
+    if insert_strategy is not None:
+        circuit = cirq.Circuit()
+        first_layer, *other_layers = surface_code_cycle.moments
+        for _ in range(num_rounds):
+            round_start = len(circuit)
+            circuit.append(op for moment in other_layers for op in moment)
+            circuit.insert(round_start, first_layer.operations, strategy=insert_strategy)
+        circuit.append(cirq.measure_each(*data_qubits))
+        return circuit
     if moment_by_moment:
         return cirq.Circuit(
             surface_code_cycle * num_rounds, cirq.Moment(cirq.measure_each(*data_qubits))
@@ -115,6 +131,24 @@ class SurfaceCodeRotatedMemoryZ:
         """Benchmark circuit construction for Rotated Bottom-Z Surface code."""
         _ = surface_code_circuit(distance, distance * distance, False)
 
+    def time_circuit_construction_with_earliest_inserts(self, distance: int) -> None:
+        """Benchmark circuit construction interleaving appends with EARLIEST inserts."""
+        _ = surface_code_circuit(
+            distance, distance * distance, insert_strategy=cirq.InsertStrategy.EARLIEST
+        )
+
+    def time_circuit_construction_with_inline_inserts(self, distance: int) -> None:
+        """Benchmark circuit construction interleaving appends with INLINE inserts."""
+        _ = surface_code_circuit(
+            distance, distance * distance, insert_strategy=cirq.InsertStrategy.INLINE
+        )
+
+    def time_circuit_construction_with_new_inserts(self, distance: int) -> None:
+        """Benchmark circuit construction interleaving appends with NEW inserts."""
+        _ = surface_code_circuit(
+            distance, distance * distance, insert_strategy=cirq.InsertStrategy.NEW
+        )
+
     def track_circuit_operation_count(self, distance: int) -> int:
         """Benchmark operation count for Rotated Bottom-Z Surface code."""
         circuit = surface_code_circuit(distance, distance * distance)
@@ -134,3 +168,56 @@ class XOnAllQubitsCircuit:
     def time_circuit_construction(self, N: int, D: int) -> cirq.Circuit:
         q = cirq.LineQubit.range(N)
         return cirq.Circuit(cirq.Moment(cirq.X.on_each(*q)) for _ in range(D))
+
+    def time_circuit_construction_layer_by_layer(self, N: int, D: int) -> cirq.Circuit:
+        q = cirq.LineQubit.range(N)
+        circuit = cirq.Circuit()
+        for _ in range(D):
+            circuit.append(cirq.X.on_each(*q))
+        return circuit
+
+
+class SurfaceCodeMomentQueries:
+    pretty_name = "Moment queries on Rotated Memory-Z Surface code circuits."
+    params = [*range(3, 26, 4)]
+    param_names = ["distance"]
+
+    def setup(self, distance: int) -> None:
+        self.circuit = surface_code_circuit(distance, distance * distance).freeze()
+        self.qubits = sorted(self.circuit.all_qubits())
+
+    def time_next_moment_operating_on(self, distance: int) -> None:
+        """Benchmark finding the next moment acting on each qubit from every moment."""
+        for i in range(len(self.circuit)):
+            for q in self.qubits:
+                _ = self.circuit.next_moment_operating_on([q], i)
+
+    def time_reachable_frontier_from(self, distance: int) -> None:
+        """Benchmark the reachable frontier from the start of the circuit."""
+        _ = self.circuit.reachable_frontier_from({q: 0 for q in self.qubits})
+
+    def time_findall_operations_between(self, distance: int) -> None:
+        """Benchmark finding the operations within a window of moments on every qubit."""
+        for i in range(0, len(self.circuit), 7):
+            _ = self.circuit.findall_operations_between(
+                {q: i for q in self.qubits}, {q: i + 7 for q in self.qubits}
+            )
+
+
+class SurfaceCodeCircuitCopies:
+    pretty_name = "Copies of Rotated Memory-Z Surface code circuits."
+    params = [*range(3, 26, 4)]
+    param_names = ["distance"]
+
+    def setup(self, distance: int) -> None:
+        self.circuit = surface_code_circuit(distance, distance * distance)
+
+    def time_copy(self, distance: int) -> None:
+        """Benchmark repeated defensive copies of a circuit."""
+        for _ in range(100):
+            _ = self.circuit.copy()
+
+    def time_copy_and_append(self, distance: int) -> None:
+        """Benchmark copying a circuit and appending a final layer to the copy."""
+        copy = self.circuit.copy()
+        copy.append(cirq.measure_each(*self.circuit.all_qubits()))
@@ -0,0 +1,58 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+
+
+def _random_ch_form(num_qubits: int, seed: int) -> cirq.StabilizerStateChForm:
+    rng = np.random.RandomState(seed)
+    state = cirq.StabilizerStateChForm(num_qubits)
+    for _ in range(3):
+        for q in range(num_qubits):
+            state.apply_h(q)
+            state.apply_z(q, exponent=0.5 * rng.randint(4))
+        perm = rng.permutation(num_qubits)
+        for q1, q2 in zip(perm[::2], perm[1::2]):
+            state.apply_cx(q1, q2)
+    return state
+
+
+class ChFormGates:
+    params = [50, 200]
+    param_names = ["num_qubits"]
+
+    def setup(self, num_qubits: int) -> None:
+        self.num_qubits = num_qubits
+
+    def time_random_clifford(self, num_qubits: int) -> None:
+        _ = _random_ch_form(num_qubits, seed=1)
+
+    def time_measure_all(self, num_qubits: int) -> None:
+        state = _random_ch_form(num_qubits, seed=1)
+        _ = state.measure(list(range(num_qubits)), seed=1)
+
+
+class ChFormAmplitudes:
+    params = ([16, 50], [1_000, 100_000])
+    param_names = ["num_qubits", "num_bitstrings"]
+
+    def setup(self, num_qubits: int, num_bitstrings: int) -> None:
+        self.state = _random_ch_form(num_qubits, seed=1)
+        rng = np.random.RandomState(2)
+        self.bitstrings = rng.randint(2, size=(num_bitstrings, num_qubits), dtype=np.uint8)
+
+    def time_amplitudes(self, *_) -> None:
+        _ = self.state.amplitudes(self.bitstrings)
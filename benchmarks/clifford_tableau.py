@@ -0,0 +1,119 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+import cirq
+
+
+class CliffordTableauMeasurement:
+    params = [100, 500, 2000]
+    param_names = ["num_qubits"]
+
+    def setup(self, num_qubits: int) -> None:
+        rng = np.random.RandomState(1)
+        self.tableau = cirq.CliffordTableau(num_qubits)
+        for _ in range(3):
+            for q in range(num_qubits):
+                self.tableau.apply_h(q)
+            perm = rng.permutation(num_qubits)
+            for q1, q2 in zip(perm[::2], perm[1::2]):
+                self.tableau.apply_cx(q1, q2)
+        self.axes = list(range(num_qubits))
+
+    def time_measure_all(self, _) -> None:
+        _ = self.tableau.copy().measure(self.axes, seed=1)
+
+
+class PauliSumExpectation:
+    params = ([20, 100], [100, 10_000])
+    param_names = ["num_qubits", "num_terms"]
+
+    def setup(self, num_qubits: int, num_terms: int) -> None:
+        rng = np.random.RandomState(1)
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.qubit_map = {q: i for i, q in enumerate(qubits)}
+        self.tableau = cirq.CliffordTableau(num_qubits)
+        for _ in range(3):
+            for q in range(num_qubits):
+                self.tableau.apply_h(q)
+                self.tableau.apply_z(q, exponent=0.5 * rng.randint(4))
+            perm = rng.permutation(num_qubits)
+            for q1, q2 in zip(perm[::2], perm[1::2]):
+                self.tableau.apply_cx(q1, q2)
+        self.ch_form = cirq.StabilizerStateChForm(num_qubits)
+        self.psum = cirq.PauliSum.from_pauli_strings(
+            [
+                cirq.DensePauliString(rng.randint(4, size=num_qubits), coefficient=rng.rand()).on(
+                    *qubits
+                )
+                for _ in range(num_terms)
+            ]
+        )
+
+    def time_tableau_expectation(self, *_) -> None:
+        _ = self.psum.expectation_from_stabilizer_state(self.tableau, self.qubit_map)
+
+    def time_ch_form_expectation(self, *_) -> None:
+        _ = self.psum.expectation_from_stabilizer_state(self.ch_form, self.qubit_map)
+
+
+class PauliStringPropagation:
+    params = ([100, 1000], [100, 10_000])
+    param_names = ["num_qubits", "num_pauli_strings"]
+
+    def setup(self, num_qubits: int, num_pauli_strings: int) -> None:
+        rng = np.random.RandomState(1)
+        self.qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.Circuit()
+        for _ in range(10):
+            gates = [cirq.H, cirq.S, cirq.X**0.5]
+            self.circuit.append(gates[rng.randint(3)](q) for q in self.qubits)
+            perm = rng.permutation(num_qubits)
+            self.circuit.append(
+                cirq.CNOT(self.qubits[q1], self.qubits[q2]) for q1, q2 in zip(perm[::2], perm[1::2])
+            )
+        self.pauli_strings = cirq.DensePauliStringArray.from_pauli_masks(
+            rng.randint(4, size=(num_pauli_strings, num_qubits))
+        )
+
+    def time_after(self, *_) -> None:
+        _ = self.pauli_strings.after(self.circuit, self.qubits)
+
+    def time_conjugated_by(self, *_) -> None:
+        _ = self.pauli_strings.conjugated_by(self.circuit, self.qubits)
+
+
+class PauliStringAlgebra:
+    params = ([20, 100], [1000, 10_000])
+    param_names = ["num_qubits", "num_pauli_strings"]
+
+    def setup(self, num_qubits: int, num_pauli_strings: int) -> None:
+        rng = np.random.RandomState(1)
+        self.qubits = cirq.LineQubit.range(num_qubits)
+        self.lhs, self.rhs = (
+            cirq.DensePauliStringArray.from_pauli_masks(
+                rng.randint(4, size=(num_pauli_strings, num_qubits))
+            )
+            for _ in range(2)
+        )
+        self.pauli_sum = self.lhs.to_pauli_sum(self.qubits)
+
+    def time_multiply(self, *_) -> None:
+        _ = self.lhs * self.rhs
+
+    def time_commutation_matrix(self, *_) -> None:
+        _ = self.lhs.commutation_matrix(self.rhs[:1000])
+
+    def time_from_pauli_sum(self, *_) -> None:
+        _ = cirq.DensePauliStringArray.from_pauli_sum(self.pauli_sum, self.qubits)
@@ -0,0 +1,36 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+class NoisyDensityMatrixSimulation:
+    params = ([8, 10], [None, 2**40])
+    param_names = ["num_qubits", "max_memory_bytes"]
+    timeout = 600
+
+    def setup(self, num_qubits: int, max_memory_bytes: int | None) -> None:
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.testing.random_circuit(
+            qubits=qubits, n_moments=10, op_density=1, random_state=1
+        ) + cirq.Circuit(cirq.amplitude_damp(0.1).on_each(*qubits))
+        self.simulator = cirq.DensityMatrixSimulator(
+            max_memory_bytes=max_memory_bytes, split_untangled_states=False
+        )
+
+    def time_simulate(self, *_) -> None:
+        _ = self.simulator.simulate(self.circuit)
+
+    def peakmem_simulate(self, *_) -> None:
+        _ = self.simulator.simulate(self.circuit)
@@ -0,0 +1,73 @@
+# Copyright 2022 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+class FusedStateVectorSimulation:
+    params = ([16, 20], [None, 2, 3])
+    param_names = ["num_qubits", "fuse_max_qubits"]
+    timeout = 600
+
+    def setup(self, num_qubits: int, fuse_max_qubits: int | None) -> None:
+        self.circuit = cirq.testing.random_circuit(
+            qubits=num_qubits,
+            n_moments=24,
+            op_density=1,
+            gate_domain={cirq.H: 1, cirq.T: 1, cirq.X**0.5: 1, cirq.CZ: 2, cirq.ISWAP**0.3: 2},
+            random_state=1,
+        ).freeze()
+        self.simulator = cirq.Simulator(
+            fuse_max_qubits=fuse_max_qubits, split_untangled_states=False
+        )
+        if fuse_max_qubits is not None:
+            # Fuse the circuit outside of the timed region, as the result is cached.
+            _ = self.circuit._fuse_unitaries(fuse_max_qubits)
+
+    def time_simulate(self, *_) -> None:
+        _ = self.simulator.simulate(self.circuit)
+
+
+class QaoaSimulation:
+    params = ([10, 20], [None, 2, 4], [False, True])
+    param_names = ["num_qubits", "fuse_diagonal_max_qubits", "density_matrix"]
+    timeout = 600
+
+    def setup(
+        self, num_qubits: int, fuse_diagonal_max_qubits: int | None, density_matrix: bool
+    ) -> None:
+        if density_matrix and num_qubits > 10:
+            raise NotImplementedError("Density matrices of this size do not fit in memory.")
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.FrozenCircuit(
+            cirq.H.on_each(*qubits),
+            [
+                (
+                    [cirq.ZZ(a, b) ** 0.3 for a, b in zip(qubits, qubits[1:])],
+                    [cirq.Z(q) ** 0.2 for q in qubits],
+                    [cirq.X(q) ** 0.4 for q in qubits],
+                )
+                for _ in range(4)
+            ],
+        )
+        simulator_type = cirq.DensityMatrixSimulator if density_matrix else cirq.Simulator
+        self.simulator = simulator_type(
+            fuse_diagonal_max_qubits=fuse_diagonal_max_qubits, split_untangled_states=False
+        )
+        if fuse_diagonal_max_qubits is not None:
+            # Fuse the circuit outside of the timed region, as the result is cached.
+            _ = self.circuit._fuse_diagonal_unitaries(fuse_diagonal_max_qubits)
+
+    def time_simulate(self, *_) -> None:
+        _ = self.simulator.simulate(self.circuit)
@@ -0,0 +1,39 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import cirq
+
+
+class DepolarizingNoiseSimulation:
+    params = ([6, 9], ["depolarize", "two_qubit_depolarize", "amplitude_damp"])
+    param_names = ["num_qubits", "noise"]
+
+    def setup(self, num_qubits: int, noise: str) -> None:
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.testing.random_circuit(
+            qubits=qubits, n_moments=10, op_density=1, random_state=1
+        )
+        channel = {
+            "depolarize": cirq.depolarize(0.01),
+            "two_qubit_depolarize": cirq.depolarize(0.01, n_qubits=2),
+            "amplitude_damp": cirq.amplitude_damp(0.01),
+        }[noise]
+        n = cirq.num_qubits(channel)
+        noise_moment = cirq.Moment(
+            channel.on(*qubits[i : i + n]) for i in range(0, num_qubits - n + 1, n)
+        )
+        self.circuit = cirq.Circuit(op for moment in self.circuit for op in (moment, noise_moment))
+        self.simulator = cirq.DensityMatrixSimulator()
+
+    def time_simulate(self, *_) -> None:
+        _ = self.simulator.simulate(self.circuit)
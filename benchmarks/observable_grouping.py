@@ -0,0 +1,41 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+import cirq
+
+
+class GroupSettings:
+    params = (["greedy", "sorted_insertion", "coloring"], [1000, 10_000])
+    param_names = ["grouper", "num_terms"]
+
+    def setup(self, grouper: str, num_terms: int) -> None:
+        rng = np.random.RandomState(1)
+        qubits = cirq.LineQubit.range(20)
+        masks = np.zeros((num_terms, len(qubits)), dtype=np.uint8)
+        for mask in masks:
+            support = rng.choice(len(qubits), 4, replace=False)
+            mask[support] = rng.randint(1, 4, size=4)
+        observables = [
+            cirq.DensePauliString(mask, coefficient=rng.randn()).on(*qubits) for mask in masks
+        ]
+        self.settings = list(cirq.work.observables_to_settings(observables, qubits))
+        self.grouper = {
+            "greedy": cirq.work.group_settings_greedy,
+            "sorted_insertion": cirq.work.group_settings_sorted_insertion,
+            "coloring": cirq.work.group_settings_coloring,
+        }[grouper]
+
+    def time_group_settings(self, *_) -> None:
+        _ = self.grouper(self.settings)
@@ -0,0 +1,77 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+
+import cirq
+
+
+def _brickwork_circuit(num_qubits: int, num_layers: int) -> cirq.Circuit:
+    qubits = cirq.LineQubit.range(num_qubits)
+    moments = []
+    for layer in range(num_layers):
+        moments.append(
+            cirq.Moment(
+                cirq.PhasedXZGate(
+                    x_exponent=0.5, z_exponent=(layer + i) % 8 / 4, axis_phase_exponent=0
+                ).on(q)
+                for i, q in enumerate(qubits)
+            )
+        )
+        pairs = zip(qubits[layer % 2 :: 2], qubits[layer % 2 + 1 :: 2])
+        moments.append(cirq.Moment(cirq.CZ(q1, q2) for q1, q2 in pairs))
+    return cirq.Circuit(moments)
+
+
+class PackedCircuitSuite:
+    param_names = ["num_qubits", "num_layers"]
+    params = ([100, 1000], [100, 1000])
+    timeout = 600
+
+    def setup(self, num_qubits: int, num_layers: int) -> None:
+        self.circuit = _brickwork_circuit(num_qubits, num_layers)
+        self.packed = cirq.PackedCircuit(self.circuit)
+        self.pickled_circuit = pickle.dumps(self.circuit)
+        self.pickled_packed = pickle.dumps(self.packed)
+
+    def time_pack(self, *_) -> None:
+        _ = cirq.PackedCircuit(self.circuit)
+
+    def time_unpack(self, *_) -> None:
+        _ = self.packed.unfreeze()
+
+    def time_pickle_circuit(self, *_) -> None:
+        _ = pickle.dumps(self.circuit)
+
+    def time_pickle_packed(self, *_) -> None:
+        _ = pickle.dumps(self.packed)
+
+    def time_unpickle_circuit(self, *_) -> None:
+        _ = pickle.loads(self.pickled_circuit)
+
+    def time_unpickle_packed(self, *_) -> None:
+        _ = pickle.loads(self.pickled_packed)
+
+    def time_iterate_operations_circuit(self, *_) -> None:
+        for _ in self.circuit.all_operations():
+            pass
+
+    def time_iterate_operations_packed(self, *_) -> None:
+        for _ in self.packed.all_operations():
+            pass
+
+    def track_pickle_size_circuit(self, *_) -> int:
+        return len(self.pickled_circuit)
+
+    def track_pickle_size_packed(self, *_) -> int:
+        return len(self.pickled_packed)
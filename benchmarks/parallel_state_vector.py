@@ -0,0 +1,38 @@
+# Copyright 2022 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+class ParallelStateVectorSimulation:
+    params = ([20, 24, 28], [1, 4])
+    param_names = ["num_qubits", "num_threads"]
+    timeout = 1800
+
+    def setup(self, num_qubits: int, num_threads: int) -> None:
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.Circuit(
+            (
+                cirq.Moment(cirq.H.on_each(*qubits)),
+                cirq.Moment(
+                    cirq.CZ(a, b) for a, b in zip(qubits[i % 2 :: 2], qubits[i % 2 + 1 :: 2])
+                ),
+                cirq.Moment(cirq.rx(0.1 * (i + 1)).on(q) for q in qubits),
+            )
+            for i in range(2)
+        )
+        self.simulator = cirq.Simulator(num_threads=num_threads, split_untangled_states=False)
+
+    def time_simulate(self, *_) -> None:
+        _ = self.simulator.simulate(self.circuit)
@@ -36,3 +36,34 @@ class RabiCalibration:
         for diff in np.linspace(-0.3, 0.3, num=num_scan_points):
             resolver = {self.symbols[q]: amp + diff for q, amp in self.qubit_amps.items()}
             _ = cirq.resolve_parameters(self.circuit, resolver)
+
+
+class SweepSimulation:
+    params = ([4, 8, 12], [20, 100], [cirq.Simulator, cirq.DensityMatrixSimulator])
+    param_names = ["num_qubits", "num_sweep_points", "simulator_type"]
+    timeout = 600
+
+    def setup(self, num_qubits: int, num_sweep_points: int, simulator_type: type) -> None:
+        if simulator_type is cirq.DensityMatrixSimulator and num_qubits > 8:
+            raise NotImplementedError("Density matrix too large.")
+        qubits = cirq.LineQubit.range(num_qubits)
+        theta = sympy.Symbol('theta')
+        self.circuit = cirq.Circuit(
+            (
+                cirq.Moment(cirq.rx(theta * (i + 1)).on(q) for q in qubits),
+                cirq.Moment(
+                    cirq.CZ(a, b) for a, b in zip(qubits[i % 2 :: 2], qubits[i % 2 + 1 :: 2])
+                ),
+                cirq.Moment(cirq.H.on_each(*qubits)),
+            )
+            for i in range(10)
+        )
+        self.measured_circuit = self.circuit + cirq.measure(*qubits, key='m')
+        self.sweep = cirq.Linspace('theta', 0, np.pi, num_sweep_points)
+        self.simulator = simulator_type(seed=1)
+
+    def time_simulate_sweep(self, *_) -> None:
+        _ = self.simulator.simulate_sweep(self.circuit, self.sweep)
+
+    def time_run_sweep(self, *_) -> None:
+        _ = self.simulator.run_sweep(self.measured_circuit, self.sweep, repetitions=100)
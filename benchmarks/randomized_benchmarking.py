@@ -73,3 +73,37 @@ class SingleQubitRandomizedBenchmarking:
                 [cirq.Moment(ops[d] for ops in op_grid) for d in range(depth + 1)],
                 cirq.Moment(cirq.measure(*qubits)),
             )
+
+
+class CliffordCircuitTableau:
+    """Benchmarks applying a random Clifford circuit to many stabilizer states.
+
+    The circuit is wrapped in a `cirq.CircuitOperation`, so that its tableau is computed once and
+    then applied to each state in one step.
+    """
+
+    params = [[10, 50], [100, 1000], [100]]
+    param_names = ["num_qubits", "depth", "num_states"]
+
+    def setup(self, num_qubits: int, depth: int, num_states: int) -> None:
+        rng = np.random.RandomState(1)
+        qubits = cirq.LineQubit.range(num_qubits)
+        gates = [cirq.H, cirq.S, cirq.CNOT, cirq.CZ]
+        operations = []
+        for _ in range(depth):
+            gate = gates[rng.randint(len(gates))]
+            targets = rng.choice(num_qubits, size=gate.num_qubits(), replace=False)
+            operations.append(gate.on(*(qubits[t] for t in targets)))
+        self.operations = operations
+        self.circuit_op = cirq.CircuitOperation(cirq.FrozenCircuit(operations))
+        self.qubits = qubits
+
+    def time_compile_tableau(self, *_) -> None:
+        _ = cirq.FrozenCircuit(self.operations).clifford_tableau()
+
+    def time_apply_to_states(self, num_qubits: int, depth: int, num_states: int) -> None:
+        for i in range(num_states):
+            state = cirq.CliffordTableauSimulationState(
+                cirq.CliffordTableau(num_qubits, initial_state=i), qubits=self.qubits
+            )
+            cirq.act_on(self.circuit_op, state)
@@ -0,0 +1,56 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+import cirq
+
+
+def _ghz_with_t_gates(num_qubits: int, num_t_gates: int) -> cirq.Circuit:
+    qubits = cirq.LineQubit.range(num_qubits)
+    rotated = qubits[:: num_qubits // num_t_gates][:num_t_gates]
+    return cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(num_qubits - 1)],
+        cirq.H.on_each(*rotated),
+        cirq.T.on_each(*rotated),
+        cirq.H.on_each(*rotated),
+        [cirq.CNOT(qubits[i], qubits[(i + 7) % num_qubits]) for i in range(num_qubits)],
+    )
+
+
+class StabilizerRankSampling:
+    params = ([50, 100], [8, 16])
+    param_names = ["num_qubits", "num_t_gates"]
+
+    def setup(self, num_qubits: int, num_t_gates: int) -> None:
+        self.circuit = _ghz_with_t_gates(num_qubits, num_t_gates) + cirq.measure(
+            *cirq.LineQubit.range(num_qubits), key='m'
+        )
+        self.simulator = cirq.StabilizerRankSimulator(seed=1)
+
+    def time_run(self, *_) -> None:
+        _ = self.simulator.run(self.circuit, repetitions=1000)
+
+
+class StabilizerRankAmplitudes:
+    params = ([50, 100], [8, 16])
+    param_names = ["num_qubits", "num_t_gates"]
+
+    def setup(self, num_qubits: int, num_t_gates: int) -> None:
+        self.circuit = _ghz_with_t_gates(num_qubits, num_t_gates)
+        self.bitstrings = np.random.RandomState(1).randint(2**31, size=100).tolist()
+        self.simulator = cirq.StabilizerRankSimulator()
+
+    def time_compute_amplitudes(self, *_) -> None:
+        _ = self.simulator.compute_amplitudes(self.circuit, self.bitstrings)
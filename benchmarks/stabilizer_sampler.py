@@ -0,0 +1,66 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import sympy
+
+import cirq
+
+
+def _repetition_code_memory(distance: int, rounds: int) -> cirq.Circuit:
+    data = cirq.LineQubit.range(0, 2 * distance - 1, 2)
+    ancillas = cirq.LineQubit.range(1, 2 * distance - 2, 2)
+    circuit = cirq.Circuit()
+    for r in range(rounds):
+        circuit += cirq.Circuit(
+            [cirq.CNOT(d, a) for d, a in zip(data, ancillas)],
+            [cirq.CNOT(d, a) for d, a in zip(data[1:], ancillas)],
+            cirq.Moment(cirq.measure(a, key=f'round{r}_{i}') for i, a in enumerate(ancillas)),
+            cirq.Moment(cirq.reset(a) for a in ancillas),
+        )
+    return circuit + cirq.measure(*data, key='data')
+
+
+class StabilizerSampling:
+    params = ([7, 25], [10_000, 100_000])
+    param_names = ["distance", "repetitions"]
+
+    def setup(self, distance: int, repetitions: int) -> None:
+        data = cirq.LineQubit.range(0, 2 * distance - 1, 2)
+        self.circuit = cirq.Circuit(cirq.H.on_each(data)) + _repetition_code_memory(
+            distance, rounds=distance
+        )
+        self.sampler = cirq.StabilizerSampler(seed=1)
+
+    def time_run(self, _, repetitions: int) -> None:
+        _ = self.sampler.run(self.circuit, repetitions=repetitions)
+
+
+class StabilizerSweep:
+    params = ([7, 25], [10, 100])
+    param_names = ["distance", "points"]
+
+    def setup(self, distance: int, points: int) -> None:
+        data = cirq.LineQubit.range(0, 2 * distance - 1, 2)
+        t = sympy.Symbol('t')
+        memory = _repetition_code_memory(distance, rounds=distance)
+        self.circuit = (
+            cirq.Circuit(cirq.H.on_each(data))
+            + memory[:-1]
+            + cirq.Circuit((cirq.X**t).on_each(data))
+            + memory[-1:]
+        )
+        self.sweep = cirq.Points('t', [i % 4 / 2 for i in range(points)])
+        self.sampler = cirq.StabilizerSampler(seed=1)
+
+    def time_run_sweep(self, *_) -> None:
+        _ = self.sampler.run_sweep(self.circuit, self.sweep, repetitions=1000)
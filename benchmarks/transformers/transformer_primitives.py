@@ -63,3 +63,9 @@ class MapLargeExpandedCircuit:
             return [op, op]
 
         _ = cirq.map_operations_and_unroll(circuit=self.circuit, map_func=map_func)
+
+    def time_merge_operations(self, *_) -> None:
+        def merge_func(op1: cirq.Operation, op2: cirq.Operation) -> cirq.Operation | None:
+            return op1 if op1.qubits == op2.qubits else None
+
+        _ = cirq.merge_operations(circuit=self.circuit, merge_func=merge_func)
@@ -72,6 +72,8 @@ from cirq.circuits import (
     FrozenCircuit as FrozenCircuit,
     InsertStrategy as InsertStrategy,
     Moment as Moment,
+    MomentBuilder as MomentBuilder,
+    PackedCircuit as PackedCircuit,
     PointOptimizationSummary as PointOptimizationSummary,
     PointOptimizer as PointOptimizer,
     QasmOutput as QasmOutput,
@@ -172,6 +174,7 @@ from cirq.linalg import (
     so4_to_magic_su2s as so4_to_magic_su2s,
     sub_state_vector as sub_state_vector,
     targeted_conjugate_about as targeted_conjugate_about,
+    targeted_diagonal_multiply as targeted_diagonal_multiply,
     targeted_left_multiply as targeted_left_multiply,
     to_special as to_special,
     unitary_eig as unitary_eig,
@@ -211,6 +214,7 @@ from cirq.ops import (
     CZSWAP as CZSWAP,
     CZPowGate as CZPowGate,
     DensePauliString as DensePauliString,
+    DensePauliStringArray as DensePauliStringArray,
     depolarize as depolarize,
     DepolarizingChannel as DepolarizingChannel,
     DiagonalGate as DiagonalGate,
@@ -488,6 +492,11 @@ from cirq.sim import (
     SimulatorBase as SimulatorBase,
     SparseSimulatorStep as SparseSimulatorStep,
     StabilizerChFormSimulationState as StabilizerChFormSimulationState,
+    StabilizerRankSimulationState as StabilizerRankSimulationState,
+    StabilizerRankSimulator as StabilizerRankSimulator,
+    StabilizerRankState as StabilizerRankState,
+    StabilizerRankStepResult as StabilizerRankStepResult,
+    StabilizerRankTrialResult as StabilizerRankTrialResult,
     StabilizerSampler as StabilizerSampler,
     StabilizerSimulationState as StabilizerSimulationState,
     StabilizerStateChForm as StabilizerStateChForm,
@@ -656,12 +665,14 @@ from cirq.protocols import (
     SupportsQasmWithArgsAndQubits as SupportsQasmWithArgsAndQubits,
     SupportsTraceDistanceBound as SupportsTraceDistanceBound,
     SupportsUnitary as SupportsUnitary,
+    SupportsUnitaryDiagonal as SupportsUnitaryDiagonal,
     to_json_gzip as to_json_gzip,
     to_json as to_json,
     obj_to_dict_helper as obj_to_dict_helper,
     trace_distance_bound as trace_distance_bound,
     trace_distance_from_angle_list as trace_distance_from_angle_list,
     unitary as unitary,
+    unitary_diagonal as unitary_diagonal,
     validate_mixture as validate_mixture,
     with_key_path as with_key_path,
     with_key_path_prefix as with_key_path_prefix,
@@ -26,7 +26,9 @@ from cirq.circuits.circuit_operation import CircuitOperation as CircuitOperation
 from cirq.circuits.frozen_circuit import FrozenCircuit as FrozenCircuit
 from cirq.circuits.insert_strategy import InsertStrategy as InsertStrategy
 
-from cirq.circuits.moment import Moment as Moment
+from cirq.circuits.moment import Moment as Moment, MomentBuilder as MomentBuilder
+
+from cirq.circuits.packed_circuit import PackedCircuit as PackedCircuit
 
 from cirq.circuits.optimization_pass import (
     PointOptimizer as PointOptimizer,
@@ -22,6 +22,7 @@ Moment the Operations must all act on distinct Qubits.
 from __future__ import annotations
 
 import abc
+import bisect
 import enum
 import html
 import itertools
@@ -55,7 +56,7 @@ from cirq._doc import document
 from cirq.circuits._bucket_priority_queue import BucketPriorityQueue
 from cirq.circuits.circuit_operation import CircuitOperation
 from cirq.circuits.insert_strategy import InsertStrategy
-from cirq.circuits.moment import Moment
+from cirq.circuits.moment import Moment, MomentBuilder
 from cirq.circuits.qasm_output import QasmOutput
 from cirq.circuits.text_diagram_drawer import TextDiagramDrawer
 from cirq.protocols import circuit_diagram_info_protocol
@@ -373,6 +374,11 @@ class AbstractCircuit(abc.ABC):
         else:
             max_distance = min(max_distance, max_circuit_distance)
 
+        timeline = self._timeline_index()
+        if timeline is not None:
+            return timeline.next_index(
+                qubits, max(start_moment_index, 0), start_moment_index + max_distance
+            )
         return self._first_moment_operating_on(
             qubits, range(start_moment_index, start_moment_index + max_distance)
         )
@@ -394,8 +400,16 @@ class AbstractCircuit(abc.ABC):
             (inclusive) that does *not* act on a given qubit.
         """
         next_moments = {}
+        timeline = self._timeline_index()
         for q in qubits:
-            next_moment = self.next_moment_operating_on([q], start_moment_index)
+            if timeline is None:
+                next_moment = self._first_moment_operating_on(
+                    [q], range(start_moment_index, len(self.moments))
+                )
+            else:
+                next_moment = timeline.next_index(
+                    [q], max(start_moment_index, 0), len(self.moments)
+                )
             next_moments[q] = len(self.moments) if next_moment is None else next_moment
         return next_moments
 
@@ -440,6 +454,11 @@ class AbstractCircuit(abc.ABC):
         if max_distance <= 0:
             return None
 
+        timeline = self._timeline_index()
+        if timeline is not None:
+            return timeline.prev_index(
+                qubits, max(end_moment_index - max_distance, 0), end_moment_index
+            )
         return self._first_moment_operating_on(
             qubits, (end_moment_index - k - 1 for k in range(max_distance))
         )
@@ -663,9 +682,15 @@ class AbstractCircuit(abc.ABC):
         result = BucketPriorityQueue[ops.Operation](drop_duplicate_entries=True)
 
         involved_qubits = set(start_frontier.keys()) | set(end_frontier.keys())
+        timeline = self._timeline_index()
         # Note: only sorted to ensure a deterministic result ordering.
         for q in sorted(involved_qubits):
-            for i in range(start_frontier.get(q, 0), end_frontier.get(q, len(self))):
+            start, end = start_frontier.get(q, 0), end_frontier.get(q, len(self))
+            if timeline is None:
+                indices: Iterable[int] = range(start, end)
+            else:
+                indices = timeline.indices_between(q, max(start, 0), end)
+            for i in indices:
                 op = self.operation_at(q, i)
                 if op is None:
                     continue
@@ -936,6 +961,14 @@ class AbstractCircuit(abc.ABC):
                     return True
         return False
 
+    def _timeline_index(self) -> _TimelineIndex | None:
+        """Returns an index of the moments operating on each qubit, or None to scan moments.
+
+        Subclasses that can keep such an index consistent with their moments
+        override this to let moment queries use binary search.
+        """
+        return None
+
     def _has_op_at(self, moment_index: int, qubits: Iterable[cirq.Qid]) -> bool:
         return 0 <= moment_index < len(self.moments) and self.moments[moment_index].operates_on(
             qubits
@@ -1828,6 +1861,9 @@ class Circuit(AbstractCircuit):
         """
         self._placement_cache: _PlacementCache | None = _PlacementCache()
         self._moments: list[cirq.Moment] = []
+        # Copies share `self._moments` and the placement cache until either circuit is mutated,
+        # at which point `self._own_moments()` gives the mutated circuit its own copies.
+        self._moments_shared = False
         self._tags = tuple(tags)
 
         # Implementation note: the following cached properties are set lazily and then
@@ -1838,6 +1874,11 @@ class Circuit(AbstractCircuit):
         self._is_measurement: bool | None = None
         self._is_parameterized: bool | None = None
         self._parameter_names: AbstractSet[str] | None = None
+        # The timeline index is built on the second query after a mutation, so that
+        # code alternating single queries with mutations keeps scanning moments
+        # instead of rebuilding the index each time.
+        self._timeline: _TimelineIndex | None = None
+        self._timeline_queried = False
         if not contents:
             return
         flattened_contents = tuple(ops.flatten_to_ops_or_moments(contents))
@@ -1851,15 +1892,48 @@ class Circuit(AbstractCircuit):
             else:
                 self.append(flattened_contents, strategy=strategy)
 
-    def _mutated(self, *, preserve_placement_cache=False) -> None:
-        """Clear cached properties in response to this circuit being mutated."""
+    def _mutated(self, *, preserve_timeline_index=False) -> None:
+        """Clear cached properties in response to this circuit being mutated.
+
+        The placement cache is not cleared here: methods that change moments
+        keep it up to date through `_splice` or `_PlacementCache.add`.
+        """
         self._all_qubits = None
         self._frozen = None
         self._is_measurement = None
         self._is_parameterized = None
         self._parameter_names = None
-        if not preserve_placement_cache:
-            self._placement_cache = None
+        if not preserve_timeline_index:
+            self._timeline = None
+            self._timeline_queried = False
+
+    def _own_moments(self) -> None:
+        """Copies the moments and placement cache if they are shared with another circuit.
+
+        This must be called before `self._moments` or the placement cache is changed.
+        """
+        if self._moments_shared:
+            self._moments = self._moments[:]
+            if self._placement_cache is not None:
+                self._placement_cache = self._placement_cache.copy()
+            self._moments_shared = False
+
+    def _splice(self, start: int, stop: int, moments: Sequence[cirq.Moment]) -> None:
+        """Replaces `self._moments[start:stop]` by `moments`, updating the placement cache."""
+        self._own_moments()
+        removed = self._moments[start:stop]
+        self._moments[start:stop] = moments
+        if self._placement_cache is not None:
+            self._placement_cache.splice(self._moments, start, removed, len(moments))
+
+    def _replace_moment(self, index: int, moment: cirq.Moment) -> None:
+        """Replaces `self._moments[index]` by `moment`, updating the placement cache."""
+        self._own_moments()
+        removed = self._moments[index]
+        self._moments[index] = moment
+        if self._placement_cache is not None:
+            index = index if index >= 0 else index + len(self._moments)
+            self._placement_cache.splice(self._moments, index, [removed], 1)
 
     @classmethod
     def _from_moments(cls, moments: Iterable[cirq.Moment], tags: Sequence[Hashable]) -> Circuit:
@@ -1951,12 +2025,29 @@ class Circuit(AbstractCircuit):
             self._parameter_names = super()._parameter_names_()
         return self._parameter_names
 
+    def _timeline_index(self) -> _TimelineIndex | None:
+        if self._timeline is None:
+            if not self._timeline_queried:
+                self._timeline_queried = True
+                return super()._timeline_index()
+            self._timeline = _TimelineIndex(self._moments)
+        return self._timeline
+
     def copy(self) -> Circuit:
-        """Return a copy of this circuit."""
+        """Return a copy of this circuit.
+
+        The copy shares its moments with this circuit until either of them is
+        mutated, so copying takes constant time.
+        """
         copied_circuit = Circuit()
-        copied_circuit._moments[:] = self._moments
-        copied_circuit._placement_cache = None
+        copied_circuit._moments = self._moments
+        copied_circuit._placement_cache = self._placement_cache
+        copied_circuit._moments_shared = self._moments_shared = True
         copied_circuit._tags = self.tags
+        copied_circuit._all_qubits = self._all_qubits
+        copied_circuit._is_measurement = self._is_measurement
+        copied_circuit._is_parameterized = self._is_parameterized
+        copied_circuit._parameter_names = self._parameter_names
         return copied_circuit
 
     @overload
@@ -1975,14 +2066,39 @@ class Circuit(AbstractCircuit):
             value = list(value)
             if any(not isinstance(v, Moment) for v in value):
                 raise TypeError('Can only assign Moments into Circuits.')
-
-        self._moments[key] = value
+            start, stop, step = key.indices(len(self._moments))
+            if step == 1:
+                self._splice(start, max(start, stop), value)
+            else:
+                self._replace_all_moments(lambda moments: moments.__setitem__(key, value))
+        else:
+            self._replace_moment(key, value)
         self._mutated()
 
     def __delitem__(self, key: int | slice):
-        del self._moments[key]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._moments))
+            if step == 1:
+                self._splice(start, max(start, stop), [])
+            else:
+                self._replace_all_moments(lambda moments: moments.__delitem__(key))
+        else:
+            removed = self._moments[key]
+            index = key if key >= 0 else key + len(self._moments)
+            self._own_moments()
+            del self._moments[key]
+            if self._placement_cache is not None:
+                self._placement_cache.splice(self._moments, index, [removed], 0)
         self._mutated()
 
+    def _replace_all_moments(self, edit: Callable[[list[cirq.Moment]], None]) -> None:
+        """Applies `edit` to the list of moments, rebuilding the placement cache."""
+        self._own_moments()
+        removed = self._moments[:]
+        edit(self._moments)
+        if self._placement_cache is not None:
+            self._placement_cache.splice(self._moments, 0, removed, len(self._moments))
+
     def __iadd__(self, other):
         self.append(other)
         return self
@@ -2000,7 +2116,7 @@ class Circuit(AbstractCircuit):
             return NotImplemented
         # Auto wrap OP_TREE inputs into a circuit.
         result = self.copy()
-        result._moments[:0] = Circuit(other)._moments
+        result._splice(0, 0, Circuit(other)._moments)
         return result
 
     # Needed for numpy to handle multiplication by np.int64 correctly.
@@ -2009,14 +2125,18 @@ class Circuit(AbstractCircuit):
     def __imul__(self, repetitions: _INT_TYPE):
         if not isinstance(repetitions, (int, np.integer)):
             return NotImplemented
-        self._moments *= int(repetitions)
+        length = len(self._moments)
+        if repetitions > 0:
+            self._splice(length, length, self._moments * (int(repetitions) - 1))
+        else:
+            self._splice(0, length, [])
         self._mutated()
         return self
 
     def __mul__(self, repetitions: _INT_TYPE):
         if not isinstance(repetitions, (int, np.integer)):
             return NotImplemented
-        return Circuit(self._moments * int(repetitions), tags=self.tags)
+        return Circuit._from_moments(self._moments * int(repetitions), tags=self.tags)
 
     def __rmul__(self, repetitions: _INT_TYPE):
         if not isinstance(repetitions, (int, np.integer)):
@@ -2129,6 +2249,9 @@ class Circuit(AbstractCircuit):
         """
         if end_moment_index is None:
             end_moment_index = len(self.moments)
+        # Only use an existing index: `insert` calls this while it is mutating moments.
+        if self._timeline is not None and 0 <= end_moment_index <= len(self._moments):
+            return self._timeline.last_conflict(op, end_moment_index) + 1
         last_available = end_moment_index
         k = end_moment_index
         op_control_keys = protocols.control_keys(op)
@@ -2182,22 +2305,33 @@ class Circuit(AbstractCircuit):
         Raises:
             ValueError: Bad insertion strategy.
         """
+        self._own_moments()
         # limit index to 0..len(self._moments), also deal with indices smaller 0
         k = max(min(index if index >= 0 else len(self._moments) + index, len(self._moments)), 0)
-        if strategy != InsertStrategy.EARLIEST or k != len(self._moments):
-            self._placement_cache = None
+        # The placement cache finds where appended operations fall directly. Otherwise, moments are
+        # only inserted at or after `k`, so the cache is updated once for that suffix at the end.
+        cache = self._placement_cache
+        append_with_cache = (
+            cache is not None and strategy is InsertStrategy.EARLIEST and k == len(self._moments)
+        )
         mops = list(ops.flatten_to_ops_or_moments(moment_or_operation_tree))
-        if self._placement_cache:
-            batches = [mops]  # Any grouping would work here; this just happens to be the fastest.
-        elif strategy is InsertStrategy.NEW:
+        if append_with_cache:
+            self._append_with_placement_cache(mops)
+            self._mutated(preserve_timeline_index=True)
+            return len(self._moments)
+        self._timeline = None
+        self._timeline_queried = False
+        start = k
+        suffix = self._moments[start:] if cache is not None else []
+        placed_before_start: list[tuple[cirq.Operation, int]] = []
+        if strategy is InsertStrategy.NEW:
             batches = [[mop] for mop in mops]  # Each op goes into its own moment.
         else:
             batches = list(_group_into_moment_compatible(mops))
         for batch in batches:
             # Insert a moment if inline/earliest and _any_ op in the batch requires it.
             if (
-                not self._placement_cache
-                and not isinstance(batch[0], Moment)
+                not isinstance(batch[0], Moment)
                 and strategy in (InsertStrategy.INLINE, InsertStrategy.EARLIEST)
                 and not all(
                     (strategy is InsertStrategy.EARLIEST and self._can_add_op_at(k, op))
@@ -2211,9 +2345,7 @@ class Circuit(AbstractCircuit):
             max_p = 0
             for moment_or_op in batch:
                 # Determine Placement
-                if self._placement_cache:
-                    p = self._placement_cache.append(moment_or_op)
-                elif isinstance(moment_or_op, Moment):
+                if isinstance(moment_or_op, Moment):
                     p = k
                 elif strategy in (InsertStrategy.NEW, InsertStrategy.NEW_THEN_INLINE):
                     self._moments.insert(k, Moment())
@@ -2229,15 +2361,47 @@ class Circuit(AbstractCircuit):
                     self._moments.append(Moment(moment_or_op))
                 else:
                     self._moments[p] = self._moments[p].with_operation(moment_or_op)
+                    if p < start:
+                        placed_before_start.append((moment_or_op, p))
                 # Iterate
                 max_p = max(p, max_p)
                 if strategy is InsertStrategy.NEW_THEN_INLINE:
                     strategy = InsertStrategy.INLINE
                     k += 1
             k = max(k, max_p + 1)
-        self._mutated(preserve_placement_cache=True)
+        if cache is not None:
+            cache.splice(self._moments, start, suffix, len(self._moments) - start)
+            for op, p in placed_before_start:
+                cache.add(op, p)
+        self._mutated(preserve_timeline_index=True)
         return k
 
+    def _append_with_placement_cache(self, mops: Iterable[_MOMENT_OR_OP]) -> None:
+        """Appends moments and operations at the indices chosen by the placement cache.
+
+        The placement cache picks indices without looking at the moments, so the
+        moments that receive operations are only built once all of them are placed.
+        """
+        cache = cast(_PlacementCache, self._placement_cache)
+        builders: dict[int, MomentBuilder] = {}
+        for mop in mops:
+            p = cache.append(mop)
+            if isinstance(mop, Moment):
+                builders[p] = MomentBuilder(mop)
+            else:
+                if p not in builders:
+                    builders[p] = MomentBuilder(
+                        self._moments[p] if p < len(self._moments) else None
+                    )
+                builders[p].add(mop)
+            if self._timeline is not None:
+                self._timeline.add(mop, p)
+        for p in sorted(builders):
+            if p < len(self._moments):
+                self._moments[p] = builders[p].build()
+            else:
+                self._moments.append(builders[p].build())
+
     def insert_into_range(self, operations: cirq.OP_TREE, start: int, end: int) -> int:
         """Writes operations inline into an area of the circuit.
 
@@ -2260,18 +2424,29 @@ class Circuit(AbstractCircuit):
             raise IndexError(f'Bad insert indices: [{start}, {end})')
 
         flat_ops = list(ops.flatten_to_ops(operations))
+        self._own_moments()
 
+        builders: dict[int, MomentBuilder] = {}
         i = start
         op_index = 0
         while op_index < len(flat_ops):
             op = flat_ops[op_index]
-            while i < end and self._moments[i].operates_on(op.qubits):
+            while i < end:
+                moment: cirq.Moment | MomentBuilder = builders.get(i, self._moments[i])
+                if not moment.operates_on(op.qubits):
+                    break
                 i += 1
             if i >= end:
                 break
 
-            self._moments[i] = self._moments[i].with_operation(op)
+            if i not in builders:
+                builders[i] = MomentBuilder(self._moments[i])
+            builders[i].add(op)
+            if self._placement_cache is not None:
+                self._placement_cache.add(op, i)
             op_index += 1
+        for i, builder in builders.items():
+            self._moments[i] = builder.build()
         self._mutated()
 
         if op_index >= len(flat_ops):
@@ -2317,7 +2492,7 @@ class Circuit(AbstractCircuit):
         )
         if n_new_moments > 0:
             insert_index = min(late_frontier.values())
-            self._moments[insert_index:insert_index] = [Moment()] * n_new_moments
+            self._splice(insert_index, insert_index, [Moment()] * n_new_moments)
             self._mutated()
             for q in update_qubits:
                 if early_frontier.get(q, 0) > insert_index:
@@ -2344,6 +2519,7 @@ class Circuit(AbstractCircuit):
         """
         if len(operations) != len(insertion_indices):
             raise ValueError('operations and insertion_indices must have the same length.')
+        self._own_moments()
         self._moments += [Moment() for _ in range(1 + max(insertion_indices) - len(self))]
         self._mutated()
         moment_to_ops: dict[int, list[cirq.Operation]] = defaultdict(list)
@@ -2351,6 +2527,9 @@ class Circuit(AbstractCircuit):
             moment_to_ops[moment_index].append(operations[op_index])
         for moment_index, new_ops in moment_to_ops.items():
             self._moments[moment_index] = self._moments[moment_index].with_operations(*new_ops)
+            if self._placement_cache is not None:
+                for op in new_ops:
+                    self._placement_cache.add(op, moment_index)
 
     def insert_at_frontier(
         self, operations: cirq.OP_TREE, start: int, frontier: dict[cirq.Qid, int] | None = None
@@ -2401,15 +2580,13 @@ class Circuit(AbstractCircuit):
             ValueError: One of the operations to delete wasn't present to start with.
             IndexError: Deleted from a moment that doesn't exist.
         """
-        copy = self.copy()
+        builders: dict[int, MomentBuilder] = {}
         for i, op in removals:
-            if op not in copy._moments[i].operations:
+            builder = self._builder_at(builders, i)
+            if op not in builder:
                 raise ValueError(f"Can't remove {op} @ {i} because it doesn't exist.")
-            copy._moments[i] = Moment(
-                old_op for old_op in copy._moments[i].operations if op != old_op
-            )
-        self._moments = copy._moments
-        self._mutated()
+            builder.remove(op)
+        self._build_moments(builders)
 
     def batch_replace(
         self, replacements: Iterable[tuple[int, cirq.Operation, cirq.Operation]]
@@ -2426,15 +2603,13 @@ class Circuit(AbstractCircuit):
             ValueError: One of the operations to replace wasn't present to start with.
             IndexError: Replaced in a moment that doesn't exist.
         """
-        copy = self.copy()
+        builders: dict[int, MomentBuilder] = {}
         for i, op, new_op in replacements:
-            if op not in copy._moments[i].operations:
+            builder = self._builder_at(builders, i)
+            if op not in builder:
                 raise ValueError(f"Can't replace {op} @ {i} because it doesn't exist.")
-            copy._moments[i] = Moment(
-                old_op if old_op != op else new_op for old_op in copy._moments[i].operations
-            )
-        self._moments = copy._moments
-        self._mutated()
+            builder.replace(op, new_op)
+        self._build_moments(builders)
 
     def batch_insert_into(self, insert_intos: Iterable[tuple[int, cirq.OP_TREE]]) -> None:
         """Inserts operations into empty spaces in existing moments.
@@ -2451,10 +2626,29 @@ class Circuit(AbstractCircuit):
                 operation.
             IndexError: Inserted into a moment index that doesn't exist.
         """
-        copy = self.copy()
+        builders: dict[int, MomentBuilder] = {}
         for i, insertions in insert_intos:
-            copy._moments[i] = copy._moments[i].with_operations(insertions)
-        self._moments = copy._moments
+            builder = self._builder_at(builders, i)
+            for op in ops.flatten_to_ops(insertions):
+                builder.add(op)
+        self._build_moments(builders)
+
+    def _builder_at(self, builders: dict[int, MomentBuilder], index: int) -> MomentBuilder:
+        """Returns the builder in `builders` for the moment at `index`, adding it if needed.
+
+        Batch edits collect their changes in builders, so that the circuit is
+        only changed once all of them are known to be valid.
+        """
+        moment = self._moments[index]
+        index %= len(self._moments)
+        if index not in builders:
+            builders[index] = MomentBuilder(moment)
+        return builders[index]
+
+    def _build_moments(self, builders: dict[int, MomentBuilder]) -> None:
+        """Replaces the moments at the indices of `builders` by the moments they build."""
+        for index, builder in builders.items():
+            self._replace_moment(index, builder.build())
         self._mutated()
 
     def batch_insert(self, insertions: Iterable[tuple[int, cirq.OP_TREE]]) -> None:
@@ -2490,6 +2684,8 @@ class Circuit(AbstractCircuit):
             if next_index > insert_index:
                 shift += next_index - insert_index
         self._moments = copy._moments
+        self._placement_cache = copy._placement_cache
+        self._moments_shared = copy._moments_shared
         self._mutated()
 
     def append(
@@ -2520,7 +2716,7 @@ class Circuit(AbstractCircuit):
         qubits = frozenset(qubits)
         for k in moment_indices:
             if 0 <= k < len(self._moments):
-                self._moments[k] = self._moments[k].without_operations_touching(qubits)
+                self._replace_moment(k, self._moments[k].without_operations_touching(qubits))
         self._mutated()
 
     @property
@@ -2535,8 +2731,8 @@ class Circuit(AbstractCircuit):
         """Creates a new tagged `Circuit` with `self.tags` and `new_tags` combined."""
         if not new_tags:
             return self
-        new_circuit = Circuit(tags=self.tags + new_tags)
-        new_circuit._moments[:] = self._moments
+        new_circuit = self.copy()
+        new_circuit._tags = self.tags + new_tags
         return new_circuit
 
     def with_noise(self, noise: cirq.NOISE_MODEL_LIKE) -> cirq.Circuit:
@@ -3000,13 +3196,15 @@ def get_earliest_accommodating_moment_index(
     mop_index = last_conflict + 1
 
     # Update our dicts with data from this `mop` placement. Note `mop_index` will always be greater
-    # than the existing value for all of these, by construction.
+    # than the existing value for qubits and measurement keys, by construction. Control keys can
+    # commute past each other, so an earlier placement must not lower their greatest index.
     for qubit in mop_qubits:
         qubit_indices[qubit] = mop_index
     for key in mop_mkeys:
         mkey_indices[key] = mop_index
     for key in mop_ckeys:
-        ckey_indices[key] = mop_index
+        if ckey_indices.get(key, -1) < mop_index:
+            ckey_indices[key] = mop_index
 
     return mop_index
 
@@ -3019,10 +3217,10 @@ class _PlacementCache:
     the maximum of these. This avoids having to iterate backwards, checking
     each moment one at a time.
 
-    It is only valid for `append` operations, and if any other insert strategy
-    is used, or if any operation is added to the circuit without notifying the
-    cache, then the cache must be invalidated for the circuit or rebuilt from
-    scratch. Future improvements may ease this restriction.
+    The placements it computes are only valid for `append` operations with the
+    EARLIEST strategy, but any other change to the circuit can be reported to
+    the cache through `add` and `splice` to keep it in sync. If the circuit is
+    changed without notifying the cache, then the cache must be invalidated.
     """
 
     def __init__(self) -> None:
@@ -3058,3 +3256,183 @@ class _PlacementCache:
         )
         self._length = max(self._length, index + 1)
         return index
+
+    def copy(self) -> _PlacementCache:
+        """Returns an independent copy of this cache."""
+        copied = _PlacementCache()
+        copied._qubit_indices = self._qubit_indices.copy()
+        copied._mkey_indices = self._mkey_indices.copy()
+        copied._ckey_indices = self._ckey_indices.copy()
+        copied._length = self._length
+        return copied
+
+    def add(self, moment_or_operation: _MOMENT_OR_OP, index: int) -> None:
+        """Records a moment or operation placed into the existing or appended moment `index`.
+
+        Args:
+            moment_or_operation: The moment or operation that was placed.
+            index: The index of the moment it was placed into.
+        """
+        for table, keys_of in self._tables():
+            for key in keys_of(moment_or_operation):
+                if table.get(key, -1) < index:
+                    table[key] = index
+        self._length = max(self._length, index + 1)
+
+    def splice(
+        self, moments: Sequence[cirq.Moment], start: int, removed: Sequence[cirq.Moment], count: int
+    ) -> None:
+        """Records that the `removed` moments at `start` were replaced by `count` moments.
+
+        Indices after the replaced range are shifted. Keys whose greatest moment
+        was removed, and that the replacement moments do not contain, are looked
+        up again by searching backwards from `start`.
+
+        Args:
+            moments: The moments of the circuit after the replacement.
+            start: The index of the first replaced moment.
+            removed: The moments that were replaced.
+            count: The number of moments that replaced them, now at
+                `moments[start:start + count]`.
+        """
+        end = start + len(removed)
+        shift = count - len(removed)
+        tables = self._tables()
+        stale: list[set[Any]] = []
+        for table, keys_of in tables:
+            table_stale = {
+                key
+                for moment in removed
+                for key in keys_of(moment)
+                if start <= table.get(key, -1) < end
+            }
+            if shift:
+                for key, index in table.items():
+                    if index >= end:
+                        table[key] = index + shift
+            for index in range(start, start + count):
+                for key in keys_of(moments[index]):
+                    if key in table_stale or table.get(key, -1) < index:
+                        table[key] = index
+                        table_stale.discard(key)
+            stale.append(table_stale)
+        index = start
+        while index > 0 and any(stale):
+            index -= 1
+            for (table, keys_of), table_stale in zip(tables, stale):
+                if table_stale:
+                    found = table_stale.intersection(keys_of(moments[index]))
+                    for key in found:
+                        table[key] = index
+                    table_stale -= found
+        for (table, _), table_stale in zip(tables, stale):
+            for key in table_stale:
+                del table[key]
+        self._length = len(moments)
+
+    def _tables(self) -> tuple[tuple[dict[Any, int], Callable[[Any], Iterable[Any]]], ...]:
+        return (
+            (self._qubit_indices, _qubits_of),
+            (self._mkey_indices, protocols.measurement_key_objs),
+            (self._ckey_indices, protocols.control_keys),
+        )
+
+
+def _qubits_of(moment_or_operation: _MOMENT_OR_OP) -> Iterable[cirq.Qid]:
+    return moment_or_operation.qubits
+
+
+class _TimelineIndex:
+    """Maintains the sorted moment indices that touch each qubit and cbit.
+
+    For every qubit, measurement key, and control key, we keep the sorted list
+    of indices of the moments that act on it, measure it, or are controlled by
+    it, respectively. This lets moment queries binary search these lists in
+    O(log d) time for a circuit of depth d, instead of iterating over moments.
+
+    The index must be rebuilt from scratch if the moments of the circuit are
+    changed, except when operations are added to the circuit through `add`.
+    """
+
+    def __init__(self, moments: Iterable[cirq.Moment] = ()) -> None:
+        # These are dicts from the qubit/key to the sorted moment indices that have it.
+        self._qubit_indices: dict[cirq.Qid, list[int]] = defaultdict(list)
+        self._mkey_indices: dict[cirq.MeasurementKey, list[int]] = defaultdict(list)
+        self._ckey_indices: dict[cirq.MeasurementKey, list[int]] = defaultdict(list)
+        for index, moment in enumerate(moments):
+            for qubit in moment.qubits:
+                self._qubit_indices[qubit].append(index)
+            for key in moment._measurement_key_objs_():
+                self._mkey_indices[key].append(index)
+            for key in moment._control_keys_():
+                self._ckey_indices[key].append(index)
+
+    def add(self, moment_or_operation: _MOMENT_OR_OP, index: int) -> None:
+        """Records a moment or operation placed into the moment at `index`.
+
+        The indices of the existing moments must not change, i.e. the moment
+        or operation must be placed into an existing moment or appended.
+        """
+        for qubit in moment_or_operation.qubits:
+            _insort_unique(self._qubit_indices[qubit], index)
+        for key in protocols.measurement_key_objs(moment_or_operation):
+            _insort_unique(self._mkey_indices[key], index)
+        for key in protocols.control_keys(moment_or_operation):
+            _insort_unique(self._ckey_indices[key], index)
+
+    def next_index(self, qubits: Iterable[cirq.Qid], start: int, end: int) -> int | None:
+        """Returns the first index in [start, end) of a moment acting on any of `qubits`."""
+        result = None
+        for qubit in qubits:
+            indices = self._qubit_indices.get(qubit)
+            if indices:
+                i = bisect.bisect_left(indices, start)
+                if (
+                    i < len(indices)
+                    and indices[i] < end
+                    and (result is None or indices[i] < result)
+                ):
+                    result = indices[i]
+        return result
+
+    def prev_index(self, qubits: Iterable[cirq.Qid], start: int, end: int) -> int | None:
+        """Returns the last index in [start, end) of a moment acting on any of `qubits`."""
+        result = None
+        for qubit in qubits:
+            indices = self._qubit_indices.get(qubit)
+            if indices:
+                i = bisect.bisect_left(indices, end) - 1
+                if i >= 0 and indices[i] >= start and (result is None or indices[i] > result):
+                    result = indices[i]
+        return result
+
+    def indices_between(self, qubit: cirq.Qid, start: int, end: int) -> list[int]:
+        """Returns the indices in [start, end) of the moments acting on `qubit`."""
+        indices = self._qubit_indices.get(qubit, [])
+        return indices[bisect.bisect_left(indices, start) : bisect.bisect_left(indices, end)]
+
+    def last_conflict(self, op: cirq.Operation, end: int) -> int:
+        """Returns the last index before `end` of a moment that `op` cannot move past.
+
+        Mirrors the conflicts checked by `get_earliest_accommodating_moment_index`,
+        returning -1 if there is no such moment.
+        """
+        op_mkeys = protocols.measurement_key_objs(op)
+        op_ckeys = protocols.control_keys(op)
+        lists = [self._qubit_indices.get(qubit) for qubit in op.qubits]
+        lists += [self._mkey_indices.get(key) for key in op_mkeys]
+        lists += [self._ckey_indices.get(key) for key in op_mkeys]
+        lists += [self._mkey_indices.get(key) for key in op_ckeys]
+        last_conflict = -1
+        for indices in lists:
+            if indices:
+                i = bisect.bisect_left(indices, end) - 1
+                if i >= 0:
+                    last_conflict = max(last_conflict, indices[i])
+        return last_conflict
+
+
+def _insort_unique(indices: list[int], index: int) -> None:
+    i = bisect.bisect_left(indices, index)
+    if i == len(indices) or indices[i] != index:
+        indices.insert(i, index)
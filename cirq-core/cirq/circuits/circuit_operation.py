@@ -436,6 +436,8 @@ class CircuitOperation(ops.Operation):
         return self.mapped_circuit(deep=False).all_operations()
 
     def _act_on_(self, sim_state: cirq.SimulationStateBase) -> bool:
+        if self._act_on_clifford_tableau(sim_state):
+            return True
         mapped_repeat_until = self._mapped_repeat_until
         if mapped_repeat_until:
             circuit = self._mapped_single_loop()
@@ -449,6 +451,26 @@ class CircuitOperation(ops.Operation):
                 protocols.act_on(op, sim_state)
         return True
 
+    def _act_on_clifford_tableau(self, sim_state: cirq.SimulationStateBase) -> bool:
+        """Applies the cached tableau of a Clifford circuit to a tableau simulation state."""
+        from cirq.sim.clifford import CliffordTableauSimulationState
+
+        if (
+            not isinstance(sim_state, CliffordTableauSimulationState)
+            or self.repeat_until
+            or not isinstance(self.repetitions, INT_CLASSES)
+            or self.repetitions < 0
+        ):
+            return False
+        qubits = sorted(self.circuit.all_qubits())
+        tableau = self.circuit._clifford_tableau(tuple(qubits))
+        if tableau is None:
+            return False
+        mapped_qubits = [self.qubit_map.get(q, q) for q in qubits]
+        for _ in range(self.repetitions):
+            sim_state.apply_clifford_tableau(tableau, mapped_qubits)
+        return True
+
     # Methods for string representation of the operation.
 
     def __repr__(self):
@@ -902,6 +902,45 @@ def test_decompose_loops_with_measurements_use_rep_ids() -> None:
     assert cirq.Circuit(cirq.decompose_once(op)) == expected_circuit
 
 
+def _act_on_tableau(operations, qubits):
+    state = cirq.CliffordTableauSimulationState(
+        tableau=cirq.CliffordTableau(num_qubits=len(qubits)),
+        qubits=qubits,
+        prng=np.random.RandomState(1),
+    )
+    for op in operations:
+        cirq.act_on(op, state)
+    return state
+
+
+def test_act_on_clifford_tableau() -> None:
+    a, b, c, d = cirq.LineQubit.range(4)
+    circuit = cirq.FrozenCircuit(cirq.H(a), cirq.CNOT(a, b), cirq.S(b))
+    qubits = [a, b, c, d]
+    for op in [
+        cirq.CircuitOperation(circuit),
+        cirq.CircuitOperation(circuit, qubit_map={a: d, b: c}),
+        cirq.CircuitOperation(circuit).repeat(3),
+        cirq.CircuitOperation(circuit).repeat(0),
+        cirq.CircuitOperation(circuit).repeat(-1),
+    ]:
+        with mock.patch.object(
+            cirq.CircuitOperation, '_decompose_', wraps=op._decompose_
+        ) as decompose:
+            state = _act_on_tableau([cirq.H(c), op], qubits)
+        assert decompose.call_count == (op.repetitions < 0)
+        expected = _act_on_tableau([cirq.H(c), *op.mapped_circuit().all_operations()], qubits)
+        assert state.tableau == expected.tableau
+
+
+def test_act_on_clifford_tableau_with_measurements() -> None:
+    a, b = cirq.LineQubit.range(2)
+    op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.X(a), cirq.measure(a, key='m')))
+    state = _act_on_tableau([op, cirq.X(b).with_classical_controls('m')], [a, b])
+    assert state.log_of_measurement_results == {'m': [1]}
+    assert state.tableau == _act_on_tableau([cirq.X(a), cirq.X(b)], [a, b]).tableau
+
+
 def test_decompose_nested() -> None:
     a, b, c, d = cirq.LineQubit.range(4)
     exp1 = sympy.Symbol('exp1')
@@ -27,6 +27,7 @@ import sympy
 
 import cirq
 from cirq import circuits, ops
+from cirq.circuits.circuit import _TimelineIndex
 from cirq.testing.devices import ValidatingTestDevice
 
 
@@ -207,6 +208,14 @@ def test_append_control_key() -> None:
     c.append(cirq.X(q2).with_classical_controls('b'))
     assert len(c) == 1
 
+    # A control key placed early must not hide a later one from a new measurement of the key.
+    c = cirq.Circuit()
+    c.append([cirq.measure(q0, key='a'), cirq.H(q1), cirq.H(q1)])
+    c.append(cirq.X(q1).with_classical_controls('a'))
+    c.append(cirq.X(q2).with_classical_controls('a'))
+    c.append(cirq.measure(q0, key='a'))
+    assert c.operation_at(q0, 3) == cirq.measure(q0, key='a')
+
 
 def test_append_multiple() -> None:
     a = cirq.NamedQubit('a')
@@ -1226,6 +1235,130 @@ def test_earliest_available_moment() -> None:
     )
 
 
+def _random_timeline_circuit(seed: int) -> cirq.Circuit:
+    prng = np.random.RandomState(seed)
+    q = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit()
+    for _ in range(60):
+        r = prng.randint(5)
+        qubits = [q[i] for i in prng.choice(5, size=1 + prng.randint(2), replace=False)]
+        if r == 0:
+            circuit.append(cirq.measure(*qubits, key=f'm{prng.randint(3)}'))
+        elif r == 1:
+            circuit.append(cirq.X(qubits[0]).with_classical_controls(f'm{prng.randint(3)}'))
+        elif r == 2:
+            circuit.insert(prng.randint(len(circuit) + 1), cirq.H.on_each(*qubits))
+        else:
+            circuit.append(cirq.CZ(*q[:2]) if len(qubits) == 1 else cirq.CZ(*qubits))
+    return circuit
+
+
+def _timeline_lists(timeline) -> tuple[dict, dict, dict]:
+    return (
+        dict(timeline._qubit_indices),
+        dict(timeline._mkey_indices),
+        dict(timeline._ckey_indices),
+    )
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_timeline_index_queries_match_scan(seed, monkeypatch) -> None:
+    scanned = _random_timeline_circuit(seed)
+    monkeypatch.setattr(scanned, '_timeline_index', lambda: None)
+    indexed = scanned.freeze()
+    assert indexed._timeline_index() is indexed._timeline_index()
+    qubits = sorted(scanned.all_qubits()) + [cirq.LineQubit(10)]
+    n = len(scanned)
+    for start in range(-2, n + 3):
+        for max_distance in [None, 0, 1, 3, 10**100]:
+            for qs in [qubits[:1], qubits[1:3], qubits[-2:]]:
+                assert indexed.next_moment_operating_on(
+                    qs, start, max_distance
+                ) == scanned.next_moment_operating_on(qs, start, max_distance)
+                assert indexed.prev_moment_operating_on(
+                    qs, start, max_distance
+                ) == scanned.prev_moment_operating_on(qs, start, max_distance)
+        assert indexed.next_moments_operating_on(
+            qubits, start
+        ) == scanned.next_moments_operating_on(qubits, start)
+        start_frontier = {q: start + i for i, q in enumerate(qubits[:3])}
+        end_frontier = {q: start + 2 * i + 5 for i, q in enumerate(qubits[1:4])}
+        for omit in [False, True]:
+            assert indexed.findall_operations_between(
+                start_frontier, end_frontier, omit
+            ) == scanned.findall_operations_between(start_frontier, end_frontier, omit)
+        assert indexed.reachable_frontier_from(start_frontier) == scanned.reachable_frontier_from(
+            start_frontier
+        )
+    assert indexed.are_all_measurements_terminal() == scanned.are_all_measurements_terminal()
+    assert indexed.are_any_measurements_terminal() == scanned.are_any_measurements_terminal()
+
+    circuit = indexed.unfreeze()
+    circuit.next_moment_operating_on(qubits)
+    circuit.next_moment_operating_on(qubits)
+    assert circuit._timeline is not None
+    q0, q1 = qubits[:2]
+    test_ops = [
+        cirq.X(q0),
+        cirq.CZ(q0, q1),
+        cirq.measure(q1, key='m0'),
+        cirq.measure(q0, key='new'),
+        cirq.Y(q0).with_classical_controls('m1'),
+    ]
+    for op in test_ops:
+        for end in [None, 0, 1, n // 2, n]:
+            assert circuit.earliest_available_moment(
+                op, end_moment_index=end
+            ) == scanned.earliest_available_moment(op, end_moment_index=end)
+
+
+def test_circuit_timeline_index_is_lazy_and_invalidated() -> None:
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(cirq.H(a), cirq.CNOT(a, b), cirq.H(a))
+
+    # The first query after a mutation scans the moments.
+    assert c.next_moment_operating_on([b]) == 1
+    assert c._timeline is None
+    assert c.prev_moment_operating_on([b]) == 1
+    timeline = c._timeline
+    assert timeline is not None
+    assert c._timeline_index() is timeline
+
+    c[1:2] = []
+    assert c._timeline is None
+    assert c.next_moment_operating_on([b]) is None
+    assert c.next_moment_operating_on([b]) is None
+
+    c.insert(0, cirq.X(b))
+    assert c._timeline is None
+    assert c.next_moment_operating_on([b]) == 0
+
+
+def test_circuit_timeline_index_updated_by_append() -> None:
+    q = cirq.LineQubit.range(3)
+    c = cirq.Circuit(cirq.H.on_each(*q), cirq.measure(q[0], key='a'))
+    c.next_moment_operating_on(q)
+    c.next_moment_operating_on(q)
+    timeline = c._timeline
+    assert timeline is not None
+
+    c.append(
+        [
+            cirq.CZ(q[1], q[2]),
+            cirq.X(q[1]).with_classical_controls('a'),
+            cirq.X(q[2]).with_classical_controls('a'),
+            cirq.Moment(cirq.measure(q[2], key='b')),
+            cirq.Z(q[0]).with_classical_controls('b'),
+        ]
+    )
+    assert c._timeline is timeline
+    assert _timeline_lists(timeline) == _timeline_lists(_TimelineIndex(c.moments))
+    assert c.earliest_available_moment(cirq.measure(q[0], key='b')) == 5
+
+    c.append(cirq.X(q[0]), strategy=cirq.InsertStrategy.NEW)
+    assert c._timeline is None
+
+
 @pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
 def test_operation_at(circuit_cls) -> None:
     a = cirq.NamedQubit('a')
@@ -4899,6 +5032,110 @@ def test_create_speed() -> None:
     assert duration < 4
 
 
+def _placement_cache_state(cache) -> tuple:
+    return (cache._qubit_indices, cache._mkey_indices, cache._ckey_indices, cache._length)
+
+
+def _assert_placement_cache_in_sync(circuit: cirq.Circuit) -> None:
+    expected = circuits.circuit._PlacementCache()
+    for moment in circuit:
+        expected.append(moment)
+    assert _placement_cache_state(circuit._placement_cache) == _placement_cache_state(expected)
+
+
+def _random_placement_op(prng: np.random.RandomState) -> cirq.Operation:
+    q = cirq.LineQubit.range(4)
+    a, b = (q[i] for i in prng.choice(4, size=2, replace=False))
+    r = prng.randint(4)
+    if r == 0:
+        return cirq.measure(a, key=f'm{prng.randint(2)}')
+    if r == 1:
+        return cirq.X(a).with_classical_controls(f'm{prng.randint(2)}')
+    return cirq.CZ(a, b) if r == 2 else cirq.H(a)
+
+
+def _random_placement_mutation(circuit: cirq.Circuit, prng: np.random.RandomState) -> None:
+    n = len(circuit)
+    op = _random_placement_op(prng)
+    r = prng.randint(14)
+    if r == 0:
+        circuit.insert(
+            prng.randint(-1, n + 2),
+            [op, _random_placement_op(prng)],
+            prng.choice(
+                [
+                    cirq.InsertStrategy.EARLIEST,
+                    cirq.InsertStrategy.NEW,
+                    cirq.InsertStrategy.INLINE,
+                    cirq.InsertStrategy.NEW_THEN_INLINE,
+                ]
+            ),
+        )
+    elif r == 1:
+        circuit.insert(prng.randint(n + 1), cirq.Moment(op))
+    elif r == 2 and n:
+        circuit[prng.randint(-n, n)] = cirq.Moment(op)
+    elif r == 3:
+        start = prng.randint(n + 1)
+        circuit[start : start + prng.randint(3)] = [cirq.Moment(op)] * prng.randint(3)
+    elif r == 4 and n > 2:
+        circuit[::2] = [cirq.Moment(op)] * len(range(0, n, 2))
+    elif r == 5 and n:
+        del circuit[prng.randint(-n, n)]
+    elif r == 6:
+        start = prng.randint(n + 1)
+        del circuit[start : start + prng.randint(3)]
+    elif r == 7 and n > 2:
+        del circuit[1::3]
+    elif r == 8:
+        found = list(circuit.findall_operations(lambda _: True))
+        if found:
+            i, old_op = found[prng.randint(len(found))]
+            i -= n * prng.randint(2)
+            if prng.randint(2):
+                circuit.batch_remove([(i, old_op)])
+            else:
+                circuit.batch_replace([(i, old_op, cirq.I.on_each(*old_op.qubits)[0])])
+    elif r == 9:
+        circuit.batch_insert([(prng.randint(n + 1), op), (prng.randint(n + 1), op)])
+    elif r == 10:
+        free = [i for i in range(n) if not circuit[i].operates_on(op.qubits)]
+        if free:
+            circuit.batch_insert_into([(free[-1] - n, op)])
+    elif r == 11:
+        circuit.clear_operations_touching(op.qubits[:1], range(prng.randint(n + 1)))
+    elif r == 12:
+        start = prng.randint(n + 1)
+        circuit.insert_into_range([op, _random_placement_op(prng)], start, n)
+    elif r == 13:
+        circuit.insert_at_frontier(op, n // 2)
+    circuit.append(_random_placement_op(prng))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_placement_cache_kept_in_sync_by_mutations(seed) -> None:
+    prng = np.random.RandomState(seed)
+    circuit = cirq.Circuit(_random_placement_op(prng) for _ in range(10))
+    # A circuit made of moments has no cache, so its appends scan moments instead.
+    uncached = cirq.Circuit(*circuit.moments)
+    assert uncached._placement_cache is None
+    for i in range(60):
+        state = prng.get_state()
+        _random_placement_mutation(circuit, prng)
+        prng.set_state(state)
+        _random_placement_mutation(uncached, prng)
+        assert circuit == uncached
+        _assert_placement_cache_in_sync(circuit)
+
+    circuit *= 2
+    _assert_placement_cache_in_sync(circuit)
+    circuit = cirq.X(cirq.LineQubit(5)) + circuit
+    _assert_placement_cache_in_sync(circuit)
+    circuit *= 0
+    _assert_placement_cache_in_sync(circuit)
+    assert not circuit._placement_cache._qubit_indices
+
+
 def test_append_speed() -> None:
     # Previously this took ~17s to run. Now it should take ~150ms. However the coverage test can
     # run this slowly, so allowing 5 sec to account for things like that. Feel free to increase the
@@ -4921,6 +5158,109 @@ def test_append_speed() -> None:
     assert duration < 5
 
 
+def test_append_speed_after_insert() -> None:
+    # Inserting used to drop the placement cache, so that every later append searched backwards
+    # from the end of the circuit, which took ~40s here. As in `test_append_speed`, the 5 sec
+    # bound leaves room for slow coverage runs.
+    moments = 10000
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(cirq.X(a) for _ in range(moments))
+    t = time.perf_counter()
+    c.insert(0, cirq.Y(a), strategy=cirq.InsertStrategy.NEW)
+    for _ in range(moments):
+        c.append(cirq.X(b))
+    duration = time.perf_counter() - t
+    assert len(c) == moments + 1
+    assert duration < 5
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_copies_share_moments_until_mutated(seed) -> None:
+    prng = np.random.RandomState(seed)
+    circuit = cirq.Circuit(_random_placement_op(prng) for _ in range(10))
+    snapshots = []
+    for _ in range(40):
+        copy = circuit.copy()
+        assert copy == circuit
+        assert copy._moments is circuit._moments
+        if prng.randint(2):
+            circuit, copy = copy, circuit
+        snapshots.append((copy, list(copy.moments)))
+        _random_placement_mutation(circuit, prng)
+        assert circuit._moments is not copy._moments
+        _assert_placement_cache_in_sync(circuit)
+    for copy, moments in snapshots:
+        assert copy.moments == moments
+        _assert_placement_cache_in_sync(copy)
+
+
+def test_copy_keeps_cached_properties() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a) ** sympy.Symbol('t'), cirq.measure(b))
+    all_qubits = circuit.all_qubits()
+    copy = circuit.copy()
+    assert copy.all_qubits() is all_qubits
+    assert cirq.is_parameterized(copy)
+    assert cirq.is_measurement(copy)
+    copy.append(cirq.X(cirq.LineQubit(2)))
+    assert copy.all_qubits() == {*all_qubits, cirq.LineQubit(2)}
+    assert circuit.all_qubits() is all_qubits
+
+
+def test_with_tags_shares_moments() -> None:
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(a), cirq.X(a))
+    tagged = circuit.with_tags('t')
+    assert tagged._moments is circuit._moments
+    # The tagged circuit used to get an empty placement cache, which placed this at moment 0.
+    tagged.append(cirq.Y(a))
+    assert tagged == cirq.Circuit(cirq.X(a), cirq.X(a), cirq.Y(a), tags=('t',))
+    assert circuit == cirq.Circuit(cirq.X(a), cirq.X(a))
+
+
+def test_failed_batch_edit_keeps_shared_moments() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a), cirq.Y(b))
+    copy = circuit.copy()
+    with pytest.raises(ValueError):
+        circuit.batch_remove([(0, cirq.X(a)), (0, cirq.Z(a))])
+    assert circuit._moments is copy._moments
+    circuit.batch_remove([(0, cirq.X(a))])
+    assert circuit == cirq.Circuit(cirq.Moment(cirq.Y(b)))
+    assert copy == cirq.Circuit(cirq.X(a), cirq.Y(b))
+
+
+def test_append_into_appended_moment() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a))
+    circuit.append(cirq.Moment(cirq.Y(b)).with_tags('tag'))
+    assert circuit[1].tags == ('tag',)
+    # Adding operations to a moment drops its tags, as with `cirq.Moment.with_operation`.
+    circuit.append([cirq.Moment(cirq.Y(b)).with_tags('tag'), cirq.Z(a), cirq.Z(a)])
+    assert circuit == cirq.Circuit(
+        cirq.Moment(cirq.X(a)), cirq.Moment(cirq.Y(b), cirq.Z(a)), cirq.Moment(cirq.Y(b), cirq.Z(a))
+    )
+    assert [moment.tags for moment in circuit] == [(), (), ()]
+
+
+def test_batch_edits_of_wide_moments_speed() -> None:
+    # Each edit used to rebuild the whole moment, which took ~25s here. As in `test_append_speed`,
+    # the 5 sec bound leaves room for slow coverage runs.
+    qubits = cirq.LineQubit.range(4000)
+    circuit = cirq.Circuit(cirq.Moment(cirq.X(q) for q in qubits), cirq.Moment())
+    t = time.perf_counter()
+    circuit.batch_remove([(0, cirq.X(q)) for q in qubits[::2]])
+    circuit.batch_replace([(-2, cirq.X(q), cirq.Y(q)) for q in qubits[1::2]])
+    circuit.batch_insert_into([(1, cirq.Z(q)) for q in qubits])
+    circuit.insert_into_range([cirq.H(q) for q in qubits[::2]], 0, 1)
+    duration = time.perf_counter() - t
+    assert circuit == cirq.Circuit(
+        cirq.Moment(cirq.H(q) if i % 2 == 0 else cirq.Y(q) for i, q in enumerate(qubits)),
+        cirq.Moment(cirq.Z(q) for q in qubits),
+    )
+    assert duration < 5
+
+
 def test_tagged_circuits() -> None:
     q = cirq.LineQubit(0)
     ops = [cirq.X(q), cirq.H(q)]
@@ -20,13 +20,14 @@ from functools import cached_property
 from types import NotImplementedType
 from typing import AbstractSet, Hashable, Iterable, Iterator, Sequence, TYPE_CHECKING
 
-from cirq import _compat, protocols
+import numpy as np
+
+from cirq import _compat, ops, protocols
 from cirq.circuits import AbstractCircuit, Alignment, Circuit
+from cirq.circuits.circuit import _TimelineIndex
 from cirq.circuits.insert_strategy import InsertStrategy
 
 if TYPE_CHECKING:
-    import numpy as np
-
     import cirq
 
 
@@ -138,6 +139,10 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
     def all_qubits(self) -> frozenset[cirq.Qid]:
         return super().all_qubits()
 
+    @_compat.cached_method
+    def _timeline_index(self) -> _TimelineIndex:
+        return _TimelineIndex(self.moments)
+
     @cached_property
     def _all_operations(self) -> tuple[cirq.Operation, ...]:
         return tuple(super().all_operations())
@@ -178,6 +183,130 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
     def _measurement_key_names_(self) -> frozenset[str]:
         return self.all_measurement_key_names()
 
+    def clifford_tableau(
+        self, qubit_order: cirq.QubitOrderOrList = ops.QubitOrder.DEFAULT
+    ) -> cirq.CliffordTableau:
+        """Returns the Clifford tableau of a circuit of unitary Clifford operations.
+
+        The tableau is computed once per qubit order and cached on the circuit, so that
+        simulators can apply a circuit to many states, or repeat it, by applying a single
+        tableau. For example, the stabilizer simulators apply the cached tableau of the
+        circuit of a `cirq.CircuitOperation`.
+
+        Args:
+            qubit_order: Determines how qubits are ordered in the tableau.
+
+        Returns:
+            The CliffordTableau of the circuit.
+
+        Raises:
+            ValueError: If the circuit has operations that are not unitary Clifford
+                operations, or if it is parameterized.
+        """
+        qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(self.all_qubits())
+        tableau = self._clifford_tableau(tuple(qubits))
+        if tableau is None:
+            raise ValueError(f'Not a circuit of unitary Clifford operations: {self!r}')
+        return tableau.copy()
+
+    @_compat.cached_method
+    def _clifford_tableau(self, qubits: tuple[cirq.Qid, ...]) -> cirq.CliffordTableau | None:
+        """The Clifford tableau of the circuit, or None if it is not a Clifford circuit."""
+        from cirq.qis import CliffordTableau
+        from cirq.sim.clifford import CliffordTableauSimulationState
+
+        if self._is_parameterized_() or not all(
+            protocols.has_unitary(op) and protocols.has_stabilizer_effect(op)
+            for op in self.all_operations()
+        ):
+            return None
+        state = CliffordTableauSimulationState(CliffordTableau(len(qubits)), qubits=qubits)
+        try:
+            for op in self.all_operations():
+                protocols.act_on(op, state)
+        except TypeError:
+            return None
+        return state.tableau
+
+    @_compat.cached_method
+    def _fuse_unitaries(self, max_qubits: int) -> cirq.FrozenCircuit:
+        """Merges connected components of unitaries on at most `max_qubits` qubits.
+
+        Each component of two or more operations is replaced by a `cirq.MatrixGate`, so that
+        simulators apply it in one pass over the state. Single operations are kept, as they
+        usually have faster specialized implementations. Cached for use by simulators.
+        """
+        from cirq.ops import MatrixGate
+        from cirq.transformers import merge_k_qubit_unitaries
+
+        def rewriter(circuit_op: cirq.CircuitOperation) -> cirq.Operation:
+            operations = circuit_op.circuit._all_operations
+            if len(operations) == 1:
+                return operations[0]
+            # Simulators apply matrices fastest when the qubits are in the order of the state.
+            qubits = sorted(circuit_op.qubits)
+            matrix = circuit_op.mapped_circuit().unitary(qubit_order=qubits)
+            return MatrixGate(matrix, qid_shape=protocols.qid_shape(qubits)).on(*qubits)
+
+        return merge_k_qubit_unitaries(self, k=max_qubits, rewriter=rewriter).freeze()
+
+    @_compat.cached_method
+    def _fuse_diagonal_unitaries(self, max_qubits: int) -> cirq.FrozenCircuit:
+        """Fuses diagonal gates that are not separated by other operations on their qubits.
+
+        Diagonal gates commute with each other, so every group of them acting on at most
+        `max_qubits` qubits, with no other operation on these qubits in between, is replaced by a
+        single `cirq.DiagonalGate`. Simulators multiply the state by the phases of the fused gate
+        in one pass. Cached for use by simulators.
+        """
+        from cirq import linalg
+        from cirq.ops import DiagonalGate
+
+        operations: list[cirq.Operation] = []
+        # The open groups of diagonal gates by id, with the qubits they act on, and the open group
+        # of each qubit. A group is closed when another operation acts on one of its qubits.
+        groups: dict[int, tuple[list[cirq.Operation], set[cirq.Qid]]] = {}
+        group_of: dict[cirq.Qid, int] = {}
+
+        def close(group_id: int) -> None:
+            group, group_qubits = groups.pop(group_id)
+            for q in group_qubits:
+                del group_of[q]
+            if len(group) == 1:
+                operations.append(group[0])
+                return
+            qubits = sorted(group_qubits)
+            phases = np.ones((2,) * len(qubits), dtype=np.complex128)
+            for op in group:
+                linalg.targeted_diagonal_multiply(
+                    protocols.unitary_diagonal(op), phases, [qubits.index(q) for q in op.qubits]
+                )
+            operations.append(DiagonalGate(list(np.angle(phases).ravel())).on(*qubits))
+
+        for i, op in enumerate(self.all_operations()):
+            touched = sorted({group_of[q] for q in op.qubits if q in group_of})
+            qubits = set(op.qubits).union(*(groups[group_id][1] for group_id in touched))
+            if (
+                len(op.qubits) > max_qubits
+                or any(q.dimension != 2 for q in op.qubits)
+                or protocols.unitary_diagonal(op, None) is None
+            ):
+                for group_id in touched:
+                    close(group_id)
+                operations.append(op)
+                continue
+            if len(qubits) > max_qubits:
+                for group_id in touched:
+                    close(group_id)
+                touched, qubits = [], set(op.qubits)
+            group = [op for group_id in touched for op in groups.pop(group_id)[0]] + [op]
+            groups[i] = (group, qubits)
+            for q in qubits:
+                group_of[q] = i
+        for group_id in list(groups):
+            close(group_id)
+        return FrozenCircuit(operations, tags=self.tags)
+
     def __add__(self, other) -> cirq.FrozenCircuit:
         return (self.unfreeze() + other).freeze()
 
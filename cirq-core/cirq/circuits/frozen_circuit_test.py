@@ -18,6 +18,7 @@ Behavior shared with Circuit is tested with parameters in circuit_test.py.
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 import sympy
 
@@ -142,3 +143,138 @@ def test_tagged_circuits() -> None:
     assert (
         circuit2.concat_ragged(tagged_circuit).tags == ()
     )  # We only preserve the tags for the first one
+
+
+def test_clifford_tableau() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    operations = [cirq.H(a), cirq.CNOT(a, b), cirq.S(c), cirq.CZ(b, c), cirq.Y(a)]
+    circuit = cirq.FrozenCircuit(operations)
+    expected = cirq.CliffordGate.from_op_list(operations, [a, b, c]).clifford_tableau
+    tableau = circuit.clifford_tableau()
+    assert tableau == expected
+    tableau.apply_x(0)
+    assert circuit.clifford_tableau() == expected
+    assert circuit._clifford_tableau((a, b, c)) is circuit._clifford_tableau((a, b, c))
+    assert circuit.clifford_tableau([c, b, a]) == (
+        cirq.CliffordGate.from_op_list(operations, [c, b, a]).clifford_tableau
+    )
+
+    nested = cirq.FrozenCircuit(cirq.CircuitOperation(circuit).repeat(2), cirq.X(c))
+    assert (
+        nested.clifford_tableau()
+        == cirq.CliffordGate.from_op_list(operations * 2 + [cirq.X(c)], [a, b, c]).clifford_tableau
+    )
+
+
+def test_clifford_tableau_of_non_clifford_circuits() -> None:
+    class BadCliffordGate(cirq.testing.TwoQubitGate):
+        def _has_stabilizer_effect_(self):
+            return True
+
+        def _unitary_(self):
+            return np.eye(4)
+
+    q = cirq.LineQubit.range(2)
+    for circuit in [
+        cirq.FrozenCircuit(cirq.T(q[0])),
+        cirq.FrozenCircuit(cirq.H(q[0]), cirq.measure(q[0])),
+        cirq.FrozenCircuit(cirq.X(q[0]) ** sympy.Symbol('t')),
+        cirq.FrozenCircuit(BadCliffordGate().on(*q)),
+    ]:
+        with pytest.raises(ValueError, match='Not a circuit of unitary Clifford operations'):
+            _ = circuit.clifford_tableau()
+
+
+def test_fuse_unitaries() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.FrozenCircuit(
+        cirq.H(a),
+        cirq.CZ(b, a),
+        cirq.T(b),
+        cirq.X(c),
+        cirq.measure(a, key='m'),
+        cirq.X(b).with_classical_controls('m'),
+        cirq.Y(c),
+    )
+    fused = circuit._fuse_unitaries(2)
+    assert circuit._fuse_unitaries(2) is fused
+    assert fused[2:] == cirq.FrozenCircuit(
+        cirq.measure(a, key='m'), cirq.X(b).with_classical_controls('m')
+    )
+    ((fused_c,),) = (m.operations for m in fused[:1])
+    ((fused_ab,),) = (m.operations for m in fused[1:2])
+    assert fused_ab.qubits == (a, b)
+    np.testing.assert_allclose(
+        cirq.unitary(fused_ab),
+        cirq.Circuit(cirq.H(a), cirq.CZ(b, a), cirq.T(b)).unitary(qubit_order=[a, b]),
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(
+        cirq.unitary(fused_c), cirq.unitary(cirq.Y) @ cirq.unitary(cirq.X), atol=1e-8
+    )
+
+
+def test_fuse_unitaries_keeps_single_operations() -> None:
+    q0 = cirq.LineQid(0, dimension=3)
+    q1 = cirq.LineQubit(1)
+    gate = cirq.MatrixGate(cirq.testing.random_unitary(3, random_state=1), qid_shape=(3,))
+    circuit = cirq.FrozenCircuit(cirq.CZ(cirq.LineQubit(2), q1), gate(q0), cirq.H(q1))
+    assert cirq.FrozenCircuit(cirq.CZ(cirq.LineQubit(2), q1))._fuse_unitaries(1) == (
+        cirq.FrozenCircuit(cirq.CZ(cirq.LineQubit(2), q1))
+    )
+    fused = circuit._fuse_unitaries(2)
+    assert gate(q0) in fused.all_operations()
+    assert cirq.qid_shape(fused) == cirq.qid_shape(circuit)
+
+
+def test_fuse_diagonal_unitaries() -> None:
+    a, b, c, d = cirq.LineQubit.range(4)
+    circuit = cirq.FrozenCircuit(
+        cirq.H.on_each(a, b, c, d),
+        cirq.ZZ(a, b) ** 0.3,
+        cirq.ZZ(b, c) ** 0.3,
+        cirq.ZZ(c, d) ** 0.3,
+        cirq.Z(a) ** 0.2,
+        cirq.X(b),
+        cirq.CZ(a, b),
+        cirq.T(d),
+        cirq.measure(a, key='m'),
+        cirq.Z(b).with_classical_controls('m'),
+        cirq.CZ(b, c),
+        tags=('tag',),
+    )
+    fused = circuit._fuse_diagonal_unitaries(3)
+    assert circuit._fuse_diagonal_unitaries(3) is fused
+    assert fused.tags == ('tag',)
+    ops = list(fused.all_operations())
+    assert ops[:4] == list(cirq.H.on_each(a, b, c, d))
+    assert ops[5:9] == [
+        cirq.X(b),
+        cirq.CZ(a, b),
+        cirq.measure(a, key='m'),
+        cirq.Z(b).with_classical_controls('m'),
+    ]
+    assert len(ops) == 10
+    assert ops[4].qubits == (a, b, c) and ops[9].qubits == (b, c, d)
+    np.testing.assert_allclose(
+        cirq.unitary(ops[4]),
+        cirq.Circuit(cirq.ZZ(a, b) ** 0.3, cirq.ZZ(b, c) ** 0.3, cirq.Z(a) ** 0.2).unitary(),
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(
+        cirq.unitary(ops[9]),
+        cirq.Circuit(cirq.ZZ(c, d) ** 0.3, cirq.T(d), cirq.CZ(b, c)).unitary(),
+        atol=1e-8,
+    )
+
+
+def test_fuse_diagonal_unitaries_keeps_single_operations() -> None:
+    q0 = cirq.LineQid(0, dimension=3)
+    q1, q2 = cirq.LineQubit.range(1, 3)
+    circuit = cirq.FrozenCircuit(
+        cirq.ZPowGate(exponent=0.5, dimension=3).on(q0),
+        cirq.CCZ(q0.with_dimension(2), q1, q2),
+        cirq.CZ(q1, q2) ** sympy.Symbol('t'),
+        cirq.S(q1),
+    )
+    assert circuit._fuse_diagonal_unitaries(2) == circuit
@@ -728,6 +728,170 @@ class Moment:
         return raw_types._operations_commutes_impl(self.operations, other_operations, atol=atol)
 
 
+class MomentBuilder:
+    """A mutable collection of non-overlapping operations that is built into a `cirq.Moment`.
+
+    Each call to `Moment.with_operation` creates a new moment, copying the
+    operations of the old one, so adding operations to a moment one at a time
+    takes time quadratic in the number of operations. A MomentBuilder instead
+    adds, removes and replaces operations in amortized constant time, checking
+    for overlapping operations as it goes, and `build` creates the final moment
+    without checking them again.
+
+        builder = cirq.MomentBuilder()
+        for q in qubits:
+            builder.add(cirq.H(q))
+        moment = builder.build()
+
+    Operations keep the order in which they were added. A replaced operation
+    takes the place of the operation it replaces.
+    """
+
+    def __init__(self, moment: cirq.Moment | None = None) -> None:
+        """Initializes a builder.
+
+        Args:
+            moment: The moment whose operations the builder starts with. If
+                the builder is not changed, `build` returns this moment.
+        """
+        self._moment = moment
+        # Removed operations are replaced by None until the list is compacted.
+        self._operations: list[cirq.Operation | None] = []
+        self._qubit_to_index: dict[cirq.Qid, int] = {}
+        self._size = 0
+        if moment is not None:
+            self._operations.extend(moment.operations)
+            self._qubit_to_index = {
+                q: i for i, op in enumerate(moment.operations) for q in op.qubits
+            }
+            self._size = len(self._operations)
+
+    @property
+    def operations(self) -> tuple[cirq.Operation, ...]:
+        """The operations in the builder, in the order they were added."""
+        return tuple(op for op in self._operations if op is not None)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[cirq.Operation]:
+        return iter(self.operations)
+
+    def __contains__(self, operation: cirq.Operation) -> bool:
+        return self._find(operation) is not None
+
+    def operates_on(self, qubits: Iterable[cirq.Qid]) -> bool:
+        """Determines if the builder has operations touching the given qubits."""
+        return not self._qubit_to_index.keys().isdisjoint(qubits)
+
+    def operation_at(self, qubit: cirq.Qid) -> cirq.Operation | None:
+        """Returns the operation on the given qubit, or None if there is none."""
+        index = self._qubit_to_index.get(qubit)
+        return None if index is None else self._operations[index]
+
+    def operations_touching(self, qubits: Iterable[cirq.Qid]) -> list[cirq.Operation]:
+        """Returns the operations touching the given qubits, in the order they were added."""
+        indices = {self._qubit_to_index[q] for q in qubits if q in self._qubit_to_index}
+        return [cast('cirq.Operation', self._operations[i]) for i in sorted(indices)]
+
+    def add(self, operation: cirq.Operation) -> None:
+        """Adds an operation.
+
+        Raises:
+            ValueError: If the operation overlaps an operation in the builder.
+        """
+        if not self._qubit_to_index.keys().isdisjoint(operation.qubits):
+            raise ValueError(f'Overlapping operations: {operation}')
+        index = len(self._operations)
+        self._operations.append(operation)
+        for q in operation.qubits:
+            self._qubit_to_index[q] = index
+        self._size += 1
+        self._moment = None
+
+    def remove(self, operation: cirq.Operation) -> None:
+        """Removes an operation.
+
+        Raises:
+            ValueError: If the operation is not in the builder.
+        """
+        index = self._index(operation)
+        self._remove_at(index)
+        if len(self._operations) > 2 * self._size + 8:
+            self._compact()
+
+    def replace(self, old_operation: cirq.Operation, new_operation: cirq.Operation) -> None:
+        """Replaces an operation by another one, in the same position.
+
+        Raises:
+            ValueError: If `old_operation` is not in the builder, or if
+                `new_operation` overlaps another operation in the builder.
+        """
+        index = self._index(old_operation)
+        if any(self._qubit_to_index.get(q, index) != index for q in new_operation.qubits):
+            raise ValueError(f'Overlapping operations: {new_operation}')
+        for q in cast('cirq.Operation', self._operations[index]).qubits:
+            del self._qubit_to_index[q]
+        self._operations[index] = new_operation
+        for q in new_operation.qubits:
+            self._qubit_to_index[q] = index
+        self._moment = None
+
+    def remove_operations_touching(self, qubits: Iterable[cirq.Qid]) -> None:
+        """Removes the operations touching the given qubits."""
+        for index in {self._qubit_to_index[q] for q in qubits if q in self._qubit_to_index}:
+            self._remove_at(index)
+        if len(self._operations) > 2 * self._size + 8:
+            self._compact()
+
+    def build(self) -> cirq.Moment:
+        """Returns a moment with the operations in the builder.
+
+        If the builder was created from a moment and has not been changed
+        since, that moment is returned, including its tags. Otherwise, the
+        new moment has no tags, as with `cirq.Moment.with_operation`.
+        """
+        if self._moment is not None:
+            return self._moment
+        # Use private variables to skip validating the operations again.
+        m = Moment(_flatten_contents=False)
+        m._operations = self.operations
+        m._qubit_to_op = {
+            q: cast('cirq.Operation', self._operations[i]) for q, i in self._qubit_to_index.items()
+        }
+        self._moment = m
+        return m
+
+    def _find(self, operation: cirq.Operation) -> int | None:
+        if operation.qubits:
+            index = self._qubit_to_index.get(operation.qubits[0])
+            if index is not None and self._operations[index] == operation:
+                return index
+            return None
+        for index, op in enumerate(self._operations):
+            if op is not None and not op.qubits and op == operation:
+                return index
+        return None
+
+    def _index(self, operation: cirq.Operation) -> int:
+        index = self._find(operation)
+        if index is None:
+            raise ValueError(f'Operation not in moment: {operation}')
+        return index
+
+    def _remove_at(self, index: int) -> None:
+        for q in cast('cirq.Operation', self._operations[index]).qubits:
+            del self._qubit_to_index[q]
+        self._operations[index] = None
+        self._size -= 1
+        self._moment = None
+
+    def _compact(self) -> None:
+        operations = self.operations
+        self._operations = list(operations)
+        self._qubit_to_index = {q: i for i, op in enumerate(operations) for q in op.qubits}
+
+
 class _SortByValFallbackToType:
     def __init__(self, value):
         self.value = value
@@ -1004,3 +1004,85 @@ def test_moment_with_tags() -> None:
     # Test that tags are retained if the Moment is unchanged.
     assert moment.with_operations().tags == (tag_obj,)
     assert moment.without_operations_touching([q1]).tags == (tag_obj,)
+
+
+def test_moment_builder_add() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    builder = cirq.MomentBuilder()
+    assert len(builder) == 0
+    assert builder.build() == cirq.Moment()
+    builder.add(cirq.X(a))
+    builder.add(cirq.CZ(b, c))
+    builder.add(cirq.global_phase_operation(1j))
+    assert len(builder) == 3
+    assert builder.operations == (cirq.X(a), cirq.CZ(b, c), cirq.global_phase_operation(1j))
+    assert list(builder) == list(builder.operations)
+    with pytest.raises(ValueError, match='Overlapping operations'):
+        builder.add(cirq.Y(c))
+    assert builder.operates_on([c])
+    assert not builder.operates_on([cirq.LineQubit(3)])
+    assert builder.operation_at(b) == cirq.CZ(b, c)
+    assert builder.operation_at(cirq.LineQubit(3)) is None
+    assert builder.operations_touching([c, a]) == [cirq.X(a), cirq.CZ(b, c)]
+    moment = builder.build()
+    assert moment == cirq.Moment(cirq.X(a), cirq.CZ(b, c), cirq.global_phase_operation(1j))
+    assert moment.operations == builder.operations
+    assert moment.operates_on([c])
+    assert moment[b] == cirq.CZ(b, c)
+    assert builder.build() is moment
+
+
+def test_moment_builder_from_moment() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    moment = cirq.Moment(cirq.X(a), cirq.Y(b), tags=('tag',))
+    builder = cirq.MomentBuilder(moment)
+    assert builder.build() is moment
+    assert cirq.X(a) in builder
+    assert cirq.X(b) not in builder
+    builder.add(cirq.Z(c))
+    new_moment = builder.build()
+    assert new_moment == cirq.Moment(cirq.X(a), cirq.Y(b), cirq.Z(c))
+    assert new_moment.tags == ()
+    assert moment == cirq.Moment(cirq.X(a), cirq.Y(b), tags=('tag',))
+
+
+def test_moment_builder_remove_and_replace() -> None:
+    a, b, c, d = cirq.LineQubit.range(4)
+    phase = cirq.global_phase_operation(-1)
+    builder = cirq.MomentBuilder(cirq.Moment(cirq.X(a), cirq.CZ(b, c), phase, cirq.H(d)))
+    builder.remove(cirq.CZ(c, b))
+    assert cirq.CZ(b, c) not in builder
+    assert builder.operations == (cirq.X(a), phase, cirq.H(d))
+    builder.add(cirq.Y(b))
+    assert builder.operations == (cirq.X(a), phase, cirq.H(d), cirq.Y(b))
+    builder.replace(cirq.X(a), cirq.CNOT(a, c))
+    assert builder.operations == (cirq.CNOT(a, c), phase, cirq.H(d), cirq.Y(b))
+    builder.replace(cirq.CNOT(a, c), cirq.Z(c))
+    assert builder.operation_at(a) is None
+    with pytest.raises(ValueError, match='Overlapping operations'):
+        builder.replace(cirq.Z(c), cirq.CZ(c, d))
+    with pytest.raises(ValueError, match='not in moment'):
+        builder.replace(cirq.X(a), cirq.Z(a))
+    with pytest.raises(ValueError, match='not in moment'):
+        builder.remove(cirq.X(d))
+    with pytest.raises(ValueError, match='not in moment'):
+        builder.remove(cirq.global_phase_operation(1j))
+    builder.remove(phase)
+    assert phase not in builder
+    builder.remove_operations_touching([c, d])
+    assert builder.build() == cirq.Moment(cirq.Y(b))
+    assert len(builder) == 1
+
+
+def test_moment_builder_compacts_removed_operations() -> None:
+    qubits = cirq.LineQubit.range(3)
+    builder = cirq.MomentBuilder()
+    for i in range(100):
+        for q in qubits:
+            builder.add(cirq.X(q) ** i)
+        builder.remove(cirq.X(qubits[0]) ** i)
+        builder.remove_operations_touching(qubits[1:])
+    builder.add(cirq.X(qubits[1]))
+    assert len(builder._operations) < 20
+    assert builder.build() == cirq.Moment(cirq.X(qubits[1]))
+    assert builder.operations_touching(qubits) == [cirq.X(qubits[1])]
@@ -0,0 +1,304 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An immutable circuit that stores its operations in flat arrays."""
+
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Iterator, overload, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import _compat, ops
+from cirq.circuits.circuit import _TimelineIndex, AbstractCircuit, Circuit
+from cirq.circuits.frozen_circuit import FrozenCircuit
+from cirq.circuits.insert_strategy import InsertStrategy
+from cirq.circuits.moment import Moment
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class PackedCircuit(AbstractCircuit):
+    """An immutable circuit that stores its operations in flat arrays.
+
+    Instead of holding an `Operation` object per operation, a PackedCircuit
+    stores each operation as the index of its gate in a table of distinct
+    gates, and the indices of its qubits in a table of distinct qubits, in
+    int32 arrays. Moments are stored as offsets into these arrays. This takes
+    much less memory than a `cirq.Circuit` for circuits with many operations,
+    and makes pickling them fast.
+
+    `Moment` and `Operation` objects are created when they are accessed, so
+    PackedCircuits support the read-only `cirq.AbstractCircuit` API and can be
+    passed to simulators and serializers directly. Operations that cannot be
+    recreated from their gate and qubits alone, like tagged or classically
+    controlled operations, are stored whole in the table instead.
+
+    Conversion to and from `cirq.Circuit` is lossless:
+
+        packed = cirq.PackedCircuit(circuit)
+        assert packed.unfreeze() == circuit
+    """
+
+    def __init__(
+        self,
+        *contents: cirq.OP_TREE,
+        strategy: cirq.InsertStrategy = InsertStrategy.EARLIEST,
+        tags: Sequence[Hashable] = (),
+    ) -> None:
+        """Initializes a packed circuit.
+
+        Args:
+            contents: The initial list of moments and operations defining the
+                circuit. You can also pass in operations, lists of operations,
+                or generally anything meeting the `cirq.OP_TREE` contract.
+                Non-moment entries will be inserted according to the specified
+                insertion strategy. A single circuit is packed directly,
+                without copying its moments.
+            strategy: When initializing the circuit with operations and moments
+                from `contents`, this determines how the operations are packed
+                together.
+            tags: A sequence of any type of object that is useful to attach metadata
+                to this circuit as long as the type is hashable.  If you wish the
+                resulting circuit to be eventually serialized into JSON, you should
+                also restrict the tags to be JSON serializable.
+        """
+        if len(contents) == 1 and isinstance(contents[0], AbstractCircuit):
+            moments: Sequence[cirq.Moment] = contents[0].moments
+        else:
+            moments = Circuit(contents, strategy=strategy).moments
+        self._pack(moments)
+        self._tags = tuple(tags)
+
+    def _pack(self, moments: Iterable[cirq.Moment]) -> None:
+        qubit_ids: dict[cirq.Qid, int] = {}
+        entry_ids: dict[Any, int] = {}
+        table: list[cirq.Gate | cirq.Operation] = []
+        # Whether `gate.on(*op.qubits)` recreates operations of a given type with that gate.
+        recreatable: dict[tuple[cirq.Gate, type], bool] = {}
+        table_ids: list[int] = []
+        op_qubit_ids: list[int] = []
+        op_offsets = [0]
+        moment_offsets = [0]
+        moment_tags: dict[int, tuple[Hashable, ...]] = {}
+        for i, moment in enumerate(moments):
+            if moment.tags:
+                moment_tags[i] = moment.tags
+            for op in moment.operations:
+                entry: cirq.Gate | cirq.Operation = op
+                gate = op.gate
+                if gate is not None:
+                    key = (gate, type(op))
+                    if key not in recreatable:
+                        recreated = gate.on(*op.qubits)
+                        recreatable[key] = type(recreated) is type(op) and recreated == op
+                    if recreatable[key]:
+                        entry = gate
+                entry_id = entry_ids.get(entry)
+                if entry_id is None:
+                    entry_id = entry_ids[entry] = len(table)
+                    table.append(entry)
+                table_ids.append(entry_id)
+                for q in op.qubits:
+                    qubit_id = qubit_ids.get(q)
+                    if qubit_id is None:
+                        qubit_id = qubit_ids[q] = len(qubit_ids)
+                    op_qubit_ids.append(qubit_id)
+                op_offsets.append(len(op_qubit_ids))
+            moment_offsets.append(len(table_ids))
+        self._qubits = tuple(qubit_ids)
+        self._table = tuple(table)
+        self._table_ids = np.array(table_ids, dtype=np.int32)
+        self._qubit_ids = np.array(op_qubit_ids, dtype=np.int32)
+        self._op_offsets = np.array(op_offsets, dtype=np.int64)
+        self._moment_offsets = np.array(moment_offsets, dtype=np.int64)
+        self._moment_tags = moment_tags
+
+    @classmethod
+    def _from_moments(
+        cls, moments: Iterable[cirq.Moment], tags: Sequence[Hashable]
+    ) -> PackedCircuit:
+        new_circuit = PackedCircuit()
+        new_circuit._pack(moments)
+        new_circuit._tags = tuple(tags)
+        return new_circuit
+
+    @property
+    def moments(self) -> Sequence[cirq.Moment]:
+        return _PackedMoments(self)
+
+    def freeze(self) -> cirq.FrozenCircuit:
+        return FrozenCircuit._from_moments(self.moments, tags=self.tags)
+
+    def unfreeze(self, copy: bool = True) -> cirq.Circuit:
+        return Circuit._from_moments(self.moments, tags=self.tags)
+
+    @property
+    def tags(self) -> tuple[Hashable, ...]:
+        """Returns a tuple of the Circuit's tags."""
+        return self._tags
+
+    def with_tags(self, *new_tags: Hashable) -> cirq.PackedCircuit:
+        """Creates a new tagged `PackedCircuit` with `self.tags` and `new_tags` combined."""
+        if not new_tags:
+            return self
+        return self._sliced(0, len(self), self.tags + new_tags)
+
+    @property
+    def num_operations(self) -> int:
+        """The number of operations in the circuit."""
+        return len(self._table_ids)
+
+    def _sliced(self, start: int, stop: int, tags: Sequence[Hashable]) -> PackedCircuit:
+        """Returns the moments in [start, stop) as a circuit sharing this circuit's tables."""
+        first_op, end_op = self._moment_offsets[start], self._moment_offsets[stop]
+        new_circuit = PackedCircuit(tags=tags)
+        new_circuit._qubits = self._qubits
+        new_circuit._table = self._table
+        new_circuit._table_ids = self._table_ids[first_op:end_op]
+        new_circuit._qubit_ids = self._qubit_ids[
+            self._op_offsets[first_op] : self._op_offsets[end_op]
+        ]
+        new_circuit._op_offsets = (
+            self._op_offsets[first_op : end_op + 1] - self._op_offsets[first_op]
+        )
+        new_circuit._moment_offsets = self._moment_offsets[start : stop + 1] - first_op
+        new_circuit._moment_tags = {
+            i - start: tags for i, tags in self._moment_tags.items() if start <= i < stop
+        }
+        return new_circuit
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) and key.step in (None, 1):
+            start, stop, _ = key.indices(len(self))
+            return self._sliced(start, max(start, stop), self.tags)
+        return super().__getitem__(key)
+
+    def _operations(self, start: int, end: int) -> list[cirq.Operation]:
+        """Materializes the operations with indices in [start, end)."""
+        table, qubits = self._table, self._qubits
+        offsets = self._op_offsets[start : end + 1].tolist()
+        qubit_ids = self._qubit_ids[offsets[0] : offsets[-1]].tolist()
+        base = offsets[0]
+        operations: list[cirq.Operation] = []
+        for i, table_id in enumerate(self._table_ids[start:end].tolist()):
+            entry = table[table_id]
+            if isinstance(entry, ops.Operation):
+                operations.append(entry)
+            else:
+                op_qubit_ids = qubit_ids[offsets[i] - base : offsets[i + 1] - base]
+                operations.append(entry.on(*[qubits[q] for q in op_qubit_ids]))
+        return operations
+
+    def _moment(self, index: int) -> cirq.Moment:
+        start, end = self._moment_offsets[index], self._moment_offsets[index + 1]
+        return Moment.from_ops(*self._operations(start, end), tags=self._moment_tags.get(index, ()))
+
+    def all_operations(self) -> Iterator[cirq.Operation]:
+        moment_offsets = self._moment_offsets.tolist()
+        for start, end in zip(moment_offsets, moment_offsets[1:]):
+            yield from self._operations(start, end)
+
+    @_compat.cached_method
+    def all_qubits(self) -> frozenset[cirq.Qid]:
+        # Slices share the qubit table of the circuit they were taken from.
+        return frozenset(self._qubits[i] for i in np.unique(self._qubit_ids))
+
+    @_compat.cached_method
+    def _qubit_index(self) -> dict[cirq.Qid, int]:
+        return {q: i for i, q in enumerate(self._qubits)}
+
+    def operation_at(self, qubit: cirq.Qid, moment_index: int) -> cirq.Operation | None:
+        qubit_id = self._qubit_index().get(qubit)
+        if qubit_id is None or not 0 <= moment_index < len(self):
+            return None
+        start, end = self._moment_offsets[moment_index], self._moment_offsets[moment_index + 1]
+        op_offsets = self._op_offsets[start : end + 1]
+        (found,) = np.nonzero(self._qubit_ids[op_offsets[0] : op_offsets[-1]] == qubit_id)
+        if not len(found):
+            return None
+        index = start + np.searchsorted(op_offsets, op_offsets[0] + found[0], 'right') - 1
+        return self._operations(index, index + 1)[0]
+
+    @_compat.cached_method
+    def _timeline_index(self) -> _TimelineIndex:
+        return _TimelineIndex(self.moments)
+
+    @_compat.cached_method
+    def __hash__(self) -> int:
+        # Matches the hash of an equal FrozenCircuit.
+        return hash((tuple(self.moments), self.tags))
+
+    def _json_dict_(self) -> dict[str, Any]:
+        ret: dict[str, Any] = {'moments': list(self.moments)}
+        if self.tags:
+            ret['tags'] = self.tags
+        return ret
+
+    def __getstate__(self):
+        # Don't save cached values when pickling; see #3777.
+        return {name: value for name, value in self.__dict__.items() if name in _PACKED_STATE}
+
+
+_PACKED_STATE = frozenset(
+    [
+        '_qubits',
+        '_table',
+        '_table_ids',
+        '_qubit_ids',
+        '_op_offsets',
+        '_moment_offsets',
+        '_moment_tags',
+        '_tags',
+    ]
+)
+
+
+class _PackedMoments(Sequence['cirq.Moment']):
+    """The moments of a `PackedCircuit`, created when they are accessed."""
+
+    def __init__(self, circuit: PackedCircuit) -> None:
+        self._circuit = circuit
+
+    def __len__(self) -> int:
+        return len(self._circuit._moment_offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> cirq.Moment:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[cirq.Moment, ...]:
+        pass
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('moment index out of range')
+        return self._circuit._moment(index)
+
+    def __iter__(self) -> Iterator[cirq.Moment]:
+        return (self._circuit._moment(i) for i in range(len(self)))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(m0 == m1 for m0, m1 in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
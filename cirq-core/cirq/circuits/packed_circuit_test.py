@@ -0,0 +1,184 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def _example_circuit() -> cirq.Circuit:
+    a, b, c = cirq.LineQubit.range(3)
+    return cirq.Circuit(
+        cirq.Moment(cirq.H(a), cirq.X(b), cirq.Y(c) ** sympy.Symbol('t')),
+        cirq.Moment(cirq.CZ(a, b), cirq.Z(c).with_tags('tag')),
+        cirq.Moment(cirq.measure(a, key='m')).with_tags('moment_tag'),
+        cirq.Moment(),
+        cirq.Moment(
+            cirq.X(b).with_classical_controls('m'),
+            cirq.CircuitOperation(cirq.FrozenCircuit(cirq.H(c))),
+        ),
+        cirq.Moment(cirq.CNOT(b, a), cirq.H(c)),
+        tags=('circuit_tag',),
+    )
+
+
+def test_round_trip() -> None:
+    circuit = _example_circuit()
+    packed = cirq.PackedCircuit(circuit, tags=circuit.tags)
+    assert packed == circuit
+    assert circuit == packed
+    assert packed.unfreeze() == circuit
+    assert isinstance(packed.unfreeze(), cirq.Circuit)
+    assert packed.freeze() == circuit.freeze()
+    assert hash(packed) == hash(circuit.freeze())
+    assert packed.moments == circuit.moments
+    assert list(packed.all_operations()) == list(circuit.all_operations())
+    assert packed.num_operations == 10
+    assert packed[2].tags == ('moment_tag',)
+    assert str(packed) == str(circuit)
+    assert cirq.PackedCircuit(*circuit.moments, tags=circuit.tags) == packed
+    assert cirq.PackedCircuit(cirq.PackedCircuit(circuit), tags=circuit.tags) == packed
+
+
+def test_tables_are_interned() -> None:
+    q = cirq.LineQubit.range(10)
+    circuit = cirq.Circuit([cirq.H.on_each(*q), [cirq.CZ(q[i], q[i + 1]) for i in range(9)]] * 5)
+    packed = cirq.PackedCircuit(circuit)
+    assert packed == circuit
+    assert packed.num_operations == 95
+    assert packed._table == (cirq.H, cirq.CZ)
+    assert packed._qubits == tuple(q)
+    assert packed._table_ids.dtype == np.int32
+    assert packed._qubit_ids.dtype == np.int32
+
+
+def test_operations_stored_whole() -> None:
+    a, b = cirq.LineQubit.range(2)
+    tagged = cirq.CZ(a, b).with_tags('t')
+    controlled = cirq.X(a).with_classical_controls('m')
+    packed = cirq.PackedCircuit(tagged, controlled, cirq.X(a), cirq.X(b))
+    assert packed._table == (tagged, controlled, cirq.X)
+    assert list(packed.all_operations()) == [tagged, controlled, cirq.X(b), cirq.X(a)]
+    assert type(packed.operation_at(a, 2)) is type(cirq.X(a))
+
+
+def test_strategy() -> None:
+    a = cirq.LineQubit(0)
+    packed = cirq.PackedCircuit(cirq.X(a), cirq.Y(a), strategy=cirq.InsertStrategy.NEW)
+    assert len(packed) == 2
+
+
+def test_moments_sequence() -> None:
+    circuit = _example_circuit()
+    moments = cirq.PackedCircuit(circuit).moments
+    assert len(moments) == 6
+    assert moments[-1] == circuit[-1]
+    assert moments[1:4] == tuple(circuit.moments[1:4])
+    assert moments[::-2] == tuple(circuit.moments[::-2])
+    assert list(moments) == list(circuit.moments)
+    assert moments != [circuit[0]]
+    assert moments != 'abc'
+    assert moments.__eq__(1) is NotImplemented
+    assert repr(moments) == repr(tuple(circuit.moments))
+    with pytest.raises(IndexError):
+        _ = moments[6]
+    with pytest.raises(IndexError):
+        _ = moments[-7]
+
+
+def test_getitem() -> None:
+    circuit = _example_circuit()
+    packed = cirq.PackedCircuit(circuit, tags=circuit.tags)
+    a, b, c = cirq.LineQubit.range(3)
+    for key in [slice(1, 3), slice(None, -2), slice(4, 1), slice(None)]:
+        sliced = packed[key]
+        assert isinstance(sliced, cirq.PackedCircuit)
+        assert sliced == circuit[key]
+        assert sliced.all_qubits() == circuit[key].all_qubits()
+    assert packed[1:3].all_qubits() == {a, b, c}
+    assert packed[2:4].all_qubits() == {a}
+    assert packed[::2] == circuit[::2]
+    assert packed[1] == circuit[1]
+    assert packed[1, c] == cirq.Z(c).with_tags('tag')
+    assert packed[:2, [a]] == circuit[:2, [a]]
+
+
+def test_operation_at() -> None:
+    circuit = _example_circuit()
+    packed = cirq.PackedCircuit(circuit)
+    for q in [*cirq.LineQubit.range(4)]:
+        for i in range(-1, len(circuit) + 1):
+            assert packed.operation_at(q, i) == circuit.operation_at(q, i)
+
+
+def test_queries() -> None:
+    circuit = cirq.testing.random_circuit(qubits=5, n_moments=20, op_density=0.5, random_state=1)
+    packed = cirq.PackedCircuit(circuit)
+    assert packed._timeline_index() is packed._timeline_index()
+    q = sorted(circuit.all_qubits())
+    for i in range(len(circuit)):
+        assert packed.next_moment_operating_on(q[:2], i) == circuit.next_moment_operating_on(
+            q[:2], i
+        )
+        assert packed.prev_moment_operating_on(q[2:], i) == circuit.prev_moment_operating_on(
+            q[2:], i
+        )
+    frontier = {qubit: 3 for qubit in q}
+    assert packed.reachable_frontier_from(frontier) == circuit.reachable_frontier_from(frontier)
+    assert packed.all_qubits() == circuit.all_qubits()
+    assert cirq.num_qubits(packed) == 5
+
+
+def test_with_tags() -> None:
+    circuit = _example_circuit()
+    packed = cirq.PackedCircuit(circuit)
+    assert packed.with_tags() is packed
+    tagged = packed.with_tags('a', 'b')
+    assert isinstance(tagged, cirq.PackedCircuit)
+    assert tagged.tags == ('a', 'b')
+    assert tagged.untagged == packed
+    assert tagged == circuit.untagged.with_tags('a', 'b')
+
+
+def test_pickle() -> None:
+    circuit = _example_circuit()
+    packed = cirq.PackedCircuit(circuit, tags=circuit.tags)
+    _ = hash(packed)
+    _ = packed.all_qubits()
+    state = packed.__getstate__()
+    assert not any('cache' in name for name in state)
+    unpickled = pickle.loads(pickle.dumps(packed))
+    assert unpickled == packed
+    assert hash(unpickled) == hash(packed)
+
+
+def test_json_and_repr() -> None:
+    packed = cirq.PackedCircuit(_example_circuit(), tags=('circuit_tag',))
+    cirq.testing.assert_json_roundtrip_works(packed)
+    cirq.testing.assert_equivalent_repr(packed)
+
+
+def test_simulate() -> None:
+    circuit = cirq.testing.random_circuit(qubits=4, n_moments=10, op_density=0.8, random_state=2)
+    packed = cirq.PackedCircuit(circuit)
+    np.testing.assert_allclose(
+        cirq.final_state_vector(packed), cirq.final_state_vector(circuit), atol=1e-6
+    )
+    np.testing.assert_allclose(cirq.unitary(packed), cirq.unitary(circuit), atol=1e-6)
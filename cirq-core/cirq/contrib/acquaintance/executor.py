@@ -76,6 +76,7 @@ class ExecutionStrategy(metaclass=abc.ABCMeta):
         final_circuit = strategy(input_circuit, **kwargs)
         input_circuit._moments = final_circuit._moments
         input_circuit._placement_cache = final_circuit._placement_cache
+        input_circuit._moments_shared = final_circuit._moments_shared
         return strategy.mapping
 
 
@@ -178,6 +178,7 @@ def _class_resolver_dictionary() -> dict[str, ObjectFactory]:
         'NoiseModelFromNoiseProperties': NoiseModelFromNoiseProperties,
         'ObservableMeasuredResult': cirq.work.ObservableMeasuredResult,
         'OpIdentifier': cirq.OpIdentifier,
+        'PackedCircuit': cirq.PackedCircuit,
         'ParamResolver': cirq.ParamResolver,
         'ParallelGate': cirq.ParallelGate,
         'ParallelGateFamily': cirq.ParallelGateFamily,
@@ -89,6 +89,7 @@ from cirq.linalg.transformations import (
     state_vector_kronecker_product as state_vector_kronecker_product,
     sub_state_vector as sub_state_vector,
     targeted_conjugate_about as targeted_conjugate_about,
+    targeted_diagonal_multiply as targeted_diagonal_multiply,
     targeted_left_multiply as targeted_left_multiply,
     to_special as to_special,
     transpose_flattened_array as transpose_flattened_array,
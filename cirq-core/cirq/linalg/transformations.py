@@ -170,6 +170,43 @@ def targeted_left_multiply(
     )
 
 
+def targeted_diagonal_multiply(
+    diagonal: np.ndarray, target: np.ndarray, target_axes: Sequence[int]
+) -> np.ndarray:
+    """Left-multiplies the given axes of the target tensor in place by a diagonal matrix.
+
+    This is the diagonal analogue of `cirq.targeted_left_multiply`. If few
+    entries of the diagonal differ from 1, as for `cirq.Z` or `cirq.CZ`, only
+    the slices of the target they act on are multiplied. Otherwise, the target
+    is multiplied by the diagonal broadcast over the other axes.
+
+    Args:
+        diagonal: The diagonal of the matrix, as a 1D array ordered like the
+            rows of a matrix acting on the target axes in the given order.
+        target: The tensor to multiply in place.
+        target_axes: Which axes of the target are being operated on.
+
+    Returns:
+        The target tensor.
+    """
+    shape = tuple(target.shape[axis] for axis in target_axes)
+    diagonal = np.reshape(diagonal, shape)
+    non_trivial = np.argwhere(diagonal != 1)
+    if 2 * len(non_trivial) <= diagonal.size:
+        for index in non_trivial:
+            target_slice: list[slice | int] = [slice(None)] * target.ndim
+            for axis, i in zip(target_axes, index):
+                target_slice[axis] = i
+            target[tuple(target_slice)] *= diagonal[tuple(index)]
+        return target
+    order = np.argsort(target_axes)
+    broadcast_shape = [1] * target.ndim
+    for axis in target_axes:
+        broadcast_shape[axis] = target.shape[axis]
+    target *= diagonal.transpose(order).reshape(broadcast_shape)
+    return target
+
+
 @dataclasses.dataclass
 class _SliceConfig:
     axis: int
@@ -368,11 +405,11 @@ def apply_matrix_to_slices(
     else:
         out[...] = target[...]
 
-    # Apply operation.
+    # Apply operation, skipping the zero entries of sparse matrices.
     for i, s_i in enumerate(slices):
         out[s_i] *= matrix[i, i]  # type: ignore[index]
         for j, s_j in enumerate(slices):
-            if i != j:
+            if i != j and matrix[i, j] != 0:
                 out[s_i] += target[s_j] * matrix[i, j]  # type: ignore[index]
 
     return out
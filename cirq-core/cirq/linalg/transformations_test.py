@@ -253,6 +253,26 @@ def test_targeted_conjugate_out() -> None:
     np.testing.assert_almost_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    'diagonal, shape, target_axes',
+    [
+        (np.array([1, 1, 1, -1]), (2, 2, 2, 2), [0, 2]),
+        (np.array([1, 1j, 1, 1]), (2, 2, 2, 2), [3, 1]),
+        (np.exp(1j * np.arange(4)), (2, 2, 2, 2), [0, 2]),
+        (np.exp(1j * np.arange(4)), (2, 2, 2, 2), [3, 1]),
+        (np.exp(1j * np.arange(6)), (2, 3, 2, 2), [3, 1]),
+        (np.array([1, 1, -1, 1, 1, 1]), (2, 3, 2, 2), [1, 0]),
+    ],
+)
+def test_targeted_diagonal_multiply(diagonal, shape, target_axes) -> None:
+    target = cirq.testing.random_superposition(np.prod(shape), random_state=1).reshape(shape)
+    matrix = np.diag(diagonal).reshape(tuple(shape[axis] for axis in target_axes) * 2)
+    expected = cirq.targeted_left_multiply(matrix, target, target_axes)
+    result = cirq.targeted_diagonal_multiply(diagonal, target, target_axes)
+    assert result is target
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+
+
 def test_apply_matrix_to_slices() -> None:
     # Output is input.
     with pytest.raises(ValueError, match='out'):
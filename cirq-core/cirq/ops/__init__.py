@@ -28,6 +28,8 @@ from cirq.ops.dense_pauli_string import (
     MutableDensePauliString as MutableDensePauliString,
 )
 
+from cirq.ops.dense_pauli_string_array import DensePauliStringArray as DensePauliStringArray
+
 from cirq.ops.boolean_hamiltonian import BooleanHamiltonianGate as BooleanHamiltonianGate
 
 from cirq.ops.common_channels import (
@@ -444,17 +444,11 @@ class CliffordGate(raw_types.Gate, CommonCliffordGates):
     def _act_on_(
         self, sim_state: cirq.SimulationStateBase, qubits: Sequence[cirq.Qid]
     ) -> NotImplementedType | bool:
-        # Note the computation complexity difference between _decompose_ and _act_on_.
-        # Suppose this Gate has `m` qubits, args has `n` qubits, and the decomposition of
-        # this operation into `k` operations:
-        #   1. Direct act_on is O(n^3) -- two matrices multiplication
-        #   2. Decomposition is O(m^3)+O(k*n^2) -- Decomposition complexity + k * One/two-qubits Ops
-        # So when m << n, the decomposition is more efficient.
+        # Suppose this Gate has `m` qubits and args has `n` qubits. Applying the tableau of
+        # the gate to the columns of its qubits takes O(n*m^2) time, which is faster than
+        # decomposing it.
         if isinstance(sim_state, sim.clifford.CliffordTableauSimulationState):
-            axes = sim_state.get_axes(qubits)
-            # This padding is important and cannot be omitted.
-            padded_tableau = _pad_tableau(self._clifford_tableau, len(sim_state.qubits), axes)
-            sim_state._state = sim_state.tableau.then(padded_tableau)
+            sim_state.apply_clifford_tableau(self._clifford_tableau, qubits)
             return True
 
         if isinstance(sim_state, sim.clifford.StabilizerChFormSimulationState):  # pragma: no cover
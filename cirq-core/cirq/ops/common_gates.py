@@ -632,6 +632,14 @@ class ZPowGate(eigen_gate.EigenGate):
             args.target_tensor *= p
         return args.target_tensor
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        if protocols.is_parameterized(self):
+            return None
+        p = 1j ** (2 * self._exponent * self._global_shift)
+        return np.array(
+            [p * 1j ** (self._exponent * 4 * i / self._dimension) for i in range(self._dimension)]
+        )
+
     def _decompose_into_clifford_with_qubits_(self, qubits):
         from cirq.ops.clifford_gate import SingleQubitCliffordGate
 
@@ -1076,6 +1084,12 @@ class CZPowGate(gate_features.InterchangeableQubitsGate, eigen_gate.EigenGate):
             args.target_tensor *= p
         return args.target_tensor
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        if protocols.is_parameterized(self):
+            return None
+        p = 1j ** (2 * self._exponent * self._global_shift)
+        return p * np.array([1, 1, 1, 1j ** (2 * self._exponent)])
+
     def _pauli_expansion_(self) -> value.LinearDict[str]:
         if protocols.is_parameterized(self):
             return NotImplemented
@@ -0,0 +1,568 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Arrays of Pauli strings stored as bits, for manipulating many Pauli strings at once."""
+
+from __future__ import annotations
+
+import numbers
+from typing import Any, Iterable, Iterator, overload, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import protocols, value
+from cirq._compat import proper_repr
+from cirq.ops import (
+    clifford_gate,
+    dense_pauli_string,
+    linear_combinations,
+    op_tree,
+    pauli_gates,
+    pauli_string,
+)
+from cirq.qis.clifford_tableau import _conjugate_rows
+
+if TYPE_CHECKING:
+    import cirq
+
+# Clifford operations on up to this many qubits are applied through Boolean formulas for the
+# images of all the Pauli strings on their qubits, whose size grows as 4 ** num_qubits.
+_MAX_TABLE_QUBITS = 3
+
+
+class DensePauliStringArray:
+    """An array of dense Pauli strings of the same length, stored as X and Z bits.
+
+    The Pauli string i is `coefficients[i]` times the product of the Paulis
+    given by the bits `xs[i, j]` and `zs[i, j]` of each qubit j, with I, X, Y
+    and Z encoded as 00, 10, 11 and 01 respectively. Operations on the array,
+    like multiplication, commutation checks and propagation through Clifford
+    circuits, are vectorized over the Pauli strings, which is much faster than
+    manipulating many `cirq.DensePauliString`s one at a time.
+
+    Like `cirq.DensePauliString`, the array is immutable, and is not
+    associated with qubits: methods that need qubits take them as arguments,
+    in the order of the columns of the array.
+
+    Examples:
+        >>> strings = cirq.DensePauliStringArray.from_dense_pauli_strings(
+        ...     [cirq.DensePauliString('XI'), cirq.DensePauliString('YZ', coefficient=-1)]
+        ... )
+        >>> print(strings)
+        +XI
+        -YZ
+        >>> a, b = cirq.LineQubit.range(2)
+        >>> print(strings.after(cirq.CNOT(a, b), qubits=[a, b]))
+        +XX
+        -XY
+    """
+
+    def __init__(
+        self, xs: np.ndarray, zs: np.ndarray, coefficients: np.ndarray | None = None
+    ) -> None:
+        """Initializes a new array of dense Pauli strings.
+
+        Args:
+            xs: A 2D boolean array with the X bits of each Pauli string per row.
+            zs: A 2D boolean array with the Z bits of each Pauli string per row.
+            coefficients: The complex coefficient of each Pauli string.
+                Defaults to 1 for all of them.
+
+        Raises:
+            ValueError: If the shapes of the arrays do not match.
+        """
+        xs = np.array(xs, dtype=bool)
+        zs = np.array(zs, dtype=bool)
+        if xs.ndim != 2 or xs.shape != zs.shape:
+            raise ValueError(
+                f'Expected 2D X and Z bits of the same shape, got {xs.shape} and {zs.shape}.'
+            )
+        if coefficients is None:
+            coefficients = np.ones(len(xs), dtype=np.complex128)
+        coefficients = np.array(coefficients, dtype=np.complex128)
+        if coefficients.shape != (len(xs),):
+            raise ValueError(
+                f'Expected {len(xs)} coefficients, got an array of shape {coefficients.shape}.'
+            )
+        for array in (xs, zs, coefficients):
+            array.flags.writeable = False
+        self._xs = xs
+        self._zs = zs
+        self._coefficients = coefficients
+
+    @classmethod
+    def from_pauli_masks(
+        cls, pauli_masks: np.ndarray, coefficients: np.ndarray | None = None
+    ) -> DensePauliStringArray:
+        """Creates an array of Pauli strings from rows of Pauli masks.
+
+        Args:
+            pauli_masks: A 2D integer array with the Paulis of each Pauli
+                string per row, encoded as in `cirq.DensePauliString`, i.e.
+                with I=0, X=1, Y=2 and Z=3.
+            coefficients: The complex coefficient of each Pauli string.
+                Defaults to 1 for all of them.
+        """
+        pauli_masks = np.asarray(pauli_masks)
+        xs = (pauli_masks == 1) | (pauli_masks == 2)
+        zs = (pauli_masks == 2) | (pauli_masks == 3)
+        return cls(xs, zs, coefficients)
+
+    @classmethod
+    def from_dense_pauli_strings(
+        cls, dense_pauli_strings: Iterable[cirq.BaseDensePauliString]
+    ) -> DensePauliStringArray:
+        """Creates an array from dense Pauli strings of the same length.
+
+        Raises:
+            ValueError: If the dense Pauli strings have different lengths.
+            TypeError: If a coefficient is symbolic.
+        """
+        dense_pauli_strings = list(dense_pauli_strings)
+        lengths = {len(p) for p in dense_pauli_strings}
+        if len(lengths) > 1:
+            raise ValueError(f'Expected dense Pauli strings of the same length, got {lengths}.')
+        pauli_masks = np.array([p.pauli_mask for p in dense_pauli_strings], dtype=np.uint8)
+        return cls.from_pauli_masks(
+            pauli_masks.reshape(len(dense_pauli_strings), max(lengths, default=0)),
+            [complex(p.coefficient) for p in dense_pauli_strings],
+        )
+
+    @classmethod
+    def from_pauli_strings(
+        cls, pauli_strings: Iterable[cirq.PauliString], qubits: Sequence[cirq.Qid]
+    ) -> DensePauliStringArray:
+        """Creates an array from Pauli strings, with one column per qubit.
+
+        Args:
+            pauli_strings: The Pauli strings.
+            qubits: The qubits of the columns of the array, which must include the
+                qubits of all the Pauli strings.
+
+        Raises:
+            KeyError: If a Pauli string acts on a qubit that is not in `qubits`.
+            TypeError: If a coefficient is symbolic.
+        """
+        pauli_strings = list(pauli_strings)
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        pauli_masks = pauli_string._pauli_masks(
+            (p.items() for p in pauli_strings), qubit_map, len(qubit_map)
+        )
+        return cls.from_pauli_masks(pauli_masks, [complex(p.coefficient) for p in pauli_strings])
+
+    @classmethod
+    def from_pauli_sum(
+        cls, pauli_sum: cirq.PauliSum, qubits: Sequence[cirq.Qid]
+    ) -> DensePauliStringArray:
+        """Creates an array from the terms of a Pauli sum, with one column per qubit.
+
+        Args:
+            pauli_sum: The Pauli sum.
+            qubits: The qubits of the columns of the array, which must include the
+                qubits of the Pauli sum.
+
+        Raises:
+            KeyError: If the Pauli sum acts on a qubit that is not in `qubits`.
+            TypeError: If a coefficient is symbolic.
+        """
+        terms = pauli_sum._linear_dict.items()
+        units, coefficients = zip(*terms) if terms else ((), ())
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        pauli_masks = pauli_string._pauli_masks(units, qubit_map, len(qubit_map))
+        return cls.from_pauli_masks(pauli_masks, [complex(c) for c in coefficients])
+
+    @property
+    def xs(self) -> np.ndarray:
+        """A read-only 2D boolean array with the X bits of each Pauli string per row."""
+        return self._xs
+
+    @property
+    def zs(self) -> np.ndarray:
+        """A read-only 2D boolean array with the Z bits of each Pauli string per row."""
+        return self._zs
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """A read-only 1D complex array with the coefficient of each Pauli string."""
+        return self._coefficients
+
+    @property
+    def pauli_mask(self) -> np.ndarray:
+        """A 2D uint8 array with the Paulis of each Pauli string per row, I=0, X=1, Y=2, Z=3."""
+        return (self._xs ^ self._zs).astype(np.uint8) + 2 * self._zs.astype(np.uint8)
+
+    @property
+    def num_qubits(self) -> int:
+        """The length of the Pauli strings."""
+        return self._xs.shape[1]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """A 1D integer array with the number of non-identity Paulis of each Pauli string."""
+        return np.count_nonzero(self._xs | self._zs, axis=1)
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    @overload
+    def __getitem__(self, key: int) -> cirq.DensePauliString:
+        pass
+
+    @overload
+    def __getitem__(self, key: slice | Sequence[int] | np.ndarray) -> DensePauliStringArray:
+        pass
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return dense_pauli_string.DensePauliString(
+                self.pauli_mask[key], coefficient=self._coefficients[key]
+            )
+        return DensePauliStringArray(self._xs[key], self._zs[key], self._coefficients[key])
+
+    def __iter__(self) -> Iterator[cirq.DensePauliString]:
+        for pauli_mask, coefficient in zip(self.pauli_mask, self._coefficients):
+            yield dense_pauli_string.DensePauliString(pauli_mask, coefficient=coefficient)
+
+    def to_pauli_strings(self, qubits: Sequence[cirq.Qid]) -> list[cirq.PauliString]:
+        """Returns the Pauli strings of the array on some qubits, one per column."""
+        return [p.on(*qubits) for p in self]
+
+    def to_pauli_sum(self, qubits: Sequence[cirq.Qid]) -> cirq.PauliSum:
+        """Returns the sum of the Pauli strings of the array on some qubits, one per column.
+
+        Equal Pauli strings are combined into a single term before the Pauli sum is built.
+        """
+        if len(qubits) != self.num_qubits:
+            raise ValueError(f'Expected {self.num_qubits} qubits, got {qubits}.')
+        keys = np.packbits(np.concatenate([self._xs, self._zs], axis=1), axis=1)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        coefficients = np.zeros(len(first), dtype=np.complex128)
+        np.add.at(coefficients, inverse, self._coefficients)
+        paulis = np.array([None, pauli_gates.X, pauli_gates.Y, pauli_gates.Z])
+        qubit_array = np.empty(len(qubits), dtype=object)
+        qubit_array[:] = qubits
+        terms: dict[linear_combinations.UnitPauliStringT, complex] = {}
+        for pauli_mask, coefficient in zip(self.pauli_mask[first], coefficients):
+            support = np.flatnonzero(pauli_mask)
+            terms[frozenset(zip(qubit_array[support], paulis[pauli_mask[support]]))] = complex(
+                coefficient
+            )
+        return linear_combinations.PauliSum(value.LinearDict(terms))
+
+    def commutation_matrix(self, other: DensePauliStringArray | None = None) -> np.ndarray:
+        """Returns which pairs of Pauli strings of this and another array commute.
+
+        Two Pauli strings commute if the number of qubits on which they have
+        different non-identity Paulis is even. This is the symplectic inner product
+        of their bits, which is computed for all pairs at once with a matrix product.
+
+        Args:
+            other: The other array. Defaults to this array.
+
+        Returns:
+            A 2D boolean array whose entry (i, j) is whether the Pauli string i of
+            this array commutes with the Pauli string j of the other array.
+
+        Raises:
+            ValueError: If the Pauli strings of the arrays have different lengths.
+        """
+        if other is None:
+            other = self
+        if other.num_qubits != self.num_qubits:
+            raise ValueError(
+                f'Expected Pauli strings of the same length, '
+                f'got {self.num_qubits} and {other.num_qubits}.'
+            )
+        # Float matrix products use BLAS and are exact for fewer than 2**24 qubits.
+        lhs = np.concatenate([self._xs, self._zs], axis=1).astype(np.float32)
+        rhs = np.concatenate([other._zs, other._xs], axis=1).astype(np.float32)
+        return (lhs @ rhs.T).astype(np.int64) % 2 == 0
+
+    def __mul__(self, other: Any) -> DensePauliStringArray:
+        """Multiplies the Pauli strings by numbers, or pairwise by other Pauli strings.
+
+        Multiplying by a `cirq.DensePauliString`, or by an array with a single Pauli
+        string, multiplies every Pauli string of the array by it.
+        """
+        if isinstance(other, numbers.Number):
+            return DensePauliStringArray(self._xs, self._zs, self._coefficients * complex(other))
+        if isinstance(other, dense_pauli_string.BaseDensePauliString):
+            other = DensePauliStringArray.from_dense_pauli_strings([other])
+        if not isinstance(other, DensePauliStringArray):
+            return NotImplemented
+        return _multiply(self, other)
+
+    def __rmul__(self, other: Any) -> DensePauliStringArray:
+        if isinstance(other, numbers.Number):
+            return self * other
+        if isinstance(other, dense_pauli_string.BaseDensePauliString):
+            return _multiply(DensePauliStringArray.from_dense_pauli_strings([other]), self)
+        return NotImplemented
+
+    def __neg__(self) -> DensePauliStringArray:
+        return DensePauliStringArray(self._xs, self._zs, -self._coefficients)
+
+    def conjugated_by(
+        self, clifford: cirq.OP_TREE, qubits: Sequence[cirq.Qid]
+    ) -> DensePauliStringArray:
+        r"""Returns the Pauli strings conjugated by a Clifford operation.
+
+        This is the vectorized version of `cirq.PauliString.conjugated_by`: a
+        Pauli string $P$ conjugated by the Clifford operation $C$ is
+        $C^\dagger P C$. The operations in `clifford` are applied in reverse
+        order.
+
+        Args:
+            clifford: The unitary Clifford operations to conjugate by.
+            qubits: The qubits of the columns of the array, which must include
+                the qubits of the operations.
+
+        Returns:
+            The conjugated Pauli strings.
+
+        Raises:
+            ValueError: If an operation is not a unitary Clifford operation, or
+                acts on qubits that are not in `qubits`.
+        """
+        operations = list(op_tree.flatten_to_ops(clifford))
+        return self._conjugated_by_tableaux(operations[::-1], qubits, inverse=True)
+
+    def before(self, ops: cirq.OP_TREE, qubits: Sequence[cirq.Qid]) -> DensePauliStringArray:
+        r"""Determines the equivalent Pauli strings before some operations.
+
+        If a Pauli string is $P$ and the Clifford operation is $C$, then the
+        result is $C^\dagger P C$. See `conjugated_by`.
+        """
+        return self.conjugated_by(ops, qubits)
+
+    def after(self, ops: cirq.OP_TREE, qubits: Sequence[cirq.Qid]) -> DensePauliStringArray:
+        r"""Determines the equivalent Pauli strings after some operations.
+
+        If a Pauli string is $P$ and the Clifford operation is $C$, then the
+        result is $C P C^\dagger$.
+
+        Args:
+            ops: The unitary Clifford operations to propagate through.
+            qubits: The qubits of the columns of the array, which must include
+                the qubits of the operations.
+
+        Returns:
+            The Pauli strings propagated from before to after the operations.
+
+        Raises:
+            ValueError: If an operation is not a unitary Clifford operation, or
+                acts on qubits that are not in `qubits`.
+        """
+        return self._conjugated_by_tableaux(op_tree.flatten_to_ops(ops), qubits, inverse=False)
+
+    def _conjugated_by_tableaux(
+        self, operations: Iterable[cirq.Operation], qubits: Sequence[cirq.Qid], inverse: bool
+    ) -> DensePauliStringArray:
+        """Maps the Pauli strings P to U P U^dagger for the operations U in order.
+
+        The bits of all the Pauli strings are packed into 64-bit words per qubit, and
+        commuting operations with the same gate on distinct qubits are applied at once, by
+        evaluating Boolean formulas for the images of the Paulis on their qubits with
+        bitwise operations on the words.
+
+        Args:
+            operations: The operations U.
+            qubits: The qubits of the columns of the array.
+            inverse: Whether to use the inverses of the operations.
+        """
+        axes = {q: i for i, q in enumerate(qubits)}
+        if len(axes) != len(qubits) or len(axes) != self.num_qubits:
+            raise ValueError(f'Expected {self.num_qubits} distinct qubits, got {qubits}.')
+        m = len(self)
+        xs, zs = _pack_columns(self._xs), _pack_columns(self._zs)
+        signs = np.zeros(xs.shape[1], dtype=np.uint64)
+        ones = np.full_like(signs, np.iinfo(np.uint64).max)
+        formulas: dict[Any, list[list[int]]] = {}
+        for group in _groups_of_disjoint_operations(operations):
+            op = group[0]
+            try:
+                columns = np.array([[axes[q] for q in op.qubits] for op in group])
+            except KeyError:
+                raise ValueError(f'Operation {op!r} acts on qubits that are not in {qubits}.')
+            tableau = _clifford_tableau(op)
+            if inverse:
+                tableau = tableau.inverse()
+            if tableau.n > _MAX_TABLE_QUBITS:
+                for axes_of_op in columns:
+                    rows = _unpack_columns(np.concatenate([xs[axes_of_op], zs[axes_of_op]]), m)
+                    new_xs, new_zs, new_signs = _conjugate_rows(
+                        rows, np.zeros(m, dtype=bool), tableau
+                    )
+                    xs[axes_of_op] = _pack_columns(new_xs)
+                    zs[axes_of_op] = _pack_columns(new_zs)
+                    signs ^= _pack_columns(new_signs[:, np.newaxis])[0]
+                continue
+            key = (op.gate, inverse)
+            monomials = formulas.get(key)
+            if monomials is None:
+                monomials = _conjugation_formulas(tableau)
+                formulas[key] = monomials
+            # The variables of the formulas are the Z and X bits of the qubits in turn.
+            variables = [bits[columns[:, j]] for j in range(tableau.n) for bits in (zs, xs)]
+            products = {0: ones}
+
+            def product(mask: int) -> np.ndarray:
+                if mask not in products:
+                    lowest = mask & -mask
+                    products[mask] = product(mask ^ lowest) & variables[lowest.bit_length() - 1]
+                return products[mask]
+
+            images = [
+                (
+                    np.bitwise_xor.reduce([product(mask) for mask in masks], axis=0)
+                    if masks
+                    else np.zeros_like(variables[0])
+                )
+                for masks in monomials
+            ]
+            for j in range(tableau.n):
+                xs[columns[:, j]] = images[j]
+                zs[columns[:, j]] = images[tableau.n + j]
+            signs ^= np.bitwise_xor.reduce(images[-1], axis=0)
+        return DensePauliStringArray(
+            _unpack_columns(xs, m),
+            _unpack_columns(zs, m),
+            np.where(_unpack_columns(signs[np.newaxis], m)[:, 0], -1, 1) * self._coefficients,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, DensePauliStringArray):
+            return NotImplemented
+        return (
+            np.array_equal(self._xs, other._xs)
+            and np.array_equal(self._zs, other._zs)
+            and np.array_equal(self._coefficients, other._coefficients)
+        )
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.DensePauliStringArray(xs={proper_repr(self._xs)}, '
+            f'zs={proper_repr(self._zs)}, coefficients={proper_repr(self._coefficients)})'
+        )
+
+    def __str__(self) -> str:
+        return '\n'.join(str(p) for p in self)
+
+
+def _multiply(lhs: DensePauliStringArray, rhs: DensePauliStringArray) -> DensePauliStringArray:
+    """Multiplies the Pauli strings of two arrays pairwise, broadcasting single Pauli strings.
+
+    Raises:
+        ValueError: If the Pauli strings have different lengths, or the arrays have different
+            numbers of Pauli strings, none of which is one.
+    """
+    if lhs.num_qubits != rhs.num_qubits:
+        raise ValueError(
+            f'Expected Pauli strings of the same length, got {lhs.num_qubits} and {rhs.num_qubits}.'
+        )
+    if len(lhs) != len(rhs) and 1 not in (len(lhs), len(rhs)):
+        raise ValueError(f'Cannot multiply arrays of {len(lhs)} and {len(rhs)} Pauli strings.')
+    # The same per-qubit phase exponents as `_vectorized_pauli_mul_phase`, summed per row.
+    lhs_mask = lhs.pauli_mask.astype(np.int8)
+    rhs_mask = rhs.pauli_mask.astype(np.int8)
+    t = rhs_mask * (lhs_mask != 0) - lhs_mask * (rhs_mask != 0) + 1
+    t %= 3
+    t -= 1
+    exponents = np.sum(t, axis=1, dtype=np.int64) & 3
+    return DensePauliStringArray(
+        lhs.xs ^ rhs.xs,
+        lhs.zs ^ rhs.zs,
+        lhs.coefficients * rhs.coefficients * np.array([1, 1j, -1, -1j])[exponents],
+    )
+
+
+def _groups_of_disjoint_operations(
+    operations: Iterable[cirq.Operation],
+) -> Iterator[list[cirq.Operation]]:
+    """Groups operations with the same gate that act on distinct qubits.
+
+    Runs of consecutive operations on distinct qubits commute, so the operations of each
+    run are grouped by gate in the order their gates first appear. Operations without
+    qubits, like global phases, do not change Pauli strings and are skipped.
+    """
+    groups: dict[Any, list[cirq.Operation]] = {}
+    layer_qubits: set[cirq.Qid] = set()
+    for op in operations:
+        if not op.qubits:
+            continue
+        if not layer_qubits.isdisjoint(op.qubits):
+            yield from groups.values()
+            groups, layer_qubits = {}, set()
+        # Operations without gates are never grouped.
+        key = op if op.gate is None else op.gate
+        groups.setdefault(key, []).append(op)
+        layer_qubits.update(op.qubits)
+    yield from groups.values()
+
+
+def _clifford_tableau(op: cirq.Operation) -> cirq.CliffordTableau:
+    """Returns the Clifford tableau of a unitary Clifford operation on its qubits.
+
+    Raises:
+        ValueError: If the operation is not a unitary Clifford operation.
+    """
+    if isinstance(op.gate, clifford_gate.CliffordGate):
+        return op.gate.clifford_tableau
+    if not protocols.has_unitary(op):
+        raise ValueError(f'Not a unitary Clifford operation: {op!r}')
+    return clifford_gate.CliffordGate.from_op_list([op], op.qubits).clifford_tableau
+
+
+def _conjugation_formulas(tableau: cirq.CliffordTableau) -> list[list[int]]:
+    """Returns Boolean formulas for the images of the Pauli strings on the qubits of a tableau.
+
+    The formulas are polynomials over GF(2) in the variables z_0, x_0, z_1, x_1, ... of a
+    Pauli string, i.e. XORs of monomials that AND some of the variables. A monomial is
+    represented by the mask of its variables.
+
+    Returns:
+        The masks of the monomials of the formulas for the X bits, the Z bits and the sign of
+        the image, in this order.
+    """
+    n = tableau.n
+    # Row i of the truth table is the Pauli string with z_j and x_j given by the bits 2j
+    # and 2j + 1 of i.
+    bits = np.arange(4**n)[:, np.newaxis] >> np.arange(2 * n) & 1 == 1
+    rows = np.concatenate([bits[:, 1::2], bits[:, ::2]], axis=1)
+    new_xs, new_zs, new_signs = _conjugate_rows(rows, np.zeros(len(rows), dtype=bool), tableau)
+    coefficients = np.concatenate([new_xs, new_zs, new_signs[:, np.newaxis]], axis=1)
+    # The Moebius transform turns the truth table into the coefficients of the monomials.
+    for i in range(2 * n):
+        view = coefficients.reshape(-1, 2, 2**i, coefficients.shape[1])
+        view[:, 1] ^= view[:, 0]
+    return [np.flatnonzero(column).tolist() for column in coefficients.T]
+
+
+def _pack_columns(bits: np.ndarray) -> np.ndarray:
+    """Packs the columns of a 2D boolean array into rows of 64-bit words."""
+    packed = np.packbits(bits.T, axis=1, bitorder='little')
+    words = np.zeros((bits.shape[1], -(-bits.shape[0] // 64) * 8), dtype=np.uint8)
+    words[:, : packed.shape[1]] = packed
+    return words.view(np.uint64)
+
+
+def _unpack_columns(words: np.ndarray, num_rows: int) -> np.ndarray:
+    """Inverts `_pack_columns` for a 2D boolean array with the given number of rows."""
+    bits = np.unpackbits(words.view(np.uint8), axis=1, count=num_rows, bitorder='little')
+    return bits.T.astype(bool)
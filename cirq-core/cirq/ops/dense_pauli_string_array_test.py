@@ -0,0 +1,287 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.ops import dense_pauli_string_array
+
+
+def _random_pauli_strings(
+    qubits: list[cirq.Qid], num_pauli_strings: int, seed: int
+) -> list[cirq.PauliString]:
+    prng = np.random.RandomState(seed)
+    return [
+        cirq.PauliString(
+            dict(zip(qubits, prng.choice(list('IXYZ'), len(qubits)))),
+            coefficient=prng.choice([1, -1, 1j, 0.5]),
+        )
+        for _ in range(num_pauli_strings)
+    ]
+
+
+def _random_clifford_circuit(qubits: list[cirq.Qid], seed: int) -> cirq.Circuit:
+    return cirq.testing.random_circuit(
+        qubits,
+        n_moments=10,
+        op_density=0.8,
+        gate_domain={
+            cirq.H: 1,
+            cirq.S: 1,
+            cirq.X: 1,
+            cirq.Y**0.5: 1,
+            cirq.CNOT: 2,
+            cirq.CZ: 2,
+            cirq.SWAP: 2,
+            cirq.ISWAP: 2,
+        },
+        random_state=seed,
+    )
+
+
+def test_init() -> None:
+    strings = cirq.DensePauliStringArray([[1, 0, 1]], [[0, 1, 1]], [2j])
+    assert strings.num_qubits == 3
+    assert len(strings) == 1
+    np.testing.assert_array_equal(strings.pauli_mask, [[1, 3, 2]])
+    np.testing.assert_array_equal(strings.xs, [[True, False, True]])
+    np.testing.assert_array_equal(strings.zs, [[False, True, True]])
+    np.testing.assert_array_equal(strings.coefficients, [2j])
+    assert strings[0] == cirq.DensePauliString('XZY', coefficient=2j)
+    with pytest.raises(ValueError, match='read-only'):
+        strings.xs[0, 0] = False
+
+    np.testing.assert_array_equal(
+        cirq.DensePauliStringArray(np.zeros((2, 1)), np.zeros((2, 1))).coefficients, [1, 1]
+    )
+    with pytest.raises(ValueError, match='same shape'):
+        _ = cirq.DensePauliStringArray(np.zeros((2, 1)), np.zeros((2, 2)))
+    with pytest.raises(ValueError, match='same shape'):
+        _ = cirq.DensePauliStringArray(np.zeros(2), np.zeros(2))
+    with pytest.raises(ValueError, match='Expected 2 coefficients'):
+        _ = cirq.DensePauliStringArray(np.zeros((2, 1)), np.zeros((2, 1)), [1])
+
+
+def test_from_dense_pauli_strings() -> None:
+    dense_pauli_strings = [
+        cirq.DensePauliString('XYZI'),
+        cirq.DensePauliString('IIZZ', coefficient=-1j),
+        cirq.MutableDensePauliString('YYYY', coefficient=0.5),
+    ]
+    strings = cirq.DensePauliStringArray.from_dense_pauli_strings(dense_pauli_strings)
+    assert list(strings) == [p.frozen() for p in dense_pauli_strings]
+    np.testing.assert_array_equal(strings.pauli_mask, [[1, 2, 3, 0], [0, 0, 3, 3], [2, 2, 2, 2]])
+    empty = cirq.DensePauliStringArray.from_dense_pauli_strings([])
+    assert len(empty) == 0
+    assert empty.num_qubits == 0
+    with pytest.raises(ValueError, match='same length'):
+        _ = cirq.DensePauliStringArray.from_dense_pauli_strings(
+            [cirq.DensePauliString('X'), cirq.DensePauliString('XX')]
+        )
+    with pytest.raises(TypeError):
+        _ = cirq.DensePauliStringArray.from_dense_pauli_strings(
+            [cirq.DensePauliString('X', coefficient=sympy.Symbol('t'))]
+        )
+
+
+def test_from_pauli_strings() -> None:
+    qubits = cirq.LineQubit.range(3)
+    pauli_strings = _random_pauli_strings(qubits, 10, seed=1)
+    strings = cirq.DensePauliStringArray.from_pauli_strings(pauli_strings, qubits)
+    assert strings.to_pauli_strings(qubits) == pauli_strings
+    with pytest.raises(KeyError):
+        _ = cirq.DensePauliStringArray.from_pauli_strings(pauli_strings, qubits[:2])
+
+
+def test_pauli_sum() -> None:
+    qubits = cirq.LineQubit.range(3)
+    pauli_strings = _random_pauli_strings(qubits, 20, seed=2)
+    pauli_sum = cirq.PauliSum.from_pauli_strings(pauli_strings)
+    strings = cirq.DensePauliStringArray.from_pauli_strings(pauli_strings, qubits)
+    assert strings.to_pauli_sum(qubits) == pauli_sum
+    from_sum = cirq.DensePauliStringArray.from_pauli_sum(pauli_sum, qubits)
+    assert len(from_sum) == len(pauli_sum)
+    assert from_sum.to_pauli_sum(qubits) == pauli_sum
+
+    empty = cirq.DensePauliStringArray.from_pauli_sum(cirq.PauliSum(), qubits)
+    assert empty.num_qubits == 3
+    assert len(empty) == 0
+    assert empty.to_pauli_sum(qubits) == cirq.PauliSum()
+    identities = cirq.DensePauliStringArray(np.zeros((2, 0)), np.zeros((2, 0)), [1, 2])
+    assert identities.to_pauli_sum([]) == cirq.PauliSum.from_pauli_strings(cirq.PauliString(3))
+
+    with pytest.raises(ValueError, match='Expected 3 qubits'):
+        _ = strings.to_pauli_sum(qubits[:2])
+    with pytest.raises(KeyError):
+        _ = cirq.DensePauliStringArray.from_pauli_sum(pauli_sum, qubits[:2])
+    with pytest.raises(TypeError):
+        _ = cirq.DensePauliStringArray.from_pauli_sum(cirq.X(qubits[0]) * sympy.Symbol('t'), qubits)
+
+
+def test_weights() -> None:
+    strings = cirq.DensePauliStringArray.from_pauli_masks(
+        np.array([[0, 0, 0], [1, 0, 2], [3, 3, 1]])
+    )
+    np.testing.assert_array_equal(strings.weights, [0, 2, 3])
+
+
+def test_commutation_matrix() -> None:
+    qubits = cirq.LineQubit.range(4)
+    lhs = cirq.DensePauliStringArray.from_pauli_strings(
+        _random_pauli_strings(qubits, 10, seed=3), qubits
+    )
+    rhs = cirq.DensePauliStringArray.from_pauli_strings(
+        _random_pauli_strings(qubits, 7, seed=4), qubits
+    )
+    expected = [[cirq.commutes(p, q) for q in rhs] for p in lhs]
+    np.testing.assert_array_equal(lhs.commutation_matrix(rhs), expected)
+    np.testing.assert_array_equal(
+        lhs.commutation_matrix(), [[cirq.commutes(p, q) for q in lhs] for p in lhs]
+    )
+    with pytest.raises(ValueError, match='same length'):
+        _ = lhs.commutation_matrix(cirq.DensePauliStringArray(np.zeros((1, 3)), np.zeros((1, 3))))
+
+
+def test_mul() -> None:
+    qubits = cirq.LineQubit.range(5)
+    lhs = cirq.DensePauliStringArray.from_pauli_strings(
+        _random_pauli_strings(qubits, 10, seed=5), qubits
+    )
+    rhs = cirq.DensePauliStringArray.from_pauli_strings(
+        _random_pauli_strings(qubits, 10, seed=6), qubits
+    )
+    assert list(lhs * rhs) == [p * q for p, q in zip(lhs, rhs)]
+    assert list(lhs * rhs[3:4]) == [p * rhs[3] for p in lhs]
+    assert list(lhs[3:4] * rhs) == [lhs[3] * q for q in rhs]
+
+    dense = cirq.DensePauliString('XYZIY', coefficient=1j)
+    assert list(lhs * dense) == [p * dense for p in lhs]
+    assert list(dense * lhs) == [dense * p for p in lhs]
+    assert list(cirq.MutableDensePauliString('ZZZZZ') * lhs) == [
+        cirq.DensePauliString('ZZZZZ') * p for p in lhs
+    ]
+    assert list(lhs * 2j) == [p * 2j for p in lhs]
+    assert list(0.5 * lhs) == [p * 0.5 for p in lhs]
+    assert list(-lhs) == [-p for p in lhs]
+
+    with pytest.raises(ValueError, match='same length'):
+        _ = lhs * cirq.DensePauliString('XX')
+    with pytest.raises(ValueError, match='Cannot multiply'):
+        _ = lhs * rhs[:2]
+    with pytest.raises(TypeError):
+        _ = lhs * 'X'
+    with pytest.raises(TypeError):
+        _ = 'X' * lhs
+
+
+def test_getitem() -> None:
+    strings = cirq.DensePauliStringArray.from_pauli_masks(
+        np.array([[0, 1], [2, 3], [3, 3]]), [1, 2, 3]
+    )
+    assert strings[1] == cirq.DensePauliString('YZ', coefficient=2)
+    assert strings[np.int64(2)] == cirq.DensePauliString('ZZ', coefficient=3)
+    assert strings[1:] == cirq.DensePauliStringArray.from_pauli_masks(
+        np.array([[2, 3], [3, 3]]), [2, 3]
+    )
+    assert strings[[0, 2]] == cirq.DensePauliStringArray.from_pauli_masks(
+        np.array([[0, 1], [3, 3]]), [1, 3]
+    )
+
+
+def test_eq() -> None:
+    strings = cirq.DensePauliStringArray([[1, 0]], [[0, 1]])
+    assert strings == cirq.DensePauliStringArray([[1, 0]], [[0, 1]])
+    assert strings != cirq.DensePauliStringArray([[1, 0]], [[1, 1]])
+    assert strings != cirq.DensePauliStringArray([[1, 1]], [[0, 1]])
+    assert strings != cirq.DensePauliStringArray([[1, 0]], [[0, 1]], [-1])
+    assert strings != cirq.DensePauliString('XZ')
+    with pytest.raises(TypeError, match='unhashable'):
+        _ = hash(strings)
+
+
+def test_repr_and_str() -> None:
+    strings = cirq.DensePauliStringArray([[1, 0]], [[1, 1]], [-1])
+    cirq.testing.assert_equivalent_repr(strings)
+    assert str(strings) == '-YZ'
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_after_and_before_match_pauli_strings(seed: int) -> None:
+    qubits = cirq.LineQubit.range(5)
+    pauli_strings = _random_pauli_strings(qubits, 20, seed)
+    circuit = _random_clifford_circuit(qubits, seed)
+    strings = cirq.DensePauliStringArray.from_pauli_strings(pauli_strings, qubits)
+    after = strings.after(circuit, qubits).to_pauli_strings(qubits)
+    assert after == [p.after(circuit) for p in pauli_strings]
+    before = strings.before(circuit, qubits).to_pauli_strings(qubits)
+    assert before == [p.before(circuit) for p in pauli_strings]
+    conjugated = strings.conjugated_by(circuit, qubits).to_pauli_strings(qubits)
+    assert conjugated == [p.conjugated_by(circuit) for p in pauli_strings]
+
+
+@pytest.mark.parametrize('max_table_qubits', [2, 4])
+def test_after_many_qubit_clifford_gate(max_table_qubits: int) -> None:
+    qubits = cirq.LineQubit.range(4)
+    pauli_strings = _random_pauli_strings(qubits, 70, seed=1)
+    gate = cirq.CliffordGate.from_op_list(
+        list(_random_clifford_circuit(qubits, 2).all_operations()), qubits
+    )
+    strings = cirq.DensePauliStringArray.from_pauli_strings(pauli_strings, qubits)
+    ops = [gate.on(*qubits), gate.on(*qubits[::-1])]
+    with mock.patch.object(dense_pauli_string_array, '_MAX_TABLE_QUBITS', max_table_qubits):
+        after = strings.after(ops, qubits)
+        conjugated = strings.conjugated_by(ops, qubits)
+    assert after.to_pauli_strings(qubits) == [p.after(ops) for p in pauli_strings]
+    assert conjugated.to_pauli_strings(qubits) == [p.conjugated_by(ops) for p in pauli_strings]
+
+
+def test_after_groups_operations() -> None:
+    qubits = cirq.LineQubit.range(4)
+    ops = [
+        cirq.CNOT(qubits[0], qubits[1]),
+        cirq.CNOT(qubits[2], qubits[3]),
+        cirq.CNOT(qubits[1], qubits[2]),
+        cirq.H(qubits[0]),
+        cirq.global_phase_operation(1j),
+        cirq.H(qubits[3]),
+        cirq.MatrixGate(cirq.unitary(cirq.S)).on(qubits[0]),
+    ]
+    groups = list(dense_pauli_string_array._groups_of_disjoint_operations(ops))
+    assert groups == [ops[:2], ops[2:3], [ops[3], ops[5]], ops[6:]]
+    interleaved = [cirq.H(qubits[0]), cirq.S(qubits[1]), cirq.H(qubits[2]), cirq.S(qubits[3])]
+    groups = list(dense_pauli_string_array._groups_of_disjoint_operations(interleaved))
+    assert groups == [interleaved[::2], interleaved[1::2]]
+    pauli_strings = _random_pauli_strings(qubits, 20, seed=3)
+    strings = cirq.DensePauliStringArray.from_pauli_strings(pauli_strings, qubits)
+    expected = [p.after(ops) for p in pauli_strings]
+    assert strings.after(ops, qubits).to_pauli_strings(qubits) == expected
+
+
+def test_after_invalid_operations() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    strings = cirq.DensePauliStringArray.from_pauli_strings([cirq.X(q0)], [q0])
+    with pytest.raises(ValueError, match='not in'):
+        _ = strings.after(cirq.CNOT(q0, q1), [q0])
+    with pytest.raises(ValueError, match='distinct qubits'):
+        _ = strings.after(cirq.H(q0), [q0, q0])
+    with pytest.raises(ValueError, match='stabilizer effect'):
+        _ = strings.after(cirq.T(q0), [q0])
+    with pytest.raises(ValueError, match='Not a unitary Clifford operation'):
+        _ = strings.after(cirq.measure(q0), [q0])
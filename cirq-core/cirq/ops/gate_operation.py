@@ -184,6 +184,12 @@ class GateOperation(raw_types.Operation):
             return getter()
         return NotImplemented
 
+    def _unitary_diagonal_(self) -> np.ndarray | NotImplementedType | None:
+        getter = getattr(self.gate, '_unitary_diagonal_', None)
+        if getter is not None:
+            return getter()
+        return NotImplemented
+
     def _commutes_(self, other: Any, *, atol: float = 1e-8) -> bool | NotImplementedType | None:
         commutes = self.gate._commutes_on_qids_(self.qubits, other, atol=atol)
         if commutes is not NotImplemented:
@@ -673,6 +673,41 @@ class PauliSum:
             p._expectation_from_state_vector_no_validation(state_vector, qubit_map) for p in self
         )
 
+    def expectation_from_stabilizer_state(
+        self,
+        state: cirq.StabilizerState,
+        qubit_map: Mapping[raw_types.Qid, int],
+    ) -> float:
+        """Evaluate the expectation of this PauliSum given a stabilizer state.
+
+        The expectation values of all the Pauli strings of the sum are computed
+        exactly and at once with `state.pauli_expectations`, in polynomial time
+        in the number of qubits of `state`.
+
+        Args:
+            state: The stabilizer state.
+            qubit_map: A map from all qubits used in this PauliSum to the
+                indices of the qubits that `state` is defined over.
+
+        Returns:
+            The expectation value of the input state.
+
+        Raises:
+            NotImplementedError: If any of the coefficients are imaginary,
+                so that this is not Hermitian.
+            ValueError: If the qubit map does not match the state.
+        """
+        units, coefficients = zip(*self._linear_dict.items()) if self._linear_dict else ((), ())
+        if any(abs(complex(c).imag) > 0.0001 for c in coefficients):
+            raise NotImplementedError(
+                "Cannot compute expectation value of a non-Hermitian "
+                f"PauliString <{self}>. Coefficient must be real."
+            )
+        _validate_qubit_mapping(qubit_map, self.qubits, state.n)
+        masks = pauli_string._pauli_masks(units, qubit_map, state.n)
+        real_coefficients = np.array([complex(c).real for c in coefficients], dtype=np.float64)
+        return float(real_coefficients @ state.pauli_expectations(masks))
+
     def expectation_from_density_matrix(
         self,
         state: np.ndarray,
@@ -1371,6 +1371,44 @@ def test_expectation_from_state_vector_two_qubit_states():
         )
 
 
+def test_expectation_from_stabilizer_state():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.S(q1), cirq.X(q2))
+    q_map = {q0: 0, q1: 1, q2: 2}
+    tableau = cirq.CliffordTableauSimulationState(cirq.CliffordTableau(3), qubits=[q0, q1, q2])
+    ch_form = cirq.StabilizerChFormSimulationState(qubits=[q0, q1, q2])
+    for op in circuit.all_operations():
+        cirq.act_on(op, tableau)
+        cirq.act_on(op, ch_form)
+    state_vector = cirq.final_state_vector(circuit, qubit_order=[q0, q1, q2])
+    psum = (
+        1.5
+        - 2 * cirq.Z(q2)
+        + cirq.X(q0) * cirq.Y(q1)
+        + 0.25 * cirq.Y(q0) * cirq.X(q1)
+        + 3 * cirq.X(q0)
+        - cirq.Z(q0) * cirq.Z(q1) * cirq.Z(q2)
+    )
+    expected = psum.expectation_from_state_vector(state_vector, q_map)
+    for state in [tableau.tableau, ch_form.state]:
+        actual = psum.expectation_from_stabilizer_state(state, q_map)
+        assert isinstance(actual, float)
+        np.testing.assert_allclose(actual, expected, atol=1e-8)
+    assert cirq.PauliSum().expectation_from_stabilizer_state(tableau.tableau, q_map) == 0
+
+
+def test_expectation_from_stabilizer_state_invalid_input():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    psum = cirq.X(q0) + 2 * cirq.Y(q1)
+    state = cirq.CliffordTableau(2)
+    with pytest.raises(NotImplementedError, match='non-Hermitian'):
+        ((1j + 1) * psum).expectation_from_stabilizer_state(state, {q0: 0, q1: 1})
+    with pytest.raises(ValueError, match='complete'):
+        psum.expectation_from_stabilizer_state(state, {q0: 0, q2: 1})
+    with pytest.raises(ValueError, match='indices'):
+        psum.expectation_from_stabilizer_state(state, {q0: 0, q1: 2})
+
+
 def test_expectation_from_density_matrix_invalid_input():
     q0, q1, q2, q3 = cirq.LineQubit.range(4)
     psum = cirq.X(q0) + 2 * cirq.Y(q1) + 3 * cirq.Z(q3)
@@ -37,6 +37,9 @@ three_qubit_decomposition = _import.LazyLoader(
     'three_qubit_decomposition', globals(), 'cirq.transformers.analytical_decompositions'
 )
 
+# The number of amplitudes `MatrixGate` multiplies by its matrix at once.
+_MAX_CHUNK_SIZE = 2**20
+
 
 class MatrixGate(raw_types.Gate):
     r"""A unitary qubit or qudit gate defined entirely by its numpy matrix.
@@ -185,6 +188,36 @@ class MatrixGate(raw_types.Gate):
     def _unitary_(self) -> np.ndarray:
         return np.copy(self._matrix)
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        diagonal = np.diagonal(self._matrix)
+        if np.count_nonzero(self._matrix) != np.count_nonzero(diagonal):
+            return None
+        return diagonal.copy()
+
+    def _apply_unitary_(self, args: cirq.ApplyUnitaryArgs) -> np.ndarray | None:
+        """Applies multi-qudit matrices as matrix products.
+
+        `np.einsum` slows down considerably when the target axes are not the
+        trailing axes of a contiguous state, so the state is instead copied in
+        chunks with the target axes last and multiplied by the matrix.
+        """
+        if len(self._qid_shape) < 2:
+            return NotImplemented
+        k = len(self._qid_shape)
+        matrix_t = self._matrix.T.astype(args.target_tensor.dtype)
+        target = np.moveaxis(args.target_tensor, args.axes, range(-k, 0))
+        out = np.moveaxis(args.available_buffer, args.axes, range(-k, 0))
+        num_chunk_axes = 0
+        while num_chunk_axes < target.ndim - k and (
+            np.prod(target.shape[num_chunk_axes:], dtype=np.int64) > _MAX_CHUNK_SIZE
+        ):
+            num_chunk_axes += 1
+        for index in np.ndindex(*target.shape[:num_chunk_axes]):
+            chunk = target[index]
+            product = chunk.reshape(-1, matrix_t.shape[0]) @ matrix_t
+            out[index] = product.reshape(chunk.shape)
+        return args.available_buffer
+
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
         n_qubits = len(self._qid_shape)
         # No diagram for zero-qubit gates; let fallback handle it
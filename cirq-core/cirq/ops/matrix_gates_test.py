@@ -15,12 +15,14 @@
 from __future__ import annotations
 
 import re
+from unittest import mock
 
 import numpy as np
 import pytest
 import sympy
 
 import cirq
+from cirq.ops import matrix_gates
 
 H = np.array([[1, 1], [1, -1]]) * np.sqrt(0.5)
 HH = cirq.kron(H, H)
@@ -426,3 +428,29 @@ def test_decompose_when_qubits_not_in_ascending_order():
     circuit2 = cirq.Circuit(decomposed)
     u2 = cirq.unitary(circuit2)
     np.testing.assert_allclose(u1, u2, atol=1e-14)
+
+
+@pytest.mark.parametrize('axes', [[0, 1], [1, 0], [3, 6], [7, 2], [6, 7], [0, 4, 2]])
+@pytest.mark.parametrize('max_chunk_size', [2**20, 8])
+def test_apply_unitary_matches_einsum(axes, max_chunk_size):
+    gate = cirq.MatrixGate(cirq.testing.random_unitary(2 ** len(axes), random_state=1))
+    state = cirq.testing.random_superposition(2**8, random_state=2).reshape((2,) * 8)
+    expected = cirq.targeted_left_multiply(
+        cirq.unitary(gate).reshape((2,) * 2 * len(axes)), state, axes
+    )
+    with mock.patch.object(matrix_gates, '_MAX_CHUNK_SIZE', max_chunk_size):
+        result = cirq.apply_unitary(
+            gate, cirq.ApplyUnitaryArgs(state.copy(), np.empty_like(state), axes)
+        )
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+
+
+def test_apply_unitary_qudits():
+    gate = cirq.MatrixGate(cirq.testing.random_unitary(6, random_state=1), qid_shape=(3, 2))
+    state = cirq.testing.random_superposition(36, random_state=2).reshape((2, 3, 3, 2))
+    expected = cirq.targeted_left_multiply(cirq.unitary(gate).reshape(3, 2, 3, 2), state, [2, 0])
+    result = cirq.apply_unitary(
+        gate, cirq.ApplyUnitaryArgs(state.copy(), np.empty_like(state), [2, 0])
+    )
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+    cirq.testing.assert_has_consistent_apply_unitary(gate)
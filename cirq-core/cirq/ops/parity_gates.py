@@ -340,6 +340,13 @@ class ZZPowGate(gate_features.InterchangeableQubitsGate, eigen_gate.EigenGate):
 
         return args.target_tensor
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        if protocols.is_parameterized(self):
+            return None
+        global_phase = 1j ** (2 * self._exponent * self._global_shift)
+        relative_phase = 1j ** (2 * self.exponent)
+        return global_phase * np.array([1, relative_phase, relative_phase, 1])
+
     def _phase_by_(self, phase_turns: float, qubit_index: int) -> ZZPowGate:
         return self
 
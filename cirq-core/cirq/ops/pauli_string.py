@@ -613,6 +613,41 @@ class PauliString(raw_types.Operation, Generic[TKey]):
             np.tensordot(state_vector.conj(), ket, axes=len(ket.shape)).item()
         )
 
+    def expectation_from_stabilizer_state(
+        self,
+        state: cirq.StabilizerState,
+        qubit_map: Mapping[TKey, int],
+    ) -> float:
+        """Evaluate the expectation of this PauliString given a stabilizer state.
+
+        The expectation value is computed exactly in polynomial time in the
+        number of qubits of `state`. See `cirq.PauliSum.expectation_from_stabilizer_state`
+        to compute the expectation values of many Pauli strings at once.
+
+        Args:
+            state: The stabilizer state.
+            qubit_map: A map from all qubits used in this PauliString to the
+                indices of the qubits that `state` is defined over.
+
+        Returns:
+            The expectation value of the input state.
+
+        Raises:
+            NotImplementedError: If this PauliString is non-Hermitian or
+                parameterized.
+            ValueError: If the qubit map does not match the state.
+        """
+        if self._is_parameterized_():
+            raise NotImplementedError('Cannot get expectation value when parameterized')
+        if abs(cast(complex, self.coefficient).imag) > 0.0001:
+            raise NotImplementedError(
+                'Cannot compute expectation value of a non-Hermitian '
+                f'PauliString <{self}>. Coefficient must be real.'
+            )
+        _validate_qubit_mapping(qubit_map, self.qubits, state.n)
+        masks = _pauli_masks([self.items()], qubit_map, state.n)
+        return cast(complex, self.coefficient).real * float(state.pauli_expectations(masks)[0])
+
     def expectation_from_density_matrix(
         self,
         state: np.ndarray,
@@ -1141,6 +1176,30 @@ def _validate_qubit_mapping(
         )
 
 
+def _pauli_masks(
+    pauli_strings: Iterable[Iterable[tuple[TKey, cirq.PAULI_GATE_LIKE]]],
+    qubit_map: Mapping[TKey, int],
+    num_qubits: int,
+) -> np.ndarray:
+    """Returns the Paulis of Pauli strings as rows of Pauli masks, as in `cirq.DensePauliString`.
+
+    Each Pauli string is given by its (qubit, Pauli) pairs, e.g. `cirq.PauliString.items()`.
+    """
+    qubits: list[int] = []
+    paulis: list[int] = []
+    rows: list[int] = []
+    num_pauli_strings = 0
+    for pauli_string in pauli_strings:
+        for q, pauli in pauli_string:
+            qubits.append(qubit_map[q])
+            paulis.append(PAULI_GATE_LIKE_TO_INDEX_MAP[pauli])
+            rows.append(num_pauli_strings)
+        num_pauli_strings += 1
+    masks = np.zeros((num_pauli_strings, num_qubits), dtype=np.uint8)
+    masks[rows, qubits] = paulis
+    return masks
+
+
 def _try_interpret_as_pauli_string(op: Any):
     """Return a reprepresentation of an operation as a pauli string, if it is possible."""
     if isinstance(op, gate_operation.GateOperation):
@@ -1093,6 +1093,46 @@ def test_pauli_string_expectation_from_state_vector_pure_state_with_coef():
         np.testing.assert_allclose(z1x2.expectation_from_state_vector(state, q_map), 1, atol=1e-8)
 
 
+def test_expectation_from_stabilizer_state():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.S(q1), cirq.X(q2))
+    q_map = {q0: 0, q1: 1, q2: 2}
+    tableau = cirq.CliffordTableauSimulationState(cirq.CliffordTableau(3), qubits=[q0, q1, q2])
+    ch_form = cirq.StabilizerChFormSimulationState(qubits=[q0, q1, q2])
+    for op in circuit.all_operations():
+        cirq.act_on(op, tableau)
+        cirq.act_on(op, ch_form)
+    state_vector = cirq.final_state_vector(circuit, qubit_order=[q0, q1, q2])
+    for pauli_string in [
+        cirq.PauliString(),
+        -2 * cirq.Z(q2),
+        cirq.X(q0) * cirq.Y(q1),
+        0.5 * cirq.Y(q0) * cirq.X(q1),
+        cirq.Z(q0) * cirq.Z(q1) * cirq.Z(q2),
+        cirq.X(q0),
+    ]:
+        expected = pauli_string.expectation_from_state_vector(state_vector, q_map)
+        for state in [tableau.tableau, ch_form.state]:
+            actual = pauli_string.expectation_from_stabilizer_state(state, q_map)
+            assert isinstance(actual, float)
+            np.testing.assert_allclose(actual, expected, atol=1e-8)
+
+
+def test_expectation_from_stabilizer_state_invalid_input():
+    q0, q1 = cirq.LineQubit.range(2)
+    state = cirq.CliffordTableau(2)
+    with pytest.raises(NotImplementedError, match='non-Hermitian'):
+        (1j * cirq.X(q0)).expectation_from_stabilizer_state(state, {q0: 0})
+    with pytest.raises(NotImplementedError, match='parameterized'):
+        cirq.PauliString(
+            cirq.X(q0), coefficient=sympy.Symbol('a')
+        ).expectation_from_stabilizer_state(state, {q0: 0})
+    with pytest.raises(ValueError, match='complete'):
+        cirq.X(q1).expectation_from_stabilizer_state(state, {q0: 0})
+    with pytest.raises(ValueError, match='indices'):
+        cirq.X(q0).expectation_from_stabilizer_state(state, {q0: 2})
+
+
 def test_expectation_from_density_matrix_invalid_input():
     q0, q1, q2, q3 = _make_qubits(4)
     ps = cirq.PauliString({q0: cirq.X, q1: cirq.Y})
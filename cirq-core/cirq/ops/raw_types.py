@@ -853,6 +853,9 @@ class TaggedOperation(Operation):
     def _unitary_(self) -> np.ndarray | NotImplementedType:
         return protocols.unitary(self.sub_operation, NotImplemented)
 
+    def _unitary_diagonal_(self) -> np.ndarray | NotImplementedType:
+        return protocols.unitary_diagonal(self.sub_operation, NotImplemented)
+
     def _commutes_(self, other: Any, *, atol: float = 1e-8) -> bool | NotImplementedType | None:
         return protocols.commutes(self.sub_operation, other, atol=atol)
 
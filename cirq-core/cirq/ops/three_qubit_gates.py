@@ -135,6 +135,12 @@ class CCZPowGate(gate_features.InterchangeableQubitsGate, eigen_gate.EigenGate):
             args.target_tensor *= p
         return args.target_tensor
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        if protocols.is_parameterized(self):
+            return None
+        p = 1j ** (2 * self._exponent * self._global_shift)
+        return p * np.array([1] * 7 + [np.exp(1j * self.exponent * np.pi)])
+
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
         return protocols.CircuitDiagramInfo(('@', '@', '@'), exponent=self._diagram_exponent(args))
 
@@ -256,6 +262,11 @@ class ThreeQubitDiagonalGate(raw_types.Gate):
             args.target_tensor[subspace_index] *= np.exp(1j * angle)
         return args.target_tensor
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        if self._is_parameterized_():
+            return None
+        return np.exp(1j * np.array(self._diag_angles_radians, dtype=float))
+
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
         rounded_angles = np.array(self._diag_angles_radians)
         if args.precision is not None:
@@ -114,6 +114,11 @@ class TwoQubitDiagonalGate(raw_types.Gate):
             args.target_tensor[subspace_index] *= np.exp(1j * angle)
         return args.target_tensor
 
+    def _unitary_diagonal_(self) -> np.ndarray | None:
+        if self._is_parameterized_():
+            return None
+        return np.exp(1j * np.array(self._diag_angles_radians, dtype=float))
+
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
         rounded_angles = np.array(self._diag_angles_radians)
         if args.precision is not None:
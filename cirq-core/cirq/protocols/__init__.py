@@ -174,3 +174,8 @@ from cirq.protocols.qid_shape_protocol import (
 )
 
 from cirq.protocols.unitary_protocol import SupportsUnitary as SupportsUnitary, unitary as unitary
+
+from cirq.protocols.unitary_diagonal_protocol import (
+    SupportsUnitaryDiagonal as SupportsUnitaryDiagonal,
+    unitary_diagonal as unitary_diagonal,
+)
@@ -27,6 +27,7 @@ from cirq._doc import doc_private
 from cirq.protocols import qid_shape_protocol
 from cirq.protocols.apply_unitary_protocol import apply_unitary, ApplyUnitaryArgs
 from cirq.protocols.kraus_protocol import kraus
+from cirq.protocols.mixture_protocol import mixture
 
 # This is a special indicator value used by the apply_channel method
 # to determine whether or not the caller provided a 'default' argument. It must
@@ -36,6 +37,9 @@ from cirq.protocols.kraus_protocol import kraus
 
 RaiseTypeErrorIfNotProvided: np.ndarray = np.array([])
 
+# Channels on at most this many qudits are applied as a superoperator.
+_MAX_SUPEROPERATOR_QUDITS = 2
+
 TDefault = TypeVar('TDefault')
 
 
@@ -174,9 +178,12 @@ def apply_channel(
     used to apply `val`'s channel effect to the target tensor. Otherwise, if
     `val` defines an `_apply_unitary_` method, that method will be used to
     apply `val`s channel effect to the target tensor.  Otherwise, if `val`
-    returns a non-default channel with `cirq.channel`, that channel will be
-    applied using a generic method.  If none of these cases apply, an
-    exception is raised or the specified default value is returned.
+    is a mixture of Pauli strings on qubits, such as `cirq.depolarize`, the
+    mixture is applied as elementwise products with permutations of the
+    target tensor.  Otherwise, if `val` returns a non-default channel with
+    `cirq.kraus`, that channel will be applied using a generic method.  If
+    none of these cases apply, an exception is raised or the specified default
+    value is returned.
 
 
     Args:
@@ -256,6 +263,11 @@ def apply_channel(
     if result is not None:
         return result
 
+    # Possibly use the object's mixture of Pauli strings.
+    result = _apply_pauli_mixture(val, args)
+    if result is not None:
+        return result
+
     # Fallback to using the object's `_kraus_` matrices.
     ks = kraus(val, None)
     if ks is not None:
@@ -294,43 +306,119 @@ def _apply_unitary(val: Any, args: ApplyChannelArgs) -> np.ndarray | None:
     return right_result
 
 
+def _pauli_string_bits(u: np.ndarray) -> tuple[int, int] | None:
+    """Returns the bits `(x, z)` of a Pauli string matrix, or None if it is not one.
+
+    A Pauli string on qubits is, up to global phase, `X**x Z**z` with the bits of `x` and `z`
+    selecting the qubits in big-endian order. Its row `i` has a single nonzero entry, in column
+    `i ^ x`, equal to `(-1)**popcount(z & (i ^ x))` times the phase.
+    """
+    rows = np.arange(u.shape[0])
+    x = int(np.argmax(np.abs(u[0])))
+    if not np.isclose(abs(u[x, 0]), 1):
+        return None
+    entries = u[rows ^ x, rows] / u[x, 0]
+    z = sum(1 << b for b in range(u.shape[0].bit_length() - 1) if entries[1 << b].real < 0)
+    if not np.allclose(entries, _pauli_z_signs(rows, z)):
+        return None
+    return x, z
+
+
+def _pauli_z_signs(indices: np.ndarray, z: int) -> np.ndarray:
+    """Returns the signs `(-1)**popcount(z & i)` of the diagonal of `Z**z` at the indices."""
+    parities = np.zeros(len(indices), dtype=np.int64)
+    for b in range(z.bit_length()):
+        if z >> b & 1:
+            parities ^= indices >> b & 1
+    return 1 - 2 * parities
+
+
+def _apply_pauli_mixture(val: Any, args: ApplyChannelArgs) -> np.ndarray | None:
+    """Applies a mixture of Pauli strings as products with flips of the target tensor.
+
+    A term `p P ρ P†` with `P = X**x Z**z` maps each entry `ρ[i, j]` to
+    `p (-1)**popcount(z & (i ^ j)) ρ[i ^ x, j ^ x]`. Grouping the terms by `x`, the channel is
+    a sum of the target tensor multiplied by a table of weights indexed by `i ^ j` and flipped
+    along the axes of the bits of `x`, so that it is applied in a few passes over the target.
+
+    Returns None if `val` is not a mixture of Pauli strings on qubits.
+    """
+    if any(args.target_tensor.shape[i] != 2 for i in args.left_axes):
+        return None
+    mix = mixture(val, None)
+    if mix is None:
+        return None
+    n = len(args.left_axes)
+    d = 2**n
+    indices = np.arange(d)
+    weights: dict[int, np.ndarray] = {}
+    for p, u in mix:
+        bits = _pauli_string_bits(u)
+        if bits is None:
+            return None
+        x, z = bits
+        weights[x] = weights.get(x, 0) + p * _pauli_z_signs(indices, z)
+
+    axes = [*args.left_axes, *args.right_axes]
+    shape = [1] * args.target_tensor.ndim
+    for axis in axes:
+        shape[axis] = 2
+    xor = np.bitwise_xor.outer(indices, indices)
+
+    def weight_table(x: int) -> np.ndarray:
+        table = weights.pop(x)[xor].astype(args.target_tensor.dtype)
+        return table.reshape((2,) * (2 * n)).transpose(np.argsort(axes)).reshape(shape)
+
+    if 0 in weights:
+        np.multiply(args.target_tensor, weight_table(0), out=args.out_buffer)
+    else:
+        args.out_buffer[...] = 0
+    for x in list(weights):
+        flip_axes = tuple(
+            axis
+            for q in range(n)
+            if x >> (n - 1 - q) & 1
+            for axis in (args.left_axes[q], args.right_axes[q])
+        )
+        np.multiply(args.target_tensor, weight_table(x), out=args.auxiliary_buffer0)
+        args.out_buffer += np.flip(args.auxiliary_buffer0, flip_axes)
+    return args.out_buffer
+
+
 def _apply_kraus(kraus: tuple[np.ndarray] | Sequence[Any], args: ApplyChannelArgs) -> np.ndarray:
     """Directly apply the kraus operators to the target tensor."""
+    # Small channels are applied as a superoperator, which is sparse for most of them.
+    if len(args.left_axes) <= _MAX_SUPEROPERATOR_QUDITS:
+        return _apply_superoperator(kraus, args)
     # Initialize output.
     args.out_buffer[:] = 0
     # Stash initial state into buffer0.
     np.copyto(dst=args.auxiliary_buffer0, src=args.target_tensor)
-
-    # Special case for single-qubit operations.
-    if len(args.left_axes) == 1 and kraus[0].shape == (2, 2):
-        return _apply_kraus_single_qubit(kraus, args)
     # Fallback to np.einsum for the general case.
     return _apply_kraus_multi_qubit(kraus, args)
 
 
-def _apply_kraus_single_qubit(
-    kraus: tuple[Any] | Sequence[Any], args: ApplyChannelArgs
-) -> np.ndarray:
-    """Use slicing to apply single qubit channel.  Only for two-level qubits."""
-    zero_left = linalg.slice_for_qubits_equal_to(args.left_axes, 0)
-    one_left = linalg.slice_for_qubits_equal_to(args.left_axes, 1)
-    zero_right = linalg.slice_for_qubits_equal_to(args.right_axes, 0)
-    one_right = linalg.slice_for_qubits_equal_to(args.right_axes, 1)
-    for kraus_op in kraus:
-        np.copyto(dst=args.target_tensor, src=args.auxiliary_buffer0)
-        linalg.apply_matrix_to_slices(
-            args.target_tensor, kraus_op, [zero_left, one_left], out=args.auxiliary_buffer1
-        )
-        # No need to transpose as we are acting on the tensor
-        # representation of matrix, so transpose is done for us.
-        linalg.apply_matrix_to_slices(
-            args.auxiliary_buffer1,
-            np.conjugate(kraus_op),
-            [zero_right, one_right],
-            out=args.target_tensor,
+def _apply_superoperator(kraus: tuple[Any] | Sequence[Any], args: ApplyChannelArgs) -> np.ndarray:
+    """Use slicing to apply the superoperator of a channel on few qudits.
+
+    The superoperator `sum_k K ⊗ K*` maps the slice of the target tensor for each pair of left
+    and right indices to a combination of slices, skipping its zero entries.
+    """
+    superoperator = sum(np.kron(k, np.conjugate(k)) for k in kraus)
+    slices = [
+        linalg.slice_for_qubits_equal_to(
+            [*args.left_axes, *args.right_axes],
+            big_endian_qureg_value=i,
+            qid_shape=args.target_tensor.shape,
         )
-        args.out_buffer += args.target_tensor
-    return args.out_buffer
+        for i in range(len(superoperator))
+    ]
+    return linalg.apply_matrix_to_slices(
+        args.target_tensor,
+        superoperator.astype(args.target_tensor.dtype),
+        slices,
+        out=args.out_buffer,
+    )
 
 
 def _apply_kraus_multi_qubit(
@@ -311,3 +311,100 @@ def test_apply_channel_apply_unitary_not_implemented():
                 auxiliary_buffer1=aux_buf1,
             ),
         )
+
+
+class PauliMixture:
+    def __init__(self, *mixture):
+        self._mixture = mixture
+
+    def _num_qubits_(self):
+        return cirq.num_qubits(self._mixture[0][1])
+
+    def _mixture_(self):
+        return self._mixture
+
+
+class KrausChannel:
+    def __init__(self, *kraus, qid_shape=None):
+        self._kraus = kraus
+        self._qid_shape = qid_shape or (2,) * int(np.log2(len(kraus[0])))
+
+    def _qid_shape_(self):
+        return self._qid_shape
+
+    def _kraus_(self):
+        return self._kraus
+
+
+def assert_matches_kraus_operators(val, rho, left_axes, right_axes):
+    expected = np.zeros_like(rho)
+    qid_shape = tuple(rho.shape[i] for i in left_axes)
+    for k in cirq.kraus(val):
+        k_tensor = k.reshape(qid_shape * 2)
+        left = cirq.targeted_left_multiply(k_tensor, rho, left_axes)
+        expected += cirq.targeted_left_multiply(np.conjugate(k_tensor), left, right_axes)
+    result = apply_channel(val, rho.copy(), left_axes, right_axes, assert_result_is_out_buf=True)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    'val, left_axes',
+    [
+        (cirq.depolarize(0.1), [1]),
+        (cirq.depolarize(0.2, n_qubits=2), [2, 0]),
+        (cirq.depolarize(0.3, n_qubits=3), [3, 0, 2]),
+        (cirq.asymmetric_depolarize(error_probabilities={'XZ': 0.1, 'YI': 0.2, 'II': 0.7}), [1, 3]),
+        (cirq.bit_flip(0.2), [0]),
+        (cirq.phase_flip(0.3), [2]),
+        (cirq.asymmetric_depolarize(0.1, 0.2, 0.3), [3]),
+        (PauliMixture((0.5, cirq.X), (0.5, cirq.Y)), [1]),
+        (
+            PauliMixture((0.4, cirq.DensePauliString('XZ')), (0.6, -cirq.DensePauliString('YY'))),
+            [0, 3],
+        ),
+        (PauliMixture((0.5, cirq.I), (0.5, cirq.H)), [2]),
+        (PauliMixture((0.5, cirq.I), (0.5, cirq.S)), [2]),
+        (PauliMixture((0.5, cirq.CZ), (0.5, cirq.CNOT)), [1, 2]),
+        (cirq.amplitude_damp(0.3), [1]),
+        (cirq.generalized_amplitude_damp(0.2, 0.3), [0]),
+        (
+            KrausChannel(
+                *(
+                    np.kron(np.kron(a, b), c)
+                    for a in cirq.kraus(cirq.amplitude_damp(0.1))
+                    for b in cirq.kraus(cirq.amplitude_damp(0.2))
+                    for c in cirq.kraus(cirq.phase_damp(0.3))
+                )
+            ),
+            [2, 3, 0],
+        ),
+    ],
+)
+def test_apply_channel_mixture_and_kraus_kernels(val, left_axes):
+    rng = np.random.default_rng(1)
+    rho = rng.normal(size=(2,) * 8) + 1j * rng.normal(size=(2,) * 8)
+    assert_matches_kraus_operators(val, rho, left_axes, [axis + 4 for axis in left_axes])
+
+
+def test_apply_channel_kraus_kernel_qudits():
+    rng = np.random.default_rng(2)
+    rho = rng.normal(size=(3, 2, 3, 2)) + 1j * rng.normal(size=(3, 2, 3, 2))
+    u = cirq.testing.random_unitary(3, random_state=3)
+    val = KrausChannel(np.sqrt(0.3) * np.eye(3), np.sqrt(0.7) * u, qid_shape=(3,))
+    assert_matches_kraus_operators(val, rho, [0], [2])
+    val = KrausChannel(
+        np.sqrt(0.5) * np.eye(6), np.sqrt(0.5) * np.kron(u, cirq.unitary(cirq.X)), qid_shape=(3, 2)
+    )
+    assert_matches_kraus_operators(val, rho, [0, 1], [2, 3])
+
+
+def test_apply_channel_pauli_mixture_complex64():
+    rho = cirq.testing.random_density_matrix(4, random_state=4).astype(np.complex64)
+    rho = rho.reshape((2,) * 4)
+    result = apply_channel(
+        cirq.depolarize(0.2, n_qubits=2), rho, [0, 1], [2, 3], assert_result_is_out_buf=True
+    )
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(
+        result.reshape(4, 4), (0.8 - 0.2 / 15) * rho.reshape(4, 4) + 0.8 / 15 * np.eye(4), atol=1e-6
+    )
@@ -34,6 +34,7 @@ TestSpec = ModuleJsonTestSpec(
         'CircuitSampleJob',
         'CliffordSimulatorStepResult',
         'CliffordTrialResult',
+        'DensePauliStringArray',
         'DensityMatrixSimulator',
         'DensityMatrixStepResult',
         'DensityMatrixTrialResult',
@@ -53,6 +54,9 @@ TestSpec = ModuleJsonTestSpec(
         'SimulationTrialResult',
         'SimulationTrialResultBase',
         'SparseSimulatorStep',
+        'StabilizerRankState',
+        'StabilizerRankStepResult',
+        'StabilizerRankTrialResult',
         'StateVectorMixin',
         'TextDiagramDrawer',
         'Timestamp',
@@ -75,6 +79,7 @@ TestSpec = ModuleJsonTestSpec(
         'SimulationState',
         'SimulationStateBase',
         'StabilizerChFormSimulationState',
+        'StabilizerRankSimulationState',
         'StabilizerSimulationState',
         'StateVectorSimulationState',
         # Abstract base class for creating compilation targets.
@@ -84,6 +89,8 @@ TestSpec = ModuleJsonTestSpec(
         # are ignore_failures, tolerance, and other feature flags
         'MEASUREMENT_KEY_SEPARATOR',
         'PointOptimizer',
+        # Mutable builder of immutable moments.
+        'MomentBuilder',
         # Transformers
         'DecompositionContext',
         'TransformerLogger',
@@ -142,6 +149,7 @@ TestSpec = ModuleJsonTestSpec(
         'SupportsQasmWithArgsAndQubits',
         'SupportsTraceDistanceBound',
         'SupportsUnitary',
+        'SupportsUnitaryDiagonal',
         # mypy types:
         'CIRCUIT_LIKE',
         'DURATION_LIKE',
@@ -167,6 +175,7 @@ TestSpec = ModuleJsonTestSpec(
         # utility:
         'CliffordSimulator',
         'Simulator',
+        'StabilizerRankSimulator',
         'StabilizerSampler',
         'DEFAULT_RESOLVERS',
     ],
@@ -0,0 +1,95 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from types import NotImplementedType
+from typing import Any, TypeVar
+
+import numpy as np
+from typing_extensions import Protocol
+
+from cirq._doc import doc_private
+
+# This is a special indicator value used by the unitary_diagonal method to
+# determine whether or not the caller provided a 'default' argument.
+RaiseTypeErrorIfNotProvided: np.ndarray = np.array([])
+
+TDefault = TypeVar('TDefault')
+
+
+class SupportsUnitaryDiagonal(Protocol):
+    """An object whose unitary matrix is known to be diagonal."""
+
+    @doc_private
+    def _unitary_diagonal_(self) -> np.ndarray | NotImplementedType | None:
+        """The diagonal of the unitary matrix of a diagonal value, e.g. `cirq.CZ`.
+
+        This method is used by the global `cirq.unitary_diagonal` method.
+        Simulators use it to multiply the state by the phases of a diagonal
+        gate in place, instead of applying its full matrix, and to fuse
+        consecutive diagonal gates into a single table of phases.
+
+        The entries are ordered like the rows of the unitary matrix returned by
+        `cirq.unitary`. Values should only implement this method when computing
+        their diagonal is cheap, as it is called for every simulated
+        operation.
+
+        Returns:
+            A 1D array with the diagonal of the unitary matrix, or
+            NotImplemented or None if the diagonal is not known, e.g. because
+            the value is parameterized.
+        """
+
+
+def unitary_diagonal(
+    val: Any, default: np.ndarray | TDefault = RaiseTypeErrorIfNotProvided
+) -> np.ndarray | TDefault:
+    """Returns the diagonal of the unitary matrix of a diagonal value.
+
+    Unlike `cirq.unitary`, this never computes the full unitary matrix of
+    `val` to check whether it is diagonal: the diagonal is only known if `val`
+    has a `_unitary_diagonal_` method that returns something besides None or
+    NotImplemented.
+
+    Args:
+        val: The value to describe with a diagonal.
+        default: Determines the fallback behavior when the diagonal of `val`
+            is not known. If `default` is not set, a TypeError is raised. If
+            `default` is set to a value, that value is returned.
+
+    Returns:
+        The diagonal of the unitary matrix of `val` as a 1D array, ordered like
+        the rows of `cirq.unitary(val)`. Otherwise, if `default` is specified,
+        it is returned.
+
+    Raises:
+        TypeError: The diagonal of `val` is not known and no default value was
+            specified.
+    """
+    getter = getattr(val, '_unitary_diagonal_', None)
+    result = NotImplemented if getter is None else getter()
+    if result is not NotImplemented and result is not None:
+        return result
+
+    if default is not RaiseTypeErrorIfNotProvided:
+        return default
+    if getter is None:
+        raise TypeError(
+            f"cirq.unitary_diagonal failed. Value has no _unitary_diagonal_ method: {val!r}"
+        )
+    raise TypeError(
+        "cirq.unitary_diagonal failed. "
+        f"Value's _unitary_diagonal_ method returned {result!r}: {val!r}"
+    )
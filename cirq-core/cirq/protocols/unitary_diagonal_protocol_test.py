@@ -0,0 +1,100 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def test_unitary_diagonal() -> None:
+    class NoMethod:
+        pass
+
+    class ReturnsNotImplemented:
+        def _unitary_diagonal_(self):
+            return NotImplemented
+
+    class ReturnsNone:
+        def _unitary_diagonal_(self):
+            return None
+
+    class Yes:
+        def _unitary_diagonal_(self):
+            return np.array([1, -1])
+
+    with pytest.raises(TypeError, match='no _unitary_diagonal_ method'):
+        _ = cirq.unitary_diagonal(NoMethod())
+    with pytest.raises(TypeError, match='returned NotImplemented'):
+        _ = cirq.unitary_diagonal(ReturnsNotImplemented())
+    with pytest.raises(TypeError, match='returned None'):
+        _ = cirq.unitary_diagonal(ReturnsNone())
+    assert cirq.unitary_diagonal(NoMethod(), None) is None
+    assert cirq.unitary_diagonal(ReturnsNotImplemented(), 'default') == 'default'
+    assert cirq.unitary_diagonal(ReturnsNone(), None) is None
+    np.testing.assert_array_equal(cirq.unitary_diagonal(Yes()), [1, -1])
+    np.testing.assert_array_equal(cirq.unitary_diagonal(Yes(), None), [1, -1])
+
+
+@pytest.mark.parametrize(
+    'val',
+    [
+        cirq.Z,
+        cirq.S,
+        cirq.Z**0.3,
+        cirq.ZPowGate(exponent=0.2, global_shift=0.1),
+        cirq.ZPowGate(exponent=0.7, dimension=3),
+        cirq.CZ,
+        cirq.CZ**0.4,
+        cirq.CZPowGate(exponent=0.3, global_shift=-0.2),
+        cirq.CCZ,
+        cirq.CCZ**-0.6,
+        cirq.ZZ,
+        cirq.ZZ**0.25,
+        cirq.ZZPowGate(exponent=0.5, global_shift=0.3),
+        cirq.DiagonalGate([0.1, 0.2, 0.3, 0.4]),
+        cirq.TwoQubitDiagonalGate([0.5, 0.2, 0.1, 0.4]),
+        cirq.ThreeQubitDiagonalGate([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8]),
+        cirq.MatrixGate(np.diag([1j, -1, 1, -1j])),
+        cirq.CZ(*cirq.LineQubit.range(2)),
+        cirq.Z(cirq.LineQubit(0)).with_tags('tag'),
+    ],
+)
+def test_consistent_with_unitary(val) -> None:
+    np.testing.assert_allclose(
+        cirq.unitary_diagonal(val), np.diagonal(cirq.unitary(val)), atol=1e-8
+    )
+
+
+@pytest.mark.parametrize(
+    'val',
+    [
+        cirq.X,
+        cirq.Z ** sympy.Symbol('t'),
+        cirq.CZ ** sympy.Symbol('t'),
+        cirq.CCZ ** sympy.Symbol('t'),
+        cirq.ZZ ** sympy.Symbol('t'),
+        cirq.DiagonalGate([sympy.Symbol('t'), 0]),
+        cirq.TwoQubitDiagonalGate([sympy.Symbol('t'), 0, 0, 0]),
+        cirq.ThreeQubitDiagonalGate([sympy.Symbol('t')] + [0] * 7),
+        cirq.MatrixGate(np.array([[0, 1], [1, 0]])),
+        cirq.X(cirq.LineQubit(0)),
+        cirq.X(cirq.LineQubit(0)).with_tags('tag'),
+    ],
+)
+def test_not_diagonal_or_parameterized(val) -> None:
+    assert cirq.unitary_diagonal(val, None) is None
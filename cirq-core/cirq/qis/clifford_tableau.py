@@ -27,6 +27,97 @@ from cirq.value import big_endian_int_to_digits, linear_dict, random_state
 if TYPE_CHECKING:
     import cirq
 
+# The number of set bits of each byte, for numpy versions without `np.bitwise_count`.
+_POPCOUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _pack_rows(bits: np.ndarray) -> np.ndarray:
+    """Packs the last axis of a boolean array into uint64 words, padded with zeros."""
+    packed = np.packbits(bits, axis=-1, bitorder='little')
+    padding = -packed.shape[-1] % 8
+    if padding:
+        packed = np.pad(packed, [(0, 0)] * (packed.ndim - 1) + [(0, padding)])
+    return packed.view(np.uint64)
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Returns the number of set bits in the last axis of an array of uint64 words."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNTS[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)  # pragma: no cover
+
+
+def _rowsum_phases(x1: np.ndarray, z1: np.ndarray, x2: np.ndarray, z2: np.ndarray) -> np.ndarray:
+    """Returns the exponents of i from multiplying the Pauli strings 2 by the Pauli strings 1.
+
+    This is the sum over the qubits of the function g of Aaronson and Gottesman, computed
+    for rows of Pauli strings packed into uint64 words by counting the qubits where the
+    product contributes a factor of i or -i.
+    """
+    y1 = x1 & z1
+    only_x1 = x1 & ~z1
+    only_z1 = z1 & ~x1
+    plus = (y1 & z2 & ~x2) | (only_x1 & z2 & x2) | (only_z1 & x2 & ~z2)
+    minus = (y1 & x2 & ~z2) | (only_x1 & z2 & ~x2) | (only_z1 & x2 & z2)
+    return _popcount(plus) - _popcount(minus)
+
+
+def _conjugate_rows(
+    rows: np.ndarray, signs: np.ndarray, tableau: CliffordTableau
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Conjugates Pauli strings by the Clifford operation of a tableau.
+
+    The computation is based on Theorem 36 in https://arxiv.org/pdf/2009.03218.pdf. Any Pauli
+    string of the tableaux can be expressed as (1i)^p (-1)^s X^(mx) Z^(mz), where p and s are
+    binary scalars and mx and mz are binary vectors. Note that s is not equal to the sign r:
+    r Y_1Y_2Y_3 expands into i^3 r X_1Z_1 X_2Z_2 X_3Z_3, so that s = r + 1 and p = 1.
+
+    Matrix products are computed over floats, which is exact for these small integers and much
+    faster than over integers.
+
+    Args:
+        rows: The Pauli strings as a boolean array with the X bits, then the Z bits of each
+            Pauli string per row.
+        signs: The sign of each Pauli string.
+        tableau: The tableau of the Clifford operation, on as many qubits as the Pauli strings.
+
+    Returns:
+        The X bits, Z bits and signs of the conjugated Pauli strings.
+    """
+    n = tableau.n
+    m1 = rows.astype(np.float64)
+    m2 = tableau.matrix().astype(np.float64)
+    num_ys1 = np.count_nonzero(rows[:, :n] & rows[:, n:], axis=1)
+    num_ys2 = np.count_nonzero(tableau.xs & tableau.zs, axis=1)
+    p1 = num_ys1 % 2
+    p2 = num_ys2 % 2
+    s1 = signs + num_ys1 % 4 // 2
+    s2 = tableau.rs + num_ys2 % 4 // 2
+
+    m_12 = (m1 @ m2).astype(np.int64) % 2
+    m1_p2 = (m1 @ p2).astype(np.int64)
+    p_12 = (p1 + m1_p2) % 2
+    # The products of the rows of the second tableau in the order of Theorem 36, where the
+    # lambda matrix pairs the X bits of one row with the Z bits of the other.
+    products = np.tril(np.outer(p2, p2) + m2[:, :n] @ m2[:, n:].T, -1)
+    quadratic = np.sum((m1 @ products) * m1, axis=1).astype(np.int64)
+    s_12 = s1 + (m1 @ s2).astype(np.int64) + p1 * m1_p2 + quadratic
+    num_ys12 = np.count_nonzero(m_12[:, :n] & m_12[:, n:], axis=1)
+    merged_signs = (p_12 + 2 * s_12 - num_ys12) % 4 // 2
+    return m_12[:, :n].astype(bool), m_12[:, n:].astype(bool), merged_signs.astype(bool)
+
+
+def _pauli_mask_bits(pauli_masks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the X and Z bits of Pauli strings encoded as in `cirq.DensePauliString`, as floats.
+
+    Matrix products of these bits are computed over floats, which is exact for these small
+    integers and much faster than over integers.
+    """
+    pauli_masks = np.asarray(pauli_masks)
+    x = (pauli_masks == 1) | (pauli_masks == 2)
+    z = (pauli_masks == 2) | (pauli_masks == 3)
+    return x.astype(np.float64), z.astype(np.float64)
+
 
 class StabilizerState(
     quantum_state_representation.QuantumStateRepresentation, metaclass=abc.ABCMeta
@@ -129,6 +220,23 @@ class StabilizerState(
             coefficient: The global phase to apply.
         """
 
+    @abc.abstractmethod
+    def pauli_expectations(self, pauli_masks: np.ndarray) -> np.ndarray:
+        """Returns the exact expectation values of many Pauli strings at once.
+
+        The expectation value of a Pauli string on a stabilizer state is 1 or
+        -1 if the Pauli string or its negation is in the stabilizer group of the
+        state, and 0 otherwise.
+
+        Args:
+            pauli_masks: A 2D array with one Pauli string per row, with the
+                Pauli of each qubit encoded as in `cirq.DensePauliString`:
+                0 for I, 1 for X, 2 for Y and 3 for Z.
+
+        Returns:
+            A 1D array with the expectation value of each Pauli string.
+        """
+
 
 class CliffordTableau(StabilizerState):
     """Tableau representation of a stabilizer state
@@ -391,48 +499,38 @@ class CliffordTableau(StabilizerState):
                 f"Mismatched number of qubits of two tableaux: {self.n} vs {second.n}."
             )
 
-        # Convert the underlying data type from bool to int for easier numerical computation.
-        m1 = self.matrix().astype(int)
-        m2 = second.matrix().astype(int)
-
-        # The following computation is based on Theorem 36 in
-        # https://arxiv.org/pdf/2009.03218.pdf.
-        # Any pauli string (one stabilizer) in Clifford Tableau should be able to be expressed as
-        #    (1i)^p (-1)^s X^(mx) Z^(mz)
-        # where p and s are binary scalar and mx and mz are binary vectors.
-        num_ys1 = np.sum(m1[:, : self.n] * m1[:, self.n :], axis=1)
-        num_ys2 = np.sum(m2[:, : self.n] * m2[:, self.n :], axis=1)
-
-        p1 = np.mod(num_ys1, 2)
-        p2 = np.mod(num_ys2, 2)
-
-        # Note the `s` is not equal to `r`, which depends on the number of Y gates.
-        # For example, r * Y_1Y_2Y_3 can be expanded into i^3 * r * X_1Z_1 X_2Z_2 X_3Z_3.
-        # The global phase is i * (-1) * r ==> s = r + 1 and p = 1.
-        s1 = self.rs.astype(int) + np.mod(num_ys1, 4) // 2
-        s2 = second.rs.astype(int) + np.mod(num_ys2, 4) // 2
-
-        lmbda = np.zeros((2 * self.n, 2 * self.n))
-        lmbda[: self.n, self.n :] = np.eye(self.n)
-
-        m_12 = np.mod(m1 @ m2, 2)
-        p_12 = np.mod(p1 + m1 @ p2, 2)
-        s_12 = (
-            s1
-            + m1 @ s2
-            + p1 * (m1 @ p2)
-            + np.diag(m1 @ np.tril(np.outer(p2, p2.T) + m2 @ lmbda @ m2.T, -1) @ m1.T)
-        )
-        num_ys12 = np.sum(m_12[:, : self.n] * m_12[:, self.n :], axis=1)
-        merged_sign = np.mod(p_12 + 2 * s_12 - num_ys12, 4) // 2
-
+        xs, zs, rs = _conjugate_rows(self.matrix(), self.rs, second)
         merged_tableau = CliffordTableau(num_qubits=self.n)
-        merged_tableau.xs = m_12[:, : self.n]
-        merged_tableau.zs = m_12[:, self.n :]
-        merged_tableau.rs = merged_sign
-
+        merged_tableau.xs = xs
+        merged_tableau.zs = zs
+        merged_tableau.rs = rs
         return merged_tableau
 
+    def apply_clifford_tableau(self, tableau: CliffordTableau, axes: Sequence[int]) -> None:
+        """Applies the Clifford operation of a tableau on a subset of the qubits in place.
+
+        This is equivalent to `self.then` with `tableau` padded to all the qubits of this
+        tableau, but only takes O(n k^2) time for a tableau on k qubits, instead of O(n^3).
+
+        Args:
+            tableau: The CliffordTableau of the operation to apply.
+            axes: The qubits of this tableau that the qubits of `tableau` act on.
+
+        Raises:
+            ValueError: If the number of axes does not match the number of qubits of `tableau`.
+        """
+        if len(set(axes)) != tableau.n or len(axes) != tableau.n:
+            raise ValueError(
+                f"Expected {tableau.n} distinct axes for the tableau but got {list(axes)}."
+            )
+        axes = list(axes)
+        rows = np.concatenate([self._xs[:-1, axes], self._zs[:-1, axes]], axis=1)
+        # The signs of the rows only flip by the signs of the images of their Paulis on the axes.
+        xs, zs, signs = _conjugate_rows(rows, np.zeros(2 * self.n, dtype=bool), tableau)
+        self._xs[:-1, axes] = xs
+        self._zs[:-1, axes] = zs
+        self._rs[:-1] ^= signs
+
     def inverse(self) -> CliffordTableau:
         """Returns the inverse Clifford tableau of this tableau."""
         ret_table = CliffordTableau(num_qubits=self.n)
@@ -461,25 +559,11 @@ class CliffordTableau(StabilizerState):
         """Implements the "rowsum" routine defined by
         Aaronson and Gottesman.
         Multiplies the stabilizer in row q1 by the stabilizer in row q2."""
-
-        def g(x1, z1, x2, z2):
-            if not x1 and not z1:
-                return 0
-            elif x1 and z1:
-                return int(z2) - int(x2)
-            elif x1 and not z1:
-                return int(z2) * (2 * int(x2) - 1)
-            else:
-                return int(x2) * (1 - 2 * int(z2))
-
-        r = 2 * int(self._rs[q1]) + 2 * int(self._rs[q2])
-        for j in range(self.n):
-            r += g(self._xs[q2, j], self._zs[q2, j], self._xs[q1, j], self._zs[q1, j])
-
-        r %= 4
-
-        self._rs[q1] = bool(r)
-
+        x1, z1, x2, z2 = _pack_rows(
+            np.stack([self._xs[q2], self._zs[q2], self._xs[q1], self._zs[q1]])
+        )
+        r = 2 * int(self._rs[q1]) + 2 * int(self._rs[q2]) + int(_rowsum_phases(x1, z1, x2, z2))
+        self._rs[q1] = bool(r % 4)
         self._xs[q1, :] ^= self._xs[q2, :]
         self._zs[q1, :] ^= self._zs[q2, :]
 
@@ -525,28 +609,45 @@ class CliffordTableau(StabilizerState):
     def _measure(self, q, prng: np.random.RandomState) -> int:
         """Performs a projective measurement on the q'th qubit.
 
+        The rowsums of the measurement are swept over all the rows at once,
+        with the phases computed on rows packed into uint64 words.
+
         Returns: the result (0 or 1) of the measurement.
         """
-        is_commuting = True
-        for i in range(self.n, 2 * self.n):
-            if self.xs[i, q]:
-                p = i
-                is_commuting = False
-                break
-
-        if is_commuting:
-            self._xs[2 * self.n, :] = False
-            self._zs[2 * self.n, :] = False
-            self._rs[2 * self.n] = False
-
-            for i in range(self.n):
-                if self.xs[i, q]:
-                    self._rowsum(2 * self.n, self.n + i)
+        x_column = self._xs[: 2 * self.n, q]
+        anticommuting = np.flatnonzero(x_column[self.n :])
+
+        if len(anticommuting) == 0:
+            # The outcome is the sign of the product of the stabilizers of the destabilizers
+            # with an X on the qubit, which all commute. Each rowsum into the scratch row
+            # multiplies the next stabilizer onto the product of the previous ones.
+            rows = self.n + np.flatnonzero(x_column[: self.n])
+            xs = _pack_rows(self._xs[rows])
+            zs = _pack_rows(self._zs[rows])
+            products_xs = np.zeros_like(xs)
+            products_zs = np.zeros_like(zs)
+            products_xs[1:] = np.bitwise_xor.accumulate(xs[:-1], axis=0)
+            products_zs[1:] = np.bitwise_xor.accumulate(zs[:-1], axis=0)
+            r = 2 * np.count_nonzero(self._rs[rows]) + np.sum(
+                _rowsum_phases(xs, zs, products_xs, products_zs)
+            )
+            self._xs[2 * self.n, :] = np.bitwise_xor.reduce(self._xs[rows], axis=0)
+            self._zs[2 * self.n, :] = np.bitwise_xor.reduce(self._zs[rows], axis=0)
+            self._rs[2 * self.n] = bool(r % 4)
             return int(self._rs[2 * self.n])
 
-        for i in range(2 * self.n):
-            if i != p and self.xs[i, q]:
-                self._rowsum(i, p)
+        p = self.n + int(anticommuting[0])
+        rows = np.flatnonzero(x_column)
+        rows = rows[rows != p]
+        phases = _rowsum_phases(
+            *_pack_rows(np.stack([self._xs[p], self._zs[p]]))[:, np.newaxis],
+            _pack_rows(self._xs[rows]),
+            _pack_rows(self._zs[rows]),
+        )
+        r = 2 * self._rs[rows].astype(np.int64) + 2 * int(self._rs[p]) + phases
+        self._rs[rows] = (r % 4).astype(bool)
+        self._xs[rows] ^= self._xs[p]
+        self._zs[rows] ^= self._zs[p]
 
         self.xs[p - self.n, :] = self.xs[p, :].copy()
         self.zs[p - self.n, :] = self.zs[p, :].copy()
@@ -668,6 +769,27 @@ class CliffordTableau(StabilizerState):
     ) -> list[int]:
         return [self._measure(axis, random_state.parse_random_state(seed)) for axis in axes]
 
+    def pauli_expectations(self, pauli_masks: np.ndarray) -> np.ndarray:
+        x, z = _pauli_mask_bits(pauli_masks)
+        n = self.n
+        destabilizer_xs, destabilizer_zs = self.xs[:n].astype(float), self.zs[:n].astype(float)
+        stabilizer_xs, stabilizer_zs = self.xs[n:].astype(float), self.zs[n:].astype(float)
+        anticommuting = np.any((x @ stabilizer_zs.T + z @ stabilizer_xs.T) % 2, axis=1)
+        # A Pauli string that commutes with all the stabilizers is, up to a sign, the product of
+        # the stabilizers whose destabilizers it anticommutes with.
+        c = (x @ destabilizer_zs.T + z @ destabilizer_xs.T) % 2
+        # The product of the stabilizers is the Pauli string times i to the power of the signs,
+        # the factors i of their Ys, and -1 for each Z of a stabilizer moved past an X of a later
+        # stabilizer, divided by the factors i of the Ys of the Pauli string.
+        num_ys = np.count_nonzero(self.xs[n:] & self.zs[n:], axis=1)
+        later_xs = np.triu((stabilizer_zs @ stabilizer_xs.T) % 2, 1)
+        phases = (
+            c @ (2 * self.rs[n:] + num_ys)
+            + 2 * np.sum((c @ later_xs) * c, axis=1)
+            - np.sum(x * z, axis=1)
+        )
+        return np.where(anticommuting, 0.0, 1.0 - phases.astype(np.int64) % 4)
+
     @cached_method
     def __hash__(self) -> int:
         return hash(self.matrix().tobytes() + self.rs.tobytes())
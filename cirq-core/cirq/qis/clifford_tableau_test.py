@@ -16,6 +16,8 @@
 
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
 import pytest
 
@@ -246,6 +248,66 @@ def test_rowsum():
     assert t.stabilizers()[1] == cirq.DensePauliString('YX', coefficient=1)
 
 
+def _measure_with_rowsums(t, q, prng):
+    """The measurement of Aaronson and Gottesman with one rowsum at a time."""
+    n = t.n
+    anticommuting = [i for i in range(n, 2 * n) if t.xs[i, q]]
+    if not anticommuting:
+        t._xs[2 * n, :] = False
+        t._zs[2 * n, :] = False
+        t._rs[2 * n] = False
+        for i in range(n):
+            if t.xs[i, q]:
+                t._rowsum(2 * n, n + i)
+        return int(t._rs[2 * n])
+    p = anticommuting[0]
+    for i in range(2 * n):
+        if i != p and t.xs[i, q]:
+            t._rowsum(i, p)
+    t.xs[p - n, :] = t.xs[p, :].copy()
+    t.zs[p - n, :] = t.zs[p, :].copy()
+    t.rs[p - n] = t.rs[p]
+    t.xs[p, :] = False
+    t.zs[p, :] = False
+    t.zs[p, q] = True
+    t.rs[p] = bool(prng.randint(2))
+    return int(t.rs[p])
+
+
+@pytest.mark.parametrize('num_qubits', [3, 70, 130])
+def test_measure_matches_rowsums(num_qubits):
+    rng = np.random.RandomState(1)
+    t = cirq.CliffordTableau(num_qubits)
+    for _ in range(3):
+        for q in range(num_qubits):
+            t.apply_h(q)
+            t.apply_z(q, rng.randint(4) / 2)
+        perm = rng.permutation(num_qubits)
+        for q1, q2 in zip(perm[::2], perm[1::2]):
+            t.apply_cx(q1, q2)
+    expected = t.copy()
+    # Measure every qubit twice, so that the second measurements are deterministic.
+    qubits = list(rng.permutation(num_qubits)) * 2
+    results = [t._measure(q, np.random.RandomState(q)) for q in qubits]
+    expected_results = [
+        _measure_with_rowsums(expected, q, np.random.RandomState(q)) for q in qubits
+    ]
+    assert results == expected_results
+    assert t == expected
+    assert t._validate()
+
+
+def test_rowsum_many_words():
+    t = cirq.CliffordTableau(num_qubits=100)
+    for q in range(0, 100, 3):
+        t.apply_h(q)
+        t.apply_cx(q, (q + 50) % 100)
+        t.apply_z(q, 0.5)
+    stabilizers = t.stabilizers()
+    t._rowsum(150, 120)
+    assert t.stabilizers()[50] == stabilizers[20] * stabilizers[50]
+
+
 def test_json_dict():
     t = cirq.CliffordTableau._from_json_dict_(n=1, rs=[0, 0], xs=[[1], [0]], zs=[[0], [1]])
     assert t.destabilizers()[0] == cirq.DensePauliString('X', coefficient=1)
@@ -427,6 +489,57 @@ def test_tableau_then():
     assert expected_t == t1.then(t2)
 
 
+def _random_tableau(num_qubits, seed):
+    prng = np.random.RandomState(seed)
+    t = cirq.CliffordTableau(num_qubits)
+    for _ in range(10 * num_qubits):
+        op = [_H, _S, _X, _Z, _CNOT][prng.randint(5 if num_qubits > 1 else 4)]
+        op(t, *prng.choice(num_qubits, 2 if op is _CNOT else 1, replace=False))
+    return t
+
+
+@pytest.mark.parametrize('num_qubits, axes', [(1, [0]), (5, [3]), (6, [4, 1, 2]), (8, [7, 0])])
+def test_apply_clifford_tableau(num_qubits, axes):
+    for seed in range(5):
+        t = _random_tableau(num_qubits, seed)
+        second = _random_tableau(len(axes), seed + 100)
+        expected = t.then(cirq.ops.clifford_gate._pad_tableau(second, num_qubits, axes))
+        t.apply_clifford_tableau(second, axes)
+        assert t == expected
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_pauli_expectations(seed):
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.testing.random_circuit(
+        qubits,
+        n_moments=10,
+        op_density=0.8,
+        gate_domain={cirq.H: 1, cirq.S: 1, cirq.CNOT: 2},
+        random_state=seed,
+    )
+    state = cirq.CliffordTableauSimulationState(cirq.CliffordTableau(3), qubits=qubits)
+    for op in circuit.all_operations():
+        cirq.act_on(op, state)
+    state_vector = cirq.final_state_vector(circuit, qubit_order=qubits)
+    masks = np.array(list(itertools.product(range(4), repeat=3)))
+    expected = [
+        cirq.DensePauliString(mask)
+        .on(*qubits)
+        .expectation_from_state_vector(state_vector, {q: i for i, q in enumerate(qubits)})
+        for mask in masks
+    ]
+    np.testing.assert_allclose(state.tableau.pauli_expectations(masks), expected, atol=1e-6)
+
+
+def test_apply_clifford_tableau_with_bad_axes():
+    t = cirq.CliffordTableau(3)
+    with pytest.raises(ValueError, match='Expected 2 distinct axes'):
+        t.apply_clifford_tableau(cirq.CliffordTableau(2), [1])
+    with pytest.raises(ValueError, match='Expected 2 distinct axes'):
+        t.apply_clifford_tableau(cirq.CliffordTableau(2), [1, 1])
+
+
 def test_tableau_matmul():
     t1, t2, expected_t = _three_identical_table(1)
     _ = [_H(t, 0) for t in (t1, expected_t)]
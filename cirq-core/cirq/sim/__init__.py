@@ -21,6 +21,11 @@ from cirq.sim.clifford import (
     CliffordTrialResult as CliffordTrialResult,
     CliffordTableauSimulationState as CliffordTableauSimulationState,
     StabilizerChFormSimulationState as StabilizerChFormSimulationState,
+    StabilizerRankSimulationState as StabilizerRankSimulationState,
+    StabilizerRankSimulator as StabilizerRankSimulator,
+    StabilizerRankState as StabilizerRankState,
+    StabilizerRankStepResult as StabilizerRankStepResult,
+    StabilizerRankTrialResult as StabilizerRankTrialResult,
     StabilizerSampler as StabilizerSampler,
     StabilizerSimulationState as StabilizerSimulationState,
     StabilizerStateChForm as StabilizerStateChForm,
@@ -0,0 +1,297 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized simulation of many state vector trajectories at once.
+
+The state vector simulator normally handles circuits containing mid-circuit
+measurements or classical control by simulating every repetition separately.
+The helpers in this module instead carry a stacked `(batch, *qid_shape)` state
+tensor through the circuit, applying unitaries to the whole batch, and
+measurements, resets and classically controlled operations with masked numpy
+kernels.
+
+Random numbers are drawn in the same order as the per-repetition loop (one
+uniform sample per measurement or reset, repetition by repetition), so that
+for a fixed seed both paths produce the same measurement records.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import circuits, ops, protocols, value
+
+if TYPE_CHECKING:
+    import cirq
+
+# Upper bound on the number of amplitudes held by one stacked state tensor.
+# Repetitions are processed in chunks so that the batch stays within this size.
+MAX_BATCH_AMPLITUDES = 2**22
+
+
+def _is_supported_measurement(op: cirq.Operation) -> bool:
+    gate = op.gate
+    if isinstance(gate, ops.MeasurementGate):
+        return not gate.confusion_map
+    return isinstance(gate, ops.ResetChannel)
+
+
+def _flatten_trajectory_ops(op: cirq.Operation) -> list[cirq.Operation] | None:
+    """Decomposes `op` into operations supported by `TrajectoryBatch`.
+
+    Returns None if some part of the operation cannot be batched.
+    """
+    if _is_supported_measurement(op):
+        return [op]
+    if isinstance(op, ops.ClassicallyControlledOperation):
+        return [op] if protocols.has_unitary(op.without_classical_controls()) else None
+    if protocols.has_unitary(op):
+        return [op]
+    if isinstance(op, circuits.CircuitOperation) and op.repeat_until is not None:
+        # The number of iterations differs between trajectories.
+        return None
+    decomposed = protocols.decompose_once(op, default=None, flatten=True)
+    if decomposed is None:
+        return None
+    result: list[cirq.Operation] = []
+    for sub_op in decomposed:
+        flat_ops = _flatten_trajectory_ops(sub_op)
+        if flat_ops is None:
+            return None
+        result.extend(flat_ops)
+    return result
+
+
+def compile_trajectory_ops(
+    circuit: cirq.AbstractCircuit, noise: cirq.NoiseModel
+) -> list[cirq.Operation] | None:
+    """Flattens a noisy circuit into the operations applied to each trajectory.
+
+    Args:
+        circuit: The circuit to flatten.
+        noise: The noise model of the simulator, applied as in
+            `cirq.SimulatorBase._core_iterator`.
+
+    Returns:
+        The flat list of unitary, measurement, reset and classically controlled
+        unitary operations making up the circuit, or None if the circuit
+        contains operations which cannot be simulated in a batch (such as
+        channels and mixtures, which consume randomness in a state-dependent
+        way).
+    """
+    result: list[cirq.Operation] = []
+    for moment in noise.noisy_moments(circuit, sorted(circuit.all_qubits())):
+        for op in ops.flatten_to_ops(moment):
+            flat_ops = _flatten_trajectory_ops(op)
+            if flat_ops is None:
+                return None
+            result.extend(flat_ops)
+    return result
+
+
+class TrajectoryBatch:
+    """A stack of state vectors evolving in lockstep through a circuit."""
+
+    def __init__(
+        self, state_vector: np.ndarray, qubits: Sequence[cirq.Qid], repetitions: int
+    ) -> None:
+        """Initializes the batch.
+
+        Args:
+            state_vector: The state every trajectory starts from, as a tensor
+                with one axis per qubit.
+            qubits: The qubits corresponding to the axes of `state_vector`.
+            repetitions: The number of trajectories in the batch.
+        """
+        self._qubits = tuple(qubits)
+        self._qubit_map = {q: i for i, q in enumerate(self._qubits)}
+        self._qid_shape = state_vector.shape
+        self._state = np.broadcast_to(state_vector, (repetitions,) + self._qid_shape).copy()
+        self._buffer = np.empty_like(self._state)
+        self._records: dict[cirq.MeasurementKey, list[np.ndarray]] = {}
+        self._measured_qubits: dict[cirq.MeasurementKey, list[tuple[cirq.Qid, ...]]] = {}
+
+    @property
+    def state(self) -> np.ndarray:
+        """The stacked state tensor, with the trajectory index on axis 0."""
+        return self._state
+
+    def _axes(self, qubits: Sequence[cirq.Qid]) -> list[int]:
+        return [self._qubit_map[q] + 1 for q in qubits]
+
+    def apply_unitary(self, op: cirq.Operation, rows: np.ndarray | None = None) -> None:
+        """Applies a unitary operation to all trajectories or the selected `rows`."""
+        axes = self._axes(op.qubits)
+        if rows is None:
+            result = protocols.apply_unitary(
+                op, protocols.ApplyUnitaryArgs(self._state, self._buffer, axes)
+            )
+            if result is self._buffer:
+                self._buffer = self._state
+            self._state = result
+            return
+        if not rows.any():
+            return
+        target = self._state[rows]
+        self._state[rows] = protocols.apply_unitary(
+            op, protocols.ApplyUnitaryArgs(target, np.empty_like(target), axes)
+        )
+
+    def measure(self, qubits: Sequence[cirq.Qid], uniforms: np.ndarray) -> np.ndarray:
+        """Measures `qubits` in every trajectory and collapses the states.
+
+        Args:
+            qubits: The qubits to measure.
+            uniforms: One uniform sample in `[0, 1)` per trajectory, used to
+                choose its outcome.
+
+        Returns:
+            An integer array of shape `(batch, len(qubits))` with the measured
+            digits of each trajectory.
+        """
+        axes = self._axes(qubits)
+        batch = self._state.shape[0]
+        meas_shape = tuple(self._qid_shape[a - 1] for a in axes)
+        not_measured = [a for a in range(1, self._state.ndim) if a not in axes]
+
+        probs = (self._state * self._state.conj()).real
+        probs = np.transpose(probs, [0] + axes + not_measured)
+        probs = probs.reshape((batch, int(np.prod(meas_shape, dtype=np.int64)), -1))
+        probs = np.clip(np.sum(probs, axis=-1), 0, None)
+        probs /= probs.sum(axis=1, keepdims=True)
+
+        # Inverse CDF sampling, mirroring `np.random.RandomState.choice`.
+        cdf = np.cumsum(probs.astype(np.float64), axis=1)
+        cdf /= cdf[:, -1:]
+        outcomes = np.sum(cdf <= uniforms[:, np.newaxis], axis=1)
+        outcomes = np.minimum(outcomes, probs.shape[1] - 1)
+        measured = np.stack(np.unravel_index(outcomes, meas_shape), axis=1)
+
+        keep = np.ones((batch,) + (1,) * len(self._qid_shape), dtype=bool)
+        digit_shape = (batch,) + (1,) * len(self._qid_shape)
+        for j, axis in enumerate(axes):
+            index_shape = [1] * self._state.ndim
+            index_shape[axis] = self._qid_shape[axis - 1]
+            index = np.arange(self._qid_shape[axis - 1]).reshape(index_shape)
+            keep = keep & (index == measured[:, j].reshape(digit_shape))
+        norms = np.sqrt(probs[np.arange(batch), outcomes])
+        scale = (1 / norms).reshape(digit_shape)
+        self._state *= np.where(keep, scale, 0).astype(self._state.dtype)
+        return measured
+
+    def reset(self, qubit: cirq.Qid, uniforms: np.ndarray) -> None:
+        """Measures `qubit` in every trajectory and shifts the outcome to zero."""
+        measured = self.measure([qubit], uniforms)[:, 0]
+        axis = self._axes([qubit])[0]
+        for outcome in range(1, qubit.dimension):
+            rows = measured == outcome
+            if rows.any():
+                self._state[rows] = np.roll(self._state[rows], -outcome, axis=axis)
+
+    def record(self, key: cirq.MeasurementKey, bits: np.ndarray, qubits: Sequence[cirq.Qid]):
+        """Records a measurement result for every trajectory."""
+        if key in self._measured_qubits:
+            shape = tuple(q.dimension for q in qubits)
+            key_shape = tuple(q.dimension for q in self._measured_qubits[key][-1])
+            if shape != key_shape:
+                raise ValueError(f'Measurement shape {shape} does not match {key_shape} in {key}.')
+        self._records.setdefault(key, []).append(bits)
+        self._measured_qubits.setdefault(key, []).append(tuple(qubits))
+
+    def condition_mask(self, condition: cirq.Condition) -> np.ndarray:
+        """Evaluates a classical control condition for every trajectory."""
+        if isinstance(condition, value.KeyCondition):
+            if condition.key not in self._records:
+                raise ValueError(
+                    f'Measurement key {condition.key} missing when testing classical control'
+                )
+            return np.any(self._records[condition.key][condition.index] != 0, axis=1)
+        batch = self._state.shape[0]
+        mask = np.zeros(batch, dtype=bool)
+        for row in range(batch):
+            mask[row] = condition.resolve(self._classical_data_for_row(row))
+        return mask
+
+    def _classical_data_for_row(self, row: int) -> cirq.ClassicalDataDictionaryStore:
+        return value.ClassicalDataDictionaryStore(
+            _records={
+                k: [tuple(int(x) for x in r[row]) for r in rs] for k, rs in self._records.items()
+            },
+            _measured_qubits={k: list(qs) for k, qs in self._measured_qubits.items()},
+            _measurement_types={k: value.MeasurementType.MEASUREMENT for k in self._records},
+        )
+
+    def records(self) -> dict[str, np.ndarray]:
+        """Returns the measurement records, shaped `(batch, instances, qubits)`."""
+        return {
+            str(k): np.stack(rs, axis=1).astype(np.uint8, copy=False)
+            for k, rs in self._records.items()
+        }
+
+
+def simulate_trajectories(
+    trajectory_ops: Sequence[cirq.Operation],
+    state_vector: np.ndarray,
+    qubits: Sequence[cirq.Qid],
+    repetitions: int,
+    prng: np.random.RandomState,
+) -> dict[str, np.ndarray]:
+    """Samples measurement records of many trajectories with stacked states.
+
+    Args:
+        trajectory_ops: The operations to apply, as returned by
+            `compile_trajectory_ops`.
+        state_vector: The initial state of every trajectory, as a tensor with
+            one axis per qubit.
+        qubits: The qubits corresponding to the axes of `state_vector`.
+        repetitions: The number of trajectories to simulate.
+        prng: The random number generator used to choose measurement outcomes.
+
+    Returns:
+        A dictionary from measurement key to an array of shape
+        `(repetitions, instances, qubits)`, matching the records produced by
+        simulating the repetitions one by one.
+    """
+    num_random = sum(1 for op in trajectory_ops if _is_supported_measurement(op))
+    chunk_size = max(1, MAX_BATCH_AMPLITUDES // max(1, state_vector.size))
+    chunks: list[dict[str, np.ndarray]] = []
+    for start in range(0, repetitions, chunk_size):
+        batch_size = min(chunk_size, repetitions - start)
+        uniforms = prng.random_sample((batch_size, num_random))
+        batch = TrajectoryBatch(state_vector, qubits, batch_size)
+        draw = 0
+        for op in trajectory_ops:
+            if isinstance(op.gate, ops.MeasurementGate):
+                gate = op.gate
+                bits = batch.measure(op.qubits, uniforms[:, draw])
+                draw += 1
+                invert = np.array(gate.full_invert_mask(), dtype=bool)
+                bits = np.where(invert & (bits < 2), bits ^ 1, bits)
+                batch.record(gate.mkey, bits, op.qubits)
+            elif isinstance(op.gate, ops.ResetChannel):
+                batch.reset(op.qubits[0], uniforms[:, draw])
+                draw += 1
+            elif isinstance(op, ops.ClassicallyControlledOperation):
+                rows = np.ones(batch_size, dtype=bool)
+                for condition in op.classical_controls:
+                    rows &= batch.condition_mask(condition)
+                batch.apply_unitary(op.without_classical_controls(), rows)
+            else:
+                batch.apply_unitary(op)
+        chunks.append(batch.records())
+    if not chunks:
+        return {}
+    return {k: np.concatenate([c[k] for c in chunks], axis=0) for k in chunks[0]}
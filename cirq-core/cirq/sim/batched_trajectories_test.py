@@ -0,0 +1,171 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.sim import batched_trajectories
+
+
+class PerRepetitionSimulator(cirq.Simulator):
+    """A simulator which always simulates mid-circuit measurements one repetition at a time."""
+
+    def _run_batched_trajectories(self, circuit, sim_state, repetitions):
+        return None
+
+
+def _dynamic_circuit():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    return cirq.Circuit(
+        cirq.X(q0) ** 0.3,
+        cirq.H(q1),
+        cirq.CNOT(q1, q2),
+        cirq.CNOT(q0, q1),
+        cirq.H(q0),
+        cirq.measure(q0, key='a'),
+        cirq.measure(q1, key='b', invert_mask=(True,)),
+        cirq.X(q2).with_classical_controls('b'),
+        cirq.Z(q2).with_classical_controls('a'),
+        cirq.H(q0),
+        cirq.measure(q0, key='a'),
+        cirq.reset(q1),
+        cirq.X(q1) ** 0.5,
+        cirq.measure(q0, q1, q2, key='m'),
+        cirq.X(q0).with_classical_controls(sympy.Symbol('a') > 0),
+        cirq.measure(q0, key='c'),
+    )
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+@pytest.mark.parametrize('split', [True, False])
+def test_matches_per_repetition_simulation(dtype: type[np.complexfloating], split: bool):
+    circuit = _dynamic_circuit()
+    batched = cirq.Simulator(dtype=dtype, seed=1234, split_untangled_states=split)
+    looped = PerRepetitionSimulator(dtype=dtype, seed=1234, split_untangled_states=split)
+    expected = looped.run(circuit, repetitions=200)
+    actual = batched.run(circuit, repetitions=200)
+    assert actual == expected
+    assert actual.records['a'].shape == (200, 2, 1)
+
+
+def test_matches_per_repetition_simulation_in_chunks():
+    circuit = _dynamic_circuit()
+    expected = PerRepetitionSimulator(seed=7).run(circuit, repetitions=50)
+    with mock.patch.object(batched_trajectories, 'MAX_BATCH_AMPLITUDES', 16):
+        actual = cirq.Simulator(seed=7).run(circuit, repetitions=50)
+    assert actual == expected
+
+
+def test_matches_per_repetition_simulation_qudits():
+    q0, q1 = cirq.LineQid.range(2, dimension=3)
+    circuit = cirq.Circuit(
+        cirq.MatrixGate(cirq.testing.random_unitary(3, random_state=1), qid_shape=(3,)).on(q0),
+        cirq.measure(q0, key='a'),
+        cirq.XPowGate(dimension=3).on(q1).with_classical_controls('a'),
+        cirq.reset(q0),
+        cirq.measure(q0, q1, key='b'),
+    )
+    expected = PerRepetitionSimulator(seed=3).run(circuit, repetitions=100)
+    actual = cirq.Simulator(seed=3).run(circuit, repetitions=100)
+    assert actual == expected
+
+
+def test_circuit_operations_are_flattened():
+    q0, q1 = cirq.LineQubit.range(2)
+    subcircuit = cirq.FrozenCircuit(
+        cirq.H(q0), cirq.measure(q0, key='a'), cirq.X(q1).with_classical_controls('a')
+    )
+    circuit = cirq.Circuit(
+        cirq.CircuitOperation(subcircuit, repetitions=3), cirq.measure(q1, key='b')
+    )
+    ops = batched_trajectories.compile_trajectory_ops(circuit, cirq.NO_NOISE)
+    assert ops is not None
+    assert len(ops) == 10
+    expected = PerRepetitionSimulator(seed=5).run(circuit, repetitions=30)
+    actual = cirq.Simulator(seed=5).run(circuit, repetitions=30)
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    'op',
+    [
+        cirq.bit_flip(0.1).on(cirq.LineQubit(0)),
+        cirq.measure(cirq.LineQubit(0), key='m', confusion_map={(0,): np.eye(2)}),
+        cirq.bit_flip(0.1).on(cirq.LineQubit(1)).with_classical_controls('m'),
+        cirq.CircuitOperation(cirq.FrozenCircuit(cirq.bit_flip(0.1).on(cirq.LineQubit(0)))),
+        cirq.CircuitOperation(
+            cirq.FrozenCircuit(cirq.measure(cirq.LineQubit(0), key='m')),
+            use_repetition_ids=False,
+            repeat_until=cirq.KeyCondition(cirq.MeasurementKey('m')),
+        ),
+    ],
+)
+def test_unsupported_operations(op):
+    circuit = cirq.Circuit(cirq.measure(cirq.LineQubit(0), key='m'), op)
+    assert batched_trajectories.compile_trajectory_ops(circuit, cirq.NO_NOISE) is None
+
+
+def test_unsupported_noise():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q, key='m'), cirq.X(q))
+    noise = cirq.ConstantQubitNoiseModel(cirq.depolarize(0.1))
+    assert batched_trajectories.compile_trajectory_ops(circuit, noise) is None
+    result = cirq.Simulator(noise=noise, seed=1).run(circuit, repetitions=10)
+    assert result.records['m'].shape == (10, 1, 1)
+
+
+def test_missing_condition_key():
+    q = cirq.LineQubit(0)
+    ops = [cirq.X(q).with_classical_controls('m')]
+    state = np.array([1, 0], dtype=np.complex64)
+    with pytest.raises(ValueError, match='missing'):
+        batched_trajectories.simulate_trajectories(ops, state, [q], 5, np.random.RandomState())
+
+
+def test_measurement_shape_mismatch():
+    q0 = cirq.LineQubit(0)
+    q1 = cirq.LineQid(1, dimension=3)
+    ops = [cirq.measure(q0, key='m'), cirq.measure(q1, key='m')]
+    state = np.zeros((2, 3), dtype=np.complex64)
+    state[0, 0] = 1
+    with pytest.raises(ValueError, match='does not match'):
+        batched_trajectories.simulate_trajectories(ops, state, [q0, q1], 5, np.random.RandomState())
+
+
+def test_no_repetitions():
+    q = cirq.LineQubit(0)
+    ops = [cirq.measure(q, key='m')]
+    state = np.array([1, 0], dtype=np.complex64)
+    assert batched_trajectories.simulate_trajectories(ops, state, [q], 0, None) == {}
+
+
+def test_trajectory_batch_state():
+    q0, q1 = cirq.LineQubit.range(2)
+    batch = batched_trajectories.TrajectoryBatch(
+        np.array([[1, 0], [0, 0]], dtype=np.complex64), [q0, q1], 4
+    )
+    batch.apply_unitary(cirq.H(q0))
+    batch.apply_unitary(cirq.X(q1), rows=np.array([True, False, True, False]))
+    batch.apply_unitary(cirq.X(q1), rows=np.zeros(4, dtype=bool))
+    bits = batch.measure([q0], np.array([0.1, 0.1, 0.9, 0.9]))
+    np.testing.assert_equal(bits, [[0], [0], [1], [1]])
+    expected = np.zeros((4, 2, 2))
+    expected[0, 0, 1] = expected[1, 0, 0] = expected[2, 1, 1] = expected[3, 1, 0] = 1
+    np.testing.assert_allclose(batch.state, expected, atol=1e-6)
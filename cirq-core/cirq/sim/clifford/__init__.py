@@ -15,6 +15,18 @@ from cirq.sim.clifford.stabilizer_ch_form_simulation_state import (
     StabilizerChFormSimulationState as StabilizerChFormSimulationState,
 )
 
+from cirq.sim.clifford.stabilizer_rank_simulation_state import (
+    StabilizerRankSimulationState as StabilizerRankSimulationState,
+)
+
+from cirq.sim.clifford.stabilizer_rank_simulator import (
+    StabilizerRankSimulator as StabilizerRankSimulator,
+    StabilizerRankStepResult as StabilizerRankStepResult,
+    StabilizerRankTrialResult as StabilizerRankTrialResult,
+)
+
+from cirq.sim.clifford.stabilizer_rank_state import StabilizerRankState as StabilizerRankState
+
 from cirq.sim.clifford.stabilizer_sampler import StabilizerSampler as StabilizerSampler
 
 from cirq.sim.clifford.stabilizer_simulation_state import (
@@ -56,3 +56,18 @@ class CliffordTableauSimulationState(StabilizerSimulationState[clifford_tableau.
     @property
     def tableau(self) -> cirq.CliffordTableau:
         return self.state
+
+    def apply_clifford_tableau(
+        self, tableau: cirq.CliffordTableau, qubits: Sequence[cirq.Qid]
+    ) -> None:
+        """Applies the Clifford operation of a tableau to some of the qubits in one step.
+
+        This is used to apply precomputed tableaux, e.g. of `cirq.CliffordGate`s or of the
+        Clifford circuits of `cirq.CircuitOperation`s, without decomposing them.
+
+        Args:
+            tableau: The CliffordTableau of the operation.
+            qubits: The qubits to apply the operation to, in the order of the qubits of
+                `tableau`.
+        """
+        self.tableau.apply_clifford_tableau(tableau, self.get_axes(qubits))
@@ -93,3 +93,18 @@ def test_copy() -> None:
     assert args.prng is args1.prng
     assert args.log_of_measurement_results is not args1.log_of_measurement_results
     assert args.log_of_measurement_results == args1.log_of_measurement_results
+
+
+def test_apply_clifford_tableau() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    state = cirq.CliffordTableauSimulationState(
+        tableau=cirq.CliffordTableau(num_qubits=3), qubits=[a, b, c]
+    )
+    tableau = cirq.CliffordGate.from_op_list([cirq.H(a), cirq.CNOT(a, b)], [a, b]).clifford_tableau
+    state.apply_clifford_tableau(tableau, [c, a])
+    expected = cirq.CliffordTableauSimulationState(
+        tableau=cirq.CliffordTableau(num_qubits=3), qubits=[a, b, c]
+    )
+    cirq.act_on(cirq.H(c), expected)
+    cirq.act_on(cirq.CNOT(c, a), expected)
+    assert state.tableau == expected.tableau
@@ -0,0 +1,120 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from types import NotImplementedType
+from typing import Any, Sequence, TYPE_CHECKING
+
+from cirq import ops, protocols
+from cirq.sim.clifford import stabilizer_rank_state
+from cirq.sim.clifford.stabilizer_simulation_state import StabilizerSimulationState
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    import cirq
+
+# Non-Clifford unitaries on more qubits than this are decomposed instead of being applied
+# directly, as the number of their Pauli strings grows exponentially with the number of qubits.
+_MAX_EXPANDED_QUBITS = 3
+
+
+class StabilizerRankSimulationState(
+    StabilizerSimulationState[stabilizer_rank_state.StabilizerRankState]
+):
+    """Wrapper around a superposition of stabilizer states for the act_on protocol.
+
+    Clifford operations are applied as in the other stabilizer simulation
+    states, and operations with a unitary on a few qubits are applied through
+    `cirq.StabilizerRankState.apply_unitary`, which increases the number of
+    terms of the state.
+    """
+
+    def __init__(
+        self,
+        *,
+        prng: np.random.RandomState | None = None,
+        qubits: Sequence[cirq.Qid] | None = None,
+        initial_state: int | cirq.StabilizerRankState = 0,
+        classical_data: cirq.ClassicalDataStore | None = None,
+    ):
+        """Initializes with the given state and the axes for the operation.
+
+        Args:
+            qubits: Determines the canonical ordering of the qubits. This
+                is often used in specifying the initial state, i.e. the
+                ordering of the computational basis states.
+            prng: The pseudo random number generator to use for probabilistic
+                effects.
+            initial_state: The initial state for the simulation. This can be a
+                full stabilizer rank state passed by reference which will be
+                modified inplace, or a big-endian int in the computational
+                basis. If the state is an integer, qubits must be provided in
+                order to determine array sizes.
+            classical_data: The shared classical data container for this
+                simulation.
+
+        Raises:
+            ValueError: If initial state is an integer but qubits are not
+                provided.
+        """
+        if isinstance(initial_state, int):
+            if qubits is None:
+                raise ValueError('Must specify qubits if initial state is integer')
+            initial_state = stabilizer_rank_state.StabilizerRankState(len(qubits), initial_state)
+        super().__init__(
+            state=initial_state, prng=prng, qubits=qubits, classical_data=classical_data
+        )
+
+    def _act_on_fallback_(
+        self, action: Any, qubits: Sequence[cirq.Qid], allow_decompose: bool = True
+    ) -> bool | NotImplementedType:
+        result = super()._act_on_fallback_(action, qubits, allow_decompose)
+        if result is not NotImplemented:
+            return result
+        strats = [self._strat_apply_unitary]
+        if allow_decompose:
+            strats.append(self._strat_decompose_to_unitaries)
+        for strat in strats:
+            result = strat(action, qubits)
+            if result is True:
+                return True
+            assert result is NotImplemented, str(result)
+        return NotImplemented
+
+    def _strat_apply_unitary(self, val: Any, qubits: Sequence[cirq.Qid]) -> bool:
+        if len(qubits) > _MAX_EXPANDED_QUBITS or not protocols.has_unitary(val):
+            return NotImplemented
+        self._state.apply_unitary(protocols.unitary(val), self.get_axes(qubits))
+        return True
+
+    def _strat_decompose_to_unitaries(self, val: Any, qubits: Sequence[cirq.Qid]) -> bool:
+        gate = val.gate if isinstance(val, ops.Operation) else val
+        operations = protocols.decompose_once_with_qubits(gate, qubits, None)
+        if operations is None or not all(
+            protocols.has_stabilizer_effect(op) or protocols.has_unitary(op) for op in operations
+        ):
+            return NotImplemented
+        for op in operations:
+            protocols.act_on(op, self)
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            'cirq.StabilizerRankSimulationState('
+            f'initial_state={self.state!r},'
+            f' qubits={self.qubits!r},'
+            f' classical_data={self.classical_data!r})'
+        )
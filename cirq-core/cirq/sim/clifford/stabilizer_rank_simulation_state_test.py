@@ -0,0 +1,94 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def test_init_state() -> None:
+    args = cirq.StabilizerRankSimulationState(qubits=cirq.LineQubit.range(1), initial_state=1)
+    np.testing.assert_allclose(args.state.state_vector(), [0, 1])
+    with pytest.raises(ValueError, match='Must specify qubits'):
+        _ = cirq.StabilizerRankSimulationState(initial_state=1)
+
+
+def test_cannot_act() -> None:
+    class NoDetails(cirq.testing.SingleQubitGate):
+        pass
+
+    args = cirq.StabilizerRankSimulationState(qubits=[], prng=np.random.RandomState())
+
+    with pytest.raises(TypeError, match="Failed to act"):
+        cirq.act_on(NoDetails(), args, qubits=())
+
+
+def test_non_clifford_unitary() -> None:
+    qubits = cirq.LineQubit.range(3)
+    args = cirq.StabilizerRankSimulationState(qubits=qubits)
+    circuit = cirq.Circuit(cirq.H.on_each(*qubits), cirq.T(qubits[0]), cirq.CCZ(*qubits))
+    for op in circuit.all_operations():
+        cirq.act_on(op, args)
+    np.testing.assert_allclose(
+        args.state.state_vector(), cirq.final_state_vector(circuit, dtype=np.complex128), atol=1e-10
+    )
+
+
+def test_decompose_to_unitaries() -> None:
+    class FourQubitGate(cirq.Gate):
+        def num_qubits(self) -> int:
+            return 4
+
+        def _decompose_(self, qubits):
+            yield cirq.CCZ(*qubits[:3])
+            yield cirq.T(qubits[3])
+            yield cirq.CNOT(qubits[0], qubits[3])
+
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(cirq.H.on_each(*qubits), FourQubitGate().on(*qubits))
+    args = cirq.StabilizerRankSimulationState(qubits=qubits)
+    for op in circuit.all_operations():
+        cirq.act_on(op, args)
+    np.testing.assert_allclose(
+        args.state.state_vector(), cirq.final_state_vector(circuit, dtype=np.complex128), atol=1e-10
+    )
+    with pytest.raises(TypeError, match="Failed to act"):
+        cirq.act_on(FourQubitGate(), args, qubits, allow_decompose=False)
+
+
+def test_decompose_to_non_unitaries() -> None:
+    class FourQubitChannel(cirq.Gate):
+        def num_qubits(self) -> int:
+            return 4
+
+        def _decompose_(self, qubits):
+            yield cirq.amplitude_damp(0.1).on(qubits[0])
+            yield cirq.CCZ(*qubits[1:])
+
+    args = cirq.StabilizerRankSimulationState(qubits=cirq.LineQubit.range(4))
+    with pytest.raises(TypeError, match="Failed to act"):
+        cirq.act_on(FourQubitChannel(), args, cirq.LineQubit.range(4))
+
+
+def test_repr() -> None:
+    args = cirq.StabilizerRankSimulationState(qubits=cirq.LineQubit.range(1))
+    assert repr(args) == (
+        'cirq.StabilizerRankSimulationState('
+        'initial_state=cirq.StabilizerRankState(num_qubits=1, num_terms=1),'
+        ' qubits=(cirq.LineQubit(0),),'
+        ' classical_data=cirq.ClassicalDataDictionaryStore())'
+    )
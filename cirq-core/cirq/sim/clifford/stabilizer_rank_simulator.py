@@ -0,0 +1,149 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A simulator for Clifford circuits with a few non-Clifford gates.
+
+The state is a superposition of stabilizer states, whose number grows
+exponentially with the number of non-Clifford gates but not with the number of
+qubits, so that circuits on many qubits with a few T gates can be sampled and
+their amplitudes computed exactly. See `cirq.StabilizerRankState`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Sequence, TYPE_CHECKING
+
+from cirq import ops, protocols
+from cirq.sim import simulator, simulator_base
+from cirq.sim.clifford import stabilizer_rank_simulation_state
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    import cirq
+
+
+class StabilizerRankSimulator(
+    simulator_base.SimulatorBase[
+        'cirq.StabilizerRankStepResult',
+        'cirq.StabilizerRankTrialResult',
+        'cirq.StabilizerRankSimulationState',
+    ],
+    simulator.SimulatesAmplitudes,
+):
+    """A simulator for Clifford circuits with a few non-Clifford gates.
+
+    The cost of the simulation grows linearly with the number of terms of the
+    state, which is at most doubled by each T gate, and more generally
+    multiplied by at most the number of Pauli strings in the unitary of each
+    non-Clifford gate.
+    """
+
+    def __init__(self, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None):
+        """Creates instance of `StabilizerRankSimulator`.
+
+        Args:
+            seed: The random seed to use for this simulator.
+        """
+        super().__init__(seed=seed)
+
+    @staticmethod
+    def is_supported_operation(op: cirq.Operation) -> bool:
+        """Checks whether given operation can be simulated by this simulator."""
+        return protocols.has_stabilizer_effect(op) or protocols.has_unitary(op)
+
+    def _create_partial_simulation_state(
+        self,
+        initial_state: int | cirq.StabilizerRankSimulationState,
+        qubits: Sequence[cirq.Qid],
+        classical_data: cirq.ClassicalDataStore,
+    ) -> cirq.StabilizerRankSimulationState:
+        """Creates the StabilizerRankSimulationState for a circuit.
+
+        Args:
+            initial_state: The initial state for the simulation in the
+                computational basis. Represented as a big endian int.
+            qubits: Determines the canonical ordering of the qubits. This
+                is often used in specifying the initial state, i.e. the
+                ordering of the computational basis states.
+            classical_data: The shared classical data container for this
+                simulation.
+
+        Returns:
+            StabilizerRankSimulationState for the circuit.
+        """
+        if isinstance(
+            initial_state, stabilizer_rank_simulation_state.StabilizerRankSimulationState
+        ):
+            # Instances of SimulationStateBase usually returned before this point
+            return initial_state  # pragma: no cover
+
+        return stabilizer_rank_simulation_state.StabilizerRankSimulationState(
+            prng=self._prng,
+            classical_data=classical_data,
+            qubits=qubits,
+            initial_state=initial_state,
+        )
+
+    def _create_step_result(
+        self, sim_state: cirq.SimulationStateBase[cirq.StabilizerRankSimulationState]
+    ):
+        return StabilizerRankStepResult(sim_state=sim_state)
+
+    def _create_simulator_trial_result(
+        self,
+        params: cirq.ParamResolver,
+        measurements: dict[str, np.ndarray],
+        final_simulator_state: cirq.SimulationStateBase[cirq.StabilizerRankSimulationState],
+    ):
+        return StabilizerRankTrialResult(
+            params=params, measurements=measurements, final_simulator_state=final_simulator_state
+        )
+
+    def compute_amplitudes_sweep_iter(
+        self,
+        program: cirq.AbstractCircuit,
+        bitstrings: Sequence[int],
+        params: cirq.Sweepable,
+        qubit_order: cirq.QubitOrderOrList = ops.QubitOrder.DEFAULT,
+    ) -> Iterator[Sequence[complex]]:
+        for trial_result in self.simulate_sweep_iter(program, params, qubit_order):
+            yield trial_result.final_state.amplitudes(bitstrings).tolist()
+
+
+class StabilizerRankTrialResult(
+    simulator_base.SimulationTrialResultBase['cirq.StabilizerRankSimulationState']
+):
+    """The results of a `cirq.StabilizerRankSimulator` run."""
+
+    @property
+    def final_state(self) -> cirq.StabilizerRankState:
+        return self._get_merged_sim_state().state.copy()
+
+    def __str__(self) -> str:
+        samples = super().__str__()
+        final = self._get_merged_sim_state().state
+        return f'measurements: {samples}\noutput state: {final!r}'
+
+    def _repr_pretty_(self, p: Any, cycle: bool):
+        """iPython (Jupyter) pretty print."""
+        p.text("cirq.StabilizerRankTrialResult(...)" if cycle else self.__str__())
+
+
+class StabilizerRankStepResult(simulator_base.StepResultBase['cirq.StabilizerRankSimulationState']):
+    """A step result of a `cirq.StabilizerRankSimulator`."""
+
+    @property
+    def state(self) -> cirq.StabilizerRankState:
+        return self._merged_sim_state.state.copy()
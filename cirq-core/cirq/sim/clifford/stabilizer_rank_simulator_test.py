@@ -0,0 +1,128 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def _near_clifford_circuit(qubits) -> cirq.Circuit:
+    return cirq.Circuit(
+        cirq.H(qubits[0]),
+        cirq.T(qubits[0]),
+        cirq.CNOT(qubits[0], qubits[1]),
+        cirq.ISWAP(qubits[1], qubits[2]) ** 0.3,
+        cirq.H(qubits[2]),
+        cirq.T(qubits[2]) ** -1,
+    )
+
+
+def test_is_supported_operation() -> None:
+    q = cirq.LineQubit(0)
+    assert cirq.StabilizerRankSimulator.is_supported_operation(cirq.H(q))
+    assert cirq.StabilizerRankSimulator.is_supported_operation(cirq.T(q))
+    assert cirq.StabilizerRankSimulator.is_supported_operation(cirq.measure(q))
+    assert not cirq.StabilizerRankSimulator.is_supported_operation(cirq.amplitude_damp(0.1)(q))
+    assert not cirq.StabilizerRankSimulator.is_supported_operation(cirq.Z(q) ** sympy.Symbol('t'))
+
+
+def test_simulate() -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = _near_clifford_circuit(qubits)
+    result = cirq.StabilizerRankSimulator().simulate(circuit)
+    np.testing.assert_allclose(
+        result.final_state.state_vector(),
+        cirq.final_state_vector(circuit, dtype=np.complex128),
+        atol=1e-10,
+    )
+    assert 'output state: cirq.StabilizerRankState(num_qubits=3' in str(result)
+
+
+def test_simulate_moment_steps() -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = _near_clifford_circuit(qubits)
+    simulator = cirq.StabilizerRankSimulator()
+    for i, step in enumerate(simulator.simulate_moment_steps(circuit)):
+        np.testing.assert_allclose(
+            step.state.state_vector(),
+            cirq.final_state_vector(circuit[: i + 1], qubit_order=qubits, dtype=np.complex128),
+            atol=1e-10,
+        )
+
+
+def test_run() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.T(q0), cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key='m')
+    )
+    result = cirq.StabilizerRankSimulator(seed=1).run(circuit, repetitions=1000)
+    samples = result.measurements['m']
+    assert np.all(samples[:, 0] == samples[:, 1])
+    # The probability of 1 is sin(pi / 8) ** 2 ~= 0.146.
+    assert 100 < np.sum(samples[:, 0]) < 200
+
+
+def test_run_mid_circuit_measurement() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.T(q0),
+        cirq.H(q0),
+        cirq.measure(q0, key='a'),
+        cirq.X(q1).with_classical_controls('a'),
+        cirq.T(q1),
+        cirq.measure(q1, key='b'),
+    )
+    result = cirq.StabilizerRankSimulator(seed=2).run(circuit, repetitions=100)
+    np.testing.assert_array_equal(result.measurements['a'], result.measurements['b'])
+
+
+def test_compute_amplitudes() -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = _near_clifford_circuit(qubits)
+    amplitudes = cirq.StabilizerRankSimulator().compute_amplitudes(circuit, [0, 3, 5, 6])
+    expected = cirq.final_state_vector(circuit, dtype=np.complex128)[[0, 3, 5, 6]]
+    np.testing.assert_allclose(amplitudes, expected, atol=1e-10)
+
+
+def test_many_qubits() -> None:
+    qubits = cirq.LineQubit.range(60)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(59)],
+        [cirq.T(q) for q in qubits[::6]],
+        cirq.H.on_each(*qubits[::6]),
+        cirq.measure(*qubits, key='m'),
+    )
+    result = cirq.StabilizerRankSimulator(seed=3).run(circuit, repetitions=100)
+    samples = result.measurements['m']
+    others = np.delete(samples, np.arange(0, 60, 6), axis=1)
+    assert np.all(others == others[:, :1])
+
+
+def test_trial_result_repr_pretty() -> None:
+    q = cirq.LineQubit(0)
+    result = cirq.StabilizerRankSimulator().simulate(cirq.Circuit(cirq.T(q)))
+    cirq.testing.assert_repr_pretty(result, str(result))
+    cirq.testing.assert_repr_pretty(result, 'cirq.StabilizerRankTrialResult(...)', cycle=True)
+
+
+def test_unsupported_operation() -> None:
+    q = cirq.LineQubit(0)
+    with pytest.raises(TypeError, match="doesn't support"):
+        cirq.StabilizerRankSimulator().simulate(cirq.Circuit(cirq.amplitude_damp(0.1)(q)))
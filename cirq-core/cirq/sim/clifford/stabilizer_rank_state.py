@@ -0,0 +1,554 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A superposition of stabilizer states, for circuits with few non-Clifford gates."""
+
+from __future__ import annotations
+
+import itertools
+from typing import Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import qis, value
+from cirq.qis.clifford_tableau import _pack_rows, _pauli_mask_bits, _rowsum_phases
+from cirq.sim.clifford.stabilizer_state_ch_form import (
+    _big_endian_ints_to_bits,
+    _POWERS_OF_I,
+    StabilizerStateChForm,
+)
+
+if TYPE_CHECKING:
+    import cirq
+
+# Terms whose coefficients are smaller than this are dropped from the superposition.
+_ATOL = 1e-12
+
+# The maximum number of coefficients that are sampled or evaluated at once.
+_MAX_BATCH_SIZE = 2**22
+
+_PAULI_MATRICES = np.array(
+    [[[1, 0], [0, 1]], [[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]]
+)
+
+
+class StabilizerRankState(qis.StabilizerState):
+    r"""A superposition of stabilizer states that share a Clifford frame.
+
+    The state is $\sum_a c_a D_a |\phi\rangle$, where $|\phi\rangle$ is a
+    stabilizer state and $D_a$ is the product of the destabilizers of
+    $|\phi\rangle$ selected by the bits of $a$. The terms $D_a |\phi\rangle$
+    are orthonormal stabilizer states, and their number is the stabilizer rank
+    of the decomposition.
+
+    Clifford gates are only applied to $|\phi\rangle$, which is stored both as
+    a `cirq.CliffordTableau`, whose destabilizers define the terms, and as a
+    `cirq.StabilizerStateChForm`, which keeps track of its global phase for
+    computing amplitudes. A non-Clifford gate is expanded into Pauli strings,
+    each of which maps a term to another term up to a phase, so that the
+    number of terms grows at most by a factor of the number of Pauli strings
+    of the gate, e.g. 2 for a T gate. The frame is changed beforehand so that
+    each Pauli string adds at most one destabilizer to the terms, so that the
+    terms only involve a few destabilizers, and measurements that are random
+    on all the terms are as cheap as in a Clifford simulation.
+
+    References:
+        - [Aaronson and Gottesman](https://arxiv.org/abs/quant-ph/0406196)
+        - [Bravyi et al](https://arxiv.org/abs/1808.00128)
+
+    Attributes:
+        n: The number of qubits.
+        tableau: The tableau of the stabilizer state shared by the terms.
+        ch_form: The CH form of the stabilizer state shared by the terms.
+        terms: A 2D boolean array with the destabilizers of each term per row.
+        coefficients: A 1D complex array with the coefficient of each term.
+    """
+
+    def __init__(self, num_qubits: int, initial_state: int = 0) -> None:
+        """Initializes StabilizerRankState.
+
+        Args:
+            num_qubits: The number of qubits in the system.
+            initial_state: The computational basis representation of the
+                state as a big endian int.
+        """
+        self.n = num_qubits
+        self.tableau = qis.CliffordTableau(num_qubits, initial_state)
+        self.ch_form = StabilizerStateChForm(num_qubits, initial_state)
+        self.terms = np.zeros((1, num_qubits), dtype=bool)
+        self.coefficients = np.ones(1, dtype=np.complex128)
+
+    def copy(self, deep_copy_buffers: bool = True) -> StabilizerRankState:
+        copy = StabilizerRankState(0)
+        copy.n = self.n
+        copy.tableau = self.tableau.copy()
+        copy.ch_form = self.ch_form.copy()
+        copy.terms = self.terms.copy()
+        copy.coefficients = self.coefficients.copy()
+        return copy
+
+    def __repr__(self) -> str:
+        return f'cirq.StabilizerRankState(num_qubits={self.n}, num_terms={len(self.coefficients)})'
+
+    def apply_x(self, axis: int, exponent: float = 1, global_shift: float = 0):
+        self.tableau.apply_x(axis, exponent, global_shift)
+        self.ch_form.apply_x(axis, exponent, global_shift)
+
+    def apply_y(self, axis: int, exponent: float = 1, global_shift: float = 0):
+        self.tableau.apply_y(axis, exponent, global_shift)
+        self.ch_form.apply_y(axis, exponent, global_shift)
+
+    def apply_z(self, axis: int, exponent: float = 1, global_shift: float = 0):
+        self.tableau.apply_z(axis, exponent, global_shift)
+        self.ch_form.apply_z(axis, exponent, global_shift)
+
+    def apply_h(self, axis: int, exponent: float = 1, global_shift: float = 0):
+        self.tableau.apply_h(axis, exponent, global_shift)
+        self.ch_form.apply_h(axis, exponent, global_shift)
+
+    def apply_cz(
+        self, control_axis: int, target_axis: int, exponent: float = 1, global_shift: float = 0
+    ):
+        self.tableau.apply_cz(control_axis, target_axis, exponent, global_shift)
+        self.ch_form.apply_cz(control_axis, target_axis, exponent, global_shift)
+
+    def apply_cx(
+        self, control_axis: int, target_axis: int, exponent: float = 1, global_shift: float = 0
+    ):
+        self.tableau.apply_cx(control_axis, target_axis, exponent, global_shift)
+        self.ch_form.apply_cx(control_axis, target_axis, exponent, global_shift)
+
+    def apply_global_phase(self, coefficient: cirq.Scalar):
+        self.ch_form.apply_global_phase(coefficient)
+
+    def apply_unitary(self, matrix: np.ndarray, axes: Sequence[int]) -> None:
+        """Applies a unitary matrix, which does not need to be Clifford, to some qubits.
+
+        The matrix is expanded into Pauli strings, so this is only efficient for
+        matrices on a few qubits.
+
+        Args:
+            matrix: The unitary matrix, with the first axis as the most
+                significant qubit.
+            axes: The axes of the qubits that the matrix acts on.
+        """
+        xs, zs, weights = _pauli_expansion(matrix, axes, self.n)
+        self._change_frame(xs, zs)
+        alphas, betas, exponents = _decompose(
+            self.tableau.xs, self.tableau.zs, self.tableau.rs, xs, zs
+        )
+        signs = _parities(betas, self.terms)
+        coefficients = (
+            (weights * _POWERS_OF_I[exponents])[:, np.newaxis] * signs * self.coefficients
+        )
+        self.terms, self.coefficients = _merge_terms(
+            (self.terms[np.newaxis] ^ alphas[:, np.newaxis]).reshape(-1, self.n),
+            coefficients.reshape(-1),
+        )
+
+    def _change_frame(self, xs: np.ndarray, zs: np.ndarray) -> None:
+        """Changes the frame so that each Pauli string adds at most one destabilizer to the terms.
+
+        The stabilizers that a Pauli string anticommutes with select the destabilizers that it
+        adds to the terms. For a destabilizer k that no term has yet and another destabilizer j,
+        multiplying stabilizer j by stabilizer k and destabilizer k by destabilizer j keeps the
+        terms and makes the Pauli strings that anticommute with stabilizer k flip whether they
+        anticommute with stabilizer j, so the destabilizers added to the terms besides k can be
+        removed one by one.
+        """
+        n = self.n
+        active = np.any(self.terms, axis=0)
+        for x, z in zip(xs, zs):
+            stabilizers_xs, stabilizers_zs = self.tableau.xs[n:], self.tableau.zs[n:]
+            anticommuting = (
+                np.count_nonzero(stabilizers_zs & x, axis=1)
+                + np.count_nonzero(stabilizers_xs & z, axis=1)
+            ) % 2 == 1
+            new = np.flatnonzero(anticommuting & ~active)
+            if len(new) == 0:
+                continue
+            k = int(new[0])
+            for j in new[1:]:
+                self.tableau._rowsum(n + int(j), n + k)
+                self.tableau._rowsum(k, int(j))
+            active[k] = True
+
+    def measure(
+        self, axes: Sequence[int], seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None
+    ) -> list[int]:
+        prng = value.parse_random_state(seed)
+        results = []
+        for axis in axes:
+            rs, self.terms, coefficients, _, result, _, random = _measure(
+                self.tableau.xs,
+                self.tableau.zs,
+                self.tableau.rs[np.newaxis],
+                self.terms,
+                self.coefficients[np.newaxis],
+                np.ones(1, dtype=np.int64),
+                axis,
+                prng,
+            )
+            self.tableau.rs[:] = rs[0]
+            self.coefficients = coefficients[0]
+            if random:
+                self.ch_form.project_Z(axis, int(result[0]))
+            results.append(int(result[0]))
+        return results
+
+    def sample(
+        self, axes: Sequence[int], repetitions: int = 1, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None
+    ) -> np.ndarray:
+        """Samples the state, measuring all the repetitions at once.
+
+        The repetitions with the same outcomes so far share their post-measurement state, so
+        only the distinct outcomes are measured, along with the number of repetitions of each.
+
+        Args:
+            axes: The axes to sample.
+            repetitions: The number of samples to make.
+            seed: The random number seed to use.
+        Returns:
+            The samples in order.
+        """
+        prng = value.parse_random_state(seed)
+        samples = np.zeros((repetitions, len(axes)), dtype=np.uint8)
+        batch_size = max(1, _MAX_BATCH_SIZE // len(self.coefficients))
+        for start in range(0, repetitions, batch_size):
+            counts = np.array([min(batch_size, repetitions - start)])
+            xs, zs, rs = self.tableau.xs.copy(), self.tableau.zs.copy(), self.tableau.rs[np.newaxis]
+            terms, coefficients = self.terms, self.coefficients[np.newaxis]
+            outcomes = np.zeros((1, len(axes)), dtype=np.uint8)
+            for i, axis in enumerate(axes):
+                rs, terms, coefficients, counts, results, parents = _measure(
+                    xs, zs, rs, terms, coefficients, counts, axis, prng
+                )[:6]
+                outcomes = outcomes[parents]
+                outcomes[:, i] = results
+            samples[start : start + np.sum(counts)] = np.repeat(outcomes, counts, axis=0)
+        return samples[prng.permutation(repetitions)]
+
+    def amplitudes(self, bitstrings: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Returns the amplitudes <x|psi> of many computational basis states at once.
+
+        Args:
+            bitstrings: The basis states, either as big endian ints, or as a
+                2D array with the bits of one basis state per row.
+
+        Returns:
+            A 1D complex array with the amplitude of each basis state.
+        """
+        y = np.asarray(bitstrings)
+        if y.ndim != 2:
+            y = _big_endian_ints_to_bits(bitstrings, self.n)
+        y = y.astype(bool)
+        # The products of the destabilizers of the terms are i^e X^u Z^w, which map <y| to
+        # i^e (-1)^(w . (y ^ u)) <y ^ u|.
+        n = self.n
+        destabilizers_xs, destabilizers_zs = self.tableau.xs[:n], self.tableau.zs[:n]
+        terms = self.terms.astype(np.float64)
+        u = ((terms @ destabilizers_xs) % 2).astype(bool)
+        w = ((terms @ destabilizers_zs) % 2).astype(bool)
+        exponents = _product_exponents(
+            destabilizers_xs, destabilizers_zs, self.tableau.rs[:n], terms
+        )
+        coefficients = self.coefficients * _POWERS_OF_I[exponents]
+        result = np.zeros(len(y), dtype=np.complex128)
+        batch_size = max(1, _MAX_BATCH_SIZE // (len(coefficients) * max(n, 1)))
+        for start in range(0, len(y), batch_size):
+            shifted = y[start : start + batch_size, np.newaxis] ^ u
+            signs = 1 - 2 * (np.count_nonzero(shifted & w, axis=2) % 2)
+            amplitudes = self.ch_form.amplitudes(shifted.reshape(-1, n)).reshape(shifted.shape[:2])
+            result[start : start + batch_size] = np.sum(amplitudes * signs * coefficients, axis=1)
+        return result
+
+    def pauli_expectations(self, pauli_masks: np.ndarray) -> np.ndarray:
+        # A Pauli string P = i^e D_alpha S_beta maps the term D_a to i^e (-1)^(beta . a)
+        # D_(a ^ alpha), and the terms are orthonormal, so <psi|P|psi> is the sum over the
+        # terms a of i^e (-1)^(beta . a) c_a times the conjugate coefficient of a ^ alpha.
+        x, z = (bits.astype(bool) for bits in _pauli_mask_bits(pauli_masks))
+        alphas, betas, exponents = _decompose(
+            self.tableau.xs, self.tableau.zs, self.tableau.rs, x, z
+        )
+        m = len(self.coefficients)
+        result = np.zeros(len(x), dtype=np.float64)
+        batch_size = max(1, _MAX_BATCH_SIZE // (m * max(self.n, 1)))
+        for start in range(0, len(x), batch_size):
+            batch = slice(start, start + batch_size)
+            images = (self.terms[np.newaxis] ^ alphas[batch, np.newaxis]).reshape(-1, self.n)
+            index, inverse = _unique_terms(np.concatenate([self.terms, images]))
+            coefficients = np.zeros(len(index), dtype=np.complex128)
+            coefficients[inverse[:m]] = self.coefficients
+            overlaps = np.conj(coefficients[inverse[m:]]).reshape(-1, m)
+            signs = _parities(betas[batch], self.terms)
+            result[batch] = (
+                _POWERS_OF_I[exponents[batch]]
+                * np.sum(overlaps * signs * self.coefficients, axis=1)
+            ).real
+        return result
+
+    def state_vector(self) -> np.ndarray:
+        return self.amplitudes(np.arange(2**self.n))
+
+
+def _pauli_expansion(
+    matrix: np.ndarray, axes: Sequence[int], num_qubits: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the X bits, Z bits and coefficients of the Pauli strings of a matrix on some axes."""
+    k = len(axes)
+    masks = np.array(list(itertools.product(range(4), repeat=k)), dtype=np.int64).reshape(-1, k)
+    weights = np.zeros(len(masks), dtype=np.complex128)
+    for i, mask in enumerate(masks):
+        pauli = np.ones((1, 1))
+        for p in mask:
+            pauli = np.kron(pauli, _PAULI_MATRICES[p])
+        weights[i] = np.trace(pauli @ matrix) / 2**k
+    nonzero = np.abs(weights) > _ATOL
+    masks, weights = masks[nonzero], weights[nonzero]
+    xs = np.zeros((len(masks), num_qubits), dtype=bool)
+    zs = np.zeros((len(masks), num_qubits), dtype=bool)
+    xs[:, axes] = (masks == 1) | (masks == 2)
+    zs[:, axes] = (masks == 2) | (masks == 3)
+    return xs, zs, weights
+
+
+def _product_exponents(
+    xs: np.ndarray, zs: np.ndarray, rs: np.ndarray, selections: np.ndarray
+) -> np.ndarray:
+    """Returns the exponents e of the products i^e X^x Z^z of the selected rows of a tableau.
+
+    The rows are multiplied in order. Each row is (-1)^r i^(x . z) X^x Z^z, and moving the Z
+    bits of each row past the X bits of the later rows contributes a factor of -1 each.
+
+    Args:
+        xs: The X bits of the rows.
+        zs: The Z bits of the rows.
+        rs: The signs of the rows, either as a 1D array or as a 2D array with one set of
+            signs per row.
+        selections: A 2D float array with the rows selected for each product.
+
+    Returns:
+        The exponents modulo 4, with one row per set of signs if rs is a 2D array.
+    """
+    # Only the rows selected by some product contribute.
+    rows = np.flatnonzero(np.any(selections, axis=0))
+    xs, zs, rs, selections = xs[rows], zs[rows], rs[..., rows], selections[:, rows]
+    num_ys = np.count_nonzero(xs & zs, axis=1)
+    later_xs = np.triu((zs.astype(np.float64) @ xs.T.astype(np.float64)) % 2, 1)
+    exponents = (
+        selections @ num_ys + 2 * np.sum((selections @ later_xs) * selections, axis=1)
+    ).astype(np.int64)
+    signs = (rs.astype(np.float64) @ selections.T).astype(np.int64)
+    return (2 * signs + exponents) % 4
+
+
+def _decompose(
+    tableau_xs: np.ndarray,
+    tableau_zs: np.ndarray,
+    tableau_rs: np.ndarray,
+    xs: np.ndarray,
+    zs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decomposes Pauli strings P = i^e D_alpha S_beta into destabilizers and stabilizers.
+
+    Since only destabilizer j anticommutes with stabilizer j, the destabilizers alpha of P are
+    the stabilizers it anticommutes with and the stabilizers beta of P are the destabilizers it
+    anticommutes with. As D_alpha commutes with the destabilizers of the terms and S_beta
+    stabilizes the state, P maps the term D_a to i^e (-1)^(beta . a) D_(a ^ alpha).
+
+    Args:
+        tableau_xs: The X bits of the 2n rows of the tableau.
+        tableau_zs: The Z bits of the 2n rows of the tableau.
+        tableau_rs: The signs of the 2n rows of the tableau, either as a 1D array or as a 2D
+            array with one set of signs per row.
+        xs: The X bits of the Pauli strings, one per row.
+        zs: The Z bits of the Pauli strings, one per row.
+
+    Returns:
+        The destabilizers alpha and stabilizers beta of each Pauli string, and the exponents
+        e, with one row per set of signs if tableau_rs is a 2D array.
+    """
+    n = xs.shape[1]
+    products = (
+        xs.astype(np.float64) @ tableau_zs.T.astype(np.float64)
+        + zs.astype(np.float64) @ tableau_xs.T.astype(np.float64)
+    ) % 2
+    alphas, betas = products[:, n:], products[:, :n]
+    selections = np.concatenate([alphas, betas], axis=1)
+    exponents = _product_exponents(tableau_xs, tableau_zs, tableau_rs, selections)
+    exponents = (np.count_nonzero(xs & zs, axis=1) - exponents) % 4
+    return alphas.astype(bool), betas.astype(bool), exponents
+
+
+def _parities(selections: np.ndarray, terms: np.ndarray) -> np.ndarray:
+    """Returns (-1)^(s . a) for each row s of selections and each term a, as a 2D array."""
+    return 1 - 2 * ((selections.astype(np.float64) @ terms.T.astype(np.float64)) % 2)
+
+
+def _unique_terms(terms: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the indices of the distinct terms, and the index of each term among them.
+
+    The destabilizers that any term has are usually few, so the terms are compared as integers
+    over these destabilizers, which is much faster than comparing the rows of bits.
+    """
+    columns = np.flatnonzero(np.any(terms, axis=0))
+    if len(columns) < 63:
+        keys = terms[:, columns].astype(np.int64) @ (1 << np.arange(len(columns), dtype=np.int64))
+        _, index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    else:
+        _, index, inverse = np.unique(
+            np.packbits(terms, axis=1), axis=0, return_index=True, return_inverse=True
+        )
+    return index, inverse.reshape(-1)
+
+
+def _merge_terms(terms: np.ndarray, coefficients: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sums the coefficients of equal terms and drops the terms with zero coefficients.
+
+    Args:
+        terms: A 2D boolean array with one term per row.
+        coefficients: The coefficients of the terms along the last axis.
+
+    Returns:
+        The distinct terms and their coefficients.
+    """
+    index, inverse = _unique_terms(terms)
+    merged = np.zeros(coefficients.shape[:-1] + (len(index),), dtype=np.complex128)
+    np.add.at(merged.T, inverse, coefficients.T)
+    nonzero = np.abs(merged) > _ATOL
+    keep = np.any(nonzero.reshape(-1, len(index)), axis=0)
+    return terms[index[keep]], merged[..., keep]
+
+
+def _measure(
+    xs: np.ndarray,
+    zs: np.ndarray,
+    rs: np.ndarray,
+    terms: np.ndarray,
+    coefficients: np.ndarray,
+    counts: np.ndarray,
+    axis: int,
+    prng: np.random.RandomState,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool]:
+    """Measures a qubit of many states that share their terms and the bits of their tableau.
+
+    Each state stands for a number of repetitions, which are split between the outcomes, so that
+    each state becomes up to two states, one for each outcome.
+
+    If Z on the qubit anticommutes with a stabilizer p whose destabilizer no term has, the
+    stabilizer anticommutes with Z and commutes with the terms, so the outcome is random. The
+    tableau is then updated as in the Aaronson-Gottesman algorithm with p as the pivot, which
+    multiplies stabilizer p into the destabilizers of the terms that anticommute with Z and
+    keeps the terms and their coefficients. Otherwise, Z maps the terms to terms, and the
+    outcome is sampled from the expectation value of Z and projected onto the coefficients.
+
+    Args:
+        xs: The X bits of the 2n rows of the tableau, updated in place.
+        zs: The Z bits of the 2n rows of the tableau, updated in place.
+        rs: A 2D array with the signs of the 2n rows of the tableau of each state.
+        terms: A 2D boolean array with the destabilizers of each term per row.
+        coefficients: A 2D complex array with the coefficients of the terms of each state.
+        counts: The number of repetitions of each state.
+        axis: The qubit to measure.
+        prng: The random number generator.
+
+    Returns:
+        The signs, terms, coefficients and number of repetitions of the new states, their
+        outcomes, the index of the state that each of them comes from, and whether the
+        measurement was random on the stabilizer state of the terms.
+    """
+    n = xs.shape[1]
+    candidates = np.flatnonzero(xs[n:, axis] & ~np.any(terms, axis=0))
+    if len(candidates):
+        p = n + int(candidates[0])
+        rows = np.flatnonzero(xs[:, axis])
+        rows = rows[rows != p]
+        phases = _rowsum_phases(
+            *_pack_rows(np.stack([xs[p], zs[p]]))[:, np.newaxis],
+            _pack_rows(xs[rows]),
+            _pack_rows(zs[rows]),
+        )
+        rs = rs.copy()
+        r = 2 * rs[:, rows].astype(np.int64) + 2 * rs[:, [p]].astype(np.int64) + phases
+        rs[:, rows] = (r % 4).astype(bool)
+        xs[rows] ^= xs[p]
+        zs[rows] ^= zs[p]
+        xs[p - n], zs[p - n], rs[:, p - n] = xs[p], zs[p], rs[:, p]
+        xs[p], zs[p] = False, False
+        zs[p, axis] = True
+        counts, results, parents = _split(counts, np.full(len(counts), 0.5), prng)
+        rs = rs[parents]
+        rs[:, p] = results
+        return rs, terms, coefficients[parents], counts, results, parents, True
+
+    z = np.zeros((1, n), dtype=bool)
+    z[0, axis] = True
+    alphas, betas, exponents = _decompose(xs, zs, rs, np.zeros_like(z), z)
+    if not np.any(alphas):
+        # Z is diagonal in the terms, with the eigenvalue -1 on the terms for which exactly one
+        # of the sign i^e and the sign (-1)^(beta . a) is negative.
+        flipped = _parities(betas, terms)[0] < 0
+        negative = exponents[:, 0] == 2
+        flipped_probabilities = np.abs(coefficients) ** 2 @ flipped.astype(np.float64)
+        probabilities = np.clip(
+            np.where(negative, 1 - flipped_probabilities, flipped_probabilities), 0, 1
+        )
+        counts, results, parents = _split(counts, probabilities, prng)
+        probabilities = np.where(results, probabilities[parents], 1 - probabilities[parents])
+        projected = (flipped ^ negative[parents, np.newaxis]) == results[:, np.newaxis]
+        states = (
+            np.where(projected, coefficients[parents], 0) / np.sqrt(probabilities)[:, np.newaxis]
+        )
+    else:
+        images = _POWERS_OF_I[exponents[:, :1]] * _parities(betas, terms) * coefficients
+        # The terms and their images are distinct, so they can be scattered into the merged terms.
+        m = len(terms)
+        terms = np.concatenate([terms, terms ^ alphas])
+        index, inverse = _unique_terms(terms)
+        terms = terms[index]
+        states = np.zeros((len(rs), len(index)), dtype=np.complex128)
+        images_of_states = np.zeros_like(states)
+        states[:, inverse[:m]] = coefficients
+        images_of_states[:, inverse[m:]] = images
+        expectations = np.sum(np.conj(states) * images_of_states, axis=1).real
+        probabilities = np.clip((1 - expectations) / 2, 0, 1)
+        counts, results, parents = _split(counts, probabilities, prng)
+        probabilities = np.where(results, probabilities[parents], 1 - probabilities[parents])
+        signs = np.where(results, -1, 1)[:, np.newaxis]
+        states = (states[parents] + signs * images_of_states[parents]) / (
+            2 * np.sqrt(probabilities)
+        )[:, np.newaxis]
+    keep = np.any(np.abs(states) > _ATOL, axis=0)
+    return rs[parents], terms[keep], states[:, keep], counts, results, parents, False
+
+
+def _split(
+    counts: np.ndarray, probabilities: np.ndarray, prng: np.random.RandomState
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Splits the repetitions of each state between the outcomes of a measurement.
+
+    Args:
+        counts: The number of repetitions of each state.
+        probabilities: The probability of outcome 1 for each state.
+        prng: The random number generator.
+
+    Returns:
+        The number of repetitions, the outcome and the index of the state of each pair of
+        a state and an outcome that has repetitions.
+    """
+    ones = prng.binomial(counts, probabilities)
+    zeros = counts - ones
+    parents = np.concatenate([np.flatnonzero(zeros), np.flatnonzero(ones)])
+    results = np.arange(len(parents)) >= np.count_nonzero(zeros)
+    return np.concatenate([zeros[zeros > 0], ones[ones > 0]]), results, parents
@@ -0,0 +1,252 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import itertools
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.sim.clifford import stabilizer_rank_state
+
+_GATE_DOMAIN = {
+    cirq.H: 1,
+    cirq.S: 1,
+    cirq.X: 1,
+    cirq.T: 1,
+    cirq.Ry(rads=0.3): 1,
+    cirq.CNOT: 2,
+    cirq.CZ: 2,
+    cirq.ISWAP**0.3: 2,
+}
+
+
+def _act_on(state: cirq.StabilizerRankState, circuit: cirq.Circuit, qubits) -> None:
+    sim_state = cirq.StabilizerRankSimulationState(qubits=qubits, initial_state=state)
+    for op in circuit.all_operations():
+        cirq.act_on(op, sim_state)
+
+
+def _random_state(num_qubits: int, seed: int) -> tuple[cirq.StabilizerRankState, np.ndarray]:
+    qubits = cirq.LineQubit.range(num_qubits)
+    circuit = cirq.testing.random_circuit(
+        qubits, n_moments=12, op_density=0.6, gate_domain=_GATE_DOMAIN, random_state=seed
+    )
+    state = cirq.StabilizerRankState(num_qubits)
+    _act_on(state, circuit, qubits)
+    return state, cirq.final_state_vector(circuit, qubit_order=qubits, dtype=np.complex128)
+
+
+def test_initial_state() -> None:
+    state = cirq.StabilizerRankState(3, initial_state=5)
+    np.testing.assert_allclose(state.state_vector(), np.eye(8)[5])
+    assert len(state.coefficients) == 1
+    assert repr(state) == 'cirq.StabilizerRankState(num_qubits=3, num_terms=1)'
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_state_vector_matches_simulator(seed: int) -> None:
+    state, expected = _random_state(5, seed)
+    np.testing.assert_allclose(state.state_vector(), expected, atol=1e-10)
+
+
+def test_clifford_gates() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        cirq.T(qubits[0]),
+        cirq.Y(qubits[1]) ** 0.5,
+        cirq.CZ(*qubits),
+        cirq.X(qubits[0]) ** -0.5,
+        cirq.global_phase_operation(1j),
+    )
+    state = cirq.StabilizerRankState(2)
+    _act_on(state, circuit, qubits)
+    np.testing.assert_allclose(
+        state.state_vector(), cirq.final_state_vector(circuit, dtype=np.complex128), atol=1e-10
+    )
+
+
+def test_apply_unitary_number_of_terms() -> None:
+    state = cirq.StabilizerRankState(3)
+    for axis in range(3):
+        state.apply_h(axis)
+        state.apply_unitary(cirq.unitary(cirq.T), [axis])
+    assert len(state.coefficients) == 8
+    state.apply_unitary(cirq.unitary(cirq.T**-1), [0])
+    assert len(state.coefficients) == 4
+
+
+def test_apply_unitary_changes_frame() -> None:
+    state = cirq.StabilizerRankState(3)
+    state.apply_h(0)
+    state.apply_cx(0, 1)
+    state.apply_cx(1, 2)
+    state.apply_h(0)
+    state.apply_unitary(cirq.unitary(cirq.ZZ**0.25), [0, 1])
+    assert np.count_nonzero(np.any(state.terms, axis=0)) == 1
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        cirq.CNOT(qubits[0], qubits[1]),
+        cirq.CNOT(qubits[1], qubits[2]),
+        cirq.H(qubits[0]),
+        cirq.ZZ(qubits[0], qubits[1]) ** 0.25,
+    )
+    np.testing.assert_allclose(
+        state.state_vector(), cirq.final_state_vector(circuit, dtype=np.complex128), atol=1e-10
+    )
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_measure(seed: int) -> None:
+    state, expected = _random_state(4, seed)
+    results = state.measure([0, 2], seed=seed)
+    expected = expected.reshape((2,) * 4)
+    projected = np.zeros_like(expected)
+    projected[results[0], :, results[1]] = expected[results[0], :, results[1]]
+    projected /= np.linalg.norm(projected)
+    np.testing.assert_allclose(state.state_vector(), projected.reshape(-1), atol=1e-10)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_measure_random_on_all_terms(seed: int) -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        cirq.T(qubits[0]),
+        cirq.H(qubits[0]),
+        cirq.H(qubits[1]),
+        cirq.CNOT(qubits[1], qubits[2]),
+        cirq.S(qubits[2]),
+    )
+    state = cirq.StabilizerRankState(3)
+    _act_on(state, circuit, qubits)
+    results = state.measure([2], seed=seed)
+    expected = cirq.final_state_vector(circuit, dtype=np.complex128).reshape((2,) * 3)
+    expected[:, :, 1 - results[0]] = 0
+    expected /= np.linalg.norm(expected)
+    np.testing.assert_allclose(state.state_vector(), expected.reshape(-1), atol=1e-10)
+    assert len(state.coefficients) == 2
+
+
+def test_measure_deterministic() -> None:
+    state = cirq.StabilizerRankState(2, initial_state=2)
+    state.apply_h(1)
+    state.apply_unitary(cirq.unitary(cirq.T), [1])
+    state.apply_h(1)
+    assert state.copy().measure([0], seed=1) == [1]
+    assert {tuple(state.copy().measure([1], seed=seed)) for seed in range(10)} == {(0,), (1,)}
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_sample(seed: int) -> None:
+    state, expected = _random_state(4, seed)
+    samples = state.sample([0, 1, 2, 3], repetitions=20000, seed=seed)
+    assert samples.shape == (20000, 4)
+    counts = np.bincount(samples @ [8, 4, 2, 1], minlength=16) / 20000
+    np.testing.assert_allclose(counts, np.abs(expected) ** 2, atol=0.02)
+    # Sampling does not change the state.
+    np.testing.assert_allclose(state.state_vector(), expected, atol=1e-10)
+
+
+def test_sample_in_batches() -> None:
+    state = cirq.StabilizerRankState(2)
+    state.apply_h(0)
+    state.apply_unitary(cirq.unitary(cirq.T), [0])
+    state.apply_h(0)
+    state.apply_cx(0, 1)
+    with mock.patch.object(stabilizer_rank_state, '_MAX_BATCH_SIZE', 4):
+        samples = state.sample([1, 0], repetitions=1000, seed=1)
+    assert samples.shape == (1000, 2)
+    assert np.all(samples[:, 0] == samples[:, 1])
+    assert 50 < np.sum(samples[:, 0]) < 250
+
+
+def test_sample_many_qubits() -> None:
+    n = 80
+    state = cirq.StabilizerRankState(n)
+    state.apply_h(0)
+    for i in range(n - 1):
+        state.apply_cx(i, i + 1)
+    for i in range(0, n, 8):
+        state.apply_h(i)
+        state.apply_unitary(cirq.unitary(cirq.T), [i])
+        state.apply_h(i)
+    assert len(state.coefficients) == 2**10
+    samples = state.sample(range(n), repetitions=100, seed=1)
+    assert samples.shape == (100, n)
+    # The qubits without T gates are all equal.
+    others = np.delete(samples, np.arange(0, n, 8), axis=1)
+    assert np.all(others == others[:, :1])
+    amplitudes = state.amplitudes(samples[:10])
+    assert np.all(np.abs(amplitudes) > 1e-6)
+
+
+def test_amplitudes() -> None:
+    state, expected = _random_state(4, 1)
+    bitstrings = [0, 3, 9, 15]
+    np.testing.assert_allclose(state.amplitudes(bitstrings), expected[bitstrings], atol=1e-10)
+    bits = np.array([[0, 0, 1, 1], [1, 0, 0, 1]], dtype=bool)
+    np.testing.assert_allclose(state.amplitudes(bits), expected[[3, 9]], atol=1e-10)
+    with mock.patch.object(stabilizer_rank_state, '_MAX_BATCH_SIZE', 1):
+        np.testing.assert_allclose(state.amplitudes(bitstrings), expected[bitstrings], atol=1e-10)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pauli_expectations(seed: int) -> None:
+    state, expected = _random_state(3, seed)
+    masks = np.array(list(itertools.product(range(4), repeat=3)))
+    expectations = [
+        (expected.conj() @ cirq.unitary(cirq.DensePauliString(mask)) @ expected).real
+        for mask in masks
+    ]
+    np.testing.assert_allclose(state.pauli_expectations(masks), expectations, atol=1e-8)
+    with mock.patch.object(stabilizer_rank_state, '_MAX_BATCH_SIZE', 1):
+        np.testing.assert_allclose(state.pauli_expectations(masks), expectations, atol=1e-8)
+
+
+def test_expectation_from_stabilizer_rank_state() -> None:
+    a, b = cirq.LineQubit.range(2)
+    state = cirq.StabilizerRankState(2)
+    _act_on(state, cirq.Circuit(cirq.H(a), cirq.T(a), cirq.CNOT(a, b)), [a, b])
+    qubit_map = {a: 0, b: 1}
+    assert cirq.Z(a).expectation_from_stabilizer_state(state, qubit_map) == pytest.approx(0)
+    assert (cirq.Z(a) * cirq.Z(b)).expectation_from_stabilizer_state(
+        state, qubit_map
+    ) == pytest.approx(1)
+    # The state is (|00> + exp(i pi / 4) |11>) / sqrt(2).
+    observable = cirq.X(a) * cirq.X(b) - cirq.Y(a) * cirq.Y(b)
+    assert observable.expectation_from_stabilizer_state(state, qubit_map) == pytest.approx(
+        np.sqrt(2)
+    )
+
+
+def test_copy() -> None:
+    state, expected = _random_state(3, 2)
+    copy = state.copy()
+    copy.apply_x(0)
+    copy.apply_unitary(cirq.unitary(cirq.T), [1])
+    np.testing.assert_allclose(state.state_vector(), expected, atol=1e-10)
+
+
+def test_merge_terms_with_packed_bits() -> None:
+    terms = np.tril(np.ones((70, 70), dtype=bool))[[0, 69, 0, 5, 69]]
+    merged, coefficients = stabilizer_rank_state._merge_terms(
+        terms, np.array([1, 2, -1, 3, 4], dtype=np.complex128)
+    )
+    assert {np.count_nonzero(t): c for t, c in zip(merged, coefficients)} == {6: 3, 70: 6}
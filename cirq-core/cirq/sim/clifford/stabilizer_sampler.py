@@ -14,19 +14,24 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Iterable, Sequence
 
 import numpy as np
 
 import cirq
-from cirq import protocols, value
+from cirq import ops, protocols, value
 from cirq.qis.clifford_tableau import CliffordTableau
 from cirq.sim.clifford.clifford_tableau_simulation_state import CliffordTableauSimulationState
 from cirq.work import sampler
 
 
 class StabilizerSampler(sampler.Sampler):
-    """An efficient sampler for stabilizer circuits."""
+    """An efficient sampler for stabilizer circuits.
+
+    Circuits of unitary Clifford operations, measurements and resets are
+    sampled for all repetitions at once by propagating Pauli frames. Other
+    circuits are simulated once per repetition.
+    """
 
     def __init__(self, *, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None):
         """Inits StabilizerSampler.
@@ -40,15 +45,75 @@ class StabilizerSampler(sampler.Sampler):
     def run_sweep(
         self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int = 1
     ) -> Sequence[cirq.Result]:
+        """Samples the circuit for every point of the sweep.
+
+        Circuits that are sampled with Pauli frames are compiled once for the
+        whole sweep: only their parameterized operations are resolved for each
+        point. The operations before the first parameterized one are shared by
+        all points: they are simulated once on the reference tableau, and the
+        Pauli frames of the repetitions of all points are propagated through
+        them together.
+        """
+        resolvers = list(cirq.to_resolvers(params))
+        operations = list(program.all_operations())
+        symbolic = [i for i, op in enumerate(operations) if protocols.is_parameterized(op)]
+        fixed_operations = [op for op in operations if not protocols.is_parameterized(op)]
+        # The operations of each sweep point sampled with Pauli frames, or None.
+        resolved_operations: list[list[cirq.Operation] | None] = [None] * len(resolvers)
+        if _supports_pauli_frames(fixed_operations):
+            resolved_operations = [
+                _resolve_clifford_operations(operations, symbolic, param_resolver)
+                for param_resolver in resolvers
+            ]
+
+        qubits = sorted(program.all_qubits())
+        indices = {q: i for i, q in enumerate(qubits)}
+        axes = [[indices[q] for q in op.qubits] for op in operations]
+        prefix_length = symbolic[0] if symbolic else len(operations)
+        num_points = sum(resolved is not None for resolved in resolved_operations)
+        num_words = (repetitions + 63) // 64
+        frame_maps: dict[cirq.Operation | cirq.Gate, np.ndarray] = {}
+        if num_points:
+            state = CliffordTableauSimulationState(
+                CliffordTableau(num_qubits=len(qubits)), qubits=qubits, prng=self._prng
+            )
+            frame_xs = np.zeros((len(qubits), num_points * num_words), dtype=np.uint64)
+            frame_zs = _random_words(self._prng, (len(qubits), num_points * num_words))
+            prefix_records = self._propagate_pauli_frames(
+                operations[:prefix_length],
+                axes[:prefix_length],
+                state,
+                frame_xs,
+                frame_zs,
+                frame_maps=frame_maps,
+            )
+
         results: list[cirq.Result] = []
-        for param_resolver in cirq.to_resolvers(params):
-            resolved_circuit = cirq.resolve_parameters(program, param_resolver)
-            measurements = self._run(resolved_circuit, repetitions=repetitions)
+        point = 0
+        for param_resolver, resolved in zip(resolvers, resolved_operations):
+            if resolved is None:
+                resolved_circuit = cirq.resolve_parameters(program, param_resolver)
+                measurements = self._run(resolved_circuit, repetitions=repetitions)
+            else:
+                words = slice(point * num_words, (point + 1) * num_words)
+                bits = slice(64 * words.start, 64 * words.start + repetitions)
+                records = {key: record[:, bits] for key, record in prefix_records.items()}
+                records.update(
+                    self._propagate_pauli_frames(
+                        resolved[prefix_length:],
+                        axes[prefix_length:],
+                        state.copy(),
+                        frame_xs[:, words].copy(),
+                        frame_zs[:, words].copy(),
+                        frame_maps=frame_maps,
+                    )
+                )
+                measurements = {key: record[:, :repetitions].T for key, record in records.items()}
+                point += 1
             results.append(cirq.ResultDict(params=param_resolver, measurements=measurements))
         return results
 
     def _run(self, circuit: cirq.AbstractCircuit, repetitions: int) -> dict[str, np.ndarray]:
-
         measurements: dict[str, list[np.ndarray]] = {
             key: [] for key in protocols.measurement_key_names(circuit)
         }
@@ -65,3 +130,115 @@ class StabilizerSampler(sampler.Sampler):
                 measurements[k].append(np.array(v, dtype=np.uint8))
 
         return {k: np.array(v) for k, v in measurements.items()}
+
+    def _propagate_pauli_frames(
+        self,
+        operations: Sequence[cirq.Operation],
+        axes: Sequence[list[int]],
+        state: CliffordTableauSimulationState,
+        frame_xs: np.ndarray,
+        frame_zs: np.ndarray,
+        *,
+        frame_maps: dict[cirq.Operation | cirq.Gate, np.ndarray],
+    ) -> dict[str, np.ndarray]:
+        """Samples many repetitions at once by propagating Pauli frames.
+
+        A reference sample is simulated on a single tableau. Every repetition
+        differs from it by a Pauli operator, its frame, which is conjugated by
+        the Clifford operations of the circuit and flips the measurements of
+        qubits where it has an X or Y. Random Z frames at the start and after
+        every measurement and reset make the measurements that are random
+        in the reference simulation random in the repetitions.
+
+        The frames of all repetitions are packed into uint64 words per qubit,
+        so that each operation is a few XORs of these words.
+
+        Args:
+            operations: The operations to apply.
+            axes: The indices of the qubits of each operation in `state`.
+            state: The reference simulation state, which is updated in place.
+            frame_xs: The X bits of the frames, with one row of packed words
+                per qubit, which are updated in place.
+            frame_zs: The Z bits of the frames, like `frame_xs`.
+            frame_maps: A cache of the frame maps of the gates, or of the
+                operations without gates, shared between calls.
+
+        Returns:
+            The measurement results by key, with one row per measured qubit
+            and one column per bit of the frames.
+        """
+        measurements: dict[str, np.ndarray] = {}
+        for op, op_axes in zip(operations, axes):
+            protocols.act_on(op, state)
+            if isinstance(op.gate, ops.MeasurementGate):
+                digits = state.classical_data.get_digits(op.gate.mkey)
+                reference = np.array(digits, dtype=np.uint8)
+                flips = np.unpackbits(frame_xs[op_axes].view(np.uint8), axis=-1, bitorder='little')
+                measurements[op.gate.key] = reference[:, np.newaxis] ^ flips
+                frame_zs[op_axes] = _random_words(self._prng, frame_zs[op_axes].shape)
+            elif isinstance(op.gate, ops.ResetChannel):
+                frame_xs[op_axes] = 0
+                frame_zs[op_axes] = _random_words(self._prng, frame_zs[op_axes].shape)
+            elif op_axes:
+                # The frame maps only depend on the gates, if any.
+                map_key = op if op.gate is None else op.gate
+                if map_key not in frame_maps:
+                    frame_maps[map_key] = _pauli_frame_map(op)
+                frame_map = frame_maps[map_key]
+                frames = np.concatenate([frame_xs[op_axes], frame_zs[op_axes]])
+                images = [np.bitwise_xor.reduce(frames[column], axis=0) for column in frame_map.T]
+                frame_xs[op_axes] = images[: len(op_axes)]
+                frame_zs[op_axes] = images[len(op_axes) :]
+        return measurements
+
+
+def _resolve_clifford_operations(
+    operations: Sequence[cirq.Operation], symbolic: Sequence[int], resolver: cirq.ParamResolver
+) -> list[cirq.Operation] | None:
+    """Resolves the parameterized operations, or returns None if one is not a unitary Clifford."""
+    resolved = list(operations)
+    for i in symbolic:
+        resolved[i] = protocols.resolve_parameters(operations[i], resolver)
+        if not _is_unitary_clifford(resolved[i]):
+            return None
+    return resolved
+
+
+def _random_words(prng: np.random.RandomState, shape: tuple[int, int]) -> np.ndarray:
+    """Returns uniformly random uint64 words."""
+    num_rows, num_words = shape
+    return prng.randint(0, 256, size=(num_rows, 8 * num_words), dtype=np.uint8).view(np.uint64)
+
+
+def _supports_pauli_frames(operations: Iterable[cirq.Operation]) -> bool:
+    """Returns whether operations can be sampled by propagating Pauli frames.
+
+    The operations must be unitary Clifford operations, resets, and
+    measurements without confusion maps and with distinct keys.
+    """
+    keys = set()
+    for op in operations:
+        if isinstance(op.gate, ops.MeasurementGate):
+            if op.gate.confusion_map or op.gate.key in keys:
+                return False
+            keys.add(op.gate.key)
+        elif not isinstance(op.gate, ops.ResetChannel) and not _is_unitary_clifford(op):
+            return False
+    return True
+
+
+def _is_unitary_clifford(op: cirq.Operation) -> bool:
+    return protocols.has_unitary(op) and protocols.has_stabilizer_effect(op)
+
+
+def _pauli_frame_map(op: cirq.Operation) -> np.ndarray:
+    """Returns how a Clifford operation conjugates the Paulis on its qubits, ignoring signs.
+
+    Row `i` of the returned boolean matrix holds the X bits, then the Z bits, of the image of
+    `X_i` for `i` below the number of qubits of `op`, and of the image of `Z_i` after that.
+    """
+    state = CliffordTableauSimulationState(
+        CliffordTableau(num_qubits=len(op.qubits)), qubits=op.qubits
+    )
+    protocols.act_on(op, state)
+    return state.tableau.matrix()
@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
+import sympy
 
 import cirq
 
@@ -37,3 +39,147 @@ def test_reset() -> None:
     assert sampler.sample(c)['q(0)'][0] == 0
     c = cirq.Circuit(cirq.reset(q), cirq.measure(q))
     assert sampler.sample(c)['q(0)'][0] == 0
+
+
+def _random_clifford_circuit_with_measurements(qubits, seed):
+    rng = np.random.RandomState(seed)
+    gates = [cirq.H, cirq.S, cirq.X, cirq.Y**0.5, cirq.Z, cirq.CNOT, cirq.CZ, cirq.SWAP, cirq.ISWAP]
+    circuit = cirq.Circuit()
+    for i in range(30):
+        gate = gates[rng.randint(len(gates))]
+        targets = rng.choice(len(qubits), size=gate.num_qubits(), replace=False)
+        circuit.append(gate.on(*(qubits[t] for t in targets)))
+        if i % 6 == 5:
+            q = qubits[rng.randint(len(qubits))]
+            circuit.append(cirq.measure(q, key=f'm{i}'))
+            if i % 12 == 11:
+                circuit.append(cirq.reset(q))
+    circuit.append(cirq.measure(*qubits, key='final', invert_mask=(True,)))
+    return circuit
+
+
+def test_pauli_frames_match_state_vector_simulation() -> None:
+    qubits = cirq.LineQubit.range(3)
+    for seed in range(3):
+        circuit = _random_clifford_circuit_with_measurements(qubits, seed)
+        keys = sorted(cirq.measurement_key_names(circuit))
+        result = cirq.StabilizerSampler(seed=seed).run(circuit, repetitions=4000)
+        expected = cirq.Simulator(seed=seed).run(circuit, repetitions=4000)
+        histogram = result.multi_measurement_histogram(keys=keys)
+        expected_histogram = expected.multi_measurement_histogram(keys=keys)
+        for outcome in histogram.keys() | expected_histogram.keys():
+            assert abs(histogram[outcome] - expected_histogram[outcome]) < 100
+
+
+def test_pauli_frames_correlations() -> None:
+    qubits = cirq.LineQubit.range(70)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(69)],
+        cirq.global_phase_operation(1j),
+        cirq.measure(*qubits, key='ghz'),
+        cirq.measure(qubits[0], key='again'),
+    )
+    result = cirq.StabilizerSampler(seed=1).run(circuit, repetitions=100)
+    ghz = result.measurements['ghz']
+    assert ghz.shape == (100, 70)
+    assert np.all(ghz == ghz[:, :1])
+    np.testing.assert_array_equal(result.measurements['again'], ghz[:, :1])
+    assert 20 < np.sum(ghz[:, 0]) < 80
+
+    result = cirq.StabilizerSampler().run(circuit, repetitions=0)
+    assert result.measurements['ghz'].shape == (0, 70)
+
+
+def test_pauli_frames_independent_of_qubit_hashes() -> None:
+    # Seeded samples must not depend on the iteration order of `all_qubits()`, which
+    # varies with PYTHONHASHSEED for named qubits.
+    named = [cirq.NamedQubit(f'q{i}') for i in range(8)]
+    line = cirq.LineQubit.range(8)
+    circuit = cirq.Circuit(cirq.H.on_each(*named), cirq.measure(*named, key='m'))
+    result = cirq.StabilizerSampler(seed=5).run(circuit, repetitions=20)
+    expected = cirq.StabilizerSampler(seed=5).run(
+        circuit.transform_qubits(dict(zip(named, line))), repetitions=20
+    )
+    assert result == expected
+
+
+def test_circuits_not_sampled_with_pauli_frames() -> None:
+    q = cirq.LineQubit(0)
+    for circuit in [
+        cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'), cirq.X(q).with_classical_controls('m')),
+        cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'), cirq.measure(q, key='m')),
+        cirq.Circuit(
+            cirq.X(q), cirq.measure(q, key='m', confusion_map={(0,): np.array([[0, 1], [1, 0]])})
+        ),
+    ]:
+        assert not cirq.sim.clifford.stabilizer_sampler._supports_pauli_frames(
+            circuit.all_operations()
+        )
+    result = cirq.StabilizerSampler().run(
+        cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'), cirq.X(q).with_classical_controls('m'))
+        + cirq.measure(q, key='n'),
+        repetitions=3,
+    )
+    np.testing.assert_array_equal(result.measurements['n'], [[0], [0], [0]])
+
+
+def test_run_sweep_shares_reference_prefix() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(a, key='prefix'),
+        cirq.X(b) ** sympy.Symbol('t'),
+        cirq.measure(a, b, key='m'),
+    )
+    sampler = cirq.StabilizerSampler(seed=1)
+    results = sampler.run_sweep(circuit, cirq.Points('t', [0, 1, 0.5, 2]), repetitions=1000)
+    for result in results:
+        prefix = result.measurements['prefix'][:, 0]
+        m = result.measurements['m']
+        assert 300 < np.sum(prefix) < 700
+        np.testing.assert_array_equal(m[:, 0], prefix)
+        flips = m[:, 1] ^ prefix
+        t = result.params.value_of('t')
+        if t == 0.5:
+            assert 300 < np.sum(flips) < 700
+        else:
+            np.testing.assert_array_equal(flips, t % 2)
+    assert np.any(results[0].measurements['prefix'] != results[1].measurements['prefix'])
+
+
+def test_run_sweep_matches_resolved_circuits() -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = _random_clifford_circuit_with_measurements(qubits, seed=1)
+    circuit.insert(10, cirq.YPowGate(exponent=sympy.Symbol('t')).on(qubits[1]))
+    keys = sorted(cirq.measurement_key_names(circuit))
+    sweep = cirq.Points('t', [-0.5, 1.5])
+    results = cirq.StabilizerSampler(seed=2).run_sweep(circuit, sweep, repetitions=4000)
+    for result, resolver in zip(results, sweep):
+        assert result.params == resolver
+        expected = cirq.Simulator(seed=3).run(
+            cirq.resolve_parameters(circuit, resolver), repetitions=4000
+        )
+        histogram = result.multi_measurement_histogram(keys=keys)
+        expected_histogram = expected.multi_measurement_histogram(keys=keys)
+        for outcome in histogram.keys() | expected_histogram.keys():
+            assert abs(histogram[outcome] - expected_histogram[outcome]) < 100
+
+
+def test_run_sweep_not_sampled_with_pauli_frames() -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(
+        cirq.X(q) ** sympy.Symbol('t'),
+        cirq.measure(q, key='m'),
+        cirq.X(q).with_classical_controls('m'),
+        cirq.measure(q, key='n'),
+    )
+    results = cirq.StabilizerSampler().run_sweep(circuit, cirq.Points('t', [0, 1]), repetitions=3)
+    np.testing.assert_array_equal(results[0].measurements['m'], [[0], [0], [0]])
+    np.testing.assert_array_equal(results[1].measurements['m'], [[1], [1], [1]])
+    np.testing.assert_array_equal(results[1].measurements['n'], [[0], [0], [0]])
+
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='m'))
+    with pytest.raises(TypeError, match='Failed to act'):
+        _ = cirq.StabilizerSampler().run_sweep(circuit, cirq.Points('t', [1, 0.25]))
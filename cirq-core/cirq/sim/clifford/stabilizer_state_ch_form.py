@@ -20,7 +20,10 @@ import numpy as np
 
 import cirq
 from cirq import protocols, qis, value
-from cirq.value import big_endian_int_to_digits, random_state
+from cirq.qis.clifford_tableau import _pauli_mask_bits
+from cirq.value import big_endian_int_to_bits, big_endian_int_to_digits, random_state
+
+_POWERS_OF_I = np.array([1, 1j, -1, -1j])
 
 
 @value.value_equality(unhashable=True)
@@ -107,48 +110,83 @@ class StabilizerStateChForm(qis.StabilizerState):
     def inner_product_of_state_and_x(self, x: int) -> complex:
         """Returns the amplitude of x'th element of
         the state vector, i.e. <x|psi>"""
-        if type(x) == int:
-            y = cirq.big_endian_int_to_bits(x, bit_count=self.n)
-
-        mu = sum(y * self.gamma)
-
-        u = np.zeros(self.n, dtype=bool)
-        for p in range(self.n):
-            if y[p]:
-                u ^= self.F[p, :]
-                mu += 2 * (sum(self.M[p, :] & u) % 2)
-        return (
-            self.omega
-            * 2 ** (-sum(self.v) / 2)
-            * 1j**mu
-            * (-1) ** sum(self.v & u & self.s)
-            * bool(np.all(self.v | (u == self.s)))
-        )
+        return complex(self.amplitudes([x])[0])
 
-    def state_vector(self) -> np.ndarray:
-        wf = np.zeros(2**self.n, dtype=complex)
+    def amplitudes(self, bitstrings: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Returns the amplitudes <x|psi> of many computational basis states at once.
+
+        Args:
+            bitstrings: The basis states, either as big endian ints, or as a
+                2D array with the bits of one basis state per row.
 
-        for x in range(2**self.n):
-            wf[x] = self.inner_product_of_state_and_x(x)
+        Returns:
+            A 1D complex array with the amplitude of each basis state.
+        """
+        y = np.asarray(bitstrings)
+        if y.ndim != 2:
+            y = _big_endian_ints_to_bits(bitstrings, self.n)
+        # Products of float matrices are computed by BLAS, and are exact for these small
+        # integers.
+        y = y.astype(np.float64)
+
+        # With u_p the XOR of the rows of F selected by y up to row p, the phase
+        # of Eq. 55 of Bravyi et al is i^mu with mu the sum of gamma_p and of
+        # 2 (M_p . u_p) over the rows p selected by y. Since M_p . u_p is the sum
+        # of M_p . F_q over the selected rows q <= p, all of them come from the
+        # lower triangle of M F^T.
+        overlaps = np.tril(self.M.astype(np.float64) @ self.F.T.astype(np.float64))
+        parities = (y @ overlaps.T).astype(np.int64) & 1
+        mu = (y @ self.gamma).astype(np.int64) + 2 * np.sum(y * parities, axis=1, dtype=np.int64)
+        u = ((y @ self.F.astype(np.float64)).astype(np.int64) & 1).astype(bool)
+
+        signs = 1 - 2 * (np.count_nonzero(self.v & u & self.s, axis=1) & 1)
+        overlapping = np.all(self.v | (u == self.s), axis=1)
+        scale = self.omega * 2 ** (-np.count_nonzero(self.v) / 2)
+        return scale * _POWERS_OF_I[mu % 4] * signs * overlapping
+
+    def pauli_expectations(self, pauli_masks: np.ndarray) -> np.ndarray:
+        x, z = _pauli_mask_bits(pauli_masks)
+        F, G, M = (m.astype(np.float64) for m in (self.F, self.G, self.M))
+        # Conjugate the Pauli strings by U_C, using U_C^-1 X_p U_C = i^gamma_p X^F_p Z^M_p and
+        # U_C^-1 Z_p U_C = Z^G_p (Section IV A of Bravyi et al). The product of the images of
+        # the X_p has a sign -1 for each Z of an image moved past an X of a later image.
+        xs = (x @ F).astype(np.int64) % 2
+        zs = (x @ M + z @ G).astype(np.int64) % 2
+        later_xs = np.triu((M @ F.T) % 2, 1)
+        phases = np.sum(x * z, axis=1) + x @ self.gamma + 2 * np.sum((x @ later_xs) * x, axis=1)
+        # Conjugate them by U_H, which swaps the X and Z of the qubits with v = 1, with a sign
+        # for each Y.
+        phases += 2 * np.count_nonzero(xs & zs & self.v, axis=1)
+        xs, zs = np.where(self.v, zs, xs), np.where(self.v, xs, zs)
+        # Only Z strings have nonzero expectation values on |s>.
+        phases += 2 * (zs @ self.s)
+        return np.where(np.any(xs, axis=1), 0.0, 1.0 - phases.astype(np.int64) % 4)
 
-        return wf
+    def state_vector(self) -> np.ndarray:
+        return self.amplitudes(np.arange(2**self.n))
 
     def _S_right(self, q):
         r"""Right multiplication version of S gate."""
         self.M[:, q] ^= self.F[:, q]
         self.gamma[:] = (self.gamma[:] - self.F[:, q]) % 4
 
-    def _CZ_right(self, q, r):
-        r"""Right multiplication version of CZ gate."""
-        self.M[:, q] ^= self.F[:, r]
-        self.M[:, r] ^= self.F[:, q]
-        self.gamma[:] = (self.gamma[:] + 2 * self.F[:, q] * self.F[:, r]) % 4
+    def _CZ_right(self, q, rs):
+        r"""Right multiplication version of CZ gates from q to each of rs."""
+        self.M[:, q] ^= np.bitwise_xor.reduce(self.F[:, rs], axis=1)
+        self.M[:, rs] ^= self.F[:, q, np.newaxis]
+        self.gamma[:] = (self.gamma + 2 * self.F[:, q] * np.sum(self.F[:, rs], axis=1)) % 4
 
-    def _CNOT_right(self, q, r):
-        r"""Right multiplication version of CNOT gate."""
-        self.G[:, q] ^= self.G[:, r]
-        self.F[:, r] ^= self.F[:, q]
-        self.M[:, q] ^= self.M[:, r]
+    def _CNOT_right(self, q, rs):
+        r"""Right multiplication version of CNOT gates from q to each of rs."""
+        self.G[:, q] ^= np.bitwise_xor.reduce(self.G[:, rs], axis=1)
+        self.F[:, rs] ^= self.F[:, q, np.newaxis]
+        self.M[:, q] ^= np.bitwise_xor.reduce(self.M[:, rs], axis=1)
+
+    def _CNOT_right_to(self, qs, r):
+        r"""Right multiplication version of CNOT gates from each of qs to r."""
+        self.G[:, qs] ^= self.G[:, r, np.newaxis]
+        self.F[:, r] ^= np.bitwise_xor.reduce(self.F[:, qs], axis=1)
+        self.M[:, qs] ^= self.M[:, r, np.newaxis]
 
     def update_sum(self, t, u, delta=0, alpha=0):
         """Implements the transformation (Proposition 4 in Bravyi et al)
@@ -165,16 +203,11 @@ class StabilizerStateChForm(qis.StabilizerState):
         # implement Vc
         if len(set0) > 0:
             q = set0[0]
-            for i in set0:
-                if i != q:
-                    self._CNOT_right(q, i)
-            for i in set1:
-                self._CZ_right(q, i)
+            self._CNOT_right(q, set0[1:])
+            self._CZ_right(q, set1)
         elif len(set1) > 0:
             q = set1[0]
-            for i in set1:
-                if i != q:
-                    self._CNOT_right(i, q)
+            self._CNOT_right_to(set1[1:], q)
 
         e = np.zeros(self.n, dtype=bool)
         e[q] = True
@@ -232,12 +265,7 @@ class StabilizerStateChForm(qis.StabilizerState):
         return omega, a, b, c
 
     def to_state_vector(self) -> np.ndarray:
-        arr = np.zeros(2**self.n, dtype=complex)
-
-        for x in range(len(arr)):
-            arr[x] = self.inner_product_of_state_and_x(x)
-
-        return arr
+        return self.state_vector()
 
     def _measure(self, q, prng: np.random.RandomState) -> int:
         """Measures the q'th qubit.
@@ -247,10 +275,8 @@ class StabilizerStateChForm(qis.StabilizerState):
         Returns: Computational basis measurement as 0 or 1.
         """
         w = self.s.copy()
-        for i, v_i in enumerate(self.v):
-            if v_i == 1:
-                w[i] = bool(prng.randint(2))
-        x_i = sum(w & self.G[q, :]) % 2
+        w[self.v] = prng.randint(2, size=np.count_nonzero(self.v))
+        x_i = int(np.count_nonzero(w & self.G[q, :]) % 2)
         # Project the state to the above measurement outcome.
         self.project_Z(q, x_i)
         return x_i
@@ -262,7 +288,7 @@ class StabilizerStateChForm(qis.StabilizerState):
         """
         t = self.s.copy()
         u = (self.G[q, :] & self.v) ^ self.s
-        delta = (2 * sum((self.G[q, :] & (~self.v)) & self.s) + 2 * z) % 4
+        delta = (2 * np.count_nonzero(self.G[q, :] & (~self.v) & self.s) + 2 * z) % 4
 
         if np.all(t == u):
             self.omega /= np.sqrt(2)
@@ -346,10 +372,10 @@ class StabilizerStateChForm(qis.StabilizerState):
             # Equations 48, 49 and Proposition 4
             t = self.s ^ (self.G[axis, :] & self.v)
             u = self.s ^ (self.F[axis, :] & (~self.v)) ^ (self.M[axis, :] & self.v)
-            alpha = sum(self.G[axis, :] & (~self.v) & self.s) % 2
-            beta = sum(self.M[axis, :] & (~self.v) & self.s)
-            beta += sum(self.F[axis, :] & self.v & self.M[axis, :])
-            beta += sum(self.F[axis, :] & self.v & self.s)
+            alpha = np.count_nonzero(self.G[axis, :] & (~self.v) & self.s) % 2
+            beta = np.count_nonzero(self.M[axis, :] & (~self.v) & self.s)
+            beta += np.count_nonzero(self.F[axis, :] & self.v & self.M[axis, :])
+            beta += np.count_nonzero(self.F[axis, :] & self.v & self.s)
             beta %= 2
             delta = (self.gamma[axis] + 2 * (alpha + beta)) % 4
             self.update_sum(t, u, delta=delta, alpha=alpha)
@@ -378,7 +404,7 @@ class StabilizerStateChForm(qis.StabilizerState):
             self.gamma[control_axis] = (
                 self.gamma[control_axis]
                 + self.gamma[target_axis]
-                + 2 * (sum(self.M[control_axis, :] & self.F[target_axis, :]) % 2)
+                + 2 * (np.count_nonzero(self.M[control_axis, :] & self.F[target_axis, :]) % 2)
             ) % 4
             self.G[target_axis, :] ^= self.G[control_axis, :]
             self.F[control_axis, :] ^= self.F[target_axis, :]
@@ -394,5 +420,15 @@ class StabilizerStateChForm(qis.StabilizerState):
         return [self._measure(axis, random_state.parse_random_state(seed)) for axis in axes]
 
 
+def _big_endian_ints_to_bits(values: Sequence[int] | np.ndarray, num_bits: int) -> np.ndarray:
+    """Returns the big endian bits of ints as the rows of a 2D array."""
+    if num_bits < 63:
+        shifts = np.arange(num_bits - 1, -1, -1, dtype=np.int64)
+        return (np.asarray(values, dtype=np.int64)[:, np.newaxis] >> shifts) & 1
+    return np.array(
+        [big_endian_int_to_bits(int(x), bit_count=num_bits) for x in values], dtype=np.int64
+    ).reshape(-1, num_bits)
+
+
 def _phase(exponent, global_shift):
     return np.exp(1j * np.pi * global_shift * exponent)
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
 import pytest
 
@@ -78,3 +80,73 @@ def test_run() -> None:
         measurements = {str(k): list(v[-1]) for k, v in classical_data.records.items()}
         assert measurements['q(1)'] == [1]
         assert measurements['q(0)'] != measurements['q(2)']
+
+
+def _random_clifford_circuit(qubits, seed):
+    rng = np.random.RandomState(seed)
+    gates = [cirq.H, cirq.S, cirq.X, cirq.Y, cirq.Z, cirq.Y**0.5, cirq.CNOT, cirq.CZ, cirq.SWAP]
+    circuit = cirq.Circuit()
+    for _ in range(40):
+        gate = gates[rng.randint(len(gates))]
+        targets = rng.choice(len(qubits), size=gate.num_qubits(), replace=False)
+        circuit.append(gate.on(*(qubits[t] for t in targets)))
+    return circuit
+
+
+def _ch_form(circuit, qubits):
+    args = cirq.StabilizerChFormSimulationState(qubits=qubits, prng=np.random.RandomState())
+    for op in circuit.all_operations():
+        cirq.act_on(op, args)
+    return args.state
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_amplitudes_match_state_vector_simulation(seed) -> None:
+    qubits = cirq.LineQubit.range(5)
+    circuit = _random_clifford_circuit(qubits, seed)
+    state = _ch_form(circuit, qubits)
+    expected = cirq.final_state_vector(circuit, qubit_order=qubits)
+    np.testing.assert_allclose(state.state_vector(), expected, atol=1e-8)
+    np.testing.assert_allclose(state.to_state_vector(), expected, atol=1e-8)
+
+    xs = np.random.RandomState(seed).randint(32, size=10)
+    bits = np.array([cirq.big_endian_int_to_bits(int(x), bit_count=5) for x in xs], dtype=bool)
+    np.testing.assert_allclose(state.amplitudes(xs), expected[xs], atol=1e-8)
+    np.testing.assert_allclose(state.amplitudes(bits), expected[xs], atol=1e-8)
+    assert state.amplitudes([]).shape == (0,)
+    for x in xs[:3]:
+        assert cirq.approx_eq(state.inner_product_of_state_and_x(int(x)), expected[x], atol=1e-8)
+
+
+def test_amplitudes_many_qubits() -> None:
+    qubits = cirq.LineQubit.range(70)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(69)],
+        cirq.S(qubits[3]),
+    )
+    state = _ch_form(circuit, qubits)
+    ones = 2**70 - 1
+    np.testing.assert_allclose(
+        state.amplitudes([0, ones, 1, 2**69]), [0.5**0.5, 1j * 0.5**0.5, 0, 0], atol=1e-8
+    )
+    bits = np.zeros((3, 70), dtype=np.uint8)
+    bits[1] = 1
+    bits[2, 5] = 1
+    np.testing.assert_allclose(state.amplitudes(bits), [0.5**0.5, 1j * 0.5**0.5, 0], atol=1e-8)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pauli_expectations_match_state_vector_simulation(seed) -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = _random_clifford_circuit(qubits, seed)
+    state = _ch_form(circuit, qubits)
+    state_vector = cirq.final_state_vector(circuit, qubit_order=qubits)
+    masks = np.array(list(itertools.product(range(4), repeat=3)))
+    expected = [
+        cirq.DensePauliString(mask)
+        .on(*qubits)
+        .expectation_from_state_vector(state_vector, {q: i for i, q in enumerate(qubits)})
+        for mask in masks
+    ]
+    np.testing.assert_allclose(state.pauli_expectations(masks), expected, atol=1e-6)
@@ -20,14 +20,21 @@ from typing import Any, Callable, Sequence, TYPE_CHECKING
 
 import numpy as np
 
-from cirq import protocols, qis, sim
+from cirq import linalg, protocols, qis, sim, value
 from cirq._compat import proper_repr
 from cirq.linalg import transformations
+from cirq.sim import simulation_utils
 from cirq.sim.simulation_state import SimulationState, strat_act_on_from_apply_decompose
 
 if TYPE_CHECKING:
     import cirq
 
+# The number of entries `_CompactDensityMatrix` multiplies at once.
+_MAX_CHUNK_SIZE = 2**18
+
+# The largest number of qubits on which `_CompactDensityMatrix` applies channels as superoperators.
+_MAX_SUPEROPERATOR_QUBITS = 4
+
 
 class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
     """Contains the density matrix and buffers for efficient state evolution."""
@@ -101,7 +108,7 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         Returns:
             A copy of the object.
         """
-        return _BufferedDensityMatrix(
+        return type(self)(
             density_matrix=self._density_matrix.copy(),
             buffer=[b.copy() for b in self._buffer] if deep_copy_buffers else self._buffer,
         )
@@ -117,7 +124,7 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         density_matrix = transformations.density_matrix_kronecker_product(
             self._density_matrix, other._density_matrix
         )
-        return _BufferedDensityMatrix(density_matrix=density_matrix)
+        return type(self)(density_matrix=density_matrix)
 
     def factor(
         self, axes: Sequence[int], *, validate=True, atol=1e-07
@@ -139,8 +146,8 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         extracted_tensor, remainder_tensor = transformations.factor_density_matrix(
             self._density_matrix, axes, validate=validate, atol=atol
         )
-        extracted = _BufferedDensityMatrix(density_matrix=extracted_tensor)
-        remainder = _BufferedDensityMatrix(density_matrix=remainder_tensor)
+        extracted = type(self)(density_matrix=extracted_tensor)
+        remainder = type(self)(density_matrix=remainder_tensor)
         return extracted, remainder
 
     def reindex(self, axes: Sequence[int]) -> _BufferedDensityMatrix:
@@ -155,7 +162,7 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         new_tensor = transformations.transpose_density_matrix_to_axis_order(
             self._density_matrix, axes
         )
-        return _BufferedDensityMatrix(density_matrix=new_tensor)
+        return type(self)(density_matrix=new_tensor)
 
     def apply_channel(self, action: Any, axes: Sequence[int]) -> bool:
         """Apply channel to state.
@@ -166,6 +173,9 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         Returns:
             True if the action succeeded.
         """
+        right_axes = [e + len(self._qid_shape) for e in axes]
+        if self._apply_diagonal(action, axes, right_axes):
+            return True
         result = protocols.apply_channel(
             action,
             args=protocols.ApplyChannelArgs(
@@ -174,7 +184,7 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
                 auxiliary_buffer0=self._buffer[1],
                 auxiliary_buffer1=self._buffer[2],
                 left_axes=axes,
-                right_axes=[e + len(self._qid_shape) for e in axes],
+                right_axes=right_axes,
             ),
             default=None,
         )
@@ -186,6 +196,45 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         self._density_matrix = result
         return True
 
+    def _apply_diagonal(self, action: Any, axes: Sequence[int], right_axes: Sequence[int]) -> bool:
+        """Multiplies the state in place if the action has a known diagonal unitary."""
+        diagonal = protocols.unitary_diagonal(action, None)
+        if diagonal is None:
+            return False
+        # Multiplies by the diagonal on the left and its conjugate on the right at once.
+        linalg.targeted_diagonal_multiply(
+            np.multiply.outer(diagonal, np.conjugate(diagonal)),
+            self._density_matrix,
+            [*axes, *right_axes],
+        )
+        return True
+
+    def apply_unitary(self, action: Any, axes: Sequence[int]) -> bool:
+        """Apply unitary to state.
+
+        Args:
+            action: The value with a unitary to apply.
+            axes: The axes on which to apply the unitary.
+        Returns:
+            True if the action succeeded.
+        """
+        return protocols.has_unitary(action) and self.apply_channel(action, axes)
+
+    def apply_unitary_tensor(self, tensor: np.ndarray, axes: Sequence[int]) -> None:
+        """Apply a precomputed unitary to state.
+
+        Args:
+            tensor: The unitary, reshaped to a tensor with two axes per target
+                qudit and with the same dtype as the density matrix.
+            axes: The axes on which to apply the unitary.
+        """
+        right_axes = [e + len(self._qid_shape) for e in axes]
+        linalg.targeted_left_multiply(tensor, self._density_matrix, axes, out=self._buffer[0])
+        linalg.targeted_left_multiply(
+            np.conjugate(tensor), self._buffer[0], right_axes, out=self._buffer[1]
+        )
+        self._density_matrix, self._buffer[1] = self._buffer[1], self._density_matrix
+
     def measure(
         self, axes: Sequence[int], seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None
     ) -> list[int]:
@@ -235,6 +284,151 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         return True
 
 
+class _CompactDensityMatrix(_BufferedDensityMatrix):
+    """A density matrix evolved in place, without full-size scratch buffers.
+
+    Unitaries and channels are applied to the density matrix chunk by chunk,
+    through a single small scratch buffer that is reused across operations and
+    shared by copies. Channels are applied as their superoperator, which is
+    accumulated one Kraus operator at a time. This stores one density matrix
+    instead of the four arrays of `_BufferedDensityMatrix`.
+    """
+
+    def __init__(self, density_matrix: np.ndarray, buffer: list[np.ndarray] | None = None):
+        """Initializes the object with the density matrix.
+
+        Args:
+            density_matrix: The density matrix, must be correctly formatted. The data is not
+                checked for validity here due to performance concerns.
+            buffer: Ignored, as the density matrix is evolved in place.
+        """
+        super().__init__(density_matrix, buffer=[])
+        self._scratch: np.ndarray | None = None
+
+    def copy(self, deep_copy_buffers: bool = True) -> _CompactDensityMatrix:
+        """Copies the object, sharing the scratch buffer with the copy.
+
+        Args:
+            deep_copy_buffers: Unused, as the scratch buffer is only used
+                within a single operation.
+        Returns:
+            A copy of the object.
+        """
+        result = _CompactDensityMatrix(self._density_matrix.copy())
+        result._scratch = self._scratch
+        return result
+
+    def _multiply(self, matrix: np.ndarray, axes: Sequence[int]) -> None:
+        """Left-multiplies the given axes of the density matrix in place by the matrix."""
+        target = np.moveaxis(self._density_matrix, axes, range(-len(axes), 0))
+        num_chunk_axes = 0
+        while num_chunk_axes < target.ndim - len(axes) and (
+            np.prod(target.shape[num_chunk_axes:], dtype=np.int64) > _MAX_CHUNK_SIZE
+        ):
+            num_chunk_axes += 1
+        chunk_shape = target.shape[num_chunk_axes:]
+        chunk_size = int(np.prod(chunk_shape, dtype=np.int64))
+        if (
+            self._scratch is None
+            or self._scratch.size < 2 * chunk_size
+            or self._scratch.dtype != target.dtype
+        ):
+            self._scratch = np.empty(2 * chunk_size, dtype=target.dtype)
+        chunk = self._scratch[:chunk_size].reshape(-1, matrix.shape[0])
+        product = self._scratch[chunk_size : 2 * chunk_size].reshape(chunk.shape)
+        matrix_t = matrix.T.astype(target.dtype)
+        for index in np.ndindex(*target.shape[:num_chunk_axes]):
+            np.copyto(chunk.reshape(chunk_shape), target[index])
+            np.matmul(chunk, matrix_t, out=product)
+            target[index] = product.reshape(chunk_shape)
+
+    def apply_channel(self, action: Any, axes: Sequence[int]) -> bool:
+        """Apply channel to state.
+
+        Args:
+            action: The value with a channel to apply.
+            axes: The axes on which to apply the channel.
+        Returns:
+            True if the action succeeded.
+        """
+        right_axes = [e + len(self._qid_shape) for e in axes]
+        if self._apply_diagonal(action, axes, right_axes):
+            return True
+        matrix = protocols.unitary(action, None)
+        if matrix is not None:
+            self._multiply(matrix, axes)
+            self._multiply(np.conjugate(matrix), right_axes)
+            return True
+        if len(axes) <= _MAX_SUPEROPERATOR_QUBITS:
+            kraus = protocols.kraus(action, None)
+            if kraus is not None:
+                superoperator = sum(np.kron(k, np.conjugate(k)) for k in kraus)
+                self._multiply(superoperator, [*axes, *right_axes])
+                return True
+        # Channels without Kraus operators, or acting on many qubits, are applied with
+        # temporary scratch buffers. See `_needs_full_buffers`.
+        self._buffer = [np.empty_like(self._density_matrix) for _ in range(3)]
+        try:
+            return super().apply_channel(action, axes)
+        finally:
+            self._buffer = []
+
+    def apply_unitary_tensor(self, tensor: np.ndarray, axes: Sequence[int]) -> None:
+        """Apply a precomputed unitary to state.
+
+        Args:
+            tensor: The unitary, reshaped to a tensor with two axes per target
+                qudit and with the same dtype as the density matrix.
+            axes: The axes on which to apply the unitary.
+        """
+        size = int(np.prod([self._qid_shape[axis] for axis in axes], dtype=np.int64))
+        matrix = tensor.reshape(size, size)
+        self._multiply(matrix, axes)
+        self._multiply(np.conjugate(matrix), [e + len(self._qid_shape) for e in axes])
+
+    def measure(
+        self, axes: Sequence[int], seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None
+    ) -> list[int]:
+        """Measures the density matrix in place.
+
+        This matches the results of `cirq.measure_density_matrix` for the same
+        seed, without allocating a mask of the size of the density matrix.
+
+        Args:
+            axes: The axes to measure.
+            seed: The random number seed to use.
+        Returns:
+            The measurements in order.
+        """
+        if len(axes) == 0:
+            return []
+        size = int(np.prod(self._qid_shape, dtype=np.int64))
+        probs = simulation_utils.state_probabilities_by_indices(
+            np.diagonal(self._density_matrix.reshape(size, size)).real, axes, self._qid_shape
+        )
+        result = value.parse_random_state(seed).choice(len(probs), p=probs)
+        meas_shape = tuple(self._qid_shape[axis] for axis in axes)
+        projector = np.zeros(len(probs), dtype=self._density_matrix.dtype)
+        projector[result] = 1
+        right_axes = [e + len(self._qid_shape) for e in axes]
+        linalg.targeted_diagonal_multiply(
+            np.multiply.outer(projector, projector), self._density_matrix, [*axes, *right_axes]
+        )
+        self._density_matrix /= probs[result]
+        return value.big_endian_int_to_digits(result, base=meas_shape)
+
+
+def _needs_full_buffers(op: cirq.Operation) -> bool:
+    """Whether `_CompactDensityMatrix` may allocate three full-size buffers to apply the operation.
+
+    This is the case for non-unitary operations other than measurements that act on more than
+    `_MAX_SUPEROPERATOR_QUBITS` qubits or have no Kraus operators.
+    """
+    if protocols.has_unitary(op) or protocols.is_measurement(op):
+        return False
+    return len(op.qubits) > _MAX_SUPEROPERATOR_QUBITS or not protocols.has_kraus(op)
+
+
 class DensityMatrixSimulationState(SimulationState[_BufferedDensityMatrix]):
     """State and context for an operation acting on a density matrix.
 
@@ -251,6 +445,7 @@ class DensityMatrixSimulationState(SimulationState[_BufferedDensityMatrix]):
         initial_state: np.ndarray | cirq.STATE_VECTOR_LIKE = 0,
         dtype: type[np.complexfloating] = np.complex64,
         classical_data: cirq.ClassicalDataStore | None = None,
+        low_memory: bool = False,
     ):
         """Inits DensityMatrixSimulationState.
 
@@ -271,12 +466,17 @@ class DensityMatrixSimulationState(SimulationState[_BufferedDensityMatrix]):
                 `target_tenson` is None.
             classical_data: The shared classical data container for this
                 simulation.
+            low_memory: If True, the density matrix is evolved in place, through
+                a small scratch buffer instead of three workspaces of its size,
+                and `available_buffer` is ignored. This stores a quarter of the
+                memory, but operations that are not diagonal are slower.
 
         Raises:
             ValueError: If `initial_state` is provided as integer, but `qubits`
                 is not provided.
         """
-        state = _BufferedDensityMatrix.create(
+        state_type = _CompactDensityMatrix if low_memory else _BufferedDensityMatrix
+        state = state_type.create(
             initial_state=initial_state,
             qid_shape=tuple(q.dimension for q in qubits) if qubits is not None else None,
             dtype=dtype,
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 import numpy as np
 import pytest
 
@@ -125,3 +127,135 @@ def test_initial_state_bad_shape() -> None:
         cirq.DensityMatrixSimulationState(
             qubits=qubits, initial_state=np.full((2, 2, 2, 2), 1 / 4), dtype=np.complex64
         )
+
+
+def test_apply_unitary() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    args = cirq.DensityMatrixSimulationState(qubits=[q0, q1], initial_state=0)
+    assert args._state.apply_unitary(cirq.H(q0), [0])
+    tensor = cirq.unitary(cirq.CNOT).astype(np.complex64).reshape((2,) * 4)
+    args._state.apply_unitary_tensor(tensor, [0, 1])
+    expected = cirq.final_density_matrix(cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1)))
+    np.testing.assert_allclose(args.target_tensor.reshape(4, 4), expected, atol=1e-6)
+
+
+def test_apply_diagonal_in_place() -> None:
+    qubits = cirq.LineQubit.range(3)
+    initial_state = cirq.testing.random_density_matrix(8, random_state=1).astype(np.complex64)
+    args = cirq.DensityMatrixSimulationState(
+        qubits=qubits, initial_state=initial_state, dtype=np.complex64
+    )
+    target_tensor = args.target_tensor
+    op = cirq.DiagonalGate([0.1, 0.2, 0.3, 0.4]).on(qubits[2], qubits[0])
+    cirq.act_on(op, args)
+    assert args.target_tensor is target_tensor
+    u = cirq.Circuit(op).unitary(qubit_order=qubits)
+    np.testing.assert_allclose(
+        args.target_tensor.reshape(8, 8), u @ initial_state @ u.conj().T, atol=1e-6
+    )
+
+
+class ChannelWithoutKraus(cirq.Gate):
+    """Dephases a qubit through `_apply_channel_` only."""
+
+    def _num_qubits_(self) -> int:
+        return 1
+
+    def _apply_channel_(self, args: cirq.ApplyChannelArgs):
+        return cirq.apply_channel(cirq.phase_damp(0.3), args)
+
+
+@pytest.mark.parametrize(
+    'op',
+    [
+        cirq.H(cirq.LineQubit(1)),
+        cirq.CNOT(cirq.LineQubit(3), cirq.LineQubit(0)),
+        cirq.CZ(*cirq.LineQubit.range(2)) ** 0.3,
+        cirq.MatrixGate(cirq.testing.random_unitary(8, random_state=1)).on(
+            *cirq.LineQubit.range(3, 0, -1)
+        ),
+        cirq.amplitude_damp(0.3).on(cirq.LineQubit(2)),
+        cirq.depolarize(0.2, n_qubits=2).on(cirq.LineQubit(3), cirq.LineQubit(1)),
+        cirq.reset(cirq.LineQubit(0)),
+        cirq.asymmetric_depolarize(error_probabilities={'IIIXX': 0.1, 'ZZIYI': 0.2}).on(
+            *cirq.LineQubit.range(5)
+        ),
+        ChannelWithoutKraus().on(cirq.LineQubit(4)),
+    ],
+)
+def test_low_memory_matches_buffered(op) -> None:
+    qubits = cirq.LineQubit.range(5)
+    initial_state = cirq.testing.random_density_matrix(32, random_state=2).astype(np.complex64)
+    expected = cirq.DensityMatrixSimulationState(qubits=qubits, initial_state=initial_state)
+    actual = cirq.DensityMatrixSimulationState(
+        qubits=qubits, initial_state=initial_state, low_memory=True
+    )
+    cirq.act_on(op, expected)
+    cirq.act_on(op, actual)
+    np.testing.assert_allclose(actual.target_tensor, expected.target_tensor, atol=1e-6)
+    assert actual.available_buffer == []
+
+
+def test_low_memory_qudits() -> None:
+    qubits = [cirq.LineQid(0, dimension=3), cirq.LineQubit(1)]
+    gate = cirq.MatrixGate(cirq.testing.random_unitary(6, random_state=1), qid_shape=(3, 2))
+    initial_state = cirq.testing.random_density_matrix(6, random_state=2)
+    expected = cirq.DensityMatrixSimulationState(
+        qubits=qubits, initial_state=initial_state, dtype=np.complex128
+    )
+    actual = cirq.DensityMatrixSimulationState(
+        qubits=qubits, initial_state=initial_state, dtype=np.complex128, low_memory=True
+    )
+    for state in (expected, actual):
+        cirq.act_on(gate.on(*qubits), state)
+        state._state.apply_unitary_tensor(cirq.unitary(gate).reshape((3, 2) * 2), [0, 1])
+    np.testing.assert_allclose(actual.target_tensor, expected.target_tensor, atol=1e-8)
+
+
+def test_low_memory_chunks() -> None:
+    qubits = cirq.LineQubit.range(5)
+    initial_state = cirq.testing.random_density_matrix(32, random_state=3).astype(np.complex64)
+    op = cirq.depolarize(0.2, n_qubits=2).on(qubits[4], qubits[2])
+    expected = cirq.DensityMatrixSimulationState(qubits=qubits, initial_state=initial_state)
+    cirq.act_on(op, expected)
+    with mock.patch.object(cirq.sim.density_matrix_simulation_state, '_MAX_CHUNK_SIZE', 20):
+        actual = cirq.DensityMatrixSimulationState(
+            qubits=qubits, initial_state=initial_state, low_memory=True
+        )
+        cirq.act_on(op, actual)
+        # The scratch buffer fits two chunks of the size of the superoperator.
+        assert actual._state._scratch.size == 32
+    np.testing.assert_allclose(actual.target_tensor, expected.target_tensor, atol=1e-6)
+
+
+def test_low_memory_measure() -> None:
+    qubits = cirq.LineQubit.range(3)
+    initial_state = cirq.testing.random_density_matrix(8, random_state=4).astype(np.complex64)
+    for seed in range(5):
+        expected = cirq.DensityMatrixSimulationState(
+            qubits=qubits, initial_state=initial_state, prng=np.random.RandomState(seed)
+        )
+        actual = cirq.DensityMatrixSimulationState(
+            qubits=qubits,
+            initial_state=initial_state,
+            prng=np.random.RandomState(seed),
+            low_memory=True,
+        )
+        assert actual.measure([qubits[2], qubits[0]], 'm', [False, False], {}) is None
+        expected.measure([qubits[2], qubits[0]], 'm', [False, False], {})
+        assert actual.log_of_measurement_results == expected.log_of_measurement_results
+        np.testing.assert_allclose(actual.target_tensor, expected.target_tensor, atol=1e-6)
+    assert actual._state.measure([]) == []
+
+
+def test_low_memory_copies_and_factors() -> None:
+    qubits = cirq.LineQubit.range(2)
+    state = cirq.DensityMatrixSimulationState(qubits=qubits, initial_state=1, low_memory=True)
+    cirq.act_on(cirq.H(qubits[0]), state)
+    copy = state.copy()
+    assert copy._state._scratch is state._state._scratch
+    assert copy.target_tensor is not state.target_tensor
+    extracted, remainder = state.factor([qubits[1]])
+    assert type(extracted._state) is type(remainder._state) is type(state._state)
+    assert type(extracted.kronecker_product(remainder)._state) is type(state._state)
+    assert type(state.transpose_to_qubit_order(qubits[::-1])._state) is type(state._state)
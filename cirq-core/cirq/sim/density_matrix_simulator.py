@@ -16,13 +16,14 @@
 
 from __future__ import annotations
 
+import math
 from typing import Any, Sequence, TYPE_CHECKING
 
 import numpy as np
 
-from cirq import ops, protocols, study, value
+from cirq import devices, ops, protocols, study, value
 from cirq._compat import proper_repr
-from cirq.sim import density_matrix_simulation_state, simulator, simulator_base
+from cirq.sim import density_matrix_simulation_state, simulator, simulator_base, sweep_plan
 
 if TYPE_CHECKING:
     import cirq
@@ -123,6 +124,8 @@ class DensityMatrixSimulator(
         noise: cirq.NOISE_MODEL_LIKE = None,
         seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
         split_untangled_states: bool = True,
+        fuse_diagonal_max_qubits: int | None = None,
+        max_memory_bytes: int | None = None,
     ):
         """Density matrix simulator.
 
@@ -134,10 +137,24 @@ class DensityMatrixSimulator(
             split_untangled_states: If True, optimizes simulation by running
                 unentangled qubit sets independently and merging those states
                 at the end.
+            fuse_diagonal_max_qubits: If set, diagonal gates such as `cirq.CZ`
+                and `cirq.ZZ` that are not separated by other operations on
+                their qubits are fused into a single `cirq.DiagonalGate` on at
+                most this many qubits, so that the density matrix is multiplied
+                by their phases in one pass. The fused circuit is cached on the
+                `cirq.FrozenCircuit`. Gates are not fused in noisy simulations
+                or when stepping through moments.
+            max_memory_bytes: If set, the simulator runs in a memory-budget
+                mode: density matrices are evolved in place through a small
+                scratch buffer rather than three workspaces of their size, and
+                states after circuit prefixes are not cached across runs.
+                `run` and `simulate` raise a ValueError before starting if
+                `projected_memory_bytes` of the circuit exceeds this budget.
 
         Raises:
             ValueError: If the supplied dtype is not `np.complex64` or
-                `np.complex128`.
+                `np.complex128`, or if `fuse_diagonal_max_qubits` or
+                `max_memory_bytes` is not positive.
 
         Example:
            >>> (q0,) = cirq.LineQubit.range(1)
@@ -148,6 +165,71 @@ class DensityMatrixSimulator(
         )
         if dtype not in {np.complex64, np.complex128}:
             raise ValueError(f'dtype must be complex64 or complex128, was {dtype}')
+        if fuse_diagonal_max_qubits is not None and fuse_diagonal_max_qubits < 1:
+            raise ValueError(
+                f'fuse_diagonal_max_qubits must be positive but was {fuse_diagonal_max_qubits}'
+            )
+        if max_memory_bytes is not None and max_memory_bytes < 1:
+            raise ValueError(f'max_memory_bytes must be positive but was {max_memory_bytes}')
+        self._fuse_diagonal_max_qubits = fuse_diagonal_max_qubits
+        self._max_memory_bytes = max_memory_bytes
+        if max_memory_bytes is not None:
+            # Cached prefix states would each hold another density matrix.
+            self._prefix_cache = simulator_base._PrefixStateCache(0)
+
+    def projected_memory_bytes(self, program: cirq.AbstractCircuit) -> int:
+        """Returns the projected peak memory of the states used to simulate a circuit.
+
+        This counts the density matrix of all the qubits of the circuit and the
+        workspaces used to evolve it: three arrays of the same size and up to
+        two temporary ones, or a small scratch buffer if `max_memory_bytes` is
+        set. In the latter case, channels that act on many qubits or have no
+        Kraus operators, including those added by the noise model, are still
+        applied with three temporary arrays of the same size, which are then
+        counted as well. To sample circuits with non-terminal measurements,
+        `run` evolves a copy of the state for each repetition, which adds two
+        density matrices: the state before the first measurement and the copy
+        of the previous repetition, held until the next copy is made. Results
+        returned to the caller, such as the final density matrix of each point
+        of a sweep, are not counted.
+
+        Args:
+            program: The circuit to simulate.
+
+        Returns:
+            The projected peak memory in bytes.
+        """
+        size = math.prod(protocols.qid_shape(program)) ** 2
+        if self._max_memory_bytes is None:
+            num_matrices, scratch_size = 6, 0
+        else:
+            num_matrices = 1
+            scratch_size = 2 * min(size, density_matrix_simulation_state._MAX_CHUNK_SIZE)
+            noisy_moments = (
+                program.moments
+                if self.noise is devices.NO_NOISE
+                else self.noise.noisy_moments(program, sorted(program.all_qubits()))
+            )
+            if any(
+                density_matrix_simulation_state._needs_full_buffers(op)
+                for op in ops.flatten_to_ops(noisy_moments)
+            ):
+                num_matrices += 3
+        if not program.are_all_measurements_terminal():
+            num_matrices += 2
+        return (num_matrices * size + scratch_size) * np.dtype(self._dtype).itemsize
+
+    def _prepare_circuit(self, circuit: cirq.AbstractCircuit) -> cirq.AbstractCircuit:
+        if self._max_memory_bytes is not None:
+            projected = self.projected_memory_bytes(circuit)
+            if projected > self._max_memory_bytes:
+                raise ValueError(
+                    f'Simulating the circuit needs a projected {projected} bytes, which exceeds '
+                    f'max_memory_bytes={self._max_memory_bytes}.'
+                )
+        if self._fuse_diagonal_max_qubits is None or self.noise is not devices.NO_NOISE:
+            return circuit
+        return circuit.freeze()._fuse_diagonal_unitaries(self._fuse_diagonal_max_qubits)
 
     def _create_partial_simulation_state(
         self,
@@ -179,11 +261,28 @@ class DensityMatrixSimulator(
             classical_data=classical_data,
             initial_state=initial_state,
             dtype=self._dtype,
+            low_memory=self._max_memory_bytes is not None,
         )
 
     def _can_be_in_run_prefix(self, val: Any):
         return not protocols.measurement_keys_touched(val)
 
+    def _compile_sweep_plan(
+        self,
+        circuit: cirq.AbstractCircuit,
+        qubits: Sequence[cirq.Qid],
+        *,
+        skip_terminal_measurements: bool = False,
+    ) -> sweep_plan.SweepPlan | None:
+        return sweep_plan.SweepPlan.compile(
+            circuit,
+            qubits,
+            self.noise,
+            self._dtype,
+            density_matrix=True,
+            skip_terminal_measurements=skip_terminal_measurements,
+        )
+
     def _create_step_result(
         self, sim_state: cirq.SimulationStateBase[cirq.DensityMatrixSimulationState]
     ):
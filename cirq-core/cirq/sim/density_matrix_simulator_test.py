@@ -1579,3 +1579,109 @@ def test_sweep_unparameterized_prefix_not_repeated_even_non_unitaries():
     simulator.simulate_sweep(program=circuit, params=params)
     assert op1.count == 1
     assert op2.count == 2
+
+
+def test_fuse_diagonal_gates():
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*qubits),
+        [cirq.ZZ(a, b) ** 0.3 for a, b in zip(qubits[::2], qubits[1::2])],
+        [cirq.Z(q) ** 0.2 for q in qubits],
+        cirq.X.on_each(*qubits),
+        [cirq.CZ(a, b) ** 0.7 for a, b in zip(qubits, qubits[1:])],
+        cirq.amplitude_damp(0.1).on_each(*qubits),
+    )
+    simulator = cirq.DensityMatrixSimulator(fuse_diagonal_max_qubits=2)
+    np.testing.assert_allclose(
+        simulator.simulate(circuit).final_density_matrix,
+        cirq.DensityMatrixSimulator().simulate(circuit).final_density_matrix,
+        atol=1e-5,
+    )
+    assert len(list(circuit.freeze()._fuse_diagonal_unitaries(2).all_operations())) < len(
+        list(circuit.all_operations())
+    )
+    noisy = cirq.DensityMatrixSimulator(
+        fuse_diagonal_max_qubits=2, noise=cirq.ConstantQubitNoiseModel(cirq.Z)
+    )
+    assert noisy._prepare_circuit(circuit) is circuit
+    with pytest.raises(ValueError, match='fuse_diagonal_max_qubits'):
+        _ = cirq.DensityMatrixSimulator(fuse_diagonal_max_qubits=0)
+
+
+def test_max_memory_bytes():
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(
+        qubits, n_moments=8, op_density=0.9, random_state=1
+    ) + cirq.Circuit(cirq.amplitude_damp(0.2).on_each(*qubits), cirq.reset(qubits[0]))
+    simulator = cirq.DensityMatrixSimulator(max_memory_bytes=10**6, seed=1)
+    np.testing.assert_allclose(
+        simulator.simulate(circuit).final_density_matrix,
+        cirq.DensityMatrixSimulator().simulate(circuit).final_density_matrix,
+        atol=1e-5,
+    )
+    mid_circuit = circuit + cirq.Circuit(
+        cirq.measure(qubits[0], key='a'),
+        cirq.X(qubits[1]).with_classical_controls('a'),
+        cirq.measure(*qubits, key='m'),
+    )
+    assert simulator.run(mid_circuit, repetitions=10) == cirq.DensityMatrixSimulator(seed=1).run(
+        mid_circuit, repetitions=10
+    )
+    assert len(simulator._prefix_cache) == 0
+
+
+def test_projected_memory_bytes():
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H.on_each(*qubits), cirq.measure(*qubits, key='m'))
+    mid_circuit = cirq.Circuit(cirq.measure(qubits[0], key='a'), cirq.H.on_each(*qubits))
+    simulator = cirq.DensityMatrixSimulator()
+    assert simulator.projected_memory_bytes(circuit) == 6 * 64 * 8
+    assert simulator.projected_memory_bytes(mid_circuit) == 8 * 64 * 8
+    simulator = cirq.DensityMatrixSimulator(dtype=np.complex128, max_memory_bytes=4096)
+    assert simulator.projected_memory_bytes(circuit) == 3 * 64 * 16
+    assert simulator.projected_memory_bytes(mid_circuit) == 5 * 64 * 16
+    _ = simulator.simulate(circuit)
+    with pytest.raises(ValueError, match='5120 bytes'):
+        _ = simulator.run(mid_circuit)
+    with mock.patch.object(cirq.sim.density_matrix_simulation_state, '_MAX_CHUNK_SIZE', 16):
+        assert simulator.projected_memory_bytes(mid_circuit) == (3 * 64 + 32) * 16
+    with pytest.raises(ValueError, match='max_memory_bytes'):
+        _ = cirq.DensityMatrixSimulator(max_memory_bytes=0)
+
+
+def test_projected_memory_bytes_counts_channel_buffers():
+    qubits = cirq.LineQubit.range(5)
+    wide_channel = (
+        cirq.MatrixGate(cirq.testing.random_unitary(32, random_state=1))
+        .on(*qubits)
+        .with_probability(0.5)
+    )
+    simulator = cirq.DensityMatrixSimulator(max_memory_bytes=2**30)
+    size = 4**5 * 8
+    for circuit in [
+        cirq.Circuit(cirq.H.on_each(*qubits), cirq.amplitude_damp(0.1).on_each(*qubits)),
+        cirq.Circuit(cirq.reset(qubits[0]), cirq.measure(*qubits, key='m')),
+    ]:
+        assert simulator.projected_memory_bytes(circuit) == size + 2 * size
+    # Channels on more than 4 qubits are applied with three more density matrices.
+    wide = cirq.Circuit(cirq.H.on_each(*qubits), wide_channel)
+    assert simulator.projected_memory_bytes(wide) == 4 * size + 2 * size
+    np.testing.assert_allclose(
+        simulator.simulate(wide).final_density_matrix,
+        cirq.DensityMatrixSimulator().simulate(wide).final_density_matrix,
+        atol=1e-5,
+    )
+    # So are channels added by the noise model.
+    noisy = cirq.DensityMatrixSimulator(
+        max_memory_bytes=2**30,
+        noise=cirq.ConstantQubitNoiseModel(cirq.asymmetric_depolarize(p_x=0.1)),
+    )
+    assert noisy.projected_memory_bytes(cirq.Circuit(cirq.H.on_each(*qubits))) == 3 * size
+
+    class WideNoise(cirq.NoiseModel):
+        def noisy_operation(self, operation):
+            return [operation, wide_channel]
+
+    noisy = cirq.DensityMatrixSimulator(max_memory_bytes=4 * size, noise=WideNoise())
+    with pytest.raises(ValueError, match='max_memory_bytes'):
+        _ = noisy.simulate(cirq.Circuit(cirq.H.on_each(*qubits)))
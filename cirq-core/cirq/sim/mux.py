@@ -26,12 +26,16 @@ import numpy as np
 from cirq import circuits, devices, ops, protocols, study, value
 from cirq._doc import document
 from cirq.sim import density_matrix_simulator, sparse_simulator
-from cirq.sim.clifford import clifford_simulator
+from cirq.sim.clifford import clifford_simulator, stabilizer_rank_simulator
 from cirq.transformers import measurement_transformers
 
 if TYPE_CHECKING:
     import cirq
 
+# The maximum number of non-Clifford operations in circuits that are sampled with the stabilizer
+# rank simulator, whose cost grows exponentially with this number.
+_MAX_NON_CLIFFORD_OPERATIONS = 20
+
 CIRCUIT_LIKE = circuits.Circuit | ops.Gate | ops.OP_TREE
 document(
     CIRCUIT_LIKE,
@@ -48,6 +52,28 @@ def _is_clifford_circuit(program: cirq.Circuit) -> bool:
     )
 
 
+def _is_near_clifford_circuit(program: cirq.Circuit) -> bool:
+    """Returns whether a circuit has few enough non-Clifford operations for its number of qubits.
+
+    The stabilizer rank simulator is preferred over the state vector simulator when its cost,
+    which is at least 2**k * n**2 for n qubits and k non-Clifford operations, is lower than the
+    cost 2**n of a state vector.
+    """
+    num_qubits = len(program.all_qubits())
+    num_non_clifford = 0
+    for op in program.all_operations():
+        if protocols.has_stabilizer_effect(op):
+            continue
+        num_non_clifford += 1
+        if (
+            num_non_clifford > _MAX_NON_CLIFFORD_OPERATIONS
+            or len(op.qubits) > 2
+            or not protocols.has_unitary(op)
+        ):
+            return False
+    return num_non_clifford + 2 * num_qubits.bit_length() < num_qubits
+
+
 def sample(
     program: cirq.Circuit,
     *,
@@ -82,6 +108,12 @@ def sample(
             return clifford_simulator.CliffordSimulator(seed=seed).run(
                 program, param_resolver=param_resolver, repetitions=repetitions
             )
+        if _is_near_clifford_circuit(program):
+            # If there are only a few non-Clifford operations on many qubits, use the stabilizer
+            # rank simulator.
+            return stabilizer_rank_simulator.StabilizerRankSimulator(seed=seed).run(
+                program, param_resolver=param_resolver, repetitions=repetitions
+            )
         if protocols.has_unitary(program):
             return sparse_simulator.Simulator(dtype=dtype, seed=seed).run(
                 program=program, param_resolver=param_resolver, repetitions=repetitions
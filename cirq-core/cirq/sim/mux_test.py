@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import collections
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -49,6 +50,29 @@ def test_sample():
     assert results.histogram(key=q) == collections.Counter({0: 1})
 
 
+def test_sample_near_clifford():
+    qubits = cirq.LineQubit.range(40)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(39)],
+        cirq.T(qubits[0]),
+        cirq.H(qubits[0]),
+        cirq.measure(*qubits, key='m'),
+    )
+    # A state vector simulation would not fit into memory.
+    results = cirq.sample(circuit, repetitions=100, seed=1)
+    assert np.all(results.measurements['m'][:, 1:] == results.measurements['m'][:, 1:2])
+
+    with mock.patch.object(cirq.StabilizerRankSimulator, 'run') as run:
+        # Too few qubits.
+        cirq.sample(cirq.Circuit(cirq.T.on_each(*qubits[:4]), cirq.measure(*qubits[:4])))
+        # Too many non-Clifford operations.
+        cirq.sample(cirq.Circuit([cirq.T(q) ** 0.5 for q in qubits[:30]], cirq.measure(*qubits)))
+        # Too many qubits for a non-Clifford operation.
+        cirq.sample(cirq.Circuit(cirq.CCZ(*qubits[:3]), cirq.measure(*qubits)))
+        run.assert_not_called()
+
+
 def test_sample_seed_unitary():
     q = cirq.NamedQubit('q')
     circuit = cirq.Circuit(cirq.X(q) ** 0.2, cirq.measure(q))
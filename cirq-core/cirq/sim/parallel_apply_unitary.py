@@ -0,0 +1,146 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Multi-threaded application of unitaries to large state vectors.
+
+A unitary acting on a few axes of a state vector acts independently on every
+slice of the state obtained by fixing the indices of some other axes. The
+slices are updated concurrently by a thread pool, running the same
+`cirq.apply_unitary` code as the serial path on each of them. NumPy releases
+the GIL inside its array kernels, so the threads run in parallel and the
+result is bit-identical to the serial result.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+from concurrent import futures
+from typing import Any, Sequence, TYPE_CHECKING
+
+from cirq import protocols
+
+if TYPE_CHECKING:
+    from types import NotImplementedType
+
+    import numpy as np
+
+# States with fewer amplitudes than this are not worth splitting across threads.
+MIN_PARALLEL_SIZE = 2**16
+
+# The number of slices per thread, which balances the load between threads.
+_SLICES_PER_THREAD = 4
+
+
+@functools.cache
+def _thread_pool(num_threads: int) -> futures.ThreadPoolExecutor:
+    return futures.ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix='cirq-sim')
+
+
+def _slice_indices(
+    qid_shape: Sequence[int], axes: Sequence[int], num_slices: int
+) -> tuple[list[int], list[tuple[int, ...]]]:
+    """Chooses the leading non-target axes to slice the state along.
+
+    Returns:
+        The sliced axes, and the indices of these axes for every slice. No
+        axes are sliced if there are not enough non-target axes to create at
+        least two slices.
+    """
+    sliced_axes: list[int] = []
+    size = 1
+    for axis, dim in enumerate(qid_shape):
+        if size >= num_slices:
+            break
+        if axis not in axes:
+            sliced_axes.append(axis)
+            size *= dim
+    if size < 2:
+        return [], []
+    return sliced_axes, list(itertools.product(*(range(qid_shape[a]) for a in sliced_axes)))
+
+
+def apply_unitary_in_parallel(
+    action: Any,
+    target_tensor: np.ndarray,
+    available_buffer: np.ndarray,
+    axes: Sequence[int],
+    num_threads: int,
+) -> np.ndarray | None | NotImplementedType:
+    """Applies the unitary effect of a value to a state vector using several threads.
+
+    Args:
+        action: The value with a unitary effect to apply.
+        target_tensor: The state vector, with one axis per qudit.
+        available_buffer: A workspace with the same shape and dtype as
+            `target_tensor`.
+        axes: The axes of the state vector that `action` acts on.
+        num_threads: The number of threads to use.
+
+    Returns:
+        `target_tensor` or `available_buffer`, whichever holds the result;
+        NotImplemented if `action` has no unitary effect that can be applied
+        without decomposition; or None if the state is too small or has too
+        few non-target axes to be split, in which case the caller should
+        apply the unitary serially.
+    """
+    if num_threads <= 1 or target_tensor.size < MIN_PARALLEL_SIZE:
+        return None
+    sliced_axes, slice_indices = _slice_indices(
+        target_tensor.shape, axes, num_threads * _SLICES_PER_THREAD
+    )
+    if not slice_indices:
+        return None
+    slice_axes = [a - sum(s < a for s in sliced_axes) for a in axes]
+
+    def index_of(slice_index: tuple[int, ...]) -> tuple[Any, ...]:
+        index: list[Any] = [slice(None)] * target_tensor.ndim
+        for axis, i in zip(sliced_axes, slice_index):
+            index[axis] = i
+        return tuple(index)
+
+    def apply_to_slice(slice_index: tuple[int, ...]) -> bool | NotImplementedType:
+        """Applies the unitary to a slice, returning whether the result is in the buffer.
+
+        `cirq.apply_unitary` always returns either the target or the buffer it was given.
+        """
+        index = index_of(slice_index)
+        target = target_tensor[index]
+        buffer = available_buffer[index]
+        result = protocols.apply_unitary(
+            action,
+            protocols.ApplyUnitaryArgs(
+                target_tensor=target, available_buffer=buffer, axes=slice_axes
+            ),
+            allow_decompose=False,
+            default=NotImplemented,
+        )
+        if result is NotImplemented:
+            return NotImplemented
+        return result is buffer
+
+    # The first slice determines whether the action has a unitary effect at all, before any
+    # other slice is modified.
+    first_in_buffer = apply_to_slice(slice_indices[0])
+    if first_in_buffer is NotImplemented:
+        return NotImplemented
+    in_buffer = [first_in_buffer, *_thread_pool(num_threads).map(apply_to_slice, slice_indices[1:])]
+    if not any(in_buffer):
+        return target_tensor
+    # Gates may leave some slices in place, for example slices they act trivially on.
+    for slice_index, is_in_buffer in zip(slice_indices, in_buffer):
+        if not is_in_buffer:
+            index = index_of(slice_index)
+            available_buffer[index] = target_tensor[index]
+    return available_buffer
@@ -0,0 +1,150 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.sim import parallel_apply_unitary
+
+
+class NewArrayGate(cirq.testing.SingleQubitGate):
+    def _apply_unitary_(self, args: cirq.ApplyUnitaryArgs) -> np.ndarray:
+        return args.target_tensor * 1j
+
+
+class SkipZeroSlicesGate(cirq.testing.SingleQubitGate):
+    """Applies X, leaving the target in place if it is zero."""
+
+    def _apply_unitary_(self, args: cirq.ApplyUnitaryArgs) -> np.ndarray:
+        if not np.any(args.target_tensor):
+            return args.target_tensor
+        return cirq.apply_unitary(cirq.X, args)
+
+
+class BufferViewGate(cirq.testing.TwoQubitGate):
+    """Swaps two qubits by returning a transposed view of the buffer."""
+
+    def _apply_unitary_(self, args: cirq.ApplyUnitaryArgs) -> np.ndarray:
+        args.available_buffer[...] = args.target_tensor
+        perm = list(range(args.target_tensor.ndim))
+        a, b = args.axes
+        perm[a], perm[b] = perm[b], perm[a]
+        return args.available_buffer.transpose(perm)
+
+
+def _random_state(qid_shape, dtype, seed):
+    state = cirq.testing.random_superposition(int(np.prod(qid_shape)), random_state=seed)
+    return state.astype(dtype).reshape(qid_shape)
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+@pytest.mark.parametrize(
+    'gate, axes',
+    [
+        (cirq.H, [0]),
+        (cirq.X, [3]),
+        (cirq.Y**0.2, [7]),
+        (cirq.Z**0.1, [2]),
+        (cirq.T, [5]),
+        (cirq.PhasedXZGate(x_exponent=0.3, z_exponent=0.2, axis_phase_exponent=0.1), [1]),
+        (cirq.CZ, [0, 1]),
+        (cirq.CNOT, [6, 2]),
+        (cirq.CZ**0.3, [4, 7]),
+        (cirq.ISWAP**0.5, [0, 5]),
+        (cirq.FSimGate(theta=0.2, phi=0.3), [3, 1]),
+        (cirq.MatrixGate(cirq.testing.random_unitary(4, random_state=1)), [7, 0]),
+        (cirq.MatrixGate(cirq.testing.random_unitary(8, random_state=2)), [2, 4, 6]),
+        (cirq.CCX, [0, 1, 2]),
+        (NewArrayGate(), [4]),
+        (BufferViewGate(), [1, 6]),
+    ],
+)
+def test_bit_identical_to_serial(gate, axes, dtype: type[np.complexfloating]):
+    state = _random_state((2,) * 8, dtype, seed=3)
+    expected = cirq.apply_unitary(
+        gate, cirq.ApplyUnitaryArgs(state.copy(), np.empty_like(state), axes), allow_decompose=False
+    )
+    target = state.copy()
+    buffer = np.empty_like(state)
+    with mock.patch.object(parallel_apply_unitary, 'MIN_PARALLEL_SIZE', 16):
+        result = parallel_apply_unitary.apply_unitary_in_parallel(gate, target, buffer, axes, 3)
+    assert result is target or result is buffer
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_slices_left_in_place():
+    state = np.zeros((2,) * 8, dtype=np.complex64)
+    state[1, 0, 1] = 1
+    buffer = np.empty_like(state)
+    with mock.patch.object(parallel_apply_unitary, 'MIN_PARALLEL_SIZE', 16):
+        result = parallel_apply_unitary.apply_unitary_in_parallel(
+            SkipZeroSlicesGate(), state.copy(), buffer, [7], 4
+        )
+    expected = cirq.apply_unitary(cirq.X, cirq.ApplyUnitaryArgs(state, np.empty_like(state), [7]))
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_qudits():
+    gate = cirq.MatrixGate(cirq.testing.random_unitary(3, random_state=1), qid_shape=(3,))
+    state = _random_state((3, 2, 3, 2, 3), np.complex128, seed=4)
+    expected = cirq.apply_unitary(gate, cirq.ApplyUnitaryArgs(state.copy(), state.copy(), [2]))
+    with mock.patch.object(parallel_apply_unitary, 'MIN_PARALLEL_SIZE', 16):
+        result = parallel_apply_unitary.apply_unitary_in_parallel(
+            gate, state, np.empty_like(state), [2], 8
+        )
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_not_parallelized():
+    state = np.zeros((2,) * 8, dtype=np.complex64)
+    buffer = np.empty_like(state)
+    assert parallel_apply_unitary.apply_unitary_in_parallel(cirq.H, state, buffer, [0], 1) is None
+    assert parallel_apply_unitary.apply_unitary_in_parallel(cirq.H, state, buffer, [0], 4) is None
+    with mock.patch.object(parallel_apply_unitary, 'MIN_PARALLEL_SIZE', 2):
+        assert (
+            parallel_apply_unitary.apply_unitary_in_parallel(
+                cirq.X, state[(0,) * 7], buffer[(0,) * 7], [0], 4
+            )
+            is None
+        )
+        result = parallel_apply_unitary.apply_unitary_in_parallel(
+            cirq.measure(cirq.LineQubit(0)), state, buffer, [0], 4
+        )
+    assert result is NotImplemented
+
+
+def test_simulator_num_threads_is_bit_identical():
+    circuit = cirq.testing.random_circuit(
+        qubits=10, n_moments=20, op_density=0.9, random_state=5
+    ) + cirq.Circuit(cirq.amplitude_damp(0.3).on(cirq.LineQubit(0)))
+    with mock.patch.object(parallel_apply_unitary, 'MIN_PARALLEL_SIZE', 16):
+        actual = cirq.Simulator(num_threads=4, seed=1).simulate(circuit)
+        samples = cirq.Simulator(num_threads=4, seed=1).run(
+            circuit + cirq.measure(*sorted(circuit.all_qubits())), repetitions=10
+        )
+    expected = cirq.Simulator(seed=1).simulate(circuit)
+    np.testing.assert_array_equal(actual.final_state_vector, expected.final_state_vector)
+    assert samples == cirq.Simulator(seed=1).run(
+        circuit + cirq.measure(*sorted(circuit.all_qubits())), repetitions=10
+    )
+
+
+def test_simulator_num_threads_must_be_positive():
+    with pytest.raises(ValueError, match='num_threads'):
+        _ = cirq.Simulator(num_threads=0)
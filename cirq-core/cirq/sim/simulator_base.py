@@ -18,8 +18,10 @@ from __future__ import annotations
 
 import abc
 import collections
+import contextlib
 from typing import Any, cast, Generic, Iterator, Sequence, TYPE_CHECKING, TypeVar
 
+import duet
 import numpy as np
 
 from cirq import devices, ops, protocols, study, value
@@ -38,10 +40,82 @@ from cirq.sim.simulator import (
 
 if TYPE_CHECKING:
     import cirq
+    from cirq.sim.sweep_plan import SweepPlan
 
 TStepResultBase = TypeVar('TStepResultBase', bound='StepResultBase')
 
 
+class _PrefixStateCache:
+    """A least-recently-used cache of the simulation states after circuit prefixes.
+
+    States are keyed by the qubits they represent and by the moments of the
+    prefix that evolved them from the all zeros state.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._states: collections.OrderedDict[
+            tuple[tuple[cirq.Qid, ...], tuple[cirq.Moment, ...]], SimulationStateBase
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def lookup(
+        self, qubits: tuple[cirq.Qid, ...], moments: tuple[cirq.Moment, ...]
+    ) -> tuple[SimulationStateBase | None, int, int]:
+        """Finds the cached state after the longest cached prefix of the moments.
+
+        Args:
+            qubits: The qubits of the state.
+            moments: The moments of the prefix to simulate.
+
+        Returns:
+            A copy of the cached state after the first `num_cached` moments,
+            or None if no prefix of the moments is cached; `num_cached`; and
+            the length of the longest leading run of moments shared with a
+            cached prefix. The latter can be larger than `num_cached` when
+            circuits share a state preparation but differ afterwards.
+        """
+        best_key = None
+        num_cached = 0
+        num_shared = 0
+        for key in self._states:
+            if key[0] != qubits:
+                continue
+            cached_moments = key[1]
+            common = 0
+            for a, b in zip(cached_moments, moments):
+                if a is not b and a != b:
+                    break
+                common += 1
+            if common == len(cached_moments) and common > num_cached:
+                best_key, num_cached = key, common
+            num_shared = max(num_shared, common)
+        if best_key is None:
+            return None, 0, num_shared
+        self._states.move_to_end(best_key)
+        return self._states[best_key].copy(), num_cached, num_shared
+
+    def clear(self) -> None:
+        self._states.clear()
+
+    def put(
+        self,
+        qubits: tuple[cirq.Qid, ...],
+        moments: tuple[cirq.Moment, ...],
+        sim_state: SimulationStateBase,
+    ) -> None:
+        """Caches a copy of the state, evicting the least recently used state if full."""
+        if self._max_size <= 0:
+            return
+        key = (qubits, moments)
+        self._states[key] = sim_state.copy()
+        self._states.move_to_end(key)
+        while len(self._states) > self._max_size:
+            self._states.popitem(last=False)
+
+
 class SimulatorBase(
     Generic[TStepResultBase, TSimulationTrialResult, TSimulationState],
     SimulatesIntermediateState[
@@ -68,8 +142,17 @@ class SimulatorBase(
     result when possible. If not possible, due to noise or classical
     probabilities on a state vector, the implementation attempts to fully
     iterate the unitary prefix once, then only repeat the non-unitary
-    suffix from copies of the state obtained by the prefix. If more advanced
-    functionality is required, then the `_run` method can be overridden.
+    suffix from copies of the state obtained by the prefix. Simulators that
+    can evolve all repetitions of the suffix at once may override
+    `_run_batched_trajectories` to skip this per-repetition loop. If more
+    advanced functionality is required, then the `_run` method can be
+    overridden.
+
+    In noiseless simulations, `run_sweep` over several sweep points and
+    `run_batch` cache the state obtained by the unparameterized part of the
+    prefix, so that sweep points and batched circuits that share a prefix
+    only simulate it once. The cache holds the most recently used
+    `_prefix_cache_size` states and is cleared when the call returns.
 
     Note that state here refers to simulator state, which is not necessarily
     a state vector. The included simulators and corresponding states are state
@@ -77,6 +160,9 @@ class SimulatorBase(
     `_core_iterator` and `_run` methods.
     """
 
+    # The maximum number of prefix states cached during a sweep or batch.
+    _prefix_cache_size: int = 4
+
     def __init__(
         self,
         *,
@@ -99,11 +185,36 @@ class SimulatorBase(
         self._prng = value.parse_random_state(seed)
         self._noise = devices.NoiseModel.from_noise_model_like(noise)
         self._split_untangled_states = split_untangled_states
+        self._prefix_cache = _PrefixStateCache(self._prefix_cache_size)
+        self._prefix_cache_depth = 0
 
     @property
     def noise(self) -> cirq.NoiseModel:
         return self._noise
 
+    @contextlib.contextmanager
+    def _caching_prefixes(self) -> Iterator[None]:
+        """Caches prefix states until the outermost such context exits."""
+        self._prefix_cache_depth += 1
+        try:
+            yield
+        finally:
+            self._prefix_cache_depth -= 1
+            if not self._prefix_cache_depth:
+                self._prefix_cache.clear()
+
+    def _prepare_circuit(self, circuit: cirq.AbstractCircuit) -> cirq.AbstractCircuit:
+        """Returns the circuit to simulate in place of the given circuit.
+
+        Called by `run_sweep_iter` and `simulate_sweep_iter` before simulating
+        the circuit. The default implementation returns the circuit unchanged.
+        Simulators can override this method to return an equivalent circuit
+        that is faster to simulate, e.g. with fused gates cached on the
+        `cirq.FrozenCircuit`, or to check that the circuit can be simulated
+        before the simulation starts.
+        """
+        return circuit
+
     @abc.abstractmethod
     def _create_partial_simulation_state(
         self,
@@ -217,10 +328,11 @@ class SimulatorBase(
     ) -> dict[str, np.ndarray]:
         """See definition in `cirq.SimulatesSamples`."""
         param_resolver = param_resolver or study.ParamResolver({})
-        resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
+        qubits = tuple(sorted(circuit.all_qubits()))
+        static_prefix, rest = self._split_static_run_prefix(circuit)
+        sim_state = self._simulate_static_run_prefix(static_prefix, qubits)
+        resolved_circuit = protocols.resolve_parameters(rest, param_resolver)
         check_all_resolved(resolved_circuit)
-        qubits = tuple(sorted(resolved_circuit.all_qubits()))
-        sim_state = self._create_simulation_state(0, qubits)
 
         prefix, general_suffix = (
             split_into_matching_protocol_then_general(resolved_circuit, self._can_be_in_run_prefix)
@@ -228,8 +340,12 @@ class SimulatorBase(
             else (resolved_circuit[0:0], resolved_circuit)
         )
         step_result: TStepResultBase | None = None
-        for step_result in self._core_iterator(circuit=prefix, sim_state=sim_state):
-            pass
+        if static_prefix and not prefix:
+            # The whole prefix was simulated by `_simulate_static_run_prefix`.
+            step_result = self._create_step_result(sim_state)
+        else:
+            for step_result in self._core_iterator(circuit=prefix, sim_state=sim_state):
+                pass
         assert step_result is not None
 
         general_ops = list(general_suffix.all_operations())
@@ -244,6 +360,10 @@ class SimulatorBase(
                 measurement_ops, repetitions, seed=self._prng, _allow_repeated=True
             )
 
+        batched_records = self._run_batched_trajectories(general_suffix, sim_state, repetitions)
+        if batched_records is not None:
+            return batched_records
+
         records: dict[cirq.MeasurementKey, list[Sequence[Sequence[int]]]] = {}
         for i in range(repetitions):
             for step_result in self._core_iterator(
@@ -271,6 +391,206 @@ class SimulatorBase(
 
         return {str(k): pad_evenly(v) for k, v in records.items()}
 
+    def _split_static_run_prefix(
+        self, circuit: cirq.AbstractCircuit
+    ) -> tuple[cirq.AbstractCircuit, cirq.AbstractCircuit]:
+        """Splits off the unparameterized part of the `_run` prefix of a circuit.
+
+        The state obtained by this part does not depend on the sweep point,
+        and can be cached by `_simulate_static_run_prefix`. The part is empty
+        for noisy simulations, since noise models may act on the moments of
+        the whole prefix.
+
+        Args:
+            circuit: The unresolved circuit.
+
+        Returns:
+            The static prefix and the rest of the circuit.
+        """
+        if self.noise is not devices.NO_NOISE:
+            return circuit[0:0], circuit
+
+        def static_prefixable(op: cirq.Operation):
+            return not protocols.is_parameterized(op) and self._can_be_in_run_prefix(op)
+
+        return split_into_matching_protocol_then_general(circuit, static_prefixable)
+
+    def _simulate_static_run_prefix(
+        self, prefix: cirq.AbstractCircuit, qubits: tuple[cirq.Qid, ...]
+    ) -> SimulationStateBase[TSimulationState]:
+        """Returns a new state evolved by a static prefix, reusing cached states.
+
+        States are only cached within `_caching_prefixes`.
+
+        Args:
+            prefix: A prefix returned by `_split_static_run_prefix`.
+            qubits: The qubits of the state, in order.
+
+        Returns:
+            A state that the caller owns, initialized to zero and evolved by
+            the prefix.
+        """
+        moments = tuple(prefix.moments)
+        cached_state, start, num_shared = self._prefix_cache.lookup(qubits, moments)
+        sim_state = (
+            self._create_simulation_state(0, qubits) if cached_state is None else cached_state
+        )
+        # When the prefix branches off a cached one, the shared moments are most likely a
+        # common state preparation, so the state at the branch point is cached as well.
+        for end in (num_shared, len(moments)):
+            if end > start:
+                for _ in self._core_iterator(circuit=prefix[start:end], sim_state=sim_state):
+                    pass
+                if self._prefix_cache_depth:
+                    self._prefix_cache.put(qubits, moments[:end], sim_state)
+                start = end
+        return sim_state
+
+    def _run_batched_trajectories(
+        self,
+        circuit: cirq.AbstractCircuit,
+        sim_state: SimulationStateBase[TSimulationState],
+        repetitions: int,
+    ) -> dict[str, np.ndarray] | None:
+        """Samples all repetitions of a non-terminal-measurement circuit at once.
+
+        `_run` calls this before falling back to simulating each repetition
+        separately. Simulators whose state can be stacked along a batch axis
+        can override this to evolve all repetitions together.
+
+        Args:
+            circuit: The general suffix of the circuit to sample.
+            sim_state: The state obtained by simulating the prefix of the
+                circuit. This must not be modified.
+            repetitions: The number of repetitions to sample.
+
+        Returns:
+            The measurement records in the format returned by `_run`, or None
+            if the circuit cannot be simulated in a batch.
+        """
+        return None
+
+    def _compile_sweep_plan(
+        self,
+        circuit: cirq.AbstractCircuit,
+        qubits: Sequence[cirq.Qid],
+        *,
+        skip_terminal_measurements: bool = False,
+    ) -> SweepPlan | None:
+        """Compiles a circuit once for simulation at many sweep points.
+
+        `simulate_sweep_iter` and `run_sweep_iter` use the returned plan, if
+        any, instead of resolving the parameters of the whole circuit and
+        dispatching every operation at each sweep point. Simulators whose
+        states support `cirq.sim.sweep_plan.SweepPlan` can override this.
+
+        Args:
+            circuit: The unresolved circuit to compile.
+            qubits: The qubits of the simulated state, in order.
+            skip_terminal_measurements: Whether terminal measurements should
+                be collected for sampling rather than applied to the state.
+
+        Returns:
+            The compiled plan, or None if sweep points should be simulated
+            separately.
+        """
+        return None
+
+    def _can_merge_for_sweep_plan(
+        self,
+        circuit: cirq.AbstractCircuit,
+        qubits: Sequence[cirq.Qid],
+        *,
+        ignore_measurements: bool = False,
+    ) -> bool:
+        """Whether a sweep plan, which evolves one merged state, is worth compiling.
+
+        If untangled states are split and the circuit leaves some qubits
+        unentangled, simulating the separate states point by point is cheaper.
+        """
+        return not self._split_untangled_states or _connects_all_qubits(
+            circuit, qubits, ignore_measurements
+        )
+
+    def run_sweep_iter(
+        self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int = 1
+    ) -> Iterator[cirq.Result]:
+        """Runs the supplied Circuit, mimicking quantum hardware.
+
+        This particular implementation overrides the base implementation such
+        that a circuit with only terminal measurements is compiled once with
+        `_compile_sweep_plan`. Each sweep point starts from a copy of the
+        cached state after the unparameterized prefix and only resolves the
+        parameterized operations before sampling.
+
+        Args:
+            program: The circuit to simulate.
+            params: Parameters to run with the program.
+            repetitions: The number of repetitions to simulate.
+
+        Returns:
+            Result list for this run; one for each possible parameter
+            resolver.
+
+        Raises:
+            ValueError: If the circuit has no measurements.
+        """
+        program = self._prepare_circuit(program)
+        resolvers = list(study.to_resolvers(params))
+        if len(resolvers) > 1:
+            with self._caching_prefixes():
+                yield from self._run_sweep_iter(program, resolvers, repetitions)
+        else:
+            yield from self._run_sweep_iter(program, resolvers, repetitions)
+
+    def _run_sweep_iter(
+        self, program: cirq.AbstractCircuit, resolvers: list[cirq.ParamResolver], repetitions: int
+    ) -> Iterator[cirq.Result]:
+        qubits = tuple(sorted(program.all_qubits()))
+        static_prefix, suffix = self._split_static_run_prefix(program)
+        plan = (
+            self._compile_sweep_plan(suffix, qubits, skip_terminal_measurements=True)
+            if len(resolvers) > 1
+            and repetitions > 0
+            and program.has_measurements()
+            and program.are_all_measurements_terminal()
+            and self._can_be_in_run_prefix(self.noise)
+            and self._can_merge_for_sweep_plan(program, qubits, ignore_measurements=True)
+            else None
+        )
+        if plan is None:
+            yield from super().run_sweep_iter(program, resolvers, repetitions)
+            return
+
+        for param_resolver in resolvers:
+            sim_state = self._simulate_static_run_prefix(
+                static_prefix, qubits
+            ).create_merged_state()
+            if plan.simulate(sim_state, param_resolver, can_apply=self._can_be_in_run_prefix):
+                step_result = self._create_step_result(sim_state)
+                records = step_result.sample_measurement_ops(
+                    plan.measurement_ops, repetitions, seed=self._prng, _allow_repeated=True
+                )
+            else:
+                records = self._run(program, param_resolver, repetitions)
+            yield study.ResultDict(params=param_resolver, records=records)
+
+    async def run_batch_async(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable] | None = None,
+        repetitions: int | Sequence[int] = 1,
+    ) -> Sequence[Sequence[cirq.Result]]:
+        """Runs the supplied circuits, reusing the states of shared prefixes.
+
+        See `cirq.Sampler.run_batch_async`. Circuits of the batch that share
+        an unparameterized prefix only simulate it once.
+        """
+        with self._caching_prefixes():
+            return await super().run_batch_async(programs, params_list, repetitions)
+
+    run_batch = duet.sync(run_batch_async)
+
     def simulate_sweep_iter(
         self,
         program: cirq.AbstractCircuit,
@@ -282,7 +602,9 @@ class SimulatorBase(
 
         This particular implementation overrides the base implementation such
         that an unparameterized prefix circuit is simulated and fed into the
-        parameterized suffix circuit.
+        parameterized suffix circuit. When sweeping over several points, the
+        suffix is compiled once with `_compile_sweep_plan` if the simulator
+        supports it.
 
         Args:
             program: The circuit to simulate.
@@ -303,6 +625,7 @@ class SimulatorBase(
         def sweep_prefixable(op: cirq.Operation):
             return self._can_be_in_run_prefix(op) and not protocols.is_parameterized(op)
 
+        program = self._prepare_circuit(program)
         qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(program.all_qubits())
         initial_state = 0 if initial_state is None else initial_state
         sim_state = self._create_simulation_state(initial_state, qubits)
@@ -316,7 +639,28 @@ class SimulatorBase(
             pass
         assert step_result is not None
         sim_state = step_result._sim_state
-        yield from super().simulate_sweep_iter(suffix, params, qubit_order, sim_state)
+        resolvers = list(study.to_resolvers(params))
+        plan = (
+            self._compile_sweep_plan(suffix, sim_state.qubits)
+            if len(resolvers) > 1 and self._can_merge_for_sweep_plan(program, sim_state.qubits)
+            else None
+        )
+        if plan is None:
+            yield from super().simulate_sweep_iter(suffix, resolvers, qubit_order, sim_state)
+            return
+
+        merged_state = sim_state.create_merged_state()
+        for i, param_resolver in enumerate(resolvers):
+            state = merged_state.copy() if i < len(resolvers) - 1 else merged_state
+            plan.simulate(state, param_resolver)
+            step_result = self._create_step_result(state)
+            yield self._create_simulator_trial_result(
+                params=param_resolver,
+                measurements={
+                    k: np.array(v, dtype=np.uint8) for k, v in step_result.measurements.items()
+                },
+                final_simulator_state=step_result._simulator_state(),
+            )
 
     def _create_simulation_state(
         self, initial_state: Any, qubits: Sequence[cirq.Qid]
@@ -351,6 +695,30 @@ class SimulatorBase(
             )
 
 
+def _connects_all_qubits(
+    circuit: cirq.AbstractCircuit, qubits: Sequence[cirq.Qid], ignore_measurements: bool
+) -> bool:
+    """Whether the multi-qubit operations of a circuit connect all the given qubits."""
+    parents = {q: q for q in qubits}
+
+    def find(q: cirq.Qid) -> cirq.Qid:
+        while parents[q] != q:
+            parents[q] = parents[parents[q]]
+            q = parents[q]
+        return q
+
+    num_components = len(parents)
+    for op in circuit.all_operations():
+        if ignore_measurements and protocols.is_measurement(op):
+            continue
+        roots = {find(q) for q in op.qubits}
+        root = roots.pop() if roots else None
+        for other in roots:
+            parents[other] = root
+            num_components -= 1
+    return num_components <= 1
+
+
 class StepResultBase(
     Generic[TSimulationState], StepResult[SimulationStateBase[TSimulationState]], abc.ABC
 ):
@@ -425,6 +425,134 @@ def test_sweep_unparameterized_prefix_not_repeated_iff_unitary():
     assert op2.count == 2
 
 
+class CountingUnitaryOp(cirq.Operation):
+    def __init__(self, q: cirq.Qid):
+        self.count = 0
+        self.q = q
+
+    def _act_on_(self, sim_state):
+        self.count += 1
+        return True
+
+    def with_qubits(self, qubits):
+        pass
+
+    @property
+    def qubits(self):
+        return (self.q,)
+
+    def _has_unitary_(self):
+        return True
+
+
+def test_run_sweep_unparameterized_prefix_cached():
+    q = cirq.LineQubit(0)
+    simulator = CountingSimulator()
+    params = [cirq.ParamResolver({'a': 0}), cirq.ParamResolver({'a': 1})]
+    op1 = CountingUnitaryOp(q)
+    op2 = CountingUnitaryOp(q)
+    circuit = cirq.Circuit(op1, cirq.XPowGate(exponent=sympy.Symbol('a'))(q), op2, cirq.measure(q))
+    rs = simulator.run_sweep(circuit, params, repetitions=3)
+    assert [r.repetitions for r in rs] == [3, 3]
+    assert op1.count == 1
+    assert op2.count == 2
+    # The cache only lives for the duration of the sweep.
+    assert len(simulator._prefix_cache) == 0
+
+
+def test_run_batch_shared_prefix_cached():
+    q0, q1 = cirq.LineQubit.range(2)
+    simulator = CountingSimulator()
+    op = CountingUnitaryOp(q0)
+    circuits = [
+        cirq.Circuit(op, cirq.X(q0) ** sympy.Symbol('a'), cirq.measure(q0)),
+        cirq.Circuit(op, cirq.measure(q0)),
+        cirq.Circuit(op, cirq.X(q1), cirq.measure(q0)),
+    ]
+    rs = simulator.run_batch(circuits, [{'a': 0}, None, None], repetitions=2)
+    assert len(rs) == 3
+    # The first two circuits share their prefix, the third acts on more qubits.
+    assert op.count == 2
+    assert len(simulator._prefix_cache) == 0
+    _ = simulator.run_batch(circuits, [{'a': 0}, None, None], repetitions=2)
+    assert op.count == 4
+
+
+def test_run_does_not_cache_prefix():
+    q = cirq.LineQubit(0)
+    simulator = CountingSimulator()
+    op = CountingUnitaryOp(q)
+    circuit = cirq.Circuit(op, cirq.measure(q))
+    _ = simulator.run(circuit)
+    _ = simulator.run(circuit)
+    _ = simulator.run_sweep(circuit, [{'a': 0}])
+    assert op.count == 3
+    assert len(simulator._prefix_cache) == 0
+
+
+def test_prefix_cache_reuses_shared_state_preparation():
+    q = cirq.LineQubit(0)
+    simulator = CountingSimulator()
+    prep = CountingUnitaryOp(q)
+    tails = [CountingUnitaryOp(q) for _ in range(4)]
+    _ = simulator.run_batch([cirq.Circuit(prep, tail, cirq.measure(q)) for tail in tails])
+    # The state after `prep` is cached when the second circuit branches off the first.
+    assert prep.count == 2
+    assert [tail.count for tail in tails] == [1, 1, 1, 1]
+
+
+def test_prefix_cache_evicts_least_recently_used():
+    class SmallCacheSimulator(CountingSimulator):
+        _prefix_cache_size = 2
+
+    q = cirq.LineQubit(0)
+    simulator = SmallCacheSimulator()
+    ops = [CountingUnitaryOp(q) for _ in range(3)]
+    circuits = [cirq.Circuit(op, cirq.measure(q)) for op in ops]
+    with simulator._caching_prefixes():
+        for i in [0, 1, 0, 2, 0, 1]:
+            _ = simulator.run(circuits[i])
+        assert len(simulator._prefix_cache) == 2
+    assert [op.count for op in ops] == [1, 2, 1]
+    assert len(simulator._prefix_cache) == 0
+
+
+def test_prefix_cache_disabled():
+    class NoCacheSimulator(CountingSimulator):
+        _prefix_cache_size = 0
+
+    q = cirq.LineQubit(0)
+    params = [cirq.ParamResolver({'a': 0}), cirq.ParamResolver({'a': 1})]
+    for simulator in [NoCacheSimulator(), CountingSimulator(noise=cirq.X)]:
+        op = CountingUnitaryOp(q)
+        circuit = cirq.Circuit(op, cirq.X(q) ** sympy.Symbol('a'), cirq.measure(q))
+        _ = simulator.run_sweep(circuit, params)
+        assert op.count == 2
+        assert len(simulator._prefix_cache) == 0
+
+
+@pytest.mark.parametrize('split', [True, False])
+def test_run_sweep_from_cached_prefix_matches_point_by_point(split: bool):
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.CNOT(q0, q1),
+        cirq.ry(sympy.Symbol('t')).on(q1),
+        cirq.CNOT(q1, q2),
+        cirq.measure(q0, key='m0'),
+        cirq.X(q2).with_classical_controls('m0'),
+        cirq.measure(q0, q1, q2, key='m'),
+    )
+    sweep = cirq.Linspace('t', 0, 1, 4)
+    results = cirq.Simulator(seed=1, split_untangled_states=split).run_sweep(
+        circuit, sweep, repetitions=20
+    )
+    simulator = cirq.Simulator(seed=1, split_untangled_states=split)
+    simulator._prefix_cache = cirq.sim.simulator_base._PrefixStateCache(0)
+    expected = [simulator.run(circuit, resolver, repetitions=20) for resolver in sweep]
+    assert results == expected
+
+
 def test_inhomogeneous_measurement_count_padding():
     q = cirq.LineQubit(0)
     key = cirq.MeasurementKey('m')
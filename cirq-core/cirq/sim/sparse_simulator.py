@@ -20,8 +20,15 @@ from typing import Any, Iterator, Sequence, TYPE_CHECKING
 
 import numpy as np
 
-from cirq import ops
-from cirq.sim import simulator, state_vector, state_vector_simulation_state, state_vector_simulator
+from cirq import devices, ops
+from cirq.sim import (
+    batched_trajectories,
+    simulator,
+    state_vector,
+    state_vector_simulation_state,
+    state_vector_simulator,
+    sweep_plan,
+)
 
 if TYPE_CHECKING:
     import cirq
@@ -131,6 +138,9 @@ class Simulator(
         noise: cirq.NOISE_MODEL_LIKE = None,
         seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
         split_untangled_states: bool = True,
+        num_threads: int = 1,
+        fuse_max_qubits: int | None = None,
+        fuse_diagonal_max_qubits: int | None = None,
     ):
         """A sparse matrix simulator.
 
@@ -142,15 +152,55 @@ class Simulator(
             split_untangled_states: If True, optimizes simulation by running
                 unentangled qubit sets independently and merging those states
                 at the end.
+            num_threads: The number of threads used to apply unitaries to
+                large state vectors. Each thread updates a separate slice of
+                the state vector, so results are identical to the
+                single-threaded simulation.
+            fuse_max_qubits: If set, circuits are simulated and run after
+                merging connected components of unitary operations acting on
+                at most this many qubits into a single `cirq.MatrixGate`, so
+                that each component is applied in one pass over the state
+                vector. The fused circuit is cached on the `cirq.FrozenCircuit`.
+                `simulate_moment_steps` always steps through the original
+                moments, and gates are not fused in noisy simulations, as the
+                noise model acts on the moments of the original circuit.
+            fuse_diagonal_max_qubits: If set, diagonal gates such as `cirq.CZ`
+                and `cirq.ZZ` that are not separated by other operations on
+                their qubits are fused into a single `cirq.DiagonalGate` on at
+                most this many qubits before fusing with `fuse_max_qubits`, so
+                that the state vector is multiplied by their phases in one
+                pass. Like `fuse_max_qubits`, this is not applied in noisy
+                simulations or when stepping through moments.
 
         Raises:
-            ValueError: If the given dtype is not complex.
+            ValueError: If the given dtype is not complex, or if `num_threads`,
+                `fuse_max_qubits` or `fuse_diagonal_max_qubits` is not positive.
         """
         if np.dtype(dtype).kind != 'c':
             raise ValueError(f'dtype must be a complex type but was {dtype}')
+        if num_threads < 1:
+            raise ValueError(f'num_threads must be positive but was {num_threads}')
+        if fuse_max_qubits is not None and fuse_max_qubits < 1:
+            raise ValueError(f'fuse_max_qubits must be positive but was {fuse_max_qubits}')
+        if fuse_diagonal_max_qubits is not None and fuse_diagonal_max_qubits < 1:
+            raise ValueError(
+                f'fuse_diagonal_max_qubits must be positive but was {fuse_diagonal_max_qubits}'
+            )
         super().__init__(
             dtype=dtype, noise=noise, seed=seed, split_untangled_states=split_untangled_states
         )
+        self._num_threads = num_threads
+        self._fuse_max_qubits = fuse_max_qubits
+        self._fuse_diagonal_max_qubits = fuse_diagonal_max_qubits
+
+    def _prepare_circuit(self, circuit: cirq.AbstractCircuit) -> cirq.AbstractCircuit:
+        if self.noise is not devices.NO_NOISE:
+            return circuit
+        if self._fuse_diagonal_max_qubits is not None:
+            circuit = circuit.freeze()._fuse_diagonal_unitaries(self._fuse_diagonal_max_qubits)
+        if self._fuse_max_qubits is not None:
+            circuit = circuit.freeze()._fuse_unitaries(self._fuse_max_qubits)
+        return circuit
 
     def _create_partial_simulation_state(
         self,
@@ -182,6 +232,7 @@ class Simulator(
             classical_data=classical_data,
             initial_state=initial_state,
             dtype=self._dtype,
+            num_threads=self._num_threads,
         )
 
     def _create_step_result(
@@ -189,6 +240,44 @@ class Simulator(
     ):
         return SparseSimulatorStep(sim_state=sim_state, dtype=self._dtype)
 
+    def _compile_sweep_plan(
+        self,
+        circuit: cirq.AbstractCircuit,
+        qubits: Sequence[cirq.Qid],
+        *,
+        skip_terminal_measurements: bool = False,
+    ) -> sweep_plan.SweepPlan | None:
+        return sweep_plan.SweepPlan.compile(
+            circuit,
+            qubits,
+            self.noise,
+            self._dtype,
+            skip_terminal_measurements=skip_terminal_measurements,
+        )
+
+    def _run_batched_trajectories(
+        self,
+        circuit: cirq.AbstractCircuit,
+        sim_state: cirq.SimulationStateBase[cirq.StateVectorSimulationState],
+        repetitions: int,
+    ) -> dict[str, np.ndarray] | None:
+        """Samples mid-circuit measurements for all repetitions at once.
+
+        Circuits made of unitaries, measurements, resets and classically
+        controlled unitaries are simulated on a stack of state vectors, one per
+        repetition, giving the same records as the per-repetition loop for a
+        fixed seed.
+        """
+        if repetitions == 0:
+            return None
+        trajectory_ops = batched_trajectories.compile_trajectory_ops(circuit, self.noise)
+        if trajectory_ops is None:
+            return None
+        merged_state = sim_state.create_merged_state()
+        return batched_trajectories.simulate_trajectories(
+            trajectory_ops, merged_state.target_tensor, sim_state.qubits, repetitions, self._prng
+        )
+
     def simulate_expectation_values_sweep_iter(
         self,
         program: cirq.AbstractCircuit,
@@ -157,8 +157,8 @@ def test_run_invert_mask_measure_not_terminal(dtype: type[np.complexfloating], s
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'m': [[1 - b0, b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # The repetitions are simulated as one batch after the unitary prefix.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -178,8 +178,8 @@ def test_run_partial_invert_mask_measure_not_terminal(dtype: type[np.complexfloa
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'m': [[1 - b0, b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # The repetitions are simulated as one batch after the unitary prefix.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -227,8 +227,8 @@ def test_run_repetitions_measurement_not_terminal(dtype: type[np.complexfloating
                     result.measurements, {'q(0)': [[b0]] * 3, 'q(1)': [[b1]] * 3}
                 )
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # The repetitions are simulated as one batch after the unitary prefix.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -1459,3 +1459,68 @@ def test_measurement_preserves_phase(split: bool):
     for _ in range(20):
         result = simulator.simulate(circuit, initial_state=(1, 1, 1), qubit_order=(c1, c2, t))
         assert result.dirac_notation() == '|110⟩'
+
+
+@pytest.mark.parametrize('fuse_max_qubits', [1, 2, 3])
+def test_fuse_gates(fuse_max_qubits: int):
+    circuit = cirq.testing.random_circuit(qubits=6, n_moments=20, op_density=0.8, random_state=1)
+    qubits = sorted(circuit.all_qubits())
+    uncompute = circuit + cirq.inverse(circuit) + cirq.measure(*qubits, key='m')
+    simulator = cirq.Simulator(fuse_max_qubits=fuse_max_qubits)
+    np.testing.assert_allclose(
+        simulator.simulate(circuit).final_state_vector,
+        cirq.Simulator().simulate(circuit).final_state_vector,
+        atol=1e-5,
+    )
+    assert simulator.run(uncompute, repetitions=10).histogram(key='m') == {0: 10}
+
+
+def test_fuse_gates_cached_on_frozen_circuit():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.X(q1) ** sympy.Symbol('t'))
+    simulator = cirq.Simulator(fuse_max_qubits=2)
+    with mock.patch.object(
+        cirq.FrozenCircuit, '_fuse_unitaries', autospec=True, side_effect=lambda c, k: c
+    ) as fuse:
+        _ = simulator.simulate_sweep(circuit, cirq.Points('t', [0, 1]))
+        _ = simulator.simulate_expectation_values(circuit, cirq.Z(q0), {'t': 0})
+    assert fuse.call_args_list == [mock.call(circuit.freeze(), 2)] * 2
+    fused = circuit.freeze()._fuse_unitaries(2)
+    assert len(list(fused.all_operations())) == 2
+    _ = simulator.simulate(circuit, {'t': 1})
+    assert circuit.freeze()._fuse_unitaries(2) is fused
+
+
+def test_fuse_gates_not_in_noisy_or_stepped_simulations():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1))
+    noisy = cirq.Simulator(fuse_max_qubits=2, noise=cirq.ConstantQubitNoiseModel(cirq.Z))
+    assert noisy._prepare_circuit(circuit) is circuit
+    steps = list(cirq.Simulator(fuse_max_qubits=2).simulate_moment_steps(circuit))
+    assert len(steps) == 2
+
+
+@pytest.mark.parametrize('fuse_max_qubits', [None, 2])
+def test_fuse_diagonal_gates(fuse_max_qubits: int | None):
+    qubits = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*qubits),
+        [cirq.ZZ(a, b) ** 0.3 for a, b in zip(qubits, qubits[1:])],
+        [cirq.CZ(a, b) ** 0.7 for a, b in zip(qubits[::2], qubits[1::2])],
+        cirq.X.on_each(*qubits),
+        [cirq.Z(q) ** 0.4 for q in qubits],
+    )
+    simulator = cirq.Simulator(fuse_diagonal_max_qubits=3, fuse_max_qubits=fuse_max_qubits)
+    np.testing.assert_allclose(
+        simulator.simulate(circuit).final_state_vector,
+        cirq.Simulator().simulate(circuit).final_state_vector,
+        atol=1e-5,
+    )
+    assert simulator._prepare_circuit(circuit) is simulator._prepare_circuit(circuit)
+
+
+def test_fuse_gates_invalid():
+    with pytest.raises(ValueError, match='fuse_max_qubits'):
+        _ = cirq.Simulator(fuse_max_qubits=0)
+    with pytest.raises(ValueError, match='fuse_diagonal_max_qubits'):
+        _ = cirq.Simulator(fuse_diagonal_max_qubits=0)
@@ -175,11 +175,19 @@ def sample_state_vector(
     qid_shape: tuple[int, ...] | None = None,
     repetitions: int = 1,
     seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+    packed: bool = False,
 ) -> np.ndarray:
     """Samples repeatedly from measurements in the computational basis.
 
     Note that this does not modify the passed in state.
 
+    With `packed=True`, the measurement results of qubits are returned bit-packed
+    in the layout of `np.packbits` along the last axis, i.e. the sample of
+    repetition `r` is the big endian bit string of the bytes `result[r]`,
+    truncated to `len(indices)` bits. This avoids expanding large numbers of
+    samples into one byte per qubit, and the packed results can be passed to
+    `cirq.ResultDict` as `packed_records`.
+
     Args:
         state_vector: The multi-qubit state vector to be sampled. This is an
             array of 2 to the power of the number of qubit complex numbers, and
@@ -193,16 +201,19 @@ def sample_state_vector(
             when using qudits.
         repetitions: The number of times to sample.
         seed: A seed for the pseudorandom number generator.
+        packed: If True, returns the bit-packed measurement results of qubits.
 
     Returns:
         Measurement results with True corresponding to the ``|1⟩`` state.
         The outer list is for repetitions, and the inner corresponds to
         measurements ordered by the supplied qubits. These lists
-        are wrapped as a numpy ndarray.
+        are wrapped as a numpy ndarray. If `packed` is True, the inner lists
+        are bit-packed into `ceil(len(indices) / 8)` bytes.
 
     Raises:
         ValueError: ``repetitions`` is less than one or size of `state_vector`
-            is not a power of 2.
+            is not a power of 2, or `packed` is True and a sampled index is
+            not a qubit.
         IndexError: An index from ``indices`` is out of range, given the number
             of qubits corresponding to the state.
     """
@@ -211,9 +222,13 @@ def sample_state_vector(
     shape = qis.validate_qid_shape(state_vector, qid_shape)
     num_qubits = len(shape)
     qis.validate_indices(num_qubits, indices)
+    meas_shape = tuple(shape[i] for i in indices)
+    if packed and any(d != 2 for d in meas_shape):
+        raise ValueError(f'Only qubits can be sampled bit-packed, got qid shape {meas_shape}.')
 
     if repetitions == 0 or len(indices) == 0:
-        return np.zeros(shape=(repetitions, len(indices)), dtype=np.uint8)
+        num_columns = (len(indices) + 7) // 8 if packed else len(indices)
+        return np.zeros(shape=(repetitions, num_columns), dtype=np.uint8)
 
     prng = value.parse_random_state(seed)
 
@@ -225,12 +240,19 @@ def sample_state_vector(
     # it. Note that we us ints here, since numpy's choice does not allow for
     # choosing from a list of tuples or list of lists.
     result = prng.choice(len(probs), size=repetitions, p=probs)
+    if packed:
+        return _pack_big_endian_ints(result, len(indices))
     # Convert to individual qudit measurements.
-    meas_shape = tuple(shape[i] for i in indices)
-    return np.array(
-        [value.big_endian_int_to_digits(result[i], base=meas_shape) for i in range(len(result))],
-        dtype=np.uint8,
-    )
+    return np.stack(np.unravel_index(result, meas_shape), axis=1).astype(np.uint8)
+
+
+def _pack_big_endian_ints(values: np.ndarray, num_bits: int) -> np.ndarray:
+    """Packs integers of `num_bits` bits into big endian bytes in the layout of `np.packbits`."""
+    num_bytes = (num_bits + 7) // 8
+    # Align the bits of each value to the start of its bytes, as `np.packbits` pads the end.
+    words = values.astype(np.uint64) << np.uint64(8 * num_bytes - num_bits)
+    packed = words.astype('>u8').view(np.uint8).reshape(len(values), 8)
+    return np.ascontiguousarray(packed[:, 8 - num_bytes :])
 
 
 def measure_state_vector(
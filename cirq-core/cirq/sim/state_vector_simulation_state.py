@@ -23,6 +23,7 @@ import numpy as np
 from cirq import linalg, protocols, qis, sim
 from cirq._compat import proper_repr
 from cirq.linalg import transformations
+from cirq.sim.parallel_apply_unitary import apply_unitary_in_parallel
 from cirq.sim.simulation_state import SimulationState, strat_act_on_from_apply_decompose
 
 if TYPE_CHECKING:
@@ -32,7 +33,9 @@ if TYPE_CHECKING:
 class _BufferedStateVector(qis.QuantumStateRepresentation):
     """Contains the state vector and buffer for efficient state evolution."""
 
-    def __init__(self, state_vector: np.ndarray, buffer: np.ndarray | None = None):
+    def __init__(
+        self, state_vector: np.ndarray, buffer: np.ndarray | None = None, num_threads: int = 1
+    ):
         """Initializes the object with the inputs.
 
         This initializer creates the buffer if necessary.
@@ -42,12 +45,14 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
                 for validity here due to performance concerns.
             buffer: Optional, must be same shape as the state vector. If not provided, a buffer
                 will be created automatically.
+            num_threads: The number of threads used to apply unitaries to large state vectors.
         """
         self._state_vector = state_vector
         if buffer is None:
             buffer = np.empty_like(state_vector)
         self._buffer = buffer
         self._qid_shape = state_vector.shape
+        self._num_threads = num_threads
 
     @classmethod
     def create(
@@ -57,6 +62,7 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         qid_shape: tuple[int, ...] | None = None,
         dtype: type[np.complexfloating] | None = None,
         buffer: np.ndarray | None = None,
+        num_threads: int = 1,
     ):
         """Initializes the object with the inputs.
 
@@ -69,6 +75,7 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             dtype: The dtype of the state vector, if the initial state is provided as an int.
             buffer: Optional, must be length 3 and same shape as the state vector. If not
                 provided, a buffer will be created automatically.
+            num_threads: The number of threads used to apply unitaries to large state vectors.
         Raises:
             ValueError: If initial state is provided as integer, but qid_shape is not provided.
         """
@@ -86,7 +93,7 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             if np.may_share_memory(state_vector, initial_state):
                 state_vector = state_vector.copy()
         state_vector = state_vector.astype(dtype, copy=False)
-        return cls(state_vector, buffer)
+        return cls(state_vector, buffer, num_threads)
 
     def copy(self, deep_copy_buffers: bool = True) -> _BufferedStateVector:
         """Copies the object.
@@ -99,6 +106,7 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         return _BufferedStateVector(
             state_vector=self._state_vector.copy(),
             buffer=self._buffer.copy() if deep_copy_buffers else self._buffer,
+            num_threads=self._num_threads,
         )
 
     def kron(self, other: _BufferedStateVector) -> _BufferedStateVector:
@@ -112,7 +120,11 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         target_tensor = transformations.state_vector_kronecker_product(
             self._state_vector, other._state_vector
         )
-        return _BufferedStateVector(state_vector=target_tensor, buffer=np.empty_like(target_tensor))
+        return _BufferedStateVector(
+            state_vector=target_tensor,
+            buffer=np.empty_like(target_tensor),
+            num_threads=self._num_threads,
+        )
 
     def factor(
         self, axes: Sequence[int], *, validate=True, atol=1e-07
@@ -139,10 +151,14 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             self._state_vector, axes, validate=validate, atol=atol
         )
         extracted = _BufferedStateVector(
-            state_vector=extracted_tensor, buffer=np.empty_like(extracted_tensor)
+            state_vector=extracted_tensor,
+            buffer=np.empty_like(extracted_tensor),
+            num_threads=self._num_threads,
         )
         remainder = _BufferedStateVector(
-            state_vector=remainder_tensor, buffer=np.empty_like(remainder_tensor)
+            state_vector=remainder_tensor,
+            buffer=np.empty_like(remainder_tensor),
+            num_threads=self._num_threads,
         )
         return extracted, remainder
 
@@ -155,7 +171,9 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             The transposed state vector.
         """
         new_tensor = transformations.transpose_state_vector_to_axis_order(self._state_vector, axes)
-        return _BufferedStateVector(state_vector=new_tensor, buffer=np.empty_like(new_tensor))
+        return _BufferedStateVector(
+            state_vector=new_tensor, buffer=np.empty_like(new_tensor), num_threads=self._num_threads
+        )
 
     def apply_unitary(self, action: Any, axes: Sequence[int]) -> bool:
         """Apply unitary to state.
@@ -166,19 +184,38 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         Returns:
             True if the operation succeeded.
         """
-        new_target_tensor = protocols.apply_unitary(
-            action,
-            protocols.ApplyUnitaryArgs(
-                target_tensor=self._state_vector, available_buffer=self._buffer, axes=axes
-            ),
-            allow_decompose=False,
-            default=NotImplemented,
+        diagonal = protocols.unitary_diagonal(action, None)
+        if diagonal is not None:
+            linalg.targeted_diagonal_multiply(diagonal, self._state_vector, axes)
+            return True
+        new_target_tensor = apply_unitary_in_parallel(
+            action, self._state_vector, self._buffer, axes, self._num_threads
         )
+        if new_target_tensor is None:
+            new_target_tensor = protocols.apply_unitary(
+                action,
+                protocols.ApplyUnitaryArgs(
+                    target_tensor=self._state_vector, available_buffer=self._buffer, axes=axes
+                ),
+                allow_decompose=False,
+                default=NotImplemented,
+            )
         if new_target_tensor is NotImplemented:
             return False
         self._swap_target_tensor_for(new_target_tensor)
         return True
 
+    def apply_unitary_tensor(self, tensor: np.ndarray, axes: Sequence[int]) -> None:
+        """Apply a precomputed unitary to state.
+
+        Args:
+            tensor: The unitary, reshaped to a tensor with two axes per target
+                qudit and with the same dtype as the state vector.
+            axes: The axes on which to apply the unitary.
+        """
+        linalg.targeted_left_multiply(tensor, self._state_vector, axes, out=self._buffer)
+        self._swap_target_tensor_for(self._buffer)
+
     def apply_mixture(self, action: Any, axes: Sequence[int], prng) -> int | None:
         """Apply mixture to state.
 
@@ -326,6 +363,7 @@ class StateVectorSimulationState(SimulationState[_BufferedStateVector]):
         initial_state: np.ndarray | cirq.STATE_VECTOR_LIKE = 0,
         dtype: type[np.complexfloating] = np.complex64,
         classical_data: cirq.ClassicalDataStore | None = None,
+        num_threads: int = 1,
     ):
         """Inits StateVectorSimulationState.
 
@@ -347,12 +385,15 @@ class StateVectorSimulationState(SimulationState[_BufferedStateVector]):
                 `target_tenson` is None.
             classical_data: The shared classical data container for this
                 simulation.
+            num_threads: The number of threads used to apply unitaries to
+                large state vectors. The result does not depend on it.
         """
         state = _BufferedStateVector.create(
             initial_state=initial_state,
             qid_shape=tuple(q.dimension for q in qubits) if qubits is not None else None,
             dtype=dtype,
             buffer=available_buffer,
+            num_threads=num_threads,
         )
         super().__init__(state=state, prng=prng, qubits=qubits, classical_data=classical_data)
 
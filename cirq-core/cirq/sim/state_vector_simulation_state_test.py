@@ -274,3 +274,30 @@ def test_measured_mixture() -> None:
 def test_qid_shape_error() -> None:
     with pytest.raises(ValueError, match="qid_shape must be provided"):
         cirq.sim.state_vector_simulation_state._BufferedStateVector.create(initial_state=0)
+
+
+def test_apply_unitary_tensor() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    args = cirq.StateVectorSimulationState(qubits=[q0, q1], initial_state=0)
+    cirq.act_on(cirq.H(q0), args)
+    tensor = cirq.unitary(cirq.CNOT).astype(np.complex64).reshape((2,) * 4)
+    args._state.apply_unitary_tensor(tensor, [0, 1])
+    np.testing.assert_allclose(
+        args.target_tensor.reshape(4), np.array([1, 0, 0, 1]) / np.sqrt(2), atol=1e-6
+    )
+
+
+def test_apply_diagonal_in_place() -> None:
+    qubits = cirq.LineQubit.range(3)
+    initial_state = cirq.testing.random_superposition(8, random_state=1).astype(np.complex64)
+    args = cirq.StateVectorSimulationState(qubits=qubits, initial_state=initial_state)
+    target_tensor = args.target_tensor
+    op = cirq.DiagonalGate([0.1, 0.2, 0.3, 0.4]).on(qubits[2], qubits[0])
+    cirq.act_on(op, args)
+    # Diagonal gates multiply the state in place instead of swapping it with the buffer.
+    assert args.target_tensor is target_tensor
+    np.testing.assert_allclose(
+        args.target_tensor.reshape(8),
+        cirq.Circuit(op).unitary(qubit_order=qubits) @ initial_state,
+        atol=1e-6,
+    )
@@ -151,6 +151,30 @@ def test_sample_state_seed():
     )
 
 
+@pytest.mark.parametrize('indices', [[0], [2, 0, 1], list(range(9)), [8, 3, 5, 1, 0, 7, 2, 4, 6]])
+def test_sample_state_packed(indices):
+    state = cirq.testing.random_superposition(2**9, random_state=1)
+    samples = cirq.sample_state_vector(state, indices, repetitions=100, seed=2)
+    packed = cirq.sample_state_vector(state, indices, repetitions=100, seed=2, packed=True)
+    assert packed.dtype == np.uint8
+    assert packed.shape == (100, (len(indices) + 7) // 8)
+    np.testing.assert_array_equal(packed, np.packbits(samples, axis=-1))
+
+
+def test_sample_state_packed_empty():
+    state = cirq.to_valid_state_vector(0, 3)
+    assert cirq.sample_state_vector(state, [], packed=True).shape == (1, 0)
+    assert cirq.sample_state_vector(state, [1], repetitions=0, packed=True).shape == (0, 1)
+
+
+def test_sample_state_packed_qudits():
+    state = cirq.to_valid_state_vector(3, qid_shape=(2, 3))
+    with pytest.raises(ValueError, match='qubits'):
+        _ = cirq.sample_state_vector(state, [1], qid_shape=(2, 3), packed=True)
+    packed = cirq.sample_state_vector(state, [0], qid_shape=(2, 3), repetitions=2, packed=True)
+    np.testing.assert_array_equal(packed, [[128], [128]])
+
+
 def test_sample_state_negative_repetitions():
     state = cirq.to_valid_state_vector(0, 3)
     with pytest.raises(ValueError, match='-1'):
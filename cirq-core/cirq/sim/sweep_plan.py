@@ -0,0 +1,216 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Circuits compiled once for simulation at many parameter values.
+
+Sweeping a circuit normally resolves the parameters of the whole circuit,
+expands the noise model and dispatches every operation through `cirq.act_on`
+once per sweep point. A `SweepPlan` does the parameter independent part of
+that work once: it flattens the (noisy) circuit, computes the target axes of
+every operation and, for small states, the unitary tensors of all gates that
+do not depend on the parameters. Binding a sweep point then only resolves the
+parameterized operations.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Callable, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import devices, ops, protocols
+
+if TYPE_CHECKING:
+    import cirq
+
+# Static gates on more qubits than this are applied through `cirq.act_on` instead of
+# through a precomputed unitary tensor.
+_MAX_TENSOR_QUBITS = 4
+
+# For states with at most this many amplitudes, the Python overhead of `cirq.apply_unitary`
+# outweighs the savings of its specialized strategies, and unitaries are applied as
+# precomputed tensors instead.
+_MAX_SMALL_STATE_SIZE = 2**10
+
+
+@dataclasses.dataclass(frozen=True)
+class _PlanStep:
+    """A single operation of a `SweepPlan`.
+
+    Attributes:
+        op: The (unresolved) operation.
+        axes: The axes of the simulated state that the operation acts on.
+        parameterized: Whether `op` must be resolved at every sweep point.
+        tensor: The precomputed unitary tensor of a static operation on a
+            small state.
+        unitary: Whether `op` is a static unitary operation to apply with
+            `cirq.apply_unitary`.
+    """
+
+    op: cirq.Operation
+    axes: tuple[int, ...]
+    parameterized: bool
+    tensor: np.ndarray | None = None
+    unitary: bool = False
+
+
+def _noise_is_parameter_independent(noise: cirq.NoiseModel) -> bool:
+    """Whether `noise` gives the same noisy circuit before and after parameter resolution."""
+    return noise is devices.NO_NOISE or isinstance(noise, devices.ConstantQubitNoiseModel)
+
+
+def _unitary_tensor(op: cirq.Operation, dtype: type[np.complexfloating]) -> np.ndarray | None:
+    matrix = protocols.unitary(op, None)
+    if matrix is None:
+        return None
+    return matrix.astype(dtype, copy=False).reshape(protocols.qid_shape(op) * 2)
+
+
+class SweepPlan:
+    """A circuit compiled for repeated simulation on a state vector or density matrix.
+
+    Plans are created with `SweepPlan.compile` and applied to a
+    `cirq.StateVectorSimulationState` or `cirq.DensityMatrixSimulationState`
+    with `simulate`.
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[_PlanStep],
+        measurement_ops: Sequence[cirq.GateOperation],
+        dtype: type[np.complexfloating],
+        small_state: bool,
+    ) -> None:
+        self._steps = tuple(steps)
+        self._measurement_ops = list(measurement_ops)
+        self._dtype = dtype
+        self._small_state = small_state
+
+    @classmethod
+    def compile(
+        cls,
+        circuit: cirq.AbstractCircuit,
+        qubits: Sequence[cirq.Qid],
+        noise: cirq.NoiseModel,
+        dtype: type[np.complexfloating],
+        *,
+        density_matrix: bool = False,
+        skip_terminal_measurements: bool = False,
+    ) -> SweepPlan | None:
+        """Compiles a circuit into a plan.
+
+        Args:
+            circuit: The circuit to compile. It may contain unresolved
+                parameters.
+            qubits: The qubits of the simulated state, in order.
+            noise: The noise model of the simulator.
+            dtype: The dtype of the simulated state.
+            density_matrix: Whether the simulated state is a density matrix.
+            skip_terminal_measurements: If True, measurement gates are not
+                applied but collected into `measurement_ops`, so that they can
+                be sampled from the final state. Operations acting on the same
+                qubits as a previous measurement are also skipped, mirroring
+                `cirq.SimulatorBase._core_iterator`. All measurements in the
+                circuit must be terminal.
+
+        Returns:
+            The plan, or None if the circuit cannot be compiled because the
+            noise model might depend on parameter values, or because a
+            terminal measurement cannot be sampled from the final state.
+        """
+        if not _noise_is_parameter_independent(noise):
+            return None
+        qubit_index = {q: i for i, q in enumerate(qubits)}
+        size = np.prod([q.dimension for q in qubits], dtype=np.int64)
+        small_state = size ** (2 if density_matrix else 1) <= _MAX_SMALL_STATE_SIZE
+        steps: list[_PlanStep] = []
+        measurement_ops: list[cirq.GateOperation] = []
+        measured: set[tuple[cirq.Qid, ...]] = set()
+        for moment in noise.noisy_moments(circuit, sorted(circuit.all_qubits())):
+            for op in ops.flatten_to_ops(moment):
+                if skip_terminal_measurements:
+                    if op.qubits in measured:
+                        continue
+                    if isinstance(op.gate, ops.MeasurementGate):
+                        measured.add(op.qubits)
+                        measurement_ops.append(op)
+                        continue
+                    if protocols.is_measurement(op):
+                        return None
+                axes = tuple(qubit_index[q] for q in op.qubits)
+                if protocols.is_parameterized(op):
+                    steps.append(_PlanStep(op, axes, parameterized=True))
+                elif small_state and len(axes) <= _MAX_TENSOR_QUBITS:
+                    tensor = _unitary_tensor(op, dtype)
+                    steps.append(_PlanStep(op, axes, parameterized=False, tensor=tensor))
+                else:
+                    unitary = protocols.has_unitary(op)
+                    steps.append(_PlanStep(op, axes, parameterized=False, unitary=unitary))
+        return SweepPlan(steps, measurement_ops, dtype, small_state)
+
+    @property
+    def measurement_ops(self) -> list[cirq.GateOperation]:
+        """The terminal measurements skipped when the plan was compiled."""
+        return self._measurement_ops
+
+    def simulate(
+        self,
+        sim_state: cirq.StateVectorSimulationState | cirq.DensityMatrixSimulationState,
+        param_resolver: cirq.ParamResolver,
+        can_apply: Callable[[Any], bool] | None = None,
+    ) -> bool:
+        """Applies the plan to a simulation state at one sweep point.
+
+        Args:
+            sim_state: The state to evolve in place. Its qubits must be the
+                qubits the plan was compiled for, in the same order.
+            param_resolver: The parameter values of the sweep point.
+            can_apply: An optional predicate that all operations applied
+                through `cirq.act_on` must satisfy.
+
+        Returns:
+            False if an operation does not satisfy `can_apply`, in which case
+            `sim_state` is left partially evolved, True otherwise.
+
+        Raises:
+            ValueError: If the parameters of an operation are not resolved by
+                `param_resolver`.
+        """
+        state = sim_state._state
+        for step in self._steps:
+            if step.tensor is not None:
+                state.apply_unitary_tensor(step.tensor, step.axes)
+                continue
+            if step.unitary and state.apply_unitary(step.op, step.axes):
+                continue
+            op = step.op
+            if step.parameterized:
+                op = protocols.resolve_parameters(op, param_resolver)
+                if protocols.is_parameterized(op):
+                    raise ValueError(
+                        'Circuit contains ops whose symbols were not specified in '
+                        f'parameter sweep. Ops: {[op]}'
+                    )
+                if self._small_state and len(step.axes) <= _MAX_TENSOR_QUBITS:
+                    tensor = _unitary_tensor(op, self._dtype)
+                    if tensor is not None:
+                        state.apply_unitary_tensor(tensor, step.axes)
+                        continue
+                elif state.apply_unitary(op, step.axes):
+                    continue
+            if can_apply is not None and not can_apply(op):
+                return False
+            protocols.act_on(op, sim_state)
+        return True
@@ -0,0 +1,178 @@
+# Copyright 2025 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.sim import sweep_plan
+
+
+def _sweep_circuit(num_qubits: int = 3) -> cirq.Circuit:
+    qs = cirq.LineQubit.range(num_qubits)
+    a, b = sympy.symbols('a b')
+    return cirq.Circuit(
+        cirq.H.on_each(*qs),
+        cirq.rx(a).on(qs[0]),
+        cirq.CZ(qs[0], qs[1]),
+        cirq.X(qs[1]) ** 0.3,
+        cirq.PhasedXZGate(x_exponent=0.2, z_exponent=b, axis_phase_exponent=0.1).on(qs[2]),
+        cirq.ZZ(qs[1], qs[2]) ** (a + b),
+        cirq.MatrixGate(cirq.testing.random_unitary(8, random_state=1)).on(*qs[:3]),
+    )
+
+
+_SWEEP = cirq.Zip(cirq.Linspace('a', 0, 1, 5), cirq.Linspace('b', -1, 1, 5))
+
+
+def _simulators(dtype, split):
+    return [
+        cirq.Simulator(dtype=dtype, split_untangled_states=split),
+        cirq.DensityMatrixSimulator(dtype=dtype, split_untangled_states=split),
+    ]
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+@pytest.mark.parametrize('split', [True, False])
+def test_simulate_sweep_matches_point_by_point(dtype: type[np.complexfloating], split: bool):
+    circuit = _sweep_circuit()
+    for simulator in _simulators(dtype, split):
+        results = simulator.simulate_sweep(circuit, _SWEEP)
+        for result, resolver in zip(results, _SWEEP):
+            expected = simulator.simulate(circuit, resolver)
+            assert result.params == resolver
+            np.testing.assert_allclose(
+                result._get_merged_sim_state().target_tensor,
+                expected._get_merged_sim_state().target_tensor,
+                atol=1e-5,
+            )
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+def test_simulate_sweep_large_state_uses_fast_unitaries(dtype: type[np.complexfloating]):
+    circuit = _sweep_circuit(11)
+    simulator = cirq.Simulator(dtype=dtype)
+    results = simulator.simulate_sweep(circuit, _SWEEP)
+    for result, resolver in zip(results, _SWEEP):
+        expected = simulator.simulate(circuit, resolver)
+        np.testing.assert_allclose(
+            result.final_state_vector, expected.final_state_vector, atol=1e-5
+        )
+
+
+def test_simulate_sweep_with_measurements_and_noise():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.X(q0) ** sympy.Symbol('t'),
+        cirq.measure(q0, key='m'),
+        cirq.X(q1).with_classical_controls('m'),
+    )
+    noise = cirq.ConstantQubitNoiseModel(cirq.depolarize(0.01))
+    sweep = cirq.Points('t', [0, 1])
+    results = cirq.DensityMatrixSimulator(noise=noise, seed=1).simulate_sweep(circuit, sweep)
+    simulator = cirq.DensityMatrixSimulator(noise=noise, seed=1)
+    for result, resolver in zip(results, sweep):
+        expected = simulator.simulate(circuit, resolver)
+        assert result.measurements == expected.measurements
+        np.testing.assert_allclose(
+            result.final_density_matrix, expected.final_density_matrix, atol=1e-6
+        )
+
+
+def test_simulate_sweep_unresolved_parameters():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('a'), cirq.X(q) ** sympy.Symbol('b'))
+    with pytest.raises(ValueError, match='symbols were not specified'):
+        _ = cirq.Simulator().simulate_sweep(circuit, cirq.Points('a', [0, 1]))
+
+
+@pytest.mark.parametrize('simulator_type', [cirq.Simulator, cirq.DensityMatrixSimulator])
+def test_run_sweep_matches_point_by_point(simulator_type):
+    circuit = _sweep_circuit() + cirq.measure(*cirq.LineQubit.range(3), key='m')
+    results = simulator_type(seed=1).run_sweep(circuit, _SWEEP, repetitions=20)
+    simulator = simulator_type(seed=1)
+    expected = [simulator.run(circuit, resolver, repetitions=20) for resolver in _SWEEP]
+    assert results == expected
+
+
+def test_run_sweep_falls_back_for_non_unitary_operations():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(
+        cirq.X(q) ** sympy.Symbol('t'), cirq.bit_flip(0.5).on(q), cirq.measure(q, key='m')
+    )
+    simulator = cirq.Simulator(seed=1)
+    with mock.patch.object(simulator, '_run', wraps=simulator._run) as mock_run:
+        results = simulator.run_sweep(circuit, cirq.Points('t', [0, 1]), repetitions=10)
+    assert mock_run.call_count == 2
+    assert [r.repetitions for r in results] == [10, 10]
+
+
+def test_run_sweep_uses_plan_for_terminal_measurements():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='m'))
+    simulator = cirq.Simulator()
+    with mock.patch.object(simulator, '_run', wraps=simulator._run) as mock_run:
+        results = simulator.run_sweep(circuit, cirq.Points('t', [0, 1]), repetitions=10)
+    assert mock_run.call_count == 0
+    assert [r.histogram(key='m') for r in results] == [{0: 10}, {1: 10}]
+
+
+def test_compile_skips_noise_on_measured_qubits():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.measure(q0, key='m'), cirq.X(q1))
+    noise = cirq.ConstantQubitNoiseModel(cirq.X)
+    plan = sweep_plan.SweepPlan.compile(
+        circuit, [q0, q1], noise, np.complex64, skip_terminal_measurements=True
+    )
+    assert plan is not None
+    assert plan.measurement_ops == [cirq.measure(q0, key='m')]
+    results = cirq.Simulator(noise=noise).run_sweep(circuit, [{}, {}], repetitions=3)
+    assert [r.histogram(key='m') for r in results] == [{0: 3}, {0: 3}]
+
+
+def test_compile_unsupported():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q0, key='m'))
+    noise = cirq.devices.noise_model._NoNoiseModel()
+    substitution = cirq.devices.noise_model.GateSubstitutionNoiseModel(lambda op: op)
+    assert sweep_plan.SweepPlan.compile(circuit, [q0], substitution, np.complex64) is None
+    assert sweep_plan.SweepPlan.compile(circuit, [q0], noise, np.complex64) is None
+    pauli_measurement = cirq.Circuit(cirq.measure_single_paulistring(cirq.Z(q0)))
+    assert (
+        sweep_plan.SweepPlan.compile(
+            pauli_measurement, [q0], cirq.NO_NOISE, np.complex64, skip_terminal_measurements=True
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize('num_qubits', [5, 11])
+def test_static_operations_without_tensors(num_qubits: int):
+    qs = cirq.LineQubit.range(num_qubits)
+    circuit = cirq.Circuit(
+        cirq.X(qs[0]) ** sympy.Symbol('t'),
+        cirq.CNOT.on_each(*zip(qs, qs[1:])),
+        cirq.CircuitOperation(cirq.FrozenCircuit(cirq.H.on_each(*qs[:2]))),
+        cirq.CircuitOperation(cirq.FrozenCircuit(cirq.H.on_each(*qs))),
+    )
+    results = cirq.Simulator().simulate_sweep(circuit, cirq.Points('t', [0, 1]))
+    expected = cirq.Simulator().simulate(circuit, {'t': 1})
+    np.testing.assert_allclose(
+        results[1].final_state_vector, expected.final_state_vector, atol=1e-6
+    )
@@ -32,6 +32,9 @@ if TYPE_CHECKING:
     import cirq
 
 T = TypeVar('T')
+
+# Measurements of at most this many bits are counted with `np.bincount`.
+_MAX_BINCOUNT_BITS = 16
 TMeasurementKey = Union[str, 'cirq.Qid', Iterable['cirq.Qid']]
 
 
@@ -204,6 +207,10 @@ class Result(abc.ABC):
             results.
         """
         fixed_keys = tuple(_key_to_str(key) for key in keys)
+        if fold_func is _tuple_of_big_endian_int:
+            counts = self._count_big_endian_ints(fixed_keys)
+            if counts is not None:
+                return counts
         samples: Iterable[Any] = zip(*(self.measurements[sub_key] for sub_key in fixed_keys))
         if len(fixed_keys) == 0:
             samples = [()] * self.repetitions
@@ -254,8 +261,81 @@ class Result(abc.ABC):
             A counter indicating how often a measurement sampled various
             results.
         """
+        if fold_func is value.big_endian_bits_to_int:
+            counts = self._count_big_endian_ints((_key_to_str(key),))
+            if counts is not None:
+                return collections.Counter({k[0]: v for k, v in counts.items()})
         return self.multi_measurement_histogram(keys=[key], fold_func=lambda e: fold_func(e[0]))
 
+    def marginal_histogram(
+        self, *, key: TMeasurementKey, indices: Sequence[int]  # Forces keyword args.
+    ) -> collections.Counter:
+        """Counts the number of times the measurement of some qubits of a key occurred.
+
+        For example, if the measurement with key 'abc' measures qubits a, b,
+        and c, then `marginal_histogram(key='abc', indices=[2, 0])` counts the
+        big endian integers of the bits of c and a, with c determining the
+        highest-value bit.
+
+        Args:
+            key: The key of the measurement.
+            indices: The indices of the qubits of the measurement to count.
+
+        Returns:
+            A counter indicating how often the measured qubits sampled
+            various results.
+        """
+        ints = self._big_endian_ints(_key_to_str(key))
+        if ints is None:
+            bits = self.measurements[_key_to_str(key)][:, list(indices)]
+            return collections.Counter(value.big_endian_bits_to_int(b) for b in bits)
+        values, num_bits = ints
+        marginal = np.zeros(len(values), dtype=np.uint64)
+        for i in indices:
+            marginal = (marginal << np.uint64(1)) | (values >> np.uint64(num_bits - 1 - i)) & 1
+        return _count_ints(marginal, len(indices))
+
+    def _big_endian_ints(self, key: str) -> tuple[np.ndarray, int] | None:
+        """Returns the measurements of a key as big endian integers and their number of bits.
+
+        Returns None if the measurements do not fit in 64 bits.
+        """
+        bits = self.measurements[key]
+        if bits.shape[1] > 64:
+            return None
+        return _packed_bits_to_ints(np.packbits(bits, axis=-1), bits.shape[1]), bits.shape[1]
+
+    def _count_big_endian_ints(self, keys: tuple[str, ...]) -> collections.Counter | None:
+        """Counts the combined measurements of keys as tuples of big endian integers.
+
+        The measurements are counted as arrays of integers with numpy. Returns
+        None if the measurement of a key does not fit in 64 bits.
+        """
+        columns = []
+        for key in keys:
+            ints = self._big_endian_ints(key)
+            if ints is None:
+                return None
+            columns.append(ints)
+        if not columns:
+            return collections.Counter({(): self.repetitions} if self.repetitions else {})
+        total_bits = sum(num_bits for _, num_bits in columns)
+        if total_bits > 64:
+            rows, counts = np.unique(
+                np.stack([values for values, _ in columns], axis=1), axis=0, return_counts=True
+            )
+            return collections.Counter(dict(zip(map(tuple, rows.tolist()), counts.tolist())))
+        # Count the concatenated bits of all keys, then split them back.
+        combined = np.zeros(len(columns[0][0]), dtype=np.uint64)
+        for values, num_bits in columns:
+            combined = (combined << np.uint64(num_bits)) | values
+        unique_values, counts = _unique_ints(combined, total_bits)
+        split = []
+        for _, num_bits in reversed(columns):
+            split.append((unique_values & np.uint64((1 << num_bits) - 1)).tolist())
+            unique_values = unique_values >> np.uint64(num_bits)
+        return collections.Counter(dict(zip(zip(*reversed(split)), counts.tolist())))
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Result):
             return NotImplemented
@@ -292,6 +372,11 @@ class ResultDict(Result):
     2D numpy array. The first (row) index in each array is the repetition
     number, and the second (column) index is the qubit.
 
+    The results can also be given as bit-packed records, e.g. from
+    `cirq.sample_state_vector(..., packed=True)`. These are only unpacked
+    when `records` or `measurements` are accessed, and `histogram` counts them
+    as packed integers.
+
     Attributes:
         params: A ParamResolver of settings used when sampling result.
     """
@@ -302,6 +387,7 @@ class ResultDict(Result):
         params: resolver.ParamResolver | None = None,
         measurements: Mapping[str, np.ndarray] | None = None,
         records: Mapping[str, np.ndarray] | None = None,
+        packed_records: Mapping[str, tuple[np.ndarray, int]] | None = None,
     ) -> None:
         """Inits Result.
 
@@ -318,17 +404,27 @@ class ResultDict(Result):
                 index running over "instances" of that key in the circuit, and
                 the last index running over the qubits for the corresponding
                 measurements.
+            packed_records: A dictionary from measurement gate key to pairs of
+                bit-packed measurement results of qubits and the number of
+                measured qubits. The results are a 3D array of uint8, with the
+                first index running over the repetitions, the second index
+                running over "instances" of that key in the circuit, and the
+                last index running over the bytes of the measured bits in the
+                layout of `np.packbits`. Only used if neither `measurements`
+                nor `records` are given.
         """
         if params is None:
             params = resolver.ParamResolver({})
-        if measurements is None and records is None:
+        if measurements is None and records is None and packed_records is None:
             # For backwards compatibility, allow constructing with None.
             measurements = {}
             records = {}
         self._params = params
         self._measurements = measurements
         self._records = records
+        self._packed_records = packed_records if measurements is None and records is None else None
         self._data: pd.DataFrame | None = None
+        self._counts: dict[tuple[str, ...], collections.Counter] = {}
 
     @property
     def params(self) -> cirq.ParamResolver:
@@ -337,9 +433,8 @@ class ResultDict(Result):
     @property
     def measurements(self) -> Mapping[str, np.ndarray]:
         if self._measurements is None:
-            assert self._records is not None
             self._measurements = {}
-            for key, data in self._records.items():
+            for key, data in self.records.items():
                 reps, instances, qubits = data.shape
                 if instances != 1:
                     raise ValueError('Cannot extract 2D measurements for repeated keys')
@@ -348,6 +443,11 @@ class ResultDict(Result):
 
     @property
     def records(self) -> Mapping[str, np.ndarray]:
+        if self._records is None and self._packed_records is not None:
+            self._records = {
+                key: np.unpackbits(packed, axis=-1, count=num_bits)
+                for key, (packed, num_bits) in self._packed_records.items()
+            }
         if self._records is None:
             assert self._measurements is not None
             self._records = {
@@ -357,6 +457,10 @@ class ResultDict(Result):
 
     @property
     def repetitions(self) -> int:
+        if self._packed_records is not None:
+            if not self._packed_records:
+                return 0
+            return len(next(iter(self._packed_records.values()))[0])
         if self._records is not None:
             if not self._records:
                 return 0
@@ -374,6 +478,32 @@ class ResultDict(Result):
             self._data = self.dataframe_from_measurements(self.measurements)
         return self._data
 
+    def _big_endian_ints(self, key: str) -> tuple[np.ndarray, int] | None:
+        packed_record = None if self._packed_records is None else self._packed_records.get(key)
+        if packed_record is None or packed_record[0].shape[1] != 1 or packed_record[1] > 64:
+            return super()._big_endian_ints(key)
+        packed, num_bits = packed_record
+        return _packed_bits_to_ints(packed[:, 0, :], num_bits), num_bits
+
+    def _count_big_endian_ints(self, keys: tuple[str, ...]) -> collections.Counter | None:
+        # Counts are cached, and merged by `__add__`.
+        if keys not in self._counts:
+            counts = super()._count_big_endian_ints(keys)
+            if counts is None:
+                return None
+            self._counts[keys] = counts
+        return collections.Counter(self._counts[keys])
+
+    def __add__(self, other: cirq.Result) -> cirq.Result:
+        result = super().__add__(other)
+        if isinstance(other, ResultDict) and isinstance(result, ResultDict):
+            result._counts = {
+                keys: counts + other._counts[keys]
+                for keys, counts in self._counts.items()
+                if keys in other._counts
+            }
+        return result
+
     def _record_dict_repr(self):
         """Helper function for use in __repr__ to display the records field."""
         return '{' + ', '.join(f'{k!r}: {proper_repr(v)}' for k, v in self.records.items()) + '}'
@@ -422,6 +552,32 @@ class ResultDict(Result):
         return cls._from_packed_records(params=params, records=kwargs['records'])
 
 
+def _packed_bits_to_ints(packed: np.ndarray, num_bits: int) -> np.ndarray:
+    """Returns the big endian integers of rows of at most 64 bits packed by `np.packbits`."""
+    values = np.zeros(len(packed), dtype=np.uint64)
+    for i in range(packed.shape[1]):
+        values = (values << np.uint64(8)) | packed[:, i]
+    return values >> np.uint64(8 * packed.shape[1] - num_bits)
+
+
+def _unique_ints(values: np.ndarray, num_bits: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the unique integers of `num_bits` bits in `values` and their counts.
+
+    Few bits are counted with `np.bincount`, and more bits by sorting.
+    """
+    if num_bits <= _MAX_BINCOUNT_BITS:
+        counts = np.bincount(values.astype(np.intp), minlength=1)
+        unique_values = np.flatnonzero(counts).astype(np.uint64)
+        return unique_values, counts[unique_values]
+    return np.unique(values, return_counts=True)
+
+
+def _count_ints(values: np.ndarray, num_bits: int) -> collections.Counter:
+    """Counts integers of `num_bits` bits."""
+    unique_values, counts = _unique_ints(values, num_bits)
+    return collections.Counter(dict(zip(unique_values.tolist(), counts.tolist())))
+
+
 def _pack_digits(digits: np.ndarray, pack_bits: str = 'auto') -> tuple[str, bool]:
     """Returns a string of packed digits and a boolean indicating whether the
     digits were packed as binary values.
@@ -188,6 +188,42 @@ def test_histogram():
     assert result.histogram(key='c') == collections.Counter({0: 3, 1: 2})
 
 
+def test_packed_records():
+    bits = np.array([[0, 1, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1]], dtype=np.uint8)
+    wide_bits = np.tile(bits, 25)
+    repeated_bits = np.array([[[0, 1], [1, 1]], [[1, 0], [0, 0]]], dtype=np.uint8)
+    packed_records = {
+        'abc': (np.packbits(bits, axis=-1)[:, np.newaxis, :], 3),
+        'wide': (np.packbits(wide_bits, axis=-1)[:, np.newaxis, :], 75),
+    }
+    result = cirq.ResultDict(packed_records=packed_records)
+    assert result.repetitions == 4
+    assert result.histogram(key='abc') == collections.Counter({3: 2, 5: 1, 7: 1})
+    # The records are only unpacked when accessed.
+    assert result._records is None
+    assert result.histogram(key='abc', fold_func=tuple) == collections.Counter(
+        {(0, 1, 1): 2, (1, 0, 1): 1, (1, 1, 1): 1}
+    )
+    assert result.histogram(key='wide') == collections.Counter(
+        {cirq.big_endian_bits_to_int(b): 1 for b in wide_bits[[1, 3]]}
+        | {cirq.big_endian_bits_to_int(wide_bits[0]): 2}
+    )
+    np.testing.assert_array_equal(result.measurements['abc'], bits)
+    assert result == cirq.ResultDict(measurements={'abc': bits, 'wide': wide_bits})
+
+    result = cirq.ResultDict(
+        packed_records={'ab': (np.packbits(repeated_bits, axis=-1), 2)}, params=cirq.ParamResolver()
+    )
+    assert result.records['ab'].shape == (2, 2, 2)
+    with pytest.raises(ValueError, match='repeated'):
+        _ = result.histogram(key='ab')
+
+    assert cirq.ResultDict(packed_records={}).repetitions == 0
+    result = cirq.ResultDict(measurements={'c': bits}, packed_records=packed_records)
+    assert result.histogram(key='c') == collections.Counter({3: 2, 5: 1, 7: 1})
+    assert result.records.keys() == {'c'}
+
+
 def test_multi_measurement_histogram():
     result = cirq.ResultDict(
         params=cirq.ParamResolver({}),
@@ -222,6 +258,75 @@ def test_multi_measurement_histogram():
     )
 
 
+def _slow_multi_measurement_histogram(result, keys):
+    return result.multi_measurement_histogram(
+        keys=keys, fold_func=lambda e: tuple(cirq.big_endian_bits_to_int(bits) for bits in e)
+    )
+
+
+@pytest.mark.parametrize(
+    'widths, keys',
+    [
+        ({'a': 3}, ['a']),
+        ({'a': 20, 'b': 5}, ['a', 'b']),
+        ({'a': 20, 'b': 5}, ['b', 'a', 'b']),
+        ({'a': 40, 'b': 30}, ['a', 'b']),
+        ({'a': 64, 'b': 1}, ['b', 'a']),
+        ({'a': 70, 'b': 2}, ['b', 'a']),
+        ({'a': 2}, []),
+    ],
+)
+def test_vectorized_histograms(widths, keys):
+    rng = np.random.default_rng(1)
+    measurements = {
+        key: rng.integers(0, 3, size=(200, width), dtype=np.int8) for key, width in widths.items()
+    }
+    result = cirq.ResultDict(measurements=measurements)
+    expected = _slow_multi_measurement_histogram(result, keys)
+    assert result.multi_measurement_histogram(keys=keys) == expected
+    if len(keys) == 1:
+        assert result.histogram(key=keys[0]) == collections.Counter(
+            {k[0]: v for k, v in expected.items()}
+        )
+
+
+def test_vectorized_histograms_no_repetitions():
+    result = cirq.ResultDict(measurements={'a': np.zeros((0, 2), dtype=bool)})
+    assert result.histogram(key='a') == collections.Counter()
+    assert result.multi_measurement_histogram(keys=[]) == collections.Counter()
+
+
+def test_marginal_histogram():
+    rng = np.random.default_rng(2)
+    bits = rng.integers(0, 2, size=(100, 70), dtype=np.uint8)
+    result = cirq.ResultDict(measurements={'short': bits[:, :10], 'long': bits})
+    for key, indices in [('short', [3, 0, 9]), ('short', []), ('long', [69, 2])]:
+        assert result.marginal_histogram(key=key, indices=indices) == collections.Counter(
+            cirq.big_endian_bits_to_int(b) for b in result.measurements[key][:, indices]
+        )
+    q = cirq.LineQubit.range(2)
+    result = cirq.ResultDict(measurements={'q(0),q(1)': np.array([[0, 1], [1, 1]])})
+    assert result.marginal_histogram(key=q, indices=[1]) == collections.Counter({1: 2})
+
+
+def test_histogram_counts_are_cached_and_added():
+    a = cirq.ResultDict(measurements={'m': np.array([[0, 1], [1, 1]]), 'n': np.array([[0], [1]])})
+    b = cirq.ResultDict(measurements={'m': np.array([[0, 1], [0, 0]]), 'n': np.array([[1], [1]])})
+    counts = a.histogram(key='m')
+    counts[1] += 10
+    assert a.histogram(key='m') == collections.Counter({1: 1, 3: 1})
+    _ = b.histogram(key='m')
+    _ = a.multi_measurement_histogram(keys=['m', 'n'])
+
+    c = a + b
+    assert isinstance(c, cirq.ResultDict)
+    assert c._counts == {('m',): collections.Counter({(1,): 2, (3,): 1, (0,): 1})}
+    assert c.histogram(key='m') == collections.Counter({1: 2, 3: 1, 0: 1})
+    assert c.multi_measurement_histogram(keys=['m', 'n']) == _slow_multi_measurement_histogram(
+        c, ['m', 'n']
+    )
+
+
 def test_result_equality():
     et = cirq.testing.EqualsTester()
     et.add_equality_group(
@@ -291,8 +291,8 @@ class _MergedCircuit:
             measurement operations with the same key.
         ckey_indexes: Mapping from measurement keys to (sorted) list of moment indexes containing
             classically controlled operations controlled on the same key.
-        ops_by_index: List of circuit moments containing operations. We use a dictionary instead
-            of a set to store operations to preserve insertion order.
+        ops_by_index: List of builders for the circuit moments, which find the operations acting
+            on given qubits without scanning the whole moment.
     """
 
     qubit_indexes: dict[cirq.Qid, list[int]] = dataclasses.field(
@@ -304,13 +304,13 @@ class _MergedCircuit:
     ckey_indexes: dict[cirq.MeasurementKey, list[int]] = dataclasses.field(
         default_factory=lambda: defaultdict(lambda: [-1])
     )
-    ops_by_index: list[dict[cirq.Operation, int]] = dataclasses.field(default_factory=list)
+    ops_by_index: list[cirq.MomentBuilder] = dataclasses.field(default_factory=list)
 
     def append_empty_moment(self) -> None:
-        self.ops_by_index.append({})
+        self.ops_by_index.append(circuits.MomentBuilder())
 
     def add_op_to_moment(self, moment_index: int, op: cirq.Operation) -> None:
-        self.ops_by_index[moment_index][op] = 0
+        self.ops_by_index[moment_index].add(op)
         for q in op.qubits:
             if moment_index > self.qubit_indexes[q][-1]:
                 self.qubit_indexes[q].append(moment_index)
@@ -322,7 +322,7 @@ class _MergedCircuit:
             bisect.insort(self.ckey_indexes[ckey], moment_index)
 
     def remove_op_from_moment(self, moment_index: int, op: cirq.Operation) -> None:
-        self.ops_by_index[moment_index].pop(op)
+        self.ops_by_index[moment_index].remove(op)
         for q in op.qubits:
             if self.qubit_indexes[q][-1] == moment_index:
                 self.qubit_indexes[q].pop()
@@ -346,12 +346,10 @@ class _MergedCircuit:
         if idx == -1:
             return idx, []
 
-        return idx, [
-            left_op for left_op in self.ops_by_index[idx] if not op_qs.isdisjoint(left_op.qubits)
-        ]
+        return idx, self.ops_by_index[idx].operations_touching(op_qs)
 
     def get_cirq_circuit(self) -> cirq.Circuit:
-        return circuits.Circuit(circuits.Moment(m.keys()) for m in self.ops_by_index)
+        return circuits.Circuit(builder.build() for builder in self.ops_by_index)
 
 
 def merge_operations(
@@ -21,7 +21,11 @@ from cirq.work.observable_settings import (
     _MeasurementSpec as _MeasurementSpec,
     observables_to_settings as observables_to_settings,
 )
-from cirq.work.observable_grouping import group_settings_greedy as group_settings_greedy
+from cirq.work.observable_grouping import (
+    group_settings_coloring as group_settings_coloring,
+    group_settings_greedy as group_settings_greedy,
+    group_settings_sorted_insertion as group_settings_sorted_insertion,
+)
 from cirq.work.observable_measurement_data import (
     ObservableMeasuredResult as ObservableMeasuredResult,
     BitstringAccumulator as BitstringAccumulator,
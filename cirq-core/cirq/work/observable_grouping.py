@@ -14,13 +14,24 @@
 
 from __future__ import annotations
 
-from typing import Callable, cast, Iterable
+from typing import Callable, Iterable, Sequence, TYPE_CHECKING
 
-from cirq import ops, value
+import numpy as np
+
+from cirq import ops
 from cirq.work.observable_settings import _max_weight_observable, _max_weight_state, InitObsSetting
 
+if TYPE_CHECKING:
+    from cirq.value.product_state import _NamedOneQubitState
+
 GROUPER_T = Callable[[Iterable[InitObsSetting]], dict[InitObsSetting, list[InitObsSetting]]]
 
+# The number of (setting, setting, word) triples compared at once when counting conflicts.
+_MAX_CHUNK_SIZE = 2**22
+
+# The X and Z bits of the single-qubit Paulis, as x + 2 z.
+_PAULI_CODES = {ops.X: 1, ops.Z: 2, ops.Y: 3}
+
 
 def group_settings_greedy(
     settings: Iterable[InitObsSetting],
@@ -31,11 +42,13 @@ def group_settings_greedy(
     for `_max_weight_state` and `_max_weight_observable`) where the value
     is a list of settings compatible with `max_setting`. For each new setting,
     we try to find an existing group to add it and update `max_setting` for
-    that group if necessary. Otherwise, we make a new group.
+    that group if necessary. Otherwise, we make a new group. Groups are tried
+    starting from the one that was updated least recently.
 
     In practice, this greedy algorithm performs comparably to something
     more complicated by solving the clique cover problem on a graph
-    of simultaneously-measurable settings.
+    of simultaneously-measurable settings. See also
+    `group_settings_sorted_insertion` and `group_settings_coloring`.
 
     Args:
         settings: The settings to group.
@@ -45,33 +58,188 @@ def group_settings_greedy(
         input list of settings. Each dictionary value is a list of
         settings compatible with `max_setting`.
     """
-    grouped_settings: dict[InitObsSetting, list[InitObsSetting]] = {}
-    for setting in settings:
-        for max_setting, simul_settings in grouped_settings.items():
-            trial_grouped_settings = simul_settings + [setting]
-            new_max_weight_state = _max_weight_state(
-                stg.init_state for stg in trial_grouped_settings
-            )
-            new_max_weight_obs = _max_weight_observable(
-                stg.observable for stg in trial_grouped_settings
-            )
-            compatible_init_state = new_max_weight_state is not None
-            compatible_observable = new_max_weight_obs is not None
-            can_be_inserted = compatible_init_state and compatible_observable
-            if can_be_inserted:
-                new_max_weight_state = cast(value.ProductState, new_max_weight_state)
-                new_max_weight_obs = cast(ops.PauliString, new_max_weight_obs)
-                del grouped_settings[max_setting]
-                new_max_setting = InitObsSetting(new_max_weight_state, new_max_weight_obs)
-                grouped_settings[new_max_setting] = trial_grouped_settings
-                break
+    settings = list(settings)
+    return _group_first_fit(settings, range(len(settings)), least_recently_updated_first=True)
+
+
+def group_settings_sorted_insertion(
+    settings: Iterable[InitObsSetting],
+) -> dict[InitObsSetting, list[InitObsSetting]]:
+    """Group settings by inserting them in order of decreasing coefficient magnitude.
+
+    Each setting is added to the first group, in the order the groups were
+    created, that it is compatible with. Settings whose observables have large
+    coefficients, which dominate the variance of an estimated Pauli sum, are
+    grouped first, so that they tend to share groups with many other settings.
+    This is the sorted insertion algorithm of Crawford et al., arXiv:1908.06942.
+
+    Args:
+        settings: The settings to group.
+
+    Returns:
+        A dictionary keyed by `max_setting`, as returned by `group_settings_greedy`.
+    """
+    settings = list(settings)
+    magnitudes = np.array([abs(complex(s.observable.coefficient)) for s in settings])
+    order = np.argsort(-magnitudes, kind='stable')
+    return _group_first_fit(settings, order, least_recently_updated_first=False)
+
+
+def group_settings_coloring(
+    settings: Iterable[InitObsSetting],
+) -> dict[InitObsSetting, list[InitObsSetting]]:
+    """Group settings by coloring the graph of incompatible settings.
+
+    Two settings are incompatible if their initial states or observables differ
+    on a qubit on which both are defined. Groups of pairwise compatible settings
+    are colors of the graph whose edges join incompatible settings, which are
+    assigned with the largest-degree-first greedy coloring algorithm. This
+    usually produces fewer groups than `group_settings_greedy`, but counting
+    the incompatible settings takes time quadratic in the number of settings.
+
+    Args:
+        settings: The settings to group.
+
+    Returns:
+        A dictionary keyed by `max_setting`, as returned by `group_settings_greedy`.
+    """
+    settings = list(settings)
+    codes, present = _setting_codes(settings)
+    degrees = np.zeros(len(settings), dtype=np.int64)
+    chunk_size = max(1, _MAX_CHUNK_SIZE // max(1, present.size))
+    for start in range(0, len(settings), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        conflicts = _conflicts(
+            codes[:, chunk, np.newaxis], present[chunk, np.newaxis], codes[:, np.newaxis], present
+        )
+        degrees[chunk] = np.count_nonzero(conflicts, axis=1)
+    order = np.argsort(-degrees, kind='stable')
+    return _group_first_fit(settings, order, least_recently_updated_first=False)
 
+
+def _group_first_fit(
+    settings: Sequence[InitObsSetting], order: Iterable[int], least_recently_updated_first: bool
+) -> dict[InitObsSetting, list[InitObsSetting]]:
+    """Adds the settings in order to the first group they are compatible with, if any.
+
+    Compatibility is checked against all the groups at once, using the codes of
+    the maximal setting of each group on the bits of `_setting_codes`.
+
+    Args:
+        settings: The settings to group.
+        order: The order in which to add the settings.
+        least_recently_updated_first: Whether to try the groups in the order they
+            were last updated, instead of the order they were created. The groups of
+            the returned dictionary are in the same order.
+    """
+    codes, present = _setting_codes(settings)
+    capacity = 16
+    group_codes = np.zeros((codes.shape[0], capacity, codes.shape[2]), dtype=np.uint64)
+    group_present = np.zeros((capacity, codes.shape[2]), dtype=np.uint64)
+    updates = np.zeros(capacity, dtype=np.int64)
+    groups: list[list[int]] = []
+    for step, i in enumerate(order):
+        num_groups = len(groups)
+        compatible = np.flatnonzero(
+            ~_conflicts(
+                group_codes[:, :num_groups],
+                group_present[:num_groups],
+                codes[:, i, np.newaxis],
+                present[i],
+            )
+        )
+        if len(compatible):
+            if least_recently_updated_first:
+                g = compatible[np.argmin(updates[compatible])]
+            else:
+                g = compatible[0]
+            groups[g].append(i)
         else:
-            # made it through entire dict without finding a compatible group,
-            # thus a new group needs to be created
-            # Strip coefficients before using as key
-            new_max_weight_obs = setting.observable.with_coefficient(1.0)
-            new_max_setting = InitObsSetting(setting.init_state, new_max_weight_obs)
-            grouped_settings[new_max_setting] = [setting]
+            if num_groups == capacity:
+                capacity *= 2
+                group_codes = _resized(group_codes, capacity, axis=1)
+                group_present = _resized(group_present, capacity, axis=0)
+                updates = _resized(updates, capacity, axis=0)
+            g = num_groups
+            groups.append([i])
+        # Compatible codes are equal wherever both are defined, so OR merges them.
+        group_codes[:, g] |= codes[:, i]
+        group_present[g] |= present[i]
+        updates[g] = step
 
+    if least_recently_updated_first:
+        groups = [groups[g] for g in np.argsort(updates[: len(groups)])]
+    grouped_settings: dict[InitObsSetting, list[InitObsSetting]] = {}
+    for group in groups:
+        simul_settings = [settings[i] for i in group]
+        if len(simul_settings) == 1:
+            # Strip coefficients before using as key
+            max_setting = InitObsSetting(
+                simul_settings[0].init_state, simul_settings[0].observable.with_coefficient(1.0)
+            )
+        else:
+            max_weight_state = _max_weight_state(s.init_state for s in simul_settings)
+            max_weight_obs = _max_weight_observable(s.observable for s in simul_settings)
+            assert max_weight_state is not None and max_weight_obs is not None
+            max_setting = InitObsSetting(max_weight_state, max_weight_obs)
+        grouped_settings[max_setting] = simul_settings
     return grouped_settings
+
+
+def _setting_codes(settings: Sequence[InitObsSetting]) -> tuple[np.ndarray, np.ndarray]:
+    """Encodes the initial states and observables of settings as packed bits.
+
+    Each qubit has a column for its Pauli in the observable, coded by its X and Z
+    bits, and a column for its initial state, coded by an arbitrary positive integer
+    per distinct state. Zero codes mean that the setting is not defined on the qubit.
+
+    Returns:
+        The bits of the codes, as an array of shape (num_bits, len(settings),
+        num_words) of 64-bit words packing the columns, and the OR of the bits,
+        which marks the columns where the settings are defined.
+    """
+    qubits: dict[ops.Qid, int] = {}
+    states: dict[_NamedOneQubitState, int] = {}
+    rows: list[int] = []
+    columns: list[int] = []
+    values: list[int] = []
+    for i, setting in enumerate(settings):
+        for q, pauli in setting.observable.items():
+            rows.append(i)
+            columns.append(2 * qubits.setdefault(q, len(qubits)))
+            values.append(_PAULI_CODES[pauli])
+        for q, state in setting.init_state:
+            rows.append(i)
+            columns.append(2 * qubits.setdefault(q, len(qubits)) + 1)
+            values.append(states.setdefault(state, len(states) + 1))
+    code_matrix = np.zeros((len(settings), 2 * len(qubits)), dtype=np.int64)
+    code_matrix[rows, columns] = values
+    num_bits = max(2, len(states).bit_length())
+    bits = (code_matrix >> np.arange(num_bits)[:, np.newaxis, np.newaxis]) & 1
+    packed = np.packbits(bits.astype(bool), axis=2, bitorder='little')
+    num_words = -(-code_matrix.shape[1] // 64)
+    words = np.zeros((num_bits, len(settings), 8 * num_words), dtype=np.uint8)
+    words[..., : packed.shape[2]] = packed
+    codes = words.view(np.uint64)
+    return codes, np.bitwise_or.reduce(codes, axis=0)
+
+
+def _conflicts(
+    lhs_codes: np.ndarray, lhs_present: np.ndarray, rhs_codes: np.ndarray, rhs_present: np.ndarray
+) -> np.ndarray:
+    """Returns whether settings have different codes on a column where both are defined.
+
+    The arguments are broadcast together like the arrays of `_setting_codes`, and the
+    result has their shape without the bit and word axes.
+    """
+    different = np.bitwise_or.reduce(lhs_codes ^ rhs_codes, axis=0)
+    return np.any(lhs_present & rhs_present & different, axis=-1)
+
+
+def _resized(array: np.ndarray, size: int, axis: int) -> np.ndarray:
+    """Returns a copy of an array padded with zeros to the given size along an axis."""
+    shape = list(array.shape)
+    shape[axis] = size
+    result = np.zeros(shape, dtype=array.dtype)
+    result[tuple(slice(0, n) for n in array.shape)] = array
+    return result
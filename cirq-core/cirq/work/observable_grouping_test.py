@@ -14,7 +14,57 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
+import numpy as np
+import pytest
+
 import cirq
+from cirq.work import observable_grouping
+from cirq.work.observable_settings import _max_weight_observable, _max_weight_state
+
+GROUPERS = [
+    cirq.work.group_settings_greedy,
+    cirq.work.group_settings_sorted_insertion,
+    cirq.work.group_settings_coloring,
+]
+
+
+def _random_settings(
+    qubits: list[cirq.Qid], num_settings: int, seed: int
+) -> list[cirq.work.InitObsSetting]:
+    prng = np.random.RandomState(seed)
+    states = [cirq.KET_ZERO, cirq.KET_PLUS, cirq.KET_IMAG]
+    settings = []
+    for _ in range(num_settings):
+        support = prng.choice(len(qubits), prng.randint(1, 4), replace=False)
+        observable = cirq.PauliString(
+            {qubits[j]: [cirq.X, cirq.Y, cirq.Z][prng.randint(3)] for j in support},
+            coefficient=prng.randn(),
+        )
+        init_state = cirq.ProductState(
+            {
+                q: states[prng.randint(len(states))]
+                for j, q in enumerate(qubits)
+                if j in support or prng.rand() < 0.1
+            }
+        )
+        settings.append(cirq.work.InitObsSetting(init_state, observable))
+    return settings
+
+
+def _assert_valid_grouping(grouped_settings, settings) -> None:
+    assert sorted(map(str, settings)) == sorted(
+        str(s) for group in grouped_settings.values() for s in group
+    )
+    for max_setting, group in grouped_settings.items():
+        assert max_setting.observable.coefficient == 1
+        assert _max_weight_state([max_setting.init_state, *(s.init_state for s in group)]) == (
+            max_setting.init_state
+        )
+        assert _max_weight_observable(
+            [max_setting.observable, *(s.observable for s in group)]
+        ) == max_setting.observable.with_coefficient(1)
 
 
 def test_group_settings_greedy_one_group() -> None:
@@ -148,3 +198,99 @@ def test_group_settings_greedy_hydrogen() -> None:
     assert len(groups[2]) == 1
     assert len(groups[3]) == 1
     assert len(groups[4]) == len(terms) - 4
+
+
+def _group_settings_greedy_reference(settings):
+    """The original, unvectorized implementation of `group_settings_greedy`."""
+    grouped_settings = {}
+    for setting in settings:
+        for max_setting, simul_settings in grouped_settings.items():
+            trial_grouped_settings = simul_settings + [setting]
+            new_max_weight_state = _max_weight_state(
+                stg.init_state for stg in trial_grouped_settings
+            )
+            new_max_weight_obs = _max_weight_observable(
+                stg.observable for stg in trial_grouped_settings
+            )
+            if new_max_weight_state is not None and new_max_weight_obs is not None:
+                del grouped_settings[max_setting]
+                new_max_setting = cirq.work.InitObsSetting(new_max_weight_state, new_max_weight_obs)
+                grouped_settings[new_max_setting] = trial_grouped_settings
+                break
+        else:
+            new_max_weight_obs = setting.observable.with_coefficient(1.0)
+            new_max_setting = cirq.work.InitObsSetting(setting.init_state, new_max_weight_obs)
+            grouped_settings[new_max_setting] = [setting]
+    return grouped_settings
+
+
+@pytest.mark.parametrize('num_settings, seed', [(1, 0), (20, 1), (100, 2)])
+def test_group_settings_greedy_matches_reference(num_settings: int, seed: int) -> None:
+    qubits = cirq.LineQubit.range(6)
+    settings = _random_settings(qubits, num_settings, seed)
+    grouped_settings = cirq.work.group_settings_greedy(settings)
+    assert list(grouped_settings.items()) == list(
+        _group_settings_greedy_reference(settings).items()
+    )
+
+
+@pytest.mark.parametrize('grouper', GROUPERS)
+@pytest.mark.parametrize('num_qubits, seed', [(5, 3), (70, 4)])
+def test_groupers_valid(grouper, num_qubits: int, seed: int) -> None:
+    qubits = cirq.LineQubit.range(num_qubits)
+    settings = _random_settings(qubits, 60, seed)
+    _assert_valid_grouping(grouper(settings), settings)
+
+
+@pytest.mark.parametrize('grouper', GROUPERS)
+def test_groupers_empty(grouper) -> None:
+    assert grouper([]) == {}
+
+
+def test_group_settings_many_states() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    states = [cirq.KET_ZERO, cirq.KET_ONE, cirq.KET_PLUS, cirq.KET_MINUS, cirq.KET_IMAG]
+    settings = [
+        cirq.work.InitObsSetting(init_state=state(q0) * cirq.KET_ZERO(q1), observable=cirq.Z(q1))
+        for state in states
+    ] + [cirq.work.InitObsSetting(init_state=cirq.KET_ONE(q0), observable=cirq.Z(q0))]
+    for grouper in GROUPERS:
+        grouped_settings = grouper(settings)
+        assert len(grouped_settings) == len(states)
+        _assert_valid_grouping(grouped_settings, settings)
+
+
+def test_group_settings_sorted_insertion() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    terms = [0.1 * cirq.X(q0), 0.2 * cirq.Z(q0) * cirq.Z(q1), -0.5 * cirq.X(q1), cirq.Z(q0)]
+    settings = list(cirq.work.observables_to_settings(terms, [q0, q1]))
+    grouped_settings = cirq.work.group_settings_sorted_insertion(settings)
+    assert list(grouped_settings.values()) == [
+        [settings[3], settings[2]],
+        [settings[1]],
+        [settings[0]],
+    ]
+
+
+def test_group_settings_coloring() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    terms = [cirq.X(q0), cirq.X(q1), cirq.Z(q0) * cirq.Z(q1), cirq.Z(q1) * cirq.Z(q2), cirq.X(q2)]
+    settings = list(cirq.work.observables_to_settings(terms, [q0, q1, q2]))
+    grouped_settings = cirq.work.group_settings_coloring(settings)
+    # The settings with the most conflicts are colored first.
+    assert list(grouped_settings.values()) == [
+        [settings[1], settings[0], settings[4]],
+        [settings[2], settings[3]],
+    ]
+    with mock.patch.object(observable_grouping, '_MAX_CHUNK_SIZE', 1):
+        assert cirq.work.group_settings_coloring(settings) == grouped_settings
+
+
+def test_group_settings_many_groups() -> None:
+    qubits = cirq.LineQubit.range(3)
+    terms = [cirq.DensePauliString(mask).on(*qubits) for mask in np.ndindex(4, 4, 4) if all(mask)]
+    settings = list(cirq.work.observables_to_settings(terms, qubits))
+    for grouper in GROUPERS:
+        grouped_settings = grouper(settings)
+        assert len(grouped_settings) == len(terms)
+        _assert_valid_grouping(grouped_settings, settings)
@@ -28,7 +28,12 @@ import sympy
 
 from cirq import circuits, ops, protocols, study, value
 from cirq._doc import document
-from cirq.work.observable_grouping import group_settings_greedy, GROUPER_T
+from cirq.work.observable_grouping import (
+    group_settings_coloring,
+    group_settings_greedy,
+    group_settings_sorted_insertion,
+    GROUPER_T,
+)
 from cirq.work.observable_measurement_data import (
     BitstringAccumulator,
     flatten_grouped_results,
@@ -492,8 +497,9 @@ def measure_grouped_settings(
             The key is the max-weight setting used for preparing single-qubit
             basis-change rotations. The value is a list of settings
             compatible with the maximal setting you desire to measure.
-            Automated routing algorithms like `group_settings_greedy` can
-            be used to construct this input.
+            Automated routing algorithms like `group_settings_greedy`,
+            `group_settings_sorted_insertion` or `group_settings_coloring`
+            can be used to construct this input.
         sampler: A sampler.
         stopping_criteria: A StoppingCriteria object that can report
             whether enough samples have been sampled.
@@ -584,7 +590,11 @@ def measure_grouped_settings(
     return list(accumulators.values())
 
 
-_GROUPING_FUNCS: dict[str, GROUPER_T] = {'greedy': group_settings_greedy}
+_GROUPING_FUNCS: dict[str, GROUPER_T] = {
+    'greedy': group_settings_greedy,
+    'sorted_insertion': group_settings_sorted_insertion,
+    'coloring': group_settings_coloring,
+}
 
 
 def _parse_grouper(grouper: str | GROUPER_T = group_settings_greedy) -> GROUPER_T:
@@ -643,9 +653,9 @@ def measure_observables(
         circuit_sweep: Additional parameter sweeps for parameters contained in `circuit`. The
             total sweep is the product of the circuit sweep with parameter settings for the
             single-qubit basis-change rotations.
-        grouper: Either "greedy" or a function that groups lists of `InitObsSetting`. See the
-            documentation for the `grouped_settings` argument of `measure_grouped_settings` for
-            full details.
+        grouper: Either "greedy", "sorted_insertion", "coloring" or a function that groups lists
+            of `InitObsSetting`. See the documentation for the `grouped_settings` argument of
+            `measure_grouped_settings` for full details.
         readout_calibrations: The result of `calibrate_readout_error`.
         checkpoint: Options to set up optional checkpointing of intermediate data for each
             iteration of the sampling loop. See the documentation for `CheckpointFileOptions` for
@@ -534,7 +534,15 @@ def _each_in_its_own_group_grouper(
 
 
 @pytest.mark.parametrize(
-    'grouper', ['greedy', group_settings_greedy, _each_in_its_own_group_grouper]
+    'grouper',
+    [
+        'greedy',
+        'sorted_insertion',
+        'coloring',
+        group_settings_greedy,
+        cirq.work.group_settings_coloring,
+        _each_in_its_own_group_grouper,
+    ],
 )
 def test_measure_observable_grouper(grouper) -> None:
     circuit = cirq.Circuit(cirq.X(Q) ** 0.2)